@@ -0,0 +1,567 @@
+"""In-process stand-in for the Octopoid /api/v1 server.
+
+Implements the subset of endpoints that OctopoidSDK calls from the scheduler,
+housekeeping jobs and reports (tasks, claim, poll, flows, projects, messages,
+drafts, actions, orchestrators), backed by in-memory dicts. Every request is
+counted per endpoint so benchmarks can report API calls per tick.
+
+This is not a faithful reimplementation of the real server: it applies scope
+and the common list filters, and otherwise accepts whatever the SDK sends.
+Use tests/integration for behavioural coverage.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+FLOWS_DIR = Path(__file__).resolve().parent.parent / "octopoid" / "data" / "flows"
+
+DEFAULT_LEASE_SECONDS = 3600
+
+# (method, pattern, handler name). Patterns double as endpoint labels in the
+# call counters, e.g. "GET /api/v1/tasks/{id}".
+_ROUTES: list[tuple[str, str, str]] = [
+    ("GET", "/api/health", "health"),
+    ("GET", "/api/v1/scheduler/poll", "poll"),
+    ("GET", "/api/v1/tasks", "list_tasks"),
+    ("POST", "/api/v1/tasks", "create_task"),
+    ("PATCH", "/api/v1/tasks", "bulk_update_tasks"),
+    ("POST", "/api/v1/tasks/claim", "claim"),
+    ("GET", "/api/v1/tasks/{id}", "get_task"),
+    ("PATCH", "/api/v1/tasks/{id}", "update_task"),
+    ("DELETE", "/api/v1/tasks/{id}", "delete_task"),
+    ("POST", "/api/v1/tasks/{id}/submit", "submit_task"),
+    ("POST", "/api/v1/tasks/{id}/accept", "accept_task"),
+    ("POST", "/api/v1/tasks/{id}/reject", "reject_task"),
+    ("POST", "/api/v1/tasks/{id}/requeue", "requeue_task"),
+    ("GET", "/api/v1/projects", "list_projects"),
+    ("POST", "/api/v1/projects", "create_project"),
+    ("GET", "/api/v1/projects/{id}", "get_project"),
+    ("PATCH", "/api/v1/projects/{id}", "update_project"),
+    ("GET", "/api/v1/projects/{id}/tasks", "project_tasks"),
+    ("GET", "/api/v1/flows", "list_flows"),
+    ("PUT", "/api/v1/flows/{id}", "register_flow"),
+    ("GET", "/api/v1/messages", "list_messages"),
+    ("POST", "/api/v1/messages", "create_message"),
+    ("GET", "/api/v1/drafts", "list_drafts"),
+    ("POST", "/api/v1/drafts", "create_draft"),
+    ("GET", "/api/v1/actions", "list_actions"),
+    ("POST", "/api/v1/orchestrators/register", "register_orchestrator"),
+    ("POST", "/api/v1/orchestrators/{id}/heartbeat", "heartbeat"),
+]
+
+_COMPILED_ROUTES = [
+    (method, re.compile("^" + pattern.replace("{id}", "(?P<id>[^/]+)") + "$"), pattern, handler)
+    for method, pattern, handler in _ROUTES
+]
+
+
+class NotFound(Exception):
+    """Raised by handlers to produce a 404 response."""
+
+
+def _parse(ts: str | None) -> datetime:
+    if not ts:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    parsed = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class FakeServerState:
+    """In-memory store behind the fake server. All methods are thread-safe."""
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.tasks: dict[str, dict] = {}
+        self.projects: dict[str, dict] = {}
+        self.flows: dict[str, dict] = {}
+        self.messages: list[dict] = []
+        self.drafts: list[dict] = []
+        self.orchestrators: set[str] = set()
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # Change log behind the poll's `since` cursor: task id -> sequence
+        # number of its last change (or deletion). Cursors start at 1 so a
+        # `since` of "0" always means "send everything".
+        self._seq = 1
+        self._changed: dict[str, int] = {}
+        self._deleted: dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Seeding
+    # ------------------------------------------------------------------
+
+    def seed(
+        self,
+        tasks: int,
+        projects: int,
+        roles: list[str],
+        queues: dict[str, float] | None = None,
+    ) -> None:
+        """Populate projects, tasks and the packaged flows.
+
+        Args:
+            tasks: Number of tasks to create.
+            projects: Number of projects; tasks are spread across them
+                round-robin (a project of 0 leaves tasks unattached).
+            roles: Task roles, assigned round-robin.
+            queues: Fraction of tasks per queue. Defaults to a mix weighted
+                towards incoming and done.
+        """
+        queues = queues or {"incoming": 0.4, "claimed": 0.1, "provisional": 0.1, "done": 0.35, "failed": 0.05}
+        with self._lock:
+            for i in range(projects):
+                project_id = f"PROJ-bench{i:04d}"
+                self.projects[project_id] = {
+                    "id": project_id,
+                    "title": f"Benchmark project {i}",
+                    "status": "active",
+                    "flow": "project",
+                    "scope": self.scope,
+                    "created_at": _now(),
+                }
+
+            queue_names = list(queues)
+            boundaries = []
+            total = 0.0
+            for name in queue_names:
+                total += queues[name]
+                boundaries.append(total)
+
+            now = datetime.now(timezone.utc)
+            for i in range(tasks):
+                position = (i + 0.5) / max(tasks, 1) * total
+                queue = next(q for q, b in zip(queue_names, boundaries) if position <= b)
+                task_id = f"bench{i:06d}"
+                task = {
+                    "id": task_id,
+                    "title": f"Benchmark task {i}",
+                    "content": f"Benchmark task {i}: make a small change.",
+                    "queue": queue,
+                    "priority": ("P1", "P2", "P3")[i % 3],
+                    "role": roles[i % len(roles)] if roles else "implement",
+                    "flow": "default",
+                    "branch": "main",
+                    "scope": self.scope,
+                    "attempt_count": 0,
+                    "project_id": f"PROJ-bench{i % projects:04d}" if projects else None,
+                    "created_at": (now - timedelta(hours=i % 48)).isoformat(),
+                    "updated_at": (now - timedelta(hours=i % 48)).isoformat(),
+                }
+                if queue == "claimed":
+                    task["claimed_by"] = "bench-orchestrator"
+                    task["lease_expires_at"] = (now + timedelta(minutes=10 + i % 60)).isoformat()
+                if queue == "done":
+                    task["completed_at"] = task["updated_at"]
+                self.tasks[task_id] = task
+
+            for path in sorted(FLOWS_DIR.glob("*.yaml")):
+                self._register_packaged_flow(path)
+
+    def _register_packaged_flow(self, path: Path) -> None:
+        from octopoid.flow import Flow, flow_to_server_registration
+
+        flow = Flow.from_yaml_file(path)
+        self.flows[flow.name] = {
+            "name": flow.name,
+            "scope": self.scope,
+            **flow_to_server_registration(flow),
+        }
+
+    def reset_calls(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+    def call_counts(self) -> Counter[str]:
+        with self._lock:
+            return Counter(self.calls)
+
+    def count(self, endpoint: str) -> None:
+        with self._lock:
+            self.calls[endpoint] += 1
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _new_id(self, prefix: str) -> str:
+        self._next_id += 1
+        return f"{prefix}{self._next_id:06d}"
+
+    def _task(self, task_id: str) -> dict:
+        task = self.tasks.get(task_id)
+        if task is None:
+            raise NotFound(task_id)
+        return task
+
+    def _touch(self, task: dict, **updates: Any) -> dict:
+        task.update(updates)
+        task["updated_at"] = _now()
+        self._seq += 1
+        self._changed[task["id"]] = self._seq
+        self._deleted.pop(task["id"], None)
+        return dict(task)
+
+    def _in_scope(self, item: dict, scope: str | None) -> bool:
+        return scope is None or item.get("scope") == scope
+
+    # ------------------------------------------------------------------
+    # Handlers: (params, body, path_id) -> (status, payload)
+    # ------------------------------------------------------------------
+
+    def health(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        return 200, {"status": "ok"}
+
+    def poll(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        scope = params.get("scope")
+        with self._lock:
+            counts: Counter[str] = Counter()
+            provisional = []
+            for task in self.tasks.values():
+                if not self._in_scope(task, scope):
+                    continue
+                counts[task["queue"]] += 1
+                if task["queue"] == "provisional":
+                    provisional.append({
+                        "id": task["id"],
+                        "hooks": task.get("hooks"),
+                        "pr_number": task.get("pr_number"),
+                    })
+            registered = params.get("orchestrator_id") in self.orchestrators
+            delta = self._delta(params.get("since"), scope)
+        queue_counts = {q: counts.get(q, 0) for q in ("incoming", "claimed", "provisional")}
+        queue_counts.update(counts)
+        return 200, {
+            "queue_counts": queue_counts,
+            "provisional_tasks": provisional,
+            "orchestrator_registered": registered,
+            **delta,
+        }
+
+    def _delta(self, since: str | None, scope: str | None) -> dict:
+        """Tasks changed after the `since` cursor; "0" asks for a full sync."""
+        if since is None:
+            return {}
+        try:
+            after = int(since)
+        except ValueError:
+            after = 0
+        full = after <= 0 or after > self._seq
+        changed = [
+            dict(t) for t in self.tasks.values()
+            if self._in_scope(t, scope) and (full or self._changed.get(t["id"], 0) > after)
+        ]
+        deleted = [] if full else [i for i, seq in self._deleted.items() if seq > after]
+        return {
+            "cursor": str(self._seq),
+            "full_sync": full,
+            "changed_tasks": changed,
+            "deleted_task_ids": deleted,
+        }
+
+    def list_tasks(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        scope = params.pop("scope", None)
+        limit = params.pop("limit", None)
+        offset = int(params.pop("offset", 0) or 0)
+        fields = params.pop("fields", None)
+        updated_since = params.pop("updated_since", None)
+        with self._lock:
+            tasks = [
+                dict(t) for t in self.tasks.values()
+                if self._in_scope(t, scope)
+                and all(str(t.get(k)) == v for k, v in params.items() if k in t or k in ("queue", "role"))
+                and (not updated_since or _parse(t.get("updated_at")) >= _parse(updated_since))
+            ]
+        # Same shape as the server's TaskListResponse
+        total = len(tasks)
+        limit = int(limit) if limit is not None else total
+        tasks = tasks[offset:offset + limit]
+        if fields:
+            wanted = fields.split(",")
+            tasks = [{k: t[k] for k in wanted if k in t} for t in tasks]
+        return 200, {"tasks": tasks, "total": total, "offset": offset, "limit": limit}
+
+    def create_task(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            task_id = body.get("id") or self._new_id("task")
+            task = {"queue": "incoming", "attempt_count": 0, "created_at": _now(), **body, "id": task_id}
+            self.tasks[task_id] = task
+            return 201, self._touch(task)
+
+    def claim(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        limit = body.get("limit")
+        wanted = int(limit) if limit else 1
+        queue = body.get("queue") or "incoming"
+        role = body.get("role_filter")
+        roles = {r.strip() for r in role.split(",")} if isinstance(role, str) else None
+        lease = int(body.get("lease_duration_seconds") or DEFAULT_LEASE_SECONDS)
+        expires = (datetime.now(timezone.utc) + timedelta(seconds=lease)).isoformat()
+        claimed = []
+        with self._lock:
+            candidates = sorted(
+                (
+                    t for t in self.tasks.values()
+                    if t["queue"] == queue
+                    and self._in_scope(t, body.get("scope"))
+                    and (roles is None or t.get("role") in roles)
+                ),
+                key=lambda t: (t.get("priority", "P2"), t.get("created_at", "")),
+            )
+            for task in candidates[:wanted]:
+                claimed.append(self._touch(
+                    task,
+                    queue="claimed",
+                    claimed_by=body.get("agent_name"),
+                    orchestrator_id=body.get("orchestrator_id"),
+                    lease_expires_at=expires,
+                    attempt_count=task.get("attempt_count", 0) + 1,
+                ))
+        if not claimed:
+            return 404, {"error": "No tasks available"}
+        if limit:
+            return 200, {"tasks": claimed}
+        return 200, claimed[0]
+
+    def get_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            return 200, dict(self._task(task_id))
+
+    def update_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        body.pop("scope", None)
+        with self._lock:
+            return 200, self._touch(self._task(task_id), **body)
+
+    def bulk_update_tasks(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        updated, failed = [], []
+        with self._lock:
+            for patch in body.get("tasks") or []:
+                fields = {k: v for k, v in patch.items() if k not in ("id", "scope")}
+                task = self.tasks.get(patch.get("id"))
+                if task is None:
+                    failed.append({"id": patch.get("id"), "error": "Task not found"})
+                    continue
+                updated.append(self._touch(task, **fields))
+        return 200, {"updated": updated, "failed": failed}
+
+    def delete_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            self._task(task_id)
+            del self.tasks[task_id]
+            self._seq += 1
+            self._deleted[task_id] = self._seq
+            self._changed.pop(task_id, None)
+        return 204, None
+
+    def submit_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        body.pop("scope", None)
+        with self._lock:
+            return 200, self._touch(self._task(task_id), queue="provisional", **body)
+
+    def accept_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            return 200, self._touch(self._task(task_id), queue="done", completed_at=_now())
+
+    def reject_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            return 200, self._touch(
+                self._task(task_id), queue="incoming", claimed_by=None, lease_expires_at=None,
+            )
+
+    def requeue_task(self, params: dict, body: dict, task_id: str | None) -> tuple[int, Any]:
+        return self.reject_task(params, body, task_id)
+
+    def list_projects(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        scope = params.get("scope")
+        with self._lock:
+            projects = [dict(p) for p in self.projects.values() if self._in_scope(p, scope)]
+        if "status" in params:
+            projects = [p for p in projects if p.get("status") == params["status"]]
+        return 200, {"projects": projects}
+
+    def create_project(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            project_id = body.get("id") or self._new_id("PROJ-")
+            self.projects[project_id] = {"status": "active", "created_at": _now(), **body, "id": project_id}
+            return 201, dict(self.projects[project_id])
+
+    def get_project(self, params: dict, body: dict, project_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            if project_id not in self.projects:
+                raise NotFound(project_id)
+            return 200, dict(self.projects[project_id])
+
+    def update_project(self, params: dict, body: dict, project_id: str | None) -> tuple[int, Any]:
+        body.pop("scope", None)
+        with self._lock:
+            if project_id not in self.projects:
+                raise NotFound(project_id)
+            self.projects[project_id].update(body)
+            return 200, dict(self.projects[project_id])
+
+    def project_tasks(self, params: dict, body: dict, project_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            tasks = [dict(t) for t in self.tasks.values() if t.get("project_id") == project_id]
+        return 200, {"tasks": tasks}
+
+    def list_flows(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        scope = params.get("scope")
+        with self._lock:
+            flows = [dict(f) for f in self.flows.values() if self._in_scope(f, scope)]
+        return 200, {"flows": flows}
+
+    def register_flow(self, params: dict, body: dict, name: str | None) -> tuple[int, Any]:
+        with self._lock:
+            self.flows[name] = {"scope": self.scope, **body, "name": name}
+            return 200, dict(self.flows[name])
+
+    def list_messages(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            messages = [
+                dict(m) for m in self.messages
+                if all(str(m.get(k)) == v for k, v in params.items() if k in ("task_id", "to_actor", "type"))
+            ]
+        return 200, {"messages": messages}
+
+    def create_message(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            message = {"created_at": _now(), **body, "id": self._new_id("msg")}
+            self.messages.append(message)
+            return 201, dict(message)
+
+    def list_drafts(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            return 200, {"drafts": [dict(d) for d in self.drafts]}
+
+    def create_draft(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            draft = {"status": "idea", "created_at": _now(), **body, "id": self._new_id("draft")}
+            self.drafts.append(draft)
+            return 201, dict(draft)
+
+    def list_actions(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        return 200, {"actions": []}
+
+    def register_orchestrator(self, params: dict, body: dict, _id: str | None) -> tuple[int, Any]:
+        orchestrator_id = f"{body.get('cluster', 'default')}-{body.get('machine_id', '')}"
+        with self._lock:
+            self.orchestrators.add(orchestrator_id)
+        return 200, {"orchestrator_id": orchestrator_id}
+
+    def heartbeat(self, params: dict, body: dict, orchestrator_id: str | None) -> tuple[int, Any]:
+        with self._lock:
+            self.orchestrators.add(orchestrator_id)
+        return 200, {"ok": True}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_HTTPServer"
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+        state = self.server.state
+        for route_method, regex, label, handler in _COMPILED_ROUTES:
+            if route_method != method:
+                continue
+            match = regex.match(url.path)
+            if match is None:
+                continue
+            state.count(f"{method} {label}")
+            try:
+                status, payload = getattr(state, handler)(params, body, match.groupdict().get("id"))
+            except NotFound as e:
+                status, payload = 404, {"error": f"Not found: {e}"}
+            self._respond(status, payload)
+            return
+
+        state.count(f"{method} <unrouted>")
+        self._respond(404, {"error": f"No route for {method} {url.path}"})
+
+    def _respond(self, status: int, payload: Any) -> None:
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, state: FakeServerState):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.state = state
+
+
+class FakeServer:
+    """Run a FakeServerState behind a local HTTP server on a free port.
+
+    Usage:
+        with FakeServer(scope="bench") as server:
+            server.state.seed(tasks=100, projects=5, roles=["implement"])
+            sdk = OctopoidSDK(server_url=server.url, scope="bench")
+    """
+
+    def __init__(self, scope: str):
+        self.state = FakeServerState(scope)
+        self._httpd = _HTTPServer(self.state)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,359 @@
+"""Benchmark project setup and measurement helpers.
+
+BenchmarkProject builds a throwaway Octopoid project (git repo with a bare
+origin, .octopoid/ config, agent blueprints, jobs.yaml) wired to a FakeServer,
+with a `claude` shim on PATH that runs tests/fixtures/mock-agent.sh. measure()
+times a callable and counts the API calls it made.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import shutil
+import signal
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from .fake_server import FakeServer
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = REPO_ROOT / "tests" / "fixtures"
+MOCK_AGENT = FIXTURES_DIR / "mock-agent.sh"
+FAKE_GH_BIN = FIXTURES_DIR / "bin"
+IMPLEMENTER_TEMPLATE = REPO_ROOT / "octopoid" / "data" / "agents" / "implementer"
+
+SCOPE = "bench"
+CLUSTER = "bench"
+MACHINE_ID = "local"
+
+# Script jobs only: agent-type jobs would spawn analysts on every tick and
+# drown the scheduler's own cost in mock-agent runtime.
+JOBS_YAML = """\
+jobs:
+  - {name: check_and_update_finished_agents, interval: 10, type: script, group: local}
+  - {name: _register_orchestrator, interval: 300, type: script, group: remote}
+  - {name: send_heartbeat, interval: 60, type: script, group: remote}
+  - {name: renew_active_leases, interval: 60, type: script, group: remote}
+  - {name: check_and_requeue_expired_leases, interval: 60, type: script, group: remote}
+  - {name: check_project_completion, interval: 60, type: script, group: remote}
+  - {name: _check_queue_health_throttled, interval: 1800, type: script, group: remote}
+  - {name: agent_evaluation_loop, interval: 60, type: script, group: remote}
+  - {name: sweep_stale_resources, interval: 1800, type: script, group: remote}
+  - {name: dispatch_action_messages, interval: 30, type: script, group: remote}
+"""
+
+CLAUDE_SHIM = """\
+#!/usr/bin/env bash
+# Benchmark stand-in for the claude CLI.
+# Agent runs (OCTOPOID_TASK_DIR set by invoke_claude) run the mock agent in the
+# worktree the scheduler started us in. The mock agent writes stdout.log itself,
+# so its own stdout goes to stderr rather than the scheduler's stdout.log handle.
+# Anything else is a result-inference call (_call_haiku): answer "done".
+if [ -z "${{OCTOPOID_TASK_DIR:-}}" ]; then
+    echo done
+    exit 0
+fi
+export TASK_DIR="$OCTOPOID_TASK_DIR"
+export TASK_WORKTREE="$PWD"
+exec "{mock_agent}" >&2
+"""
+
+
+def _git(args: list[str], cwd: Path) -> None:
+    subprocess.run(["git"] + args, cwd=cwd, check=True, capture_output=True)
+
+
+@dataclass
+class BenchmarkConfig:
+    """Size of the synthetic workload."""
+
+    tasks: int = 200
+    blueprints: int = 2
+    projects: int = 10
+    max_instances: int = 2
+    agent_sleep: int = 0  # MOCK_SLEEP for spawned agents
+    sdk_cache_ttl: float = 0  # OCTOPOID_SDK_CACHE_TTL; 0 leaves the SDK cache off
+
+
+class BenchmarkProject:
+    """A temporary Octopoid project pointed at a running FakeServer.
+
+    Use as a context manager: entering creates the project, starts and seeds
+    the server and points the octopoid package at it (cwd, ORCHESTRATOR_DIR,
+    OCTOPOID_SERVER_URL, PATH); exiting kills spawned agents and restores
+    everything.
+    """
+
+    def __init__(self, config: BenchmarkConfig):
+        self.config = config
+        self.root = Path(tempfile.mkdtemp(prefix="octopoid-bench-"))
+        self.project = self.root / "project"
+        self.octopoid_dir = self.project / ".octopoid"
+        self.server = FakeServer(scope=SCOPE)
+        self.blueprint_names = [f"implementer-{i}" for i in range(config.blueprints)]
+        self._saved_env: dict[str, str | None] = {}
+        self._saved_cwd: Path | None = None
+
+    # ------------------------------------------------------------------
+    # Setup / teardown
+    # ------------------------------------------------------------------
+
+    def __enter__(self) -> "BenchmarkProject":
+        self._create_repo()
+        self._write_config()
+        self._write_blueprints()
+        bin_dir = self._write_claude_shim()
+
+        self.server.start()
+        self.server.state.seed(
+            tasks=self.config.tasks,
+            projects=self.config.projects,
+            roles=["implement"],
+        )
+
+        self._saved_cwd = Path.cwd()
+        os.chdir(self.project)
+        self._set_env({
+            "ORCHESTRATOR_DIR": str(self.octopoid_dir),
+            "OCTOPOID_SERVER_URL": self.server.url,
+            "OCTOPOID_API_KEY": None,
+            "PATH": f"{bin_dir}:{FAKE_GH_BIN}:{os.environ.get('PATH', '')}",
+            "MOCK_SLEEP": str(self.config.agent_sleep),
+            "OCTOPOID_SDK_CACHE_TTL": str(self.config.sdk_cache_ttl) if self.config.sdk_cache_ttl else None,
+            "GIT_AUTHOR_NAME": "Bench",
+            "GIT_AUTHOR_EMAIL": "bench@example.com",
+            "GIT_COMMITTER_NAME": "Bench",
+            "GIT_COMMITTER_EMAIL": "bench@example.com",
+        })
+        reset_octopoid_caches()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.kill_agents()
+        reset_octopoid_caches()
+        for key, value in self._saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        if self._saved_cwd is not None:
+            os.chdir(self._saved_cwd)
+        self.server.stop()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _set_env(self, values: dict[str, str | None]) -> None:
+        for key, value in values.items():
+            self._saved_env[key] = os.environ.get(key)
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    def _create_repo(self) -> None:
+        remote = self.root / "origin.git"
+        _git(["init", "--bare", "-b", "main", str(remote)], cwd=self.root)
+        self.project.mkdir()
+        _git(["init", "-b", "main"], cwd=self.project)
+        _git(["config", "user.email", "bench@example.com"], cwd=self.project)
+        _git(["config", "user.name", "Bench"], cwd=self.project)
+        (self.project / "README.md").write_text("# Benchmark project\n")
+        (self.project / ".gitignore").write_text(".octopoid/\n")
+        _git(["add", "."], cwd=self.project)
+        _git(["commit", "-m", "init"], cwd=self.project)
+        _git(["remote", "add", "origin", str(remote)], cwd=self.project)
+        _git(["push", "origin", "main"], cwd=self.project)
+
+    def _write_config(self) -> None:
+        self.octopoid_dir.mkdir()
+        (self.octopoid_dir / "config.yaml").write_text(
+            "server:\n"
+            "  enabled: true\n"
+            f"  url: {self.server.url}\n"
+            f"  cluster: {CLUSTER}\n"
+            f"  machine_id: {MACHINE_ID}\n"
+            f"scope: {SCOPE}\n"
+            "repo:\n"
+            f"  path: {self.project}\n"
+            "  base_branch: main\n"
+        )
+        (self.octopoid_dir / "agents.yaml").write_text(
+            "paused: false\n"
+            "queue_limits:\n"
+            f"  max_claimed: {self.config.blueprints * self.config.max_instances + self.config.tasks}\n"
+            f"  max_incoming: {self.config.tasks + 1}\n"
+            f"  max_provisional: {self.config.tasks + 1}\n"
+        )
+        (self.octopoid_dir / "jobs.yaml").write_text(JOBS_YAML)
+
+    def _write_blueprints(self) -> None:
+        agents_dir = self.octopoid_dir / "agents"
+        for name in self.blueprint_names:
+            dest = agents_dir / name
+            shutil.copytree(IMPLEMENTER_TEMPLATE, dest)
+            (dest / "agent.yaml").write_text(
+                "role: implement\n"
+                "model: sonnet\n"
+                "max_turns: 10\n"
+                "interval_seconds: 0\n"
+                "spawn_mode: scripts\n"
+                f"max_instances: {self.config.max_instances}\n"
+            )
+
+    def _write_claude_shim(self) -> Path:
+        bin_dir = self.root / "bin"
+        bin_dir.mkdir()
+        shim = bin_dir / "claude"
+        shim.write_text(CLAUDE_SHIM.format(mock_agent=MOCK_AGENT))
+        shim.chmod(0o755)
+        return bin_dir
+
+    # ------------------------------------------------------------------
+    # Agents
+    # ------------------------------------------------------------------
+
+    def agent_pids(self) -> list[int]:
+        from octopoid.pool import load_blueprint_pids
+
+        pids: list[int] = []
+        for name in self.blueprint_names:
+            pids.extend(load_blueprint_pids(name))
+        return pids
+
+    def reap_agents(self) -> None:
+        """Reap exited mock agents so they do not linger as zombies.
+
+        One-shot schedulers exit after each tick, so their agents are reparented
+        and reaped by init. The benchmark keeps the process alive, and a zombie
+        still passes the scheduler's os.kill(pid, 0) liveness check.
+        """
+        while True:
+            try:
+                pid, _status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+    def wait_for_agents(self, timeout: float = 30.0) -> None:
+        """Wait until every spawned mock agent has exited (and reap it)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            self.reap_agents()
+            if not any(_is_alive(pid) for pid in self.agent_pids()):
+                return
+            time.sleep(0.05)
+
+    def kill_agents(self) -> None:
+        for pid in self.agent_pids():
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        self.reap_agents()
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except (ProcessLookupError, PermissionError):
+        return False
+    return True
+
+
+def reset_octopoid_caches() -> None:
+    """Drop every process-wide cache so the next tick sees the current project."""
+    from octopoid.config import invalidate_config_cache
+    from octopoid.flow import invalidate_flow_cache
+    from octopoid.sdk import reset_sdk
+    from octopoid.task_mirror import close_task_mirror
+
+    invalidate_config_cache()
+    invalidate_flow_cache()
+    reset_sdk()
+    close_task_mirror()
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class ScenarioResult:
+    """Latency, API call and memory figures for one benchmarked callable."""
+
+    name: str
+    latencies_ms: list[float] = field(default_factory=list)
+    api_calls: list[int] = field(default_factory=list)
+    peak_memory_kib: float = 0.0
+    endpoints: dict[str, float] = field(default_factory=dict)  # mean calls per iteration
+
+    def summary(self) -> dict[str, Any]:
+        # p95 is the nearest-rank percentile, so it never falls below the median
+        latencies = sorted(self.latencies_ms)
+        return {
+            "name": self.name,
+            "iterations": len(latencies),
+            "latency_ms_p50": round(statistics.median(latencies), 2) if latencies else 0.0,
+            "latency_ms_p95": round(latencies[math.ceil(0.95 * len(latencies)) - 1], 2) if latencies else 0.0,
+            "latency_ms_max": round(latencies[-1], 2) if latencies else 0.0,
+            "api_calls_mean": round(statistics.mean(self.api_calls), 2) if self.api_calls else 0.0,
+            "peak_memory_kib": round(self.peak_memory_kib, 1),
+            "endpoints": {k: round(v, 2) for k, v in sorted(self.endpoints.items())},
+        }
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    project: BenchmarkProject,
+    iterations: int,
+    between: Callable[[], None] | None = None,
+) -> ScenarioResult:
+    """Run fn repeatedly and record latency, API calls and peak memory.
+
+    Latency is measured without tracemalloc (it slows allocation-heavy code
+    several-fold); one extra traced run afterwards records peak memory.
+
+    Args:
+        name: Scenario label.
+        fn: Callable to benchmark (one scheduler tick, one report, ...).
+        project: Active benchmark project; its server's counters are used.
+        iterations: Number of timed runs.
+        between: Optional hook run (untimed) after every run.
+    """
+    result = ScenarioResult(name=name)
+    totals: dict[str, int] = {}
+    state = project.server.state
+
+    for _ in range(iterations):
+        state.reset_calls()
+        start = time.perf_counter()
+        fn()
+        result.latencies_ms.append((time.perf_counter() - start) * 1000)
+        calls = state.call_counts()
+        result.api_calls.append(sum(calls.values()))
+        for endpoint, count in calls.items():
+            totals[endpoint] = totals.get(endpoint, 0) + count
+        if between is not None:
+            between()
+
+    result.endpoints = {k: v / max(iterations, 1) for k, v in totals.items()}
+
+    tracemalloc.start()
+    try:
+        fn()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result.peak_memory_kib = peak / 1024
+    if between is not None:
+        between()
+    return result
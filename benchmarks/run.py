@@ -0,0 +1,171 @@
+"""Scheduler benchmark runner.
+
+Usage:
+    python -m benchmarks.run                      # default workload
+    python -m benchmarks.run --tasks 1000 --blueprints 4 --projects 50
+    python -m benchmarks.run --json results.json  # save results
+    python -m benchmarks.run --baseline results.json  # fail on regression
+
+Scenarios (each iteration starts from an empty scheduler state, so every job
+is due — the worst-case tick):
+    run_due_jobs        one dispatch of all jobs in jobs.yaml
+    run_scheduler       a full tick, including pause/scope checks and state I/O
+    get_project_report  the report behind `octopoid status` and the dashboard
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+from .harness import BenchmarkConfig, BenchmarkProject, ScenarioResult, measure
+
+SCENARIOS = ("run_due_jobs", "run_scheduler", "get_project_report")
+
+
+def run_benchmarks(
+    config: BenchmarkConfig,
+    iterations: int,
+    scenarios: tuple[str, ...] = SCENARIOS,
+) -> list[ScenarioResult]:
+    """Run the selected scenarios against a fresh benchmark project."""
+    results: list[ScenarioResult] = []
+    with BenchmarkProject(config) as project:
+        from octopoid.jobs import run_due_jobs
+        from octopoid.reports import get_project_report
+        from octopoid.scheduler import run_scheduler
+        from octopoid.sdk import get_sdk
+
+        def settle() -> None:
+            project.wait_for_agents()
+
+        callables = {
+            "run_due_jobs": lambda: run_due_jobs({}),
+            "run_scheduler": lambda: run_scheduler({}),
+            "get_project_report": lambda: get_project_report(get_sdk()),
+        }
+        for name in scenarios:
+            results.append(measure(name, callables[name], project, iterations, between=settle))
+    return results
+
+
+def format_table(results: list[ScenarioResult]) -> str:
+    header = f"{'scenario':<20} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'calls':>7} {'peak KiB':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        s = result.summary()
+        lines.append(
+            f"{s['name']:<20} {s['latency_ms_p50']:>9.1f} {s['latency_ms_p95']:>9.1f} "
+            f"{s['latency_ms_max']:>9.1f} {s['api_calls_mean']:>7.1f} {s['peak_memory_kib']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_endpoints(results: list[ScenarioResult]) -> str:
+    lines = []
+    for result in results:
+        lines.append(f"{result.name}:")
+        for endpoint, count in sorted(result.endpoints.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {count:>7.1f}  {endpoint}")
+    return "\n".join(lines)
+
+
+def compare_to_baseline(
+    summaries: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Return a description of every regression against a saved run.
+
+    API call counts are deterministic for a given workload, so any increase
+    is a regression. Latency and memory are noisy and only flagged when they
+    grow by more than ``tolerance`` (a fraction, e.g. 0.5 for +50%).
+    """
+    previous = {s["name"]: s for s in baseline}
+    regressions = []
+    for current in summaries:
+        before = previous.get(current["name"])
+        if before is None:
+            continue
+        if current["api_calls_mean"] > before["api_calls_mean"]:
+            regressions.append(
+                f"{current['name']}: API calls {before['api_calls_mean']} -> {current['api_calls_mean']}"
+            )
+        for metric in ("latency_ms_p50", "peak_memory_kib"):
+            if before[metric] and current[metric] > before[metric] * (1 + tolerance):
+                regressions.append(f"{current['name']}: {metric} {before[metric]} -> {current[metric]}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scheduler ticks against a local fake server")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks to seed (default: 200)")
+    parser.add_argument("--blueprints", type=int, default=2, help="Agent blueprints (default: 2)")
+    parser.add_argument("--projects", type=int, default=10, help="Projects to seed (default: 10)")
+    parser.add_argument("--max-instances", type=int, default=2, help="max_instances per blueprint (default: 2)")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs per scenario (default: 5)")
+    parser.add_argument("--agent-sleep", type=int, default=0, help="Seconds each mock agent sleeps (default: 0)")
+    parser.add_argument("--sdk-cache-ttl", type=float, default=0,
+                        help="Enable the SDK response cache with this TTL in seconds (default: off)")
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, help="Run only these scenarios")
+    parser.add_argument("--endpoints", action="store_true", help="Also print API calls per endpoint")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --json file")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed latency/memory growth vs baseline (default: 0.5 = +50%%)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show scheduler logs")
+    args = parser.parse_args(argv)
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+        quiet = contextlib.nullcontext()
+    else:
+        # Scheduler logging and print() output would swamp the report
+        logging.getLogger("octopoid").setLevel(logging.CRITICAL + 1)
+        quiet = contextlib.redirect_stdout(io.StringIO())
+
+    config = BenchmarkConfig(
+        tasks=args.tasks,
+        blueprints=args.blueprints,
+        projects=args.projects,
+        max_instances=args.max_instances,
+        agent_sleep=args.agent_sleep,
+        sdk_cache_ttl=args.sdk_cache_ttl,
+    )
+    with quiet:
+        results = run_benchmarks(config, args.iterations, tuple(args.scenario or SCENARIOS))
+
+    print(f"workload: {config.tasks} tasks, {config.blueprints} blueprints "
+          f"x {config.max_instances} instances, {config.projects} projects, "
+          f"{args.iterations} iterations")
+    print(format_table(results))
+    if args.endpoints:
+        print()
+        print(format_endpoints(results))
+
+    summaries = [r.summary() for r in results]
+    if args.json:
+        args.json.write_text(json.dumps({"config": vars(config), "results": summaries}, indent=2) + "\n")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("config") != vars(config):
+            print(f"\nwarning: baseline workload differs: {baseline.get('config')}", file=sys.stderr)
+        regressions = compare_to_baseline(summaries, baseline.get("results", []), args.tolerance)
+        if regressions:
+            print("\nRegressions:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Task worktree backend benchmark.
+
+Usage:
+    python -m benchmarks.worktrees                        # default repo
+    python -m benchmarks.worktrees --files 20000 --dirs 50 --count 10
+    python -m benchmarks.worktrees --dir /mnt/btrfs/tmp   # measure on another filesystem
+    python -m benchmarks.worktrees --json worktrees.json
+
+Builds a synthetic repository with a bare origin, then creates --count task
+worktrees with each backend in octopoid/worktree_backend.py (git, reflink,
+sparse) and reports:
+
+    create ms   p50 / max time to create one worktree
+    du MiB      allocated size of all worktrees as du counts it (shared
+                reflink blocks are counted once per copy)
+    fs MiB      drop in free space on the filesystem, i.e. what the worktrees
+                really cost. Only meaningful on an otherwise idle filesystem.
+
+The reflink row falls back to sparse (and says so) when the filesystem cannot
+clone files. The sparse cone is the first --cone directories.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+BACKENDS = ("git", "reflink", "sparse")
+
+
+def _git(args: list[str], cwd: Path) -> None:
+    subprocess.run(["git"] + args, cwd=cwd, check=True, capture_output=True)
+
+
+def build_repo(root: Path, files: int, dirs: int, file_size: int) -> Path:
+    """Create a clone of a bare origin holding files spread over dirs."""
+    bare = root / "origin.git"
+    _git(["init", "--bare", "--initial-branch=main", str(bare)], cwd=root)
+    repo = root / "repo"
+    _git(["clone", str(bare), str(repo)], cwd=root)
+    _git(["config", "user.email", "bench@example.com"], cwd=repo)
+    _git(["config", "user.name", "Bench"], cwd=repo)
+    for i in range(files):
+        directory = repo / f"dir{i % dirs:03d}"
+        directory.mkdir(exist_ok=True)
+        # Distinct contents so git cannot dedupe the blobs
+        (directory / f"file{i:06d}.txt").write_bytes((f"{i}\n".encode() * file_size)[:file_size])
+    _git(["add", "."], cwd=repo)
+    _git(["commit", "-m", "bench"], cwd=repo)
+    _git(["push", "origin", "main"], cwd=repo)
+    return repo
+
+
+def _allocated_bytes(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, name)).st_blocks * 512
+            except OSError:
+                pass
+    return total
+
+
+def _free_bytes(path: Path) -> int:
+    st = os.statvfs(path)
+    return st.f_bavail * st.f_frsize
+
+
+def bench_backend(repo: Path, root: Path, backend: str, count: int, cone: list[str]) -> dict[str, Any]:
+    """Create count worktrees with one backend and measure them."""
+    from octopoid.worktree_backend import create_worktree
+
+    work = root / f"worktrees-{backend}"
+    pristine = root / f"pristine-{backend}"
+    work.mkdir()
+    timings: list[float] = []
+    used = set()
+    with patch("octopoid.worktree_backend.get_pristine_dir", return_value=pristine):
+        # The pristine checkout is a one-off cost, made before measuring
+        if backend == "reflink":
+            used.add(create_worktree(repo, work / "warmup", "origin/main", backend, cone))
+            _git(["worktree", "remove", "--force", str(work / "warmup")], cwd=repo)
+        os.sync()
+        free_before = _free_bytes(root)
+        for i in range(count):
+            start = time.perf_counter()
+            used.add(create_worktree(repo, work / f"task-{i}", "origin/main", backend, cone))
+            timings.append((time.perf_counter() - start) * 1000)
+        os.sync()
+        free_after = _free_bytes(root)
+
+    result = {
+        "backend": backend,
+        "used": "/".join(sorted(used)),
+        "create_ms_p50": round(statistics.median(timings), 1),
+        "create_ms_max": round(max(timings), 1),
+        "du_mib": round(_allocated_bytes(work) / 2**20, 1),
+        "fs_mib": round(max(0, free_before - free_after) / 2**20, 1),
+    }
+    for path in sorted(work.iterdir()):
+        _git(["worktree", "remove", "--force", str(path)], cwd=repo)
+    shutil.rmtree(work, ignore_errors=True)
+    return result
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    header = f"{'backend':<9} {'used':<9} {'create p50':>11} {'create max':>11} {'du MiB':>9} {'fs MiB':>9}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['backend']:<9} {r['used']:<9} {r['create_ms_p50']:>9.1f}ms {r['create_ms_max']:>9.1f}ms "
+            f"{r['du_mib']:>9.1f} {r['fs_mib']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark task worktree backends")
+    parser.add_argument("--files", type=int, default=5000, help="Files in the repository (default: 5000)")
+    parser.add_argument("--dirs", type=int, default=20, help="Top-level directories (default: 20)")
+    parser.add_argument("--file-size", type=int, default=4096, help="Bytes per file (default: 4096)")
+    parser.add_argument("--count", type=int, default=5, help="Worktrees per backend (default: 5)")
+    parser.add_argument("--cone", type=int, default=2, help="Directories in the sparse cone (default: 2)")
+    parser.add_argument("--backend", action="append", choices=BACKENDS, help="Run only these backends")
+    parser.add_argument("--dir", type=Path, help="Where to build the repository (default: system temp)")
+    parser.add_argument("--json", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    cone = [f"dir{i:03d}" for i in range(min(args.cone, args.dirs))]
+    with tempfile.TemporaryDirectory(prefix="octopoid-worktree-bench-", dir=args.dir) as tmp:
+        root = Path(tmp)
+        repo = build_repo(root, args.files, args.dirs, args.file_size)
+        results = [bench_backend(repo, root, b, args.count, cone) for b in args.backend or BACKENDS]
+
+    print(f"repo: {args.files} files x {args.file_size} B in {args.dirs} dirs, "
+          f"{args.count} worktrees per backend, sparse cone: {len(cone)} dirs")
+    print(format_table(results))
+    if args.json:
+        config = {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items()}
+        args.json.write_text(json.dumps({"config": config, "results": results}, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,10 +4,16 @@ The Python SDK (octopoid_sdk) is installed in editable mode from the main
 repo. This conftest ensures that when running tests from this worktree, the
 worktree's copy of packages/python-sdk is loaded first, so changes made here
 are picked up without reinstalling.
+
+It also keeps state that both test trees would otherwise share through
+.octopoid/runtime/ out of the working tree.
 """
 
 import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 # Prepend this worktree's python-sdk to sys.path so it shadows the editable
 # install from the main repo. We also remove any stale cached module so that
@@ -21,3 +27,17 @@ if _worktree_sdk not in sys.path:
 for _mod in list(sys.modules):
     if _mod == "octopoid_sdk" or _mod.startswith("octopoid_sdk."):
         del sys.modules[_mod]
+
+
+@pytest.fixture(autouse=True)
+def isolate_outcome_classifier(tmp_path_factory):
+    """Keep haiku answers and tier counts out of the working tree's runtime dir.
+
+    A cached answer from one test would otherwise replace another test's
+    mocked _call_haiku for the same tail.
+    """
+    state_dir = tmp_path_factory.mktemp("outcomes")
+    with patch("octopoid.outcome_classifier.get_cache_path", return_value=state_dir / "outcome_cache.json"), \
+         patch("octopoid.outcome_classifier.get_stats_path", return_value=state_dir / "outcome_stats.json"), \
+         patch.dict("octopoid.outcome_classifier._batch_answers", clear=True):
+        yield state_dir
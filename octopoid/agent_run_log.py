@@ -18,7 +18,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from .result_handler import extract_stdout_text
+from .log_tail import read_result
 
 
 # Max JSONL entries to keep per job (older entries are trimmed on write)
@@ -142,14 +142,11 @@ def _extract_summary(job_dir: Path | str) -> str | None:
         return None
 
     try:
-        content = stdout_log.read_text(errors="replace")
-        content = extract_stdout_text(content)
-        if not content.strip():
+        # Only the tail of stdout (or of its JSON result) is read
+        _, tail = read_result(stdout_log, max_chars=_STDOUT_TAIL_CHARS)
+        if not tail.strip():
             return None
 
-        # Take the tail of stdout
-        tail = content[-_STDOUT_TAIL_CHARS:]
-
         # Filter to non-empty lines and take the last 3
         lines = [line.strip() for line in tail.splitlines() if line.strip()]
         if not lines:
@@ -0,0 +1,140 @@
+"""Per-tick API call metrics for the scheduler.
+
+The SDK client counts every request it sends per endpoint (see
+``OctopoidSDK.stats()``). The scheduler captures those counters before a tick
+and hands them to record_tick() afterwards, which:
+
+- logs a one-line summary of the tick's API calls and the slowest endpoints;
+- appends the tick's per-endpoint figures to a rolling JSONL file
+  (.octopoid/runtime/logs/api_metrics.jsonl, rotated to .1 at 1 MB).
+
+top_endpoints() aggregates the recent ticks from that file for the health
+report, so the dashboard shows what the scheduler process actually called;
+format_endpoint() renders one of its entries for the status script.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("octopoid.scheduler")
+
+METRICS_FILENAME = "api_metrics.jsonl"
+MAX_METRICS_BYTES = 1024 * 1024  # Rotate to api_metrics.jsonl.1 past this size
+SUMMARY_TOP_N = 3  # Endpoints named in the per-tick log line
+
+
+def get_metrics_path() -> Path:
+    """Return the path of the rolling API metrics file."""
+    from .config import get_logs_dir
+    return get_logs_dir() / METRICS_FILENAME
+
+
+def capture() -> dict[str, dict[str, Any]]:
+    """Return the SDK's cumulative per-endpoint stats, or {} if unavailable."""
+    try:
+        from .sdk import get_sdk
+        stats = get_sdk().stats()
+    except Exception:
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+def record_tick(before: dict[str, dict[str, Any]], path: Path | None = None) -> dict[str, dict[str, Any]]:
+    """Log and persist the API calls made since ``before`` was captured.
+
+    Args:
+        before: Result of capture() taken at the start of the tick.
+        path: Metrics file to append to (defaults to get_metrics_path()).
+
+    Returns:
+        Per-endpoint figures for the tick (empty if no calls were made).
+    """
+    try:
+        from octopoid_sdk.metrics import diff_stats
+    except ImportError:
+        return {}
+
+    delta = diff_stats(before, capture())
+    if not delta:
+        return {}
+
+    logger.info(f"API: {summarize(delta)}")
+    try:
+        _append(path or get_metrics_path(), {"ts": datetime.now().isoformat(), "endpoints": delta})
+    except Exception as e:
+        logger.debug(f"Could not write API metrics: {e}")
+    return delta
+
+
+def summarize(delta: dict[str, dict[str, Any]], top_n: int = SUMMARY_TOP_N) -> str:
+    """Format a tick's per-endpoint figures as a single log line."""
+    calls = sum(e["calls"] for e in delta.values())
+    total_ms = sum(e["total_ms"] for e in delta.values())
+    errors = sum(e["errors"] for e in delta.values())
+    top = sorted(delta.items(), key=lambda item: item[1]["total_ms"], reverse=True)[:top_n]
+    top_str = ", ".join(f"{name} {e['calls']}x {e['total_ms']:.0f}ms" for name, e in top)
+    error_str = f", {errors} errors" if errors else ""
+    return f"{calls} calls, {total_ms:.0f}ms{error_str}; slowest: {top_str}"
+
+
+def format_endpoint(entry: dict[str, Any]) -> str:
+    """Format one top_endpoints() entry, e.g. ``GET /api/v1/tasks  6 calls, avg 50ms, total 300ms, 1 error``."""
+    errors = entry.get("errors", 0)
+    error_str = f", {errors} error{'s' if errors != 1 else ''}" if errors else ""
+    return (
+        f"{entry.get('endpoint', '?')}  {entry.get('calls', 0)} calls, "
+        f"avg {entry.get('avg_ms', 0):.0f}ms, total {entry.get('total_ms', 0):.0f}ms{error_str}"
+    )
+
+
+def _append(path: Path, record: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if path.stat().st_size > MAX_METRICS_BYTES:
+            path.replace(path.with_name(path.name + ".1"))
+    except FileNotFoundError:
+        pass
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def top_endpoints(limit: int = 5, ticks: int = 60, path: Path | None = None) -> list[dict[str, Any]]:
+    """Return the endpoints with the most total time over the last few ticks.
+
+    Args:
+        limit: Maximum endpoints to return.
+        ticks: Number of most recent ticks in the metrics file to aggregate.
+        path: Metrics file to read (defaults to get_metrics_path()).
+
+    Returns:
+        Dicts with endpoint, calls, errors, total_ms and avg_ms, slowest first.
+        Empty if no metrics have been recorded.
+    """
+    path = path or get_metrics_path()
+    try:
+        lines = path.read_text().splitlines()[-ticks:]
+    except (OSError, ValueError):
+        return []
+
+    totals: dict[str, dict[str, Any]] = {}
+    for line in lines:
+        try:
+            endpoints = json.loads(line).get("endpoints", {})
+        except (ValueError, AttributeError):
+            continue
+        for name, e in endpoints.items():
+            agg = totals.setdefault(name, {"endpoint": name, "calls": 0, "errors": 0, "total_ms": 0.0})
+            agg["calls"] += e.get("calls", 0)
+            agg["errors"] += e.get("errors", 0)
+            agg["total_ms"] += e.get("total_ms", 0.0)
+
+    result = sorted(totals.values(), key=lambda e: e["total_ms"], reverse=True)[:limit]
+    for e in result:
+        e["total_ms"] = round(e["total_ms"], 1)
+        e["avg_ms"] = round(e["total_ms"] / e["calls"], 1) if e["calls"] else 0.0
+    return result
@@ -2,12 +2,25 @@
 
 from typing import Any
 
-from .config import get_queue_limits
+from .config import get_queue_limits, get_scope
 
-def count_queue(subdir: str) -> int:
-    """Count tasks in a queue via API."""
+def count_queue(subdir: str, snapshot: Any = None) -> int:
+    """Count tasks in a queue via API.
+
+    Args:
+        subdir: Queue name.
+        snapshot: Optional TickSnapshot; when given, the queue is read from it
+            (listed at most once per tick) instead of a fresh API call. The same
+            client-side scope filter as list_tasks() is applied.
+    """
     from .tasks import list_tasks
     try:
+        if snapshot is not None:
+            tasks = snapshot.list_tasks(subdir)
+            scope = get_scope()
+            if scope:
+                tasks = [t for t in tasks if t.get("scope") == scope]
+            return len(tasks)
         tasks = list_tasks(subdir)
         return len(tasks)
     except Exception as e:
@@ -24,7 +37,7 @@ def can_create_task() -> tuple[bool, str]:
         return False, f"Queue full: {total_pending} pending tasks (limit: {limits['max_incoming']})"
     return True, ""
 
-def can_claim_task(queue_counts: dict | None = None) -> tuple[bool, str]:
+def can_claim_task(queue_counts: dict | None = None, snapshot: Any = None) -> tuple[bool, str]:
     """Check if a task can be claimed (backpressure check).
 
     Args:
@@ -35,6 +48,8 @@ def can_claim_task(queue_counts: dict | None = None) -> tuple[bool, str]:
             using it for the 'claimed' limit check can block a scope when
             another scope has tasks claimed.
             If None, falls back to individual count_queue() calls for all queues.
+        snapshot: Optional TickSnapshot passed through to count_queue() so the
+            'claimed' list is shared with the lease jobs in the same tick.
     """
     limits = get_queue_limits()
     if queue_counts is not None:
@@ -43,13 +58,13 @@ def can_claim_task(queue_counts: dict | None = None) -> tuple[bool, str]:
         # Always fetch claimed via count_queue() for scope-filtered results.
         # The poll endpoint may return unscoped counts; using it for the
         # max_claimed check causes cross-scope capacity blocking (GH-227).
-        claimed = count_queue("claimed")
+        claimed = count_queue("claimed", snapshot=snapshot)
     else:
-        incoming = count_queue("incoming")
+        incoming = count_queue("incoming", snapshot=snapshot)
         if incoming == 0:
             return False, "No tasks in incoming queue"
-        claimed = count_queue("claimed")
-        provisional = count_queue("provisional")
+        claimed = count_queue("claimed", snapshot=snapshot)
+        provisional = count_queue("provisional", snapshot=snapshot)
 
     if incoming == 0:
         return False, "No tasks in incoming queue"
@@ -59,15 +74,30 @@ def can_claim_task(queue_counts: dict | None = None) -> tuple[bool, str]:
         return False, f"Too many provisional tasks: {provisional} (limit: {limits['max_provisional']})"
     return True, ""
 
+def claim_headroom(snapshot: Any = None) -> int:
+    """Number of tasks that can still be claimed before max_claimed is reached.
+
+    Args:
+        snapshot: Optional TickSnapshot passed through to count_queue().
+    """
+    return max(0, get_queue_limits()["max_claimed"] - count_queue("claimed", snapshot=snapshot))
+
+# Task columns shown in the queue status listing
+_STATUS_FIELDS = ("id", "title", "role", "queue", "claimed_by", "project_id", "blocked_by")
+
 def get_queue_status() -> dict[str, Any]:
-    """Get overall queue status for monitoring."""
+    """Get overall queue status for monitoring.
+
+    Only the listing columns are requested, so large done/rejected queues
+    do not transfer full task records just to be counted.
+    """
     from .tasks import list_tasks
     from .projects import list_projects
     queues = ["incoming", "claimed", "needs_continuation", "done", "failed", "rejected",
               "breakdown", "provisional", "escalated"]
     result = {}
     for q in queues:
-        tasks = list_tasks(q)
+        tasks = list_tasks(q, fields=_STATUS_FIELDS)
         result[q] = {"count": len(tasks), "tasks": tasks[-10:] if q in ("done", "rejected") else tasks}
     result["limits"] = get_queue_limits()
     result["provisional"] = count_queue("provisional")
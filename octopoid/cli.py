@@ -6,6 +6,7 @@ from pathlib import Path
 
 from .config import get_tasks_dir
 from .queue_utils import get_sdk
+from .status_api import try_query
 
 
 def _fmt_table(rows: list[list[str]], headers: list[str]) -> str:
@@ -27,11 +28,14 @@ def _fmt_table(rows: list[list[str]], headers: list[str]) -> str:
 
 def cmd_tasks(args: argparse.Namespace) -> None:
     """List tasks in a table."""
-    sdk = get_sdk()
-    params = {}
-    if args.queue:
-        params["queue"] = args.queue
-    tasks = sdk.tasks.list(**params)
+    # Served by the scheduler daemon's task mirror when it is running
+    tasks = try_query("tasks", queue=args.queue)
+    if tasks is None:
+        sdk = get_sdk()
+        params = {}
+        if args.queue:
+            params["queue"] = args.queue
+        tasks = sdk.tasks.list(**params)
 
     if not tasks:
         print("No tasks found.")
@@ -225,7 +229,7 @@ def cmd_trigger_agent(args: argparse.Namespace) -> None:
 def cmd_sync_flows(args: argparse.Namespace) -> None:
     """Read all .octopoid/flows/*.yaml and register them on the server."""
     from .config import get_orchestrator_dir
-    from .flow import Flow, flow_to_server_registration
+    from .flow import Flow, flow_to_server_registration, invalidate_flow_cache
 
     flows_dir = get_orchestrator_dir() / "flows"
     if not flows_dir.exists():
@@ -258,6 +262,7 @@ def cmd_sync_flows(args: argparse.Namespace) -> None:
             print(f"  Failed '{yaml_file.stem}': {e}", file=sys.stderr)
             failed += 1
 
+    invalidate_flow_cache()
     print(f"\n{registered} flow(s) registered" + (f", {failed} failed" if failed else ""))
     if failed:
         sys.exit(1)
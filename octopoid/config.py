@@ -1,6 +1,8 @@
 """Configuration loading and constants for the orchestrator."""
 
+import copy
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +31,47 @@ TERMINAL_QUEUES: list[str] = ["done", "failed", "rejected", "escalated", "recycl
 # No hardcoded role lists — the server is the source of truth for valid roles.
 
 
+# ---------------------------------------------------------------------------
+# Parsed YAML cache
+# ---------------------------------------------------------------------------
+
+# Parsed config files (agents.yaml, agent.yaml, config.yaml, jobs.yaml) keyed by
+# path, valid while the file's (mtime_ns, size) is unchanged. The scheduler reads
+# these on every guard evaluation and claim; edits still take effect on the
+# next read.
+_yaml_cache: dict[str, tuple[tuple[int, int], Any]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def read_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Returns a deep copy, so callers may mutate the result freely.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    st = path.stat()
+    key = str(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+
+    with open(path) as f:
+        data = yaml.safe_load(f)
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (signature, data)
+    return copy.deepcopy(data)
+
+
+def invalidate_config_cache() -> None:
+    """Drop every cached config file so the next read re-parses from disk."""
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+
+
 # Port allocation
 BASE_PORT = 41000
 PORT_STRIDE = 10
@@ -109,14 +152,34 @@ def get_base_branch() -> str:
     try:
         config_path = find_parent_project() / ".octopoid" / "config.yaml"
         if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
+            config = read_yaml_cached(config_path) or {}
             return config.get("repo", {}).get("base_branch", "main")
     except Exception:
         pass
     return "main"
 
 
+DEFAULT_FETCH_TTL_SECONDS = 30.0
+
+
+def get_fetch_ttl() -> float:
+    """Get how long a ``git fetch origin`` counts as fresh, in seconds.
+
+    Reads ``repo.fetch_ttl`` from .octopoid/config.yaml. Fetches through
+    git_fetch.fetch_origin() within this window are reused instead of run
+    again. 0 makes every fetch run.
+    """
+    try:
+        config_path = find_parent_project() / ".octopoid" / "config.yaml"
+        if config_path.exists():
+            config = read_yaml_cached(config_path) or {}
+            ttl = (config.get("repo") or {}).get("fetch_ttl")
+            if ttl is not None:
+                return max(0.0, float(ttl))
+    except Exception:
+        pass
+    return DEFAULT_FETCH_TTL_SECONDS
+
 
 def get_proposals_dir() -> Path:
     """Get the shared proposals directory."""
@@ -192,10 +255,7 @@ def load_agents_config() -> dict[str, Any]:
             "Run 'python orchestrator/orchestrator/init.py' to initialize."
         )
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f) or {}
-
-    return config
+    return read_yaml_cached(config_path) or {}
 
 
 def get_queue_limits() -> dict[str, int]:
@@ -275,8 +335,7 @@ def discover_agent_config(agent_dir: Path) -> dict[str, Any] | None:
     if not agent_yaml_path.exists():
         return None
 
-    with open(agent_yaml_path) as f:
-        config = yaml.safe_load(f) or {}
+    config = read_yaml_cached(agent_yaml_path) or {}
 
     blueprint_name = agent_dir.name
     config.setdefault("name", blueprint_name)
@@ -363,8 +422,7 @@ def get_agents() -> list[dict[str, Any]]:
             type_defaults: dict[str, Any] = {}
             agent_yaml = agent_dir / "agent.yaml"
             if agent_yaml.exists():
-                with open(agent_yaml) as f:
-                    type_defaults = yaml.safe_load(f) or {}
+                type_defaults = read_yaml_cached(agent_yaml) or {}
             merged = {**type_defaults, **entry}
             merged["agent_dir"] = str(agent_dir)
         else:
@@ -508,8 +566,7 @@ def _load_project_config() -> dict[str, Any]:
         config_path = find_parent_project() / ".octopoid" / "config.yaml"
         if not config_path.exists():
             return {}
-        with open(config_path) as f:
-            return yaml.safe_load(f) or {}
+        return read_yaml_cached(config_path) or {}
     except (RuntimeError, IOError):
         return {}
 
@@ -555,3 +612,129 @@ def get_hooks_config() -> dict[str, list[str]]:
     if hooks and isinstance(hooks, dict):
         return hooks
     return DEFAULT_HOOKS_CONFIG.copy()
+
+
+# =============================================================================
+# Scheduler Configuration
+# =============================================================================
+
+# Default scheduler tuning when nothing is configured
+DEFAULT_SCHEDULER_CONFIG: dict[str, Any] = {
+    "parallel_evaluation": False,
+    "max_workers": 4,
+    # Max concurrent operations per shared resource during parallel evaluation.
+    # git defaults to 1: concurrent fetches / worktree adds on one repo race on ref locks.
+    "resource_limits": {"git": 1, "api": 4},
+    # Daemon threads handling finished agents' results (0 handles them inline in the tick)
+    "result_workers": 2,
+}
+
+
+def get_scheduler_config() -> dict[str, Any]:
+    """Get scheduler tuning from the ``scheduler:`` key of .octopoid/config.yaml.
+
+    Example::
+
+        scheduler:
+          parallel_evaluation: true
+          max_workers: 6
+          resource_limits:
+            git: 2
+            api: 4
+          result_workers: 2
+
+    Returns:
+        Dict with parallel_evaluation, max_workers, resource_limits and
+        result_workers, with missing keys filled from DEFAULT_SCHEDULER_CONFIG.
+    """
+    config = _load_project_config().get("scheduler") or {}
+    if not isinstance(config, dict):
+        config = {}
+    limits = dict(DEFAULT_SCHEDULER_CONFIG["resource_limits"])
+    limits.update(config.get("resource_limits") or {})
+    return {
+        "parallel_evaluation": bool(config.get("parallel_evaluation", DEFAULT_SCHEDULER_CONFIG["parallel_evaluation"])),
+        "max_workers": max(1, int(config.get("max_workers", DEFAULT_SCHEDULER_CONFIG["max_workers"]))),
+        "resource_limits": limits,
+        "result_workers": max(0, int(config.get("result_workers", DEFAULT_SCHEDULER_CONFIG["result_workers"]))),
+    }
+
+
+# =============================================================================
+# Worktree Pool Configuration
+# =============================================================================
+
+# Pre-created task worktrees are disabled unless a pool size is configured
+DEFAULT_WORKTREE_POOL_CONFIG: dict[str, Any] = {
+    "size": 0,
+    "branches": [],
+}
+
+
+def get_worktree_pool_config() -> dict[str, Any]:
+    """Get the warm worktree pool settings from the ``worktree_pool:`` key.
+
+    Example::
+
+        worktree_pool:
+          size: 2            # ready worktrees kept per branch
+          branches: [main]   # defaults to repo.base_branch
+
+    Returns:
+        Dict with size (0 disables the pool) and branches, with missing keys
+        filled from DEFAULT_WORKTREE_POOL_CONFIG.
+    """
+    config = _load_project_config().get("worktree_pool") or {}
+    if not isinstance(config, dict):
+        config = {}
+    branches = config.get("branches") or [get_base_branch()]
+    if isinstance(branches, str):
+        branches = [branches]
+    return {
+        "size": max(0, int(config.get("size", DEFAULT_WORKTREE_POOL_CONFIG["size"]))),
+        "branches": [str(b) for b in branches],
+    }
+
+
+# =============================================================================
+# Worktree Backend Configuration
+# =============================================================================
+
+WORKTREE_BACKENDS = ("git", "reflink", "sparse")
+
+DEFAULT_WORKTREE_BACKEND_CONFIG: dict[str, Any] = {
+    "type": "git",
+    "sparse_cone": [],
+}
+
+
+def get_worktree_backend_config() -> dict[str, Any]:
+    """Get how task worktrees are created, from the ``worktree_backend:`` key.
+
+    Example::
+
+        worktree_backend:
+          type: reflink              # git (default), reflink or sparse
+          sparse_cone: [src, docs]   # directories for sparse checkouts
+
+    ``reflink`` copies a pristine checkout with ``cp --reflink`` and falls
+    back to ``sparse`` when the filesystem cannot clone files. ``sparse``
+    without a cone is a full checkout. An unknown type is treated as ``git``.
+
+    Returns:
+        Dict with type and sparse_cone, with missing keys filled from
+        DEFAULT_WORKTREE_BACKEND_CONFIG.
+    """
+    config = _load_project_config().get("worktree_backend") or {}
+    if isinstance(config, str):
+        config = {"type": config}
+    if not isinstance(config, dict):
+        config = {}
+    backend = str(config.get("type", DEFAULT_WORKTREE_BACKEND_CONFIG["type"]))
+    cone = config.get("sparse_cone") or []
+    if isinstance(cone, str):
+        cone = [cone]
+    return {
+        "type": backend if backend in WORKTREE_BACKENDS else "git",
+        "sparse_cone": [str(d).strip("/") for d in cone],
+    }
@@ -0,0 +1,172 @@
+"""Event-driven detection of agent process exits.
+
+In daemon mode the scheduler outlives the agents it spawns, so instead of
+waiting for the next check_and_update_finished_agents sweep (every 10s) it can
+be woken the moment an agent exits. invoke_claude() registers every PID it
+spawns with the installed ExitWatcher; the daemon blocks on ExitWatcher.wait()
+between ticks and hands exited PIDs straight to result handling.
+
+Each PID is watched with a pidfd (Linux 5.3+, Python 3.9+), which becomes
+readable when the process exits and works for non-child processes too (e.g.
+agents spawned by a previous scheduler process). Where pidfd_open is not
+available the PID is polled instead: waitpid(WNOHANG) for our own children,
+/proc (os.kill probe) for anything else.
+
+Exited children are reaped here. Without that, an agent spawned by the daemon
+lingers as a zombie and os.kill(pid, 0) keeps reporting it as running.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import selectors
+import threading
+import time
+
+from .state_utils import is_process_running
+
+logger = logging.getLogger("octopoid.scheduler")
+
+POLL_INTERVAL_SECONDS = 0.5  # Fallback polling interval when pidfd is unavailable
+
+
+class ExitWatcher:
+    """Watch a set of PIDs and report them once they exit.
+
+    Each watched PID is reported by wait() exactly once, after which it is no
+    longer watched.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.poll_interval = poll_interval
+        self._selector = selectors.DefaultSelector()
+        self._pidfds: dict[int, int] = {}  # pid -> pidfd
+        self._polled: set[int] = set()
+        self._exited: list[int] = []
+        self._lock = threading.Lock()
+
+    def watch(self, pid: int) -> None:
+        """Start watching a PID. Watching an already-watched PID is a no-op."""
+        with self._lock:
+            if pid in self._pidfds or pid in self._polled or pid in self._exited:
+                return
+            pidfd_open = getattr(os, "pidfd_open", None)
+            if pidfd_open is not None:
+                try:
+                    fd = pidfd_open(pid)
+                except ProcessLookupError:
+                    self._exited.append(pid)
+                    return
+                except OSError as e:
+                    logger.debug(f"pidfd_open({pid}) failed, falling back to polling: {e}")
+                else:
+                    self._pidfds[pid] = fd
+                    self._selector.register(fd, selectors.EVENT_READ, pid)
+                    return
+            self._polled.add(pid)
+
+    def watched(self) -> set[int]:
+        """Return the PIDs currently being watched."""
+        with self._lock:
+            return set(self._pidfds) | self._polled | set(self._exited)
+
+    def wait(self, timeout: float) -> list[int]:
+        """Block until at least one watched PID exits, or timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait. 0 checks without blocking.
+
+        Returns:
+            PIDs that exited (reaped if they were our children). Empty on timeout.
+        """
+        deadline = time.monotonic() + max(timeout, 0.0)
+        exited = self._collect(0.0)
+        while not exited:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._polled:
+                remaining = min(remaining, self.poll_interval)
+            exited = self._collect(remaining)
+        return exited
+
+    def close(self) -> None:
+        """Stop watching everything and release the pidfds."""
+        with self._lock:
+            for fd in self._pidfds.values():
+                self._selector.unregister(fd)
+                os.close(fd)
+            self._pidfds.clear()
+            self._polled.clear()
+            self._exited.clear()
+            self._selector.close()
+
+    def _collect(self, timeout: float) -> list[int]:
+        if self._pidfds:
+            ready = self._selector.select(timeout)
+        else:
+            if timeout > 0:
+                time.sleep(timeout)
+            ready = []
+
+        with self._lock:
+            exited, self._exited = self._exited, []
+            for key, _events in ready:
+                pid = key.data
+                fd = self._pidfds.pop(pid, None)
+                if fd is None:
+                    continue
+                self._selector.unregister(fd)
+                os.close(fd)
+                exited.append(pid)
+            for pid in list(self._polled):
+                if _has_exited(pid):
+                    self._polled.discard(pid)
+                    exited.append(pid)
+
+        for pid in exited:
+            _has_exited(pid)  # reap children reported via pidfd
+        return exited
+
+
+def _has_exited(pid: int) -> bool:
+    """Return True if pid has exited, reaping it if it is our child."""
+    try:
+        waited, _status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return not is_process_running(pid)
+    return waited == pid
+
+
+# ---------------------------------------------------------------------------
+# Process-wide watcher (installed by the scheduler daemon)
+# ---------------------------------------------------------------------------
+
+_watcher: ExitWatcher | None = None
+
+
+def install_exit_watcher() -> ExitWatcher:
+    """Create the process-wide watcher that watch_pid() registers with."""
+    global _watcher
+    if _watcher is None:
+        _watcher = ExitWatcher()
+    return _watcher
+
+
+def uninstall_exit_watcher() -> None:
+    """Close and remove the process-wide watcher, if any."""
+    global _watcher
+    if _watcher is not None:
+        _watcher.close()
+        _watcher = None
+
+
+def watch_pid(pid: int) -> None:
+    """Watch a newly spawned agent PID. No-op unless a watcher is installed.
+
+    One-shot scheduler runs exit right after spawning, so they never install
+    a watcher; their agents are picked up by the periodic sweep.
+    """
+    if _watcher is not None:
+        _watcher.watch(pid)
@@ -7,9 +7,12 @@ Flow files are YAML stored in .octopoid/flows/ and used as source files for
 `octopoid sync-flows`. At runtime, flows are read from the server via the SDK.
 """
 
+import hashlib
 import json
 import logging
 import subprocess
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -153,6 +156,8 @@ class Transition:
     conditions: list[Condition] = field(default_factory=list)  # Gates that must pass
     checks: list[str] = field(default_factory=list)  # Async checks polled before conditions
     on_checks_fail: str | None = None  # State to move to if any check fails
+    # Step -> steps it waits for; unlisted steps wait for the step before them in runs
+    after: dict[str, list[str]] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, key: str, data: dict[str, Any]) -> "Transition":
@@ -183,6 +188,7 @@ class Transition:
             conditions=conditions,
             checks=data.get("checks", []),
             on_checks_fail=data.get("on_checks_fail"),
+            after=_parse_after(data.get("after")),
         )
 
     def validate(self, flow_name: str, valid_states: set[str]) -> list[str]:
@@ -224,6 +230,9 @@ class Transition:
         # Note: We can't validate scripts exist here because we don't know which
         # agent they belong to. Script validation happens at runtime.
 
+        # Validate step dependencies
+        errors.extend(self._validate_after(flow_name, transition_key))
+
         # Validate on_checks_fail target
         if self.on_checks_fail and self.on_checks_fail not in valid_states:
             errors.append(
@@ -244,6 +253,33 @@ class Transition:
 
         return errors
 
+    def _validate_after(self, flow_name: str, transition_key: str) -> list[str]:
+        from .steps import step_dependencies
+
+        prefix = f"Flow '{flow_name}' transition '{transition_key}'"
+        errors = []
+        for step, waits in self.after.items():
+            if step not in self.runs:
+                errors.append(f"{prefix}: after: step '{step}' is not in runs")
+            for dependency in waits:
+                if dependency not in self.runs:
+                    errors.append(f"{prefix}: after: '{step}' waits for '{dependency}', which is not in runs")
+        try:
+            step_dependencies(self.runs, self.after)
+        except ValueError as e:
+            errors.append(f"{prefix}: {e}")
+        return errors
+
+
+def _parse_after(data: Any) -> dict[str, list[str]]:
+    """Normalize a transition's ``after:`` mapping; a single step may be given as a string."""
+    if not isinstance(data, dict):
+        return {}
+    return {
+        str(step): [waits] if isinstance(waits, str) else [str(w) for w in waits or []]
+        for step, waits in data.items()
+    }
+
 
 _REQUIRED_TERMINAL_STEPS = ["rebase_on_base", "merge_pr"]
 
@@ -271,6 +307,11 @@ class Flow:
     description: str
     transitions: list[Transition]
     child_flow: "Flow | None" = None  # For projects: flow applied to child tasks
+    # state -> transitions from that state, built on first lookup (see get_transitions_from)
+    _by_state: dict[str, list[Transition]] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Flow":
@@ -312,8 +353,8 @@ class Flow:
 
         Handles JSON-encoded strings for states and transitions, and supports
         both 'from_state'/'to_state' and 'from'/'to' key names in transitions.
-        Full transition detail (agent, runs, conditions) is preserved when
-        present (stored by sync-flows).
+        Full transition detail (agent, runs, after, conditions) is preserved
+        when present (stored by sync-flows).
 
         Args:
             data: Flow dict from the server, with keys 'name', 'transitions', etc.
@@ -351,6 +392,7 @@ class Flow:
                 conditions=conditions,
                 checks=t.get("checks", []),
                 on_checks_fail=t.get("on_checks_fail"),
+                after=_parse_after(t.get("after")),
             ))
 
         _inject_terminal_steps(transitions)
@@ -397,8 +439,23 @@ class Flow:
         return states
 
     def get_transitions_from(self, state: str) -> list[Transition]:
-        """Get all transitions starting from a given state."""
-        return [t for t in self.transitions if t.from_state == state]
+        """Get all transitions starting from a given state.
+
+        Uses a state -> [Transition] index compiled on first call (and rebuilt
+        if transitions are appended afterwards), so repeated lookups on a
+        cached flow do not rescan the transition list.
+        """
+        if self._by_state is None or self._indexed_count != len(self.transitions):
+            self.compile()
+        return list(self._by_state.get(state, ()))  # type: ignore[union-attr]
+
+    def compile(self) -> None:
+        """(Re)build the state -> transitions index, preserving declaration order."""
+        index: dict[str, list[Transition]] = {}
+        for t in self.transitions:
+            index.setdefault(t.from_state, []).append(t)
+        self._by_state = index
+        self._indexed_count = len(self.transitions)
 
     def validate(self) -> list[str]:
         """Validate this flow.
@@ -444,9 +501,107 @@ class Flow:
         return errors
 
 
+# Seconds a fetched flow list is trusted before load_flow() re-fetches it
+FLOW_CACHE_TTL_SECONDS = 60.0
+
+
+def _flow_content_hash(flow_data: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(flow_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class _FlowRegistry:
+    """Process-wide cache of the server's flows.
+
+    One sdk.flows.list() call populates every flow; entries are keyed by
+    name and content hash so a refresh only re-parses (and re-compiles)
+    flows whose definition actually changed. The cache is tied to the SDK
+    instance it was filled from, so reset_sdk() (new server or scope) starts
+    afresh.
+    """
+
+    def __init__(self, ttl: float = FLOW_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sdk: Any = None
+        self._fetched_at: float | None = None
+        self._flows: dict[str, tuple[str, Flow]] = {}
+        self.fetches = 0
+        self.hits = 0
+
+    def _is_fresh(self, sdk: Any) -> bool:
+        return (
+            self._sdk is sdk
+            and self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self.ttl
+        )
+
+    def _refresh(self, sdk: Any) -> None:
+        flows_raw = sdk.flows.list()
+        self.fetches += 1
+        previous = self._flows if self._sdk is sdk else {}
+        flows: dict[str, tuple[str, Flow]] = {}
+        for flow_data in flows_raw:
+            name = flow_data.get("name")
+            if not name:
+                continue
+            digest = _flow_content_hash(flow_data)
+            cached = previous.get(name)
+            if cached is not None and cached[0] == digest:
+                flows[name] = cached
+                continue
+            flow = Flow.from_server_dict(flow_data)
+            flow.compile()
+            flows[name] = (digest, flow)
+        self._sdk = sdk
+        self._flows = flows
+        self._fetched_at = time.monotonic()
+
+    def _ensure_fresh(self, sdk: Any) -> None:
+        if self._is_fresh(sdk):
+            self.hits += 1
+            return
+        self._refresh(sdk)
+
+    def get(self, sdk: Any, flow_name: str) -> Flow | None:
+        with self._lock:
+            self._ensure_fresh(sdk)
+            entry = self._flows.get(flow_name)
+        return entry[1] if entry else None
+
+    def names(self, sdk: Any) -> list[str]:
+        with self._lock:
+            self._ensure_fresh(sdk)
+            return list(self._flows)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._fetched_at = None
+
+
+_flow_registry = _FlowRegistry()
+
+
+def invalidate_flow_cache() -> None:
+    """Force the next load_flow()/list_flows() to re-fetch flows from the server.
+
+    Call after registering flows (e.g. sync-flows) so this process sees them
+    immediately rather than after FLOW_CACHE_TTL_SECONDS.
+    """
+    _flow_registry.invalidate()
+
+
+def flow_cache_stats() -> dict[str, int]:
+    """Return the flow cache's fetch and hit counters."""
+    return {"fetches": _flow_registry.fetches, "hits": _flow_registry.hits}
+
+
 def load_flow(flow_name: str) -> Flow:
     """Load a flow by name from the server.
 
+    Flows are served from a process-wide cache refreshed at most every
+    FLOW_CACHE_TTL_SECONDS, so many lookups in one tick cost one list call.
+    The returned Flow is shared; treat it as read-only.
+
     Args:
         flow_name: Name of the flow
 
@@ -461,16 +616,15 @@ def load_flow(flow_name: str) -> Flow:
 
     try:
         sdk = get_sdk()
-        flows = sdk.flows.list()
+        flow = _flow_registry.get(sdk, flow_name)
     except Exception as e:
         logging.error(f"load_flow: failed to reach server for flow '{flow_name}': {e}")
         raise
 
-    for flow_data in flows:
-        if flow_data.get("name") == flow_name:
-            return Flow.from_server_dict(flow_data)
+    if flow is not None:
+        return flow
 
-    available = [f.get("name") for f in flows if f.get("name")]
+    available = _flow_registry.names(sdk)
     raise FileNotFoundError(
         f"Flow '{flow_name}' not found on server. "
         f"Available flows: {available}"
@@ -483,8 +637,7 @@ def list_flows() -> list[str]:
 
     try:
         sdk = get_sdk()
-        flows = sdk.flows.list()
-        return [f.get("name") for f in flows if f.get("name")]
+        return _flow_registry.names(sdk)
     except Exception as e:
         logging.warning(f"list_flows: failed to fetch flows from server: {e}")
         return []
@@ -527,7 +680,7 @@ def generate_default_flow() -> str:
 
     The flow engine owns transitions — steps are pre-transition side effects.
     - incoming → claimed: implementer agent claims
-    - claimed → provisional: runs push_branch, run_tests, create_pr
+    - claimed → provisional: runs push_branch and run_tests side by side, then create_pr
     - provisional → done: CI checked first, then gatekeeper reviews, then merges
     """
     return """name: default
@@ -539,6 +692,10 @@ transitions:
 
   "claimed -> provisional":
     runs: [push_branch, run_tests, create_pr]
+    # Steps wait for the step before them unless listed here
+    after:
+      run_tests: []
+      create_pr: [push_branch, run_tests]
 
   "provisional -> done":
     checks: [check_ci]
@@ -617,7 +774,7 @@ def _serialize_condition(c: Condition) -> dict:
 
 
 def _serialize_transitions(transitions: list[Transition]) -> list[dict]:
-    """Serialize transitions including agent, runs, conditions, and checks."""
+    """Serialize transitions including agent, runs, after, conditions, and checks."""
     result = []
     for t in transitions:
         td: dict[str, Any] = {"from": t.from_state, "to": t.to_state}
@@ -631,6 +788,8 @@ def _serialize_transitions(transitions: list[Transition]) -> list[dict]:
             td["checks"] = t.checks
         if t.on_checks_fail:
             td["on_checks_fail"] = t.on_checks_fail
+        if t.after:
+            td["after"] = t.after
         result.append(td)
     return result
 
@@ -684,7 +843,7 @@ def flow_to_server_registration(flow: Flow) -> dict:
 
     Returns:
         Dict with 'states', 'transitions' (with full detail: agent, runs,
-        conditions), and optionally 'description' and 'child_flow'.
+        after, conditions), and optionally 'description' and 'child_flow'.
     """
     all_states = flow.get_all_states()
     if flow.child_flow:
@@ -0,0 +1,254 @@
+"""Long-lived git processes for hot read-only queries.
+
+Status pages and result handling ask every worktree the same small
+questions: which branch is checked out, what HEAD or a ref points at.
+Forking ``git rev-parse`` for each answer costs far more than the answer
+itself. Instead, each worktree gets one GitBatch:
+
+- ``git cat-file --batch-check`` resolves revisions (``HEAD``,
+  ``origin/main``, ``HEAD~1``) to object names over a pipe.
+- The current branch is read from the worktree's ``HEAD`` file directly.
+
+Commit counts (``A..B``) are not answered here. A walk ordered by committer
+date gives wrong counts when dates are skewed, so the callers run
+``git rev-list --count`` for them.
+
+The processes start on first use. They are restarted if they exit, stop
+answering, or the worktree is replaced under them. Every function returns
+None when it cannot answer (not a checkout, git missing), and the callers in
+git_utils and RepoManager fall back to running git as before.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import select
+import stat
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger("octopoid.scheduler")
+
+MAX_HELPERS = 32  # Worktrees with live processes; least recently used are closed
+READ_TIMEOUT_SECONDS = 10.0
+
+
+class GitBatchError(Exception):
+    """A batch process could not answer."""
+
+
+def _git_dir(worktree: Path) -> Path | None:
+    """Return the worktree's own git dir (where its HEAD lives), if any."""
+    dot_git = worktree / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if not dot_git.is_file():
+        return None
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:"):].strip())
+    if not git_dir.is_absolute():
+        git_dir = worktree / git_dir
+    return git_dir if git_dir.is_dir() else None
+
+
+def current_branch(worktree: Path | str) -> str | None:
+    """Branch checked out in worktree, like ``git rev-parse --abbrev-ref HEAD``.
+
+    Returns:
+        The branch name, "HEAD" when detached, or None if worktree is not a
+        checkout or HEAD cannot be read.
+    """
+    git_dir = _git_dir(Path(worktree))
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: "):
+        ref = head[len("ref: "):]
+        return ref[len("refs/heads/"):] if ref.startswith("refs/heads/") else ref
+    return "HEAD"
+
+
+class _Process:
+    """One ``git cat-file`` process with a timeout-aware reader."""
+
+    def __init__(self, worktree: Path, mode: str):
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", f"--{mode}"],
+            cwd=worktree,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self._buffer = bytearray()
+
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _fill(self) -> None:
+        ready, _, _ = select.select([self.proc.stdout], [], [], READ_TIMEOUT_SECONDS)
+        if not ready:
+            raise GitBatchError("git cat-file did not answer")
+        chunk = os.read(self.proc.stdout.fileno(), 65536)
+        if not chunk:
+            raise GitBatchError("git cat-file exited")
+        self._buffer.extend(chunk)
+
+    def send(self, line: str) -> None:
+        try:
+            self.proc.stdin.write(line.encode() + b"\n")
+            self.proc.stdin.flush()
+        except OSError as e:
+            raise GitBatchError(f"git cat-file is gone: {e}") from e
+
+    def read_line(self) -> str:
+        while b"\n" not in self._buffer:
+            self._fill()
+        line, _, rest = bytes(self._buffer).partition(b"\n")
+        self._buffer = bytearray(rest)
+        return line.decode(errors="replace")
+
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
+class GitBatch:
+    """Persistent ``git cat-file`` processes for one worktree."""
+
+    def __init__(self, worktree: Path):
+        self.worktree = worktree
+        self._lock = threading.Lock()
+        self._procs: dict[str, _Process] = {}
+        self._identity = self._worktree_identity()
+        self.restarts = 0
+
+    def _worktree_identity(self) -> tuple[int, int] | None:
+        try:
+            st = (self.worktree / ".git").stat()
+        except OSError:
+            return None
+        # A linked worktree's .git file is rewritten when the worktree is
+        # re-created; a .git directory changes ctime on every commit
+        return (st.st_ino, 0 if stat.S_ISDIR(st.st_mode) else st.st_ctime_ns)
+
+    def is_current(self) -> bool:
+        """False once the worktree was removed or re-created at the same path."""
+        identity = self._worktree_identity()
+        return identity is not None and identity == self._identity
+
+    def _drop(self, mode: str) -> None:
+        proc = self._procs.pop(mode, None)
+        if proc is not None:
+            proc.close()
+
+    def _ask(self, mode: str, line: str) -> tuple[str, _Process]:
+        """Send one request, restarting the process once if it fails."""
+        if "\n" in line:
+            raise GitBatchError("revision contains a newline")
+        failures = 0
+        while True:
+            proc = self._procs.get(mode)
+            if proc is not None and not proc.alive():
+                self._drop(mode)
+                proc = None
+                self.restarts += 1
+            if proc is None:
+                try:
+                    proc = self._procs[mode] = _Process(self.worktree, mode)
+                except OSError as e:
+                    raise GitBatchError(f"cannot start git cat-file: {e}") from e
+            try:
+                proc.send(line)
+                return proc.read_line(), proc
+            except GitBatchError as e:
+                self._drop(mode)
+                failures += 1
+                if failures > 1:
+                    raise
+                self.restarts += 1
+                logger.debug(f"Restarting git cat-file --{mode} in {self.worktree}: {e}")
+
+    def resolve(self, rev: str) -> str | None:
+        """Object name of rev, or None if it does not exist."""
+        with self._lock:
+            header, _ = self._ask("batch-check", rev)
+        parts = header.split()
+        if len(parts) == 3 and parts[1] in ("commit", "tree", "blob", "tag"):
+            return parts[0]
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            for proc in self._procs.values():
+                proc.close()
+            self._procs.clear()
+
+
+_helpers: OrderedDict[str, GitBatch] = OrderedDict()
+_helpers_lock = threading.Lock()
+
+
+def get_batch(worktree: Path | str) -> GitBatch | None:
+    """Return the GitBatch for worktree, or None if it is not a checkout."""
+    worktree = Path(worktree)
+    if _git_dir(worktree) is None:
+        return None
+    key = str(worktree.resolve())
+    with _helpers_lock:
+        helper = _helpers.get(key)
+        if helper is not None and not helper.is_current():
+            _helpers.pop(key).close()
+            helper = None
+        if helper is None:
+            helper = _helpers[key] = GitBatch(worktree)
+            while len(_helpers) > MAX_HELPERS:
+                _helpers.popitem(last=False)[1].close()
+        _helpers.move_to_end(key)
+        return helper
+
+
+def close_all() -> None:
+    """Stop every batch process."""
+    with _helpers_lock:
+        helpers = list(_helpers.values())
+        _helpers.clear()
+    for helper in helpers:
+        helper.close()
+
+
+atexit.register(close_all)
+
+
+def rev_parse(worktree: Path | str, rev: str) -> str | None:
+    """Object name of rev in worktree, like ``git rev-parse --verify rev``.
+
+    Returns None if rev does not exist or the helper cannot answer.
+    """
+    helper = get_batch(worktree)
+    if helper is None:
+        return None
+    try:
+        return helper.resolve(rev)
+    except GitBatchError as e:
+        logger.debug(f"git batch rev-parse {rev} in {worktree} failed: {e}")
+        return None
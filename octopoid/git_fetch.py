@@ -0,0 +1,201 @@
+"""Coalesced ``git fetch origin`` with a freshness TTL.
+
+Claiming a task, reusing a worktree, rebasing before merge and updating the
+changelog each fetch origin. In a busy tick these run back to back against
+the same repository, and each fetch takes seconds on a large repo. All of
+them go through fetch_origin() instead:
+
+- Fetches of one repository are serialized by a file lock in its common git
+  dir, so they are shared by every worktree and every process.
+- The outcome of each fetch is recorded next to the lock. A caller is
+  served from a recorded fetch that started less than ``max_age`` seconds
+  ago (``repo.fetch_ttl`` in config.yaml by default). A full fetch of the
+  remote also serves requests for a single branch.
+- Callers that were waiting on the lock while a fetch ran share its
+  outcome, including a failure, rather than fetching again.
+- ``max_age=0`` only accepts a fetch that started after the call. Steps
+  that rebase right before a merge use it.
+
+When the repository's git dir cannot be found from ``cwd`` (e.g. the path is
+not a checkout), the fetch simply runs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Callable
+
+from .lock_utils import locked
+
+logger = logging.getLogger("octopoid.scheduler")
+
+STATE_FILENAME = "octopoid-fetch.json"
+LOCK_FILENAME = "octopoid-fetch.lock"
+FETCH_TIMEOUT_SECONDS = 120
+
+Runner = Callable[[list[str]], subprocess.CompletedProcess]
+
+
+def _common_git_dir(cwd: Path) -> Path | None:
+    """Find the git dir shared by all worktrees of the checkout at cwd.
+
+    Reads ``.git`` directly rather than running git, so it costs no process.
+    """
+    dot_git = cwd / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if not dot_git.is_file():
+        return None
+    try:
+        content = dot_git.read_text().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = Path(content[len("gitdir:"):].strip())
+    if not git_dir.is_absolute():
+        git_dir = cwd / git_dir
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        try:
+            common = Path(commondir.read_text().strip())
+        except OSError:
+            return None
+        git_dir = common if common.is_absolute() else git_dir / common
+    return git_dir.resolve() if git_dir.is_dir() else None
+
+
+def _read_state(path: Path) -> dict:
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _write_state(path: Path, state: dict) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state))
+    tmp.replace(path)
+
+
+def _usable(record: dict | None, requested_at: float, max_age: float) -> bool:
+    """Whether a recorded fetch can answer a request made at requested_at.
+
+    It must have started within max_age of the request. A failed fetch only
+    counts for callers that were already waiting while it ran.
+    """
+    if not record:
+        return False
+    started_at = record.get("started_at", 0.0)
+    if started_at < requested_at - max_age:
+        return False
+    return record.get("returncode") == 0 or record.get("finished_at", 0.0) >= requested_at
+
+
+def _find_record(state: dict, keys: list[str], requested_at: float, max_age: float) -> dict | None:
+    for key in keys:
+        record = state.get(key)
+        if _usable(record, requested_at, max_age):
+            return record
+    return None
+
+
+def _completed(args: list[str], record: dict, check: bool) -> subprocess.CompletedProcess:
+    """Turn a recorded fetch into the result the caller would have got from git."""
+    cmd = ["git"] + args
+    if record.get("timed_out"):
+        raise subprocess.TimeoutExpired(cmd, record.get("timeout", FETCH_TIMEOUT_SECONDS))
+    returncode = record.get("returncode", 1)
+    stderr = record.get("stderr", "")
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, output="", stderr=stderr)
+    return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr=stderr)
+
+
+def _run(args: list[str], runner: Runner, timeout: float) -> dict:
+    started_at = time.time()
+    record: dict = {"started_at": started_at}
+    try:
+        result = runner(args)
+        record["returncode"] = result.returncode
+        record["stderr"] = (result.stderr or "")[-2000:]
+    except subprocess.CalledProcessError as e:
+        record["returncode"] = e.returncode
+        record["stderr"] = (e.stderr or "")[-2000:]
+    except subprocess.TimeoutExpired:
+        record["returncode"] = None
+        record["timed_out"] = True
+        record["timeout"] = timeout
+    record["finished_at"] = time.time()
+    return record
+
+
+def fetch_origin(
+    cwd: Path | str,
+    branch: str | None = None,
+    max_age: float | None = None,
+    check: bool = False,
+    runner: Runner | None = None,
+    remote: str = "origin",
+    timeout: float = FETCH_TIMEOUT_SECONDS,
+) -> subprocess.CompletedProcess:
+    """Fetch remote (or one branch of it) unless a recent fetch already did.
+
+    Args:
+        cwd: Any worktree of the repository.
+        branch: Fetch only this branch. None fetches the whole remote.
+        max_age: Seconds a previous fetch stays fresh. Defaults to
+            ``repo.fetch_ttl``; 0 requires a fetch that starts after this call.
+        check: Raise CalledProcessError if the fetch failed.
+        runner: Runs ``git <args>`` in cwd and returns the CompletedProcess.
+            Defaults to subprocess.run with timeout.
+        remote: Remote to fetch.
+        timeout: Timeout of the default runner, in seconds.
+
+    Returns:
+        CompletedProcess of the fetch that served the call. stdout is empty.
+
+    Raises:
+        subprocess.CalledProcessError: If check is set and the fetch failed.
+        subprocess.TimeoutExpired: If the fetch timed out.
+    """
+    cwd = Path(cwd)
+    args = ["fetch", remote] + ([branch] if branch else [])
+    if max_age is None:
+        from .config import get_fetch_ttl
+        max_age = get_fetch_ttl()
+    if runner is None:
+        def runner(git_args: list[str]) -> subprocess.CompletedProcess:
+            return subprocess.run(
+                ["git"] + git_args, cwd=cwd, capture_output=True, text=True, timeout=timeout,
+            )
+
+    requested_at = time.time()
+    common_dir = _common_git_dir(cwd)
+    if common_dir is None:
+        return _completed(args, _run(args, runner, timeout), check)
+
+    keys = [remote] + ([f"{remote} {branch}"] if branch else [])
+    state_path = common_dir / STATE_FILENAME
+    record = _find_record(_read_state(state_path), keys, requested_at, max_age)
+    if record is None:
+        with locked(common_dir / LOCK_FILENAME, blocking=True):
+            # Whoever held the lock may just have fetched for us
+            state = _read_state(state_path)
+            record = _find_record(state, keys, requested_at, max_age)
+            if record is None:
+                record = _run(args, runner, timeout)
+                state[keys[-1]] = record
+                try:
+                    _write_state(state_path, state)
+                except OSError as e:
+                    logger.debug(f"Could not record fetch in {state_path}: {e}")
+                return _completed(args, record, check)
+    logger.debug(f"Reused a recent fetch of {' '.join(args[1:])} in {cwd}")
+    return _completed(args, record, check)
@@ -5,7 +5,16 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
-from .config import find_parent_project, get_agents_runtime_dir, get_base_branch, get_tasks_dir
+from .config import (
+    find_parent_project,
+    get_agents_runtime_dir,
+    get_base_branch,
+    get_tasks_dir,
+    get_worktree_backend_config,
+    get_worktree_pool_config,
+)
+from .git_batch import current_branch, rev_parse
+from .git_fetch import fetch_origin
 
 
 def run_git(args: list[str], cwd: Path | str | None = None, check: bool = True) -> subprocess.CompletedProcess:
@@ -30,6 +39,40 @@ def run_git(args: list[str], cwd: Path | str | None = None, check: bool = True)
     )
 
 
+def _fetch_origin(cwd: Path, check: bool = False) -> subprocess.CompletedProcess:
+    """Fetch origin through the shared fetch coordinator (see git_fetch).
+
+    A fetch of the same repository within ``repo.fetch_ttl`` seconds is
+    reused instead of running again.
+    """
+    return fetch_origin(
+        cwd, check=check, runner=lambda args: run_git(args, cwd=cwd, check=False),
+    )
+
+
+def _current_ref(cwd: Path) -> str | None:
+    """``git rev-parse --abbrev-ref HEAD``, from the HEAD file when possible.
+
+    Returns the branch name, "HEAD" when detached, or None if git fails.
+    """
+    branch = current_branch(cwd)
+    if branch is not None:
+        return branch
+    result = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd, check=False)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _count_commits(cwd: Path, revision_range: str) -> int | None:
+    """``git rev-list --count A..B``. Returns None if the range is invalid."""
+    result = run_git(["rev-list", "--count", revision_range], cwd=cwd, check=False)
+    if result.returncode != 0:
+        return None
+    try:
+        return int(result.stdout.strip())
+    except ValueError:
+        return None
+
+
 def _add_detached_worktree(parent_repo: Path, worktree_path: Path, start_point: str) -> None:
     """Create a new worktree in detached HEAD state.
 
@@ -88,7 +131,7 @@ def ensure_worktree(agent_name: str, base_branch: str = "main") -> Path:
     if worktree_path.exists() and (worktree_path / ".git").exists():
         # Update existing worktree to latest origin/main
         try:
-            run_git(["fetch", "origin"], cwd=worktree_path)
+            _fetch_origin(worktree_path, check=True)
             # Reset to origin/main so the worktree isn't based on stale local main
             run_git(
                 ["checkout", "--detach", f"origin/{base_branch}"],
@@ -115,7 +158,7 @@ def ensure_worktree(agent_name: str, base_branch: str = "main") -> Path:
 
     # Fetch latest from origin first
     try:
-        run_git(["fetch", "origin"], cwd=parent_repo)
+        _fetch_origin(parent_repo, check=True)
     except subprocess.CalledProcessError:
         pass  # May fail if offline
 
@@ -258,36 +301,20 @@ def _reuse_existing_worktree(
             log_path.unlink()
 
     # Fetch latest from origin
-    run_git(["fetch", "origin"], cwd=parent_repo, check=False)
+    _fetch_origin(parent_repo)
 
     target_ref = f"origin/{base_branch}"
 
     # Check if worktree is on a named branch or detached HEAD
-    branch_result = run_git(
-        ["rev-parse", "--abbrev-ref", "HEAD"],
-        cwd=worktree_path,
-        check=False,
-    )
-    if branch_result.returncode != 0:
+    current_ref = _current_ref(worktree_path)
+    if current_ref is None:
         return
 
-    current_ref = branch_result.stdout.strip()
-
     if current_ref == "HEAD":
         # Detached HEAD — only update to latest origin/<base_branch> if the
         # agent made no commits on top (count commits not reachable from origin).
         # If the agent has commits, leave them; the agent or branch creation will rebase.
-        ahead_result = run_git(
-            ["rev-list", "--count", f"{target_ref}..HEAD"],
-            cwd=worktree_path,
-            check=False,
-        )
-        commits_ahead = 0
-        if ahead_result.returncode == 0:
-            try:
-                commits_ahead = int(ahead_result.stdout.strip())
-            except ValueError:
-                pass
+        commits_ahead = _count_commits(worktree_path, f"{target_ref}..HEAD") or 0
 
         if commits_ahead == 0:
             # No agent commits on detached HEAD — update to current origin/<base_branch>
@@ -365,34 +392,47 @@ def create_task_worktree(task: dict) -> Path:
     worktree_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Fetch latest from origin
-    run_git(["fetch", "origin"], cwd=parent_repo, check=False)
+    _fetch_origin(parent_repo)
 
     # Determine the correct base branch for this task
     base_branch = task.get("branch") or get_base_branch()
     start_point = f"origin/{base_branch}"
 
     # Verify start point exists, fall back to origin/main if not
-    verify = run_git(
-        ["rev-parse", "--verify", start_point],
-        cwd=parent_repo,
-        check=False,
-    )
-    if verify.returncode != 0:
-        start_point = "origin/main"
+    if rev_parse(parent_repo, start_point) is None:
+        verify = run_git(
+            ["rev-parse", "--verify", start_point],
+            cwd=parent_repo,
+            check=False,
+        )
+        if verify.returncode != 0:
+            start_point = "origin/main"
 
     # Always create worktrees as detached HEADs.
     # Agents will create the branch when they're ready to push.
-    _add_detached_worktree(parent_repo, worktree_path, start_point)
+    # A pre-created worktree from the pool (see worktree_pool.py) skips the
+    # full checkout; the pool is refilled in the background either way.
+    from . import worktree_pool
+    pool_config = get_worktree_pool_config()
+    taken = pool_config["size"] > 0 and worktree_pool.take(
+        parent_repo, [base_branch, *pool_config["branches"]], start_point, worktree_path,
+    )
+    if not taken:
+        backend = get_worktree_backend_config()
+        if backend["type"] == "git":
+            _add_detached_worktree(parent_repo, worktree_path, start_point)
+        else:
+            from .worktree_backend import create_worktree
+            create_worktree(
+                parent_repo, worktree_path, start_point, backend["type"], backend["sparse_cone"],
+            )
+    if pool_config["size"] > 0:
+        worktree_pool.replenish_async(parent_repo)
 
     # Safety check: assert the worktree is on detached HEAD.
     # If this fails, something in the worktree creation pipeline checked out a
     # named branch, violating the detached HEAD rule.
-    head_ref = run_git(
-        ["rev-parse", "--abbrev-ref", "HEAD"],
-        cwd=worktree_path,
-        check=False,
-    )
-    actual_ref = head_ref.stdout.strip()
+    actual_ref = _current_ref(worktree_path)
     assert actual_ref == "HEAD", (
         f"Worktree for task {task_id} must be on detached HEAD, "
         f"but is on branch '{actual_ref}'. "
@@ -430,24 +470,13 @@ def cleanup_task_worktree(task_id: str, push_commits: bool = True) -> bool:
         # Push unpushed commits if requested
         if push_commits:
             # Check if we're on a named branch (not detached HEAD)
-            branch_result = run_git(
-                ["rev-parse", "--abbrev-ref", "HEAD"],
-                cwd=worktree_path,
-                check=False,
-            )
-            if branch_result.returncode == 0 and branch_result.stdout.strip() != "HEAD":
+            branch_name = _current_ref(worktree_path)
+            if branch_name is not None and branch_name != "HEAD":
                 # We're on a named branch — check for unpushed commits using upstream
-                result = run_git(
-                    ["rev-list", "@{u}..HEAD", "--count"],
-                    cwd=worktree_path,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    unpushed_count = int(result.stdout.strip())
-                    if unpushed_count > 0:
-                        # Push explicitly with branch name for shared-branch projects
-                        branch_name = branch_result.stdout.strip()
-                        run_git(["push", "origin", f"HEAD:{branch_name}"], cwd=worktree_path, check=False)
+                unpushed_count = _count_commits(worktree_path, "@{u}..HEAD")
+                if unpushed_count:
+                    # Push explicitly with branch name for shared-branch projects
+                    run_git(["push", "origin", f"HEAD:{branch_name}"], cwd=worktree_path, check=False)
             # else: On detached HEAD, nothing to push (agent never created a branch)
 
         # Detach HEAD to free the branch for the next task
@@ -481,7 +510,7 @@ def create_feature_branch(
 
     # Fetch latest from origin and create branch from origin/main
     # (not local main, which may be behind if human hasn't run git pull)
-    run_git(["fetch", "origin"], cwd=worktree_path, check=False)
+    _fetch_origin(worktree_path)
 
     try:
         run_git(["checkout", "--detach", f"origin/{base_branch}"], cwd=worktree_path)
@@ -504,6 +533,9 @@ def get_current_branch(worktree_path: Path) -> str:
     Returns:
         Current branch name
     """
+    branch = current_branch(worktree_path)
+    if branch is not None:
+        return branch
     result = run_git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree_path)
     return result.stdout.strip()
 
@@ -552,16 +584,9 @@ def has_commits_ahead_of_base(worktree_path: Path, base_branch: str = "main") ->
         True if there are commits on current branch not in base
     """
     try:
-        result = run_git(
-            ["rev-list", "--count", f"{base_branch}..HEAD"],
-            cwd=worktree_path,
-            check=False,
-        )
-        if result.returncode != 0:
-            return False
-        count = int(result.stdout.strip())
-        return count > 0
-    except (ValueError, subprocess.CalledProcessError):
+        count = _count_commits(worktree_path, f"{base_branch}..HEAD")
+        return bool(count)
+    except subprocess.CalledProcessError:
         return False
 
 
@@ -813,7 +838,7 @@ def get_submodule_unpushed_commits(worktree_path: Path, submodule_name: str = "o
         return []
 
     # Fetch to make sure we have latest remote state
-    run_git(["fetch", "origin"], cwd=submodule_path, check=False)
+    _fetch_origin(submodule_path)
 
     # Get commits that are in HEAD but not in origin/main
     result = run_git(
@@ -961,6 +986,9 @@ def get_head_ref(worktree_path: Path) -> str:
     Returns:
         SHA of HEAD, or empty string on error
     """
+    sha = rev_parse(worktree_path, "HEAD")
+    if sha is not None:
+        return sha
     try:
         result = run_git(["rev-parse", "HEAD"], cwd=worktree_path, check=False)
         if result.returncode == 0:
@@ -1012,20 +1040,21 @@ def get_submodule_status(worktree_path: Path, submodule_name: str = "orchestrato
 
     # Get branch
     try:
-        branch_result = run_git(
-            ["rev-parse", "--abbrev-ref", "HEAD"], cwd=sub_path, check=False
-        )
-        branch = branch_result.stdout.strip() if branch_result.returncode == 0 else ""
+        branch = _current_ref(sub_path) or ""
     except (subprocess.SubprocessError, OSError):
         branch = ""
 
     if branch == "HEAD":
         # Detached HEAD
         try:
-            short_sha = run_git(
-                ["rev-parse", "--short", "HEAD"], cwd=sub_path, check=False
-            )
-            branch = f"DETACHED@{short_sha.stdout.strip()}" if short_sha.returncode == 0 else "DETACHED"
+            sha = rev_parse(sub_path, "HEAD")
+            if sha is not None:
+                branch = f"DETACHED@{sha[:7]}"
+            else:
+                short_sha = run_git(
+                    ["rev-parse", "--short", "HEAD"], cwd=sub_path, check=False
+                )
+                branch = f"DETACHED@{short_sha.stdout.strip()}" if short_sha.returncode == 0 else "DETACHED"
         except (subprocess.SubprocessError, OSError):
             branch = "DETACHED"
         warnings.append("submodule HEAD is detached")
@@ -1037,12 +1066,10 @@ def get_submodule_status(worktree_path: Path, submodule_name: str = "orchestrato
     # Count commits ahead of origin/<branch>
     remote_ref = f"origin/{branch}" if branch and not branch.startswith("DETACHED") else "origin/main"
     try:
-        ahead_result = run_git(
-            ["rev-list", "--count", f"{remote_ref}..HEAD"], cwd=sub_path, check=False
-        )
-        if ahead_result.returncode == 0:
-            result["commits_ahead"] = int(ahead_result.stdout.strip())
-    except (subprocess.SubprocessError, OSError, ValueError):
+        ahead = _count_commits(sub_path, f"{remote_ref}..HEAD")
+        if ahead is not None:
+            result["commits_ahead"] = ahead
+    except (subprocess.SubprocessError, OSError):
         pass
 
     # Recent commit log (up to 5)
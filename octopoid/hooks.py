@@ -74,13 +74,18 @@ def hook_rebase_on_base(ctx: HookContext) -> HookResult:
     aborts the rebase and returns FAILURE so the scheduler can requeue the
     task for re-implementation on a fresh base.
     """
+    from .git_fetch import fetch_origin
     from .git_utils import run_git
 
     base_branch = ctx.base_branch
     worktree = ctx.worktree
 
     try:
-        run_git(["fetch", "origin"], cwd=worktree)
+        # Runs right before merge: only a fetch started now is fresh enough
+        fetch_origin(
+            worktree, max_age=0, check=True,
+            runner=lambda args: run_git(args, cwd=worktree, check=False),
+        )
     except subprocess.CalledProcessError as e:
         return HookResult(
             status=HookStatus.FAILURE,
@@ -19,20 +19,24 @@ from .config import (
     get_tasks_dir,
 )
 from .git_utils import run_git
+from .lock_utils import locked
 from .pool import (
     find_pid_for_task,
     load_blueprint_pids,
     remove_pid_from_blueprint,
     save_blueprint_pids,
 )
+from .sdk import fan_out
 from .result_handler import (
     _get_circuit_breaker_threshold,
     handle_agent_result,
     handle_agent_result_via_flow,
     handle_fixer_result,
+    prefetch_outcomes,
 )
 from .state_utils import is_process_running
-from . import queue_utils
+from .tick_snapshot import TickSnapshot
+from . import queue_utils, result_queue, worktree_backend, worktree_pool
 
 logger = logging.getLogger("octopoid.scheduler")
 
@@ -88,18 +92,82 @@ def _log_pid_snapshot(agents_dir: Path) -> None:
         pass
 
 
-def check_and_update_finished_agents() -> None:
+def _dispatch_result(
+    blueprint_name: str,
+    claim_from: str,
+    task_id: str,
+    instance_name: str,
+    task_dir: Path,
+) -> bool:
+    """Run the result handler for a finished agent's task.
+
+    Returns:
+        True if the handler moved the task on, so its PID can be dropped.
+    """
+    if blueprint_name == "fixer" or claim_from == "intervention":
+        # Fixer agents use dedicated result handler
+        return handle_fixer_result(task_id, instance_name, task_dir)
+    if claim_from == "needs_continuation":
+        # Continuation agents use the same outcome dispatch as implementers
+        return handle_agent_result(task_id, instance_name, task_dir)
+    if claim_from != "incoming":
+        # Review agents (claim from provisional, etc.) use flow dispatch
+        return handle_agent_result_via_flow(task_id, instance_name, task_dir, expected_queue=claim_from)
+    # Implementers (claim from incoming) use outcome dispatch
+    return handle_agent_result(task_id, instance_name, task_dir)
+
+
+def _result_role(blueprint_name: str, claim_from: str) -> str:
+    """The agent_role _dispatch_result()'s handler classifies the outcome as."""
+    if blueprint_name == "fixer" or claim_from == "intervention":
+        return "fixer"
+    if claim_from in ("incoming", "needs_continuation"):
+        return "implement"
+    return "gatekeeper"
+
+
+def _prefetch_results(entries: list[dict]) -> None:
+    """Classify the outcomes of agents finishing together in shared haiku calls.
+
+    Args:
+        entries: Finished agents, with the blueprint, claim_from and
+            task_id keys of a result queue entry.
+    """
+    tasks_dir = get_tasks_dir()
+    prefetch_outcomes([
+        (entry["task_id"], tasks_dir / entry["task_id"], _result_role(entry["blueprint"], entry["claim_from"]))
+        for entry in entries
+        if entry.get("task_id")
+    ])
+
+
+def check_and_update_finished_agents(only_pids: set[int] | None = None) -> None:
     """Check for agents that have finished and update their state.
 
     Iterates blueprints via running_pids.json. For each dead PID, processes
-    the agent result and removes the PID from pool tracking.
+    the agent result and removes the PID from pool tracking. The outcomes of
+    all the agents found dead are classified together first (see
+    result_handler.prefetch_outcomes()).
+
+    When the scheduler daemon runs result workers (see result_queue.py), task
+    results are not handled here: dead PIDs are queued for the workers, and
+    PIDs whose queue entry is done are removed.
+
+    Args:
+        only_pids: If given, only these PIDs are considered (used by the
+            scheduler daemon when its exit watcher reports specific exits).
+            None sweeps every tracked PID.
     """
+    if only_pids is not None and not only_pids:
+        return
+
     agents_dir = get_agents_runtime_dir()
     if not agents_dir.exists():
         return
 
     # Snapshot current PIDs for diagnostics — helps trace orphan creation
-    _log_pid_snapshot(agents_dir)
+    if only_pids is None:
+        _log_pid_snapshot(agents_dir)
 
     # Pre-fetch agent configs to look up claim_from per blueprint
     try:
@@ -111,6 +179,12 @@ def check_and_update_finished_agents() -> None:
     except Exception:
         blueprint_configs = {}
 
+    workers = result_queue.get_result_workers()
+    queued = workers.queue.entries() if workers is not None else {}
+    tracked_keys: set[str] = set()
+
+    # Collect every dead PID first, so their outcomes can be classified together
+    finished: list[tuple[str, str, dict[int, dict], dict[int, dict]]] = []
     for agent_dir in agents_dir.iterdir():
         if not agent_dir.is_dir():
             continue
@@ -127,14 +201,28 @@ def check_and_update_finished_agents() -> None:
         dead_pids = {
             pid: info
             for pid, info in pids.items()
-            if not is_process_running(pid)
+            if (only_pids is None or pid in only_pids) and not is_process_running(pid)
         }
         if not dead_pids:
+            tracked_keys.update(result_queue.entry_key(blueprint_name, pid) for pid in pids)
             continue
 
         blueprint_config = blueprint_configs.get(blueprint_name, {})
         claim_from = blueprint_config.get("claim_from", "incoming")
+        finished.append((blueprint_name, claim_from, pids, dead_pids))
+
+    if workers is None:
+        # Result workers batch their own entries (see ResultWorkers' prepare)
+        try:
+            _prefetch_results([
+                {"blueprint": blueprint_name, "claim_from": claim_from, "task_id": info.get("task_id", "")}
+                for blueprint_name, claim_from, _, dead_pids in finished
+                for info in dead_pids.values()
+            ])
+        except Exception as e:
+            logger.warning(f"Batch outcome inference failed: {e}")
 
+    for blueprint_name, claim_from, pids, dead_pids in finished:
         for pid, info in dead_pids.items():
             instance_name = info.get("instance_name", blueprint_name)
             task_id = info.get("task_id", "")
@@ -142,41 +230,46 @@ def check_and_update_finished_agents() -> None:
 
             if task_id:
                 task_dir = get_tasks_dir() / task_id
-                if task_dir.exists():
-                    try:
-                        if blueprint_name == "fixer" or claim_from == "intervention":
-                            # Fixer agents use dedicated result handler
-                            transitioned = handle_fixer_result(task_id, instance_name, task_dir)
-                        elif claim_from == "needs_continuation":
-                            # Continuation agents use the same outcome dispatch as implementers
-                            transitioned = handle_agent_result(task_id, instance_name, task_dir)
-                        elif claim_from != "incoming":
-                            # Review agents (claim from provisional, etc.) use flow dispatch
-                            transitioned = handle_agent_result_via_flow(task_id, instance_name, task_dir, expected_queue=claim_from)
-                        else:
-                            # Implementers (claim from incoming) use outcome dispatch
-                            transitioned = handle_agent_result(task_id, instance_name, task_dir)
-                        # Only remove PID when the handler confirmed a state transition
-                        # (or the task is gone). If transitioned=False, the task was not
-                        # moved — keep the PID so the next tick retries.
-                        if transitioned:
-                            del pids[pid]
-                            logger.info(f"Instance {instance_name} (PID {pid}) finished")
-                        else:
-                            logger.debug(
-                                f"Instance {instance_name} (PID {pid}): handler returned False "
-                                f"(task not transitioned), keeping PID for retry"
-                            )
-                    except Exception as e:
-                        logger.error(
-                            f"Instance {instance_name} (PID {pid}) "
-                            f"result handling failed, will retry next tick: {e}"
-                        )
-                        # PID intentionally left in tracking for retry
-                else:
+                if not task_dir.exists():
                     # Task dir missing — clean up the PID
                     del pids[pid]
                     logger.info(f"Instance {instance_name} (PID {pid}) finished (no task dir)")
+                elif workers is not None:
+                    key = result_queue.entry_key(blueprint_name, pid)
+                    entry = queued.get(key)
+                    if entry is None:
+                        workers.queue.add(blueprint_name, pid, info, claim_from)
+                        logger.debug(f"Instance {instance_name} (PID {pid}): result queued")
+                    elif entry.get("status") == result_queue.DONE:
+                        del pids[pid]
+                        logger.info(f"Instance {instance_name} (PID {pid}) finished")
+                else:
+                    with locked(result_queue.task_lock_path(task_dir)) as acquired:
+                        if not acquired:
+                            logger.debug(
+                                f"Instance {instance_name} (PID {pid}): task {task_id} result is being "
+                                f"handled elsewhere, keeping PID"
+                            )
+                            continue
+                        try:
+                            transitioned = _dispatch_result(blueprint_name, claim_from, task_id, instance_name, task_dir)
+                            # Only remove PID when the handler confirmed a state transition
+                            # (or the task is gone). If transitioned=False, the task was not
+                            # moved — keep the PID so the next tick retries.
+                            if transitioned:
+                                del pids[pid]
+                                logger.info(f"Instance {instance_name} (PID {pid}) finished")
+                            else:
+                                logger.debug(
+                                    f"Instance {instance_name} (PID {pid}): handler returned False "
+                                    f"(task not transitioned), keeping PID for retry"
+                                )
+                        except Exception as e:
+                            logger.error(
+                                f"Instance {instance_name} (PID {pid}) "
+                                f"result handling failed, will retry next tick: {e}"
+                            )
+                            # PID intentionally left in tracking for retry
             else:
                 # No task ID — background agent job (e.g. codebase_analyst).
                 # Write a run log entry before removing the PID so the dashboard
@@ -196,6 +289,12 @@ def check_and_update_finished_agents() -> None:
                 logger.info(f"Instance {instance_name} (PID {pid}) finished (no task id)")
 
         save_blueprint_pids(blueprint_name, pids)
+        tracked_keys.update(result_queue.entry_key(blueprint_name, pid) for pid in pids)
+
+    if workers is not None:
+        # Entries of PIDs no longer tracked (reaped above, or removed elsewhere) are finished with
+        workers.queue.retain(tracked_keys)
+        workers.submit_pending()
 
 
 # =============================================================================
@@ -391,7 +490,7 @@ def _execute_project_flow_transition(sdk: object, project: dict, from_state: str
     defined or a condition failed).
     """
     from .flow import load_flow
-    from .steps import execute_steps
+    from .steps import execute_steps, transition_step_options
 
     project_id = project["id"]
     flow_name = project.get("flow", "project")
@@ -445,7 +544,7 @@ def _execute_project_flow_transition(sdk: object, project: dict, from_state: str
     # Execute pre-transition steps
     if transition.runs:
         logger.debug(f"Project {project_id}: executing steps {transition.runs}")
-        execute_steps(transition.runs, project, {}, parent_project_dir)
+        execute_steps(transition.runs, project, {}, parent_project_dir, **transition_step_options(transition))
 
     # Re-fetch project to pick up PR metadata stored by steps (e.g. create_project_pr)
     updated_project = sdk.projects.get(project_id) or project
@@ -479,6 +578,7 @@ def check_project_completion() -> None:
         if not projects:
             return
 
+        candidates = []
         for project in projects:
             project_id = project.get("id", "")
             project_status = project.get("status", "")
@@ -487,8 +587,18 @@ def check_project_completion() -> None:
             if project_status in ("review", "provisional", "completed", "done"):
                 logger.debug(f"check_project_completion: skipping {project_id} (status={project_status})")
                 continue
+            candidates.append(project)
 
-            tasks = sdk.projects.get_tasks(project_id)
+        # Fetch every project's children concurrently rather than one round trip each
+        children = _fan_out_calls(
+            sdk, lambda async_sdk, project: async_sdk.projects.get_tasks(project.get("id", "")), candidates,
+        )
+
+        for project, tasks in zip(candidates, children):
+            project_id = project.get("id", "")
+            if isinstance(tasks, Exception):
+                logger.debug(f"check_project_completion: failed to list tasks for {project_id}: {tasks}")
+                continue
 
             if not tasks:
                 continue
@@ -522,11 +632,40 @@ def check_project_completion() -> None:
         logger.debug(f"check_project_completion failed: {e}")
 
 
+def _fan_out_calls(sdk: object, call, items: list) -> list:
+    """Make one SDK call per item concurrently (see sdk.fan_out).
+
+    Falls back to calling them one after another when the installed SDK has
+    no async client.
+
+    Args:
+        sdk: Sync SDK to issue the calls through.
+        call: ``call(sdk, item)``; given the async SDK, it returns an awaitable.
+        items: Items to call for.
+
+    Returns:
+        One entry per item, in order: the call's result, or the exception it
+        raised.
+    """
+    try:
+        return fan_out(call, items, sdk=sdk)
+    except RuntimeError as e:
+        logger.debug(f"Concurrent SDK calls unavailable, calling sequentially: {e}")
+
+    outcomes: list = []
+    for item in items:
+        try:
+            outcomes.append(call(sdk, item))
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
 # =============================================================================
 # Lease Expiry, Registration, and Resource Cleanup
 # =============================================================================
 
-def check_and_requeue_expired_leases() -> None:
+def check_and_requeue_expired_leases(snapshot: TickSnapshot | None = None) -> None:
     """Requeue tasks whose lease has expired (orchestrator-side fallback).
 
     Handles two cases:
@@ -535,6 +674,10 @@ def check_and_requeue_expired_leases() -> None:
     - Tasks in 'provisional' queue with an active claim (claimed in-place by the
       gatekeeper via claim_for_review): claim fields are cleared, task stays in
       'provisional'.
+
+    Args:
+        snapshot: Tick snapshot to read queues from (and record updates into).
+            When None, queues are listed directly via the SDK.
     """
     try:
         sdk = queue_utils.get_sdk()
@@ -549,8 +692,12 @@ def check_and_requeue_expired_leases() -> None:
 
         threshold = _get_circuit_breaker_threshold()
 
+        requeues: dict[str, tuple[dict, str]] = {}  # task_id -> (updates, lease_expires_at)
         for queue_name, target_queue in queues_to_check.items():
-            tasks = sdk.tasks.list(queue=queue_name)
+            if snapshot is not None:
+                tasks = snapshot.list_tasks(queue_name)
+            else:
+                tasks = sdk.tasks.list(queue=queue_name)
             for task in tasks or []:
                 # For provisional queue, skip tasks with neither a claimer nor a
                 # stale lease — these are normal un-reviewed tasks needing no action.
@@ -602,10 +749,11 @@ def check_and_requeue_expired_leases() -> None:
                                     attempt_count=new_attempt_count,
                                 )
                                 logger.debug(f"Circuit breaker tripped for {task_id}: {reason}")
+                                if snapshot is not None:
+                                    snapshot.record_update(task_id, queue="failed")
                                 continue
 
-                            sdk.tasks.update(
-                                task_id,
+                            updates = dict(
                                 queue=target_queue,
                                 claimed_by=None,
                                 lease_expires_at=None,
@@ -614,13 +762,31 @@ def check_and_requeue_expired_leases() -> None:
                             )
                         else:
                             # Provisional: just clear the claim, no attempt_count increment
-                            sdk.tasks.update(task_id, queue=target_queue, claimed_by=None, lease_expires_at=None)
+                            updates = dict(queue=target_queue, claimed_by=None, lease_expires_at=None)
 
-                        logger.info(f"Requeued expired lease: {task_id} → {target_queue} (expired {lease_expires})")
+                        requeues[task_id] = (updates, lease_expires)
                 except (ValueError, TypeError):
                     pass
+
+        if not requeues:
+            return
+
+        # All requeues for the tick go to the server in one request
+        result = sdk.tasks.bulk_update(
+            [{"id": task_id, **updates} for task_id, (updates, _expired) in requeues.items()]
+        )
+        for task in result.get("updated", []):
+            task_id = task.get("id")
+            if task_id not in requeues:
+                continue
+            updates, lease_expires = requeues[task_id]
+            if snapshot is not None:
+                snapshot.record_update(task_id, **updates)
+            logger.info(f"Requeued expired lease: {task_id} → {updates['queue']} (expired {lease_expires})")
+        for failure in result.get("failed", []):
+            logger.debug(f"Failed to requeue expired lease for {failure.get('id')}: {failure.get('error')}")
     except Exception as e:
-        logger.debug(f"Lease expiry check failed: {e}")
+        logger.warning(f"Lease expiry check failed: {e}")
 
 
 def _register_orchestrator(orchestrator_registered: bool = False) -> None:
@@ -707,7 +873,7 @@ def send_heartbeat() -> None:
         logger.debug(f"Heartbeat failed (non-fatal): {e}")
 
 
-def renew_active_leases() -> None:
+def renew_active_leases(snapshot: TickSnapshot | None = None) -> None:
     """Extend leases for tasks whose agent processes are still running.
 
     Must run BEFORE check_and_requeue_expired_leases. When a laptop wakes from
@@ -716,10 +882,17 @@ def renew_active_leases() -> None:
 
     Renews any claimed task whose lease expires within the next 30 minutes (or is
     already past). Tasks with plenty of lease time remaining are skipped.
+
+    Args:
+        snapshot: Tick snapshot to read the claimed queue from. Renewed leases
+            are recorded into it so the expiry check sees the new values.
     """
     try:
         sdk = queue_utils.get_sdk()
-        tasks = sdk.tasks.list(queue="claimed")
+        if snapshot is not None:
+            tasks = snapshot.list_tasks("claimed")
+        else:
+            tasks = sdk.tasks.list(queue="claimed")
         if not tasks:
             return
 
@@ -727,6 +900,7 @@ def renew_active_leases() -> None:
         renewal_threshold = timedelta(minutes=30)
         new_lease_duration = timedelta(hours=1)
 
+        renewals: list[tuple[str, str]] = []  # (task_id, status)
         for task in tasks:
             task_id = task.get("id")
             if not task_id:
@@ -750,34 +924,60 @@ def renew_active_leases() -> None:
             if pid_result is None:
                 continue  # No running process — let the expiry check handle it
 
-            new_expiry = (now + new_lease_duration).isoformat()
-            try:
-                sdk.tasks.update(task_id, lease_expires_at=new_expiry)
-                status = "expired" if expires_at < now else "expiring soon"
-                logger.info(f"Renewed lease for {task_id} (was {status}, extended 1h from now)")
-            except Exception as update_err:
-                logger.debug(f"Failed to renew lease for {task_id}: {update_err}")
+            renewals.append((task_id, "expired" if expires_at < now else "expiring soon"))
+
+        if not renewals:
+            return
+
+        # All renewals for the tick go to the server in one request
+        statuses = dict(renewals)
+        result = sdk.tasks.bulk_renew_leases(
+            list(statuses), duration_seconds=int(new_lease_duration.total_seconds())
+        )
+        for task in result.get("updated", []):
+            task_id = task.get("id")
+            if task_id not in statuses:
+                continue
+            if snapshot is not None:
+                snapshot.record_update(task_id, lease_expires_at=task.get("lease_expires_at"))
+            logger.info(f"Renewed lease for {task_id} (was {statuses[task_id]}, extended 1h from now)")
+        for failure in result.get("failed", []):
+            logger.debug(f"Failed to renew lease for {failure.get('id')}: {failure.get('error')}")
 
     except Exception as e:
-        logger.debug(f"Lease renewal check failed: {e}")
+        logger.warning(f"Lease renewal check failed: {e}")
 
 
 _DONE_GRACE_SECONDS = 3600    # 1 hour — work is merged, safe to clean
 _FAILED_GRACE_SECONDS = 86400  # 24 hours — need time to investigate
 
+# Columns read by _task_past_grace() and _sweep_task_resources()
+_SWEEP_FIELDS = ("id", "queue", "updated_at", "completed_at")
+# Extra look-back on incremental sweeps, so a missed or failed run is retried
+_SWEEP_OVERLAP_SECONDS = 3600
 
-def _task_past_grace(task: dict, now: datetime) -> bool:
-    """Return True if task has exceeded its queue-dependent grace period."""
+# Track last successful sweep time (global state); None forces a full scan
+_last_sweep_at: datetime | None = None
+
+
+def _task_timestamp(task: dict) -> datetime | None:
+    """Return a task's updated_at (or completed_at) as an aware datetime."""
     ts_str = task.get("updated_at") or task.get("completed_at")
     if not ts_str:
-        return False
+        return None
     try:
         ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-        if ts.tzinfo is None:
-            ts = ts.replace(tzinfo=timezone.utc)
-        elapsed = (now - ts).total_seconds()
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, AttributeError):
+        return None
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def _task_past_grace(task: dict, now: datetime) -> bool:
+    """Return True if task has exceeded its queue-dependent grace period."""
+    ts = _task_timestamp(task)
+    if ts is None:
         return False
+    elapsed = (now - ts).total_seconds()
     grace = _FAILED_GRACE_SECONDS if task.get("queue") == "failed" else _DONE_GRACE_SECONDS
     return elapsed >= grace
 
@@ -840,11 +1040,47 @@ def _sweep_task_resources(
     return swept
 
 
-def sweep_stale_resources() -> None:
-    """Archive logs and delete worktrees for old done/failed tasks."""
+def _list_sweep_candidates(
+    sdk, queue: str, grace_seconds: int, snapshot: TickSnapshot | None = None,
+) -> list[dict]:
+    """List the tasks in a terminal queue that may have crossed their grace period.
+
+    The first sweep scans the whole queue. Later sweeps only consider tasks
+    updated since (last sweep - grace - overlap): anything older already passed
+    its grace period at the previous sweep and has been cleaned up.
+
+    Tasks are read from the snapshot when it is backed by the task mirror,
+    otherwise listed from the server.
+    """
+    updated_since = None
+    if _last_sweep_at is not None:
+        updated_since = _last_sweep_at - timedelta(seconds=grace_seconds + _SWEEP_OVERLAP_SECONDS)
+    if snapshot is not None and snapshot.mirror is not None:
+        tasks = snapshot.list_tasks(queue)
+        if updated_since is None:
+            return tasks
+        return [t for t in tasks if (_task_timestamp(t) or updated_since) >= updated_since]
+    return list(sdk.tasks.iter_tasks(queue=queue, fields=_SWEEP_FIELDS, updated_since=updated_since))
+
+
+def sweep_stale_resources(snapshot: TickSnapshot | None = None) -> None:
+    """Archive logs and delete worktrees for old done/failed tasks.
+
+    Also prunes warm-pool and pristine worktrees that are no longer used.
+
+    Args:
+        snapshot: Tick snapshot; when it is backed by the task mirror the
+            done and failed queues are read from it instead of the server.
+    """
+    global _last_sweep_at
+
+    now = datetime.now(timezone.utc)
     try:
         sdk = queue_utils.get_sdk()
-        all_tasks = (sdk.tasks.list(queue="done") or []) + (sdk.tasks.list(queue="failed") or [])
+        all_tasks = (
+            _list_sweep_candidates(sdk, "done", _DONE_GRACE_SECONDS, snapshot)
+            + _list_sweep_candidates(sdk, "failed", _FAILED_GRACE_SECONDS, snapshot)
+        )
     except Exception as e:
         logger.debug(f"sweep_stale_resources: failed to fetch tasks: {e}")
         return
@@ -857,10 +1093,11 @@ def sweep_stale_resources() -> None:
 
     tasks_dir = get_tasks_dir()
     logs_dir = get_logs_dir()
-    now = datetime.now(timezone.utc)
 
     candidates = [t for t in all_tasks if t.get("id") and _task_past_grace(t, now)]
-    pruned_any = any(_sweep_task_resources(t, tasks_dir, logs_dir, parent_repo) for t in candidates)
+    # Sweep every candidate (no short-circuit): incremental runs will not list
+    # these tasks again once they fall out of the look-back window.
+    pruned_any = any([_sweep_task_resources(t, tasks_dir, logs_dir, parent_repo) for t in candidates])
 
     if pruned_any:
         try:
@@ -869,6 +1106,15 @@ def sweep_stale_resources() -> None:
         except Exception as e:
             logger.debug(f"sweep_stale_resources: git worktree prune failed: {e}")
 
+    # Pooled and pristine worktrees for branches/refs that are gone
+    for prune in (worktree_pool.prune, worktree_backend.prune_pristine):
+        try:
+            prune(parent_repo)
+        except Exception as e:
+            logger.debug(f"sweep_stale_resources: {prune.__name__} failed: {e}")
+
+    _last_sweep_at = now
+
 
 # =============================================================================
 # Check Evaluation
@@ -21,8 +21,6 @@ from typing import Callable
 
 logger = logging.getLogger("octopoid.jobs")
 
-import yaml
-
 from .config import (
     find_parent_project,
     get_agents,
@@ -30,11 +28,13 @@ from .config import (
     get_logs_dir,
     get_orchestrator_dir,
     get_tasks_dir,
+    read_yaml_cached,
 )
 from .git_utils import run_git
 from . import queue_utils
-from .pool import count_running_instances, load_blueprint_pids, save_blueprint_pids
+from .pool import count_running_instances, load_blueprint_pids, save_blueprint_pids, tick_pid_registry
 from .state_utils import is_process_running
+from .tick_snapshot import TickSnapshot
 
 
 # ---------------------------------------------------------------------------
@@ -51,10 +51,13 @@ class JobContext:
         poll_data: Combined poll response from the server, or None if the job is
                    local (no API call) or poll failed. Job functions extract
                    relevant fields (e.g. poll_data.get("queue_counts")).
+        snapshot: Tick-scoped task lists shared by every job in the tick. Jobs
+                  read queues through it and record the updates they make.
     """
 
     scheduler_state: dict
     poll_data: dict | None = None
+    snapshot: TickSnapshot | None = None
 
 
 # Registry mapping job name → callable that accepts JobContext
@@ -80,16 +83,52 @@ def get_jobs_yaml_path() -> Path:
 def load_jobs_yaml() -> list[dict]:
     """Load job definitions from .octopoid/jobs.yaml.
 
-    Returns an empty list if the file does not exist or is empty.
+    Returns an empty list if the file does not exist or is empty. The parsed
+    file is cached (see config.read_yaml_cached) until its mtime or size
+    changes, so a long-lived daemon calling this every tick does not re-parse.
     """
-    path = get_jobs_yaml_path()
-    if not path.exists():
+    try:
+        data = read_yaml_cached(get_jobs_yaml_path())
+    except FileNotFoundError:
         return []
-    with open(path) as f:
-        data = yaml.safe_load(f)
     return data.get("jobs", []) if data else []
 
 
+def seconds_until_next_job(scheduler_state: dict, jobs: list[dict] | None = None) -> float:
+    """Return how many seconds until the earliest job in jobs.yaml is due.
+
+    Uses the same last-run bookkeeping as is_job_due(). Returns 0.0 if any job
+    is already due (or has never run), and 60.0 if no jobs are defined.
+
+    Args:
+        scheduler_state: State dict from load_scheduler_state().
+        jobs: Job definitions; loaded from jobs.yaml when None.
+    """
+    if jobs is None:
+        jobs = load_jobs_yaml()
+    if not jobs:
+        return 60.0
+
+    last_runs = scheduler_state.get("jobs", {})
+    now = datetime.now()
+    soonest: float | None = None
+    for job_def in jobs:
+        interval = job_def.get("interval", 60)
+        last_run_str = last_runs.get(job_def.get("name", ""))
+        if not last_run_str:
+            return 0.0
+        try:
+            elapsed = (now - datetime.fromisoformat(last_run_str)).total_seconds()
+        except (ValueError, TypeError):
+            return 0.0
+        remaining = interval - elapsed
+        if remaining <= 0:
+            return 0.0
+        if soonest is None or remaining < soonest:
+            soonest = remaining
+    return soonest if soonest is not None else 60.0
+
+
 # ---------------------------------------------------------------------------
 # Main dispatcher
 # ---------------------------------------------------------------------------
@@ -142,24 +181,41 @@ def run_due_jobs(scheduler_state: dict) -> dict | None:
         f"Skipped (not due): {', '.join(skipped) if skipped else 'none'}"
     )
 
-    # Run local jobs first — no API calls needed
-    for job_def in due_local:
-        name = job_def["name"]
-        ctx = JobContext(scheduler_state=scheduler_state, poll_data=None)
-        _run_job(job_def, ctx)
-        record_job_run(scheduler_state, name)
-
-    # Fetch poll data once for all remote jobs
-    poll_data: dict | None = None
-    if due_remote:
-        poll_data = _fetch_poll_data()
-
-    # Run remote jobs with shared poll data
-    for job_def in due_remote:
-        name = job_def["name"]
-        ctx = JobContext(scheduler_state=scheduler_state, poll_data=poll_data)
-        _run_job(job_def, ctx)
-        record_job_run(scheduler_state, name)
+    # One PID registry per tick — running_pids.json files are read and PIDs
+    # probed once, then count/lookup calls are served from memory
+    with tick_pid_registry():
+        # One snapshot per tick — queues are listed lazily, at most once each
+        snapshot = TickSnapshot()
+
+        # Run local jobs first — no API calls needed
+        for job_def in due_local:
+            name = job_def["name"]
+            ctx = JobContext(scheduler_state=scheduler_state, poll_data=None, snapshot=snapshot)
+            _run_job(job_def, ctx)
+            record_job_run(scheduler_state, name)
+
+        # Local jobs (result handling) may have moved tasks; start remote jobs clean
+        snapshot.invalidate()
+
+        # Fetch poll data once for all remote jobs
+        poll_data: dict | None = None
+        if due_remote:
+            poll_data = _fetch_poll_data()
+            snapshot.poll_data = poll_data
+            # A poll that synced the task mirror lets jobs read queues locally
+            if poll_data and poll_data.get("mirror_synced"):
+                from .task_mirror import get_task_mirror
+                snapshot.mirror = get_task_mirror()
+
+        # Run remote jobs with shared poll data
+        for job_def in due_remote:
+            name = job_def["name"]
+            ctx = JobContext(scheduler_state=scheduler_state, poll_data=poll_data, snapshot=snapshot)
+            _run_job(job_def, ctx)
+            record_job_run(scheduler_state, name)
+
+        if due_remote:
+            logger.debug(f"Tick snapshot: {snapshot.stats()}")
 
     return poll_data
 
@@ -207,7 +263,6 @@ def _resolve_job_agent_config(job_def: dict) -> dict:
         Agent config dict loaded from agent.yaml (with agent_dir injected),
         or the inline agent_config dict as a fallback.
     """
-    import yaml as _yaml
     from .config import find_parent_project, get_agents_base_dir
 
     name = job_def.get("name", "")
@@ -220,8 +275,7 @@ def _resolve_job_agent_config(job_def: dict) -> dict:
             agent_dir = find_parent_project() / agent_dir
         agent_yaml_path = agent_dir / "agent.yaml"
         if agent_yaml_path.exists():
-            with open(agent_yaml_path) as f:
-                config = _yaml.safe_load(f) or {}
+            config = read_yaml_cached(agent_yaml_path) or {}
             config["agent_dir"] = str(agent_dir)
             return config
 
@@ -232,8 +286,7 @@ def _resolve_job_agent_config(job_def: dict) -> dict:
         candidate_dir = agents_base / candidate
         agent_yaml_path = candidate_dir / "agent.yaml"
         if agent_yaml_path.exists():
-            with open(agent_yaml_path) as f:
-                config = _yaml.safe_load(f) or {}
+            config = read_yaml_cached(agent_yaml_path) or {}
             config["agent_dir"] = str(candidate_dir)
             return config
 
@@ -336,14 +389,14 @@ def _register_orchestrator(ctx: JobContext) -> None:
 def renew_active_leases(ctx: JobContext) -> None:
     """Extend leases for claimed tasks with live agent processes (sleep resilience)."""
     from .scheduler import renew_active_leases as _impl
-    _impl()
+    _impl(snapshot=ctx.snapshot)
 
 
 @register_job
 def check_and_requeue_expired_leases(ctx: JobContext) -> None:
     """Requeue tasks whose claim lease has expired."""
     from .scheduler import check_and_requeue_expired_leases as _impl
-    _impl()
+    _impl(snapshot=ctx.snapshot)
 
 
 @register_job
@@ -365,18 +418,19 @@ def agent_evaluation_loop(ctx: JobContext) -> None:
     """Main agent evaluation and spawning loop.
 
     Passes pre-fetched queue_counts from poll_data so the evaluation loop
-    can avoid per-agent API calls.
+    can avoid per-agent API calls, and the tick snapshot so backpressure
+    reuses the queue lists already fetched by the lease jobs.
     """
     from .scheduler import _run_agent_evaluation_loop
     queue_counts = (ctx.poll_data or {}).get("queue_counts")
-    _run_agent_evaluation_loop(queue_counts=queue_counts)
+    _run_agent_evaluation_loop(queue_counts=queue_counts, snapshot=ctx.snapshot)
 
 
 @register_job
 def sweep_stale_resources(ctx: JobContext) -> None:
     """Archive logs and clean up stale worktrees and remote branches."""
     from .scheduler import sweep_stale_resources as _impl
-    _impl()
+    _impl(snapshot=ctx.snapshot)
 
 
 @register_job
@@ -0,0 +1,250 @@
+"""Read the end of agent logs without loading the whole file.
+
+Result inference, continuation context, run-log summaries and the dashboard
+only ever look at the last few thousand characters of ``stdout.log`` /
+``stderr.log``. A long ``claude --output-format json`` run can leave a log of
+several MB, and reading and decoding all of it for a 2000-character tail is
+wasted work. This module:
+
+- read_tail() seeks to the end and decodes only the bytes it needs.
+- read_result() memory-maps a ``--output-format json`` log and walks the top
+  level of the object with C-speed regex scans. Nested values (``usage``,
+  ``modelUsage``...) are skipped without being parsed, and only the tail of
+  the ``result`` string is decoded.
+
+Both return text as ``Path.read_text()`` would (undecodable bytes replaced,
+newlines normalized to ``\\n``).
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_SCALAR = re.compile(rb'[^\s,}\]]+')
+_WHITESPACE = re.compile(rb'\s*')
+_NON_WHITESPACE = re.compile(rb'\S')
+
+# Worst case bytes per decoded character: a \uXXXX\uXXXX surrogate pair
+_JSON_BYTES_PER_CHAR = 12
+_UTF8_BYTES_PER_CHAR = 4
+
+
+def _decode(data: bytes, partial: bool = False) -> str:
+    """Decode like read_text(errors="replace").
+
+    partial means data was cut from a longer file, so a character split at
+    its start is dropped instead of being decoded as garbage.
+    """
+    start = 0
+    while partial and start < len(data) and start < 3 and 0x80 <= data[start] <= 0xBF:
+        start += 1
+    text = data[start:].decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_tail(path: Path, max_chars: int) -> tuple[str, bool]:
+    """Return the last max_chars characters of a text file.
+
+    Returns:
+        (tail, truncated), where truncated is True if the file holds more
+        than max_chars characters.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    max_bytes = max_chars * _UTF8_BYTES_PER_CHAR
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > max_bytes:
+            f.seek(size - max_bytes)
+        text = _decode(f.read(max_bytes), partial=size > max_bytes)
+    return text[-max_chars:], size > max_bytes or len(text) > max_chars
+
+
+def is_blank(path: Path) -> bool:
+    """True if the file is empty or holds only whitespace.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _NON_WHITESPACE.search(buf) is None
+
+
+def _skip_whitespace(buf, pos: int) -> int:
+    return _WHITESPACE.match(buf, pos).end()
+
+
+def _string_end(buf, pos: int) -> int | None:
+    """Return the end of the string literal starting at pos, or None if unterminated."""
+    if buf[pos:pos + 1] != b'"':
+        return None
+    search_from = pos + 1
+    while True:
+        quote = buf.find(b'"', search_from)
+        if quote < 0:
+            return None
+        backslash = quote - 1
+        while buf[backslash] == 0x5C:
+            backslash -= 1
+        if (quote - 1 - backslash) % 2 == 0:
+            return quote + 1
+        search_from = quote + 1
+
+
+def _skip_value(buf, pos: int) -> int | None:
+    """Return the end of the JSON value starting at pos, or None if malformed."""
+    first = buf[pos:pos + 1]
+    if first == b'"':
+        return _string_end(buf, pos)
+    if first in (b"{", b"["):
+        depth = 0
+        while True:
+            match = _STRUCTURAL.search(buf, pos)
+            if match is None:
+                return None
+            char = match.group()
+            if char == b'"':
+                pos = _string_end(buf, match.start())
+                if pos is None:
+                    return None
+                continue
+            depth += 1 if char in (b"{", b"[") else -1
+            pos = match.end()
+            if depth == 0:
+                return pos
+    match = _SCALAR.match(buf, pos)
+    return match.end() if match else None
+
+
+def _top_level_fields(buf, pos: int) -> tuple[dict[str, tuple[int, int]], int] | None:
+    """Spans of each top-level value of the object starting at pos.
+
+    Returns ({key: (start, end)}, end of the object), or None if malformed.
+    """
+    if buf[pos:pos + 1] != b"{":
+        return None
+    spans: dict[str, tuple[int, int]] = {}
+    pos = _skip_whitespace(buf, pos + 1)
+    if buf[pos:pos + 1] == b"}":
+        return spans, pos + 1
+    while True:
+        key_end = _string_end(buf, pos)
+        if key_end is None:
+            return None
+        key = json.loads(bytes(buf[pos:key_end]))
+        pos = _skip_whitespace(buf, key_end)
+        if buf[pos:pos + 1] != b":":
+            return None
+        start = _skip_whitespace(buf, pos + 1)
+        end = _skip_value(buf, start)
+        if end is None:
+            return None
+        spans[key] = (start, end)
+        pos = _skip_whitespace(buf, end)
+        separator = buf[pos:pos + 1]
+        if separator == b"}":
+            return spans, pos + 1
+        if separator != b",":
+            return None
+        pos = _skip_whitespace(buf, pos + 1)
+
+
+def _string_tail(buf, start: int, end: int, max_chars: int | None) -> str:
+    """Decode the JSON string literal buf[start:end], keeping its last max_chars characters."""
+    if max_chars is None or end - start <= max_chars * _JSON_BYTES_PER_CHAR + 2:
+        text = json.loads(bytes(buf[start:end]))
+        return text if max_chars is None else text[-max_chars:]
+    body_end = end - 1
+    pos = body_end - max_chars * _JSON_BYTES_PER_CHAR
+    # Start on a whole character: not inside a UTF-8 sequence...
+    while 0x80 <= buf[pos] <= 0xBF:
+        pos += 1
+    # ...nor just after the backslash of an escape...
+    backslashes = 0
+    while buf[pos - 1 - backslashes] == 0x5C:
+        backslashes += 1
+    if backslashes % 2:
+        pos -= 1
+    # ...nor inside the hex digits of a \uXXXX escape
+    for back in range(1, 6):
+        at = pos - back
+        if buf[at:at + 2] == b"\\u":
+            run = 0
+            while buf[at - 1 - run] == 0x5C:
+                run += 1
+            if run % 2 == 0:
+                pos = at
+            break
+    text = json.loads(b'"' + bytes(buf[pos:body_end]) + b'"')
+    return text[-max_chars:]
+
+
+def read_result(path: Path, max_chars: int | None = None) -> tuple[dict[str, Any] | None, str]:
+    """Read a ``claude --output-format json`` log without loading all of it.
+
+    Behaves like parsing the whole file with json.loads and keeping the
+    object only if it is a ``{"type": "result", ...}`` document, but
+    nested values are skipped rather than parsed.
+
+    Args:
+        path: The log, usually stdout.log.
+        max_chars: Keep only the last max_chars characters of the text.
+            None keeps all of it.
+
+    Returns:
+        (fields, text). For a result document, fields holds its top-level
+        scalar fields (type, subtype, is_error, result...) with ``result``
+        cut to max_chars, and text is that result. Otherwise fields is None
+        and text is the end of the file, as read_tail() returns it.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        fields = None
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                fields = _parse_result(buf, max_chars)
+    if fields is not None:
+        return fields, fields.get("result") or ""
+    if max_chars is None:
+        return None, _decode(Path(path).read_bytes())
+    return None, read_tail(path, max_chars)[0]
+
+
+def _parse_result(buf, max_chars: int | None) -> dict[str, Any] | None:
+    first = _NON_WHITESPACE.search(buf)
+    if first is None or buf[first.start():first.start() + 1] != b"{":
+        return None
+    try:
+        parsed = _top_level_fields(buf, first.start())
+        if parsed is None:
+            return None
+        spans, end = parsed
+        # Nothing but whitespace may follow the object
+        if _NON_WHITESPACE.search(buf, end) is not None:
+            return None
+        fields: dict[str, Any] = {}
+        for key, (start, stop) in spans.items():
+            if buf[start:start + 1] in (b"{", b"["):
+                continue
+            if key == "result" and buf[start:start + 1] == b'"':
+                fields[key] = _string_tail(buf, start, stop, max_chars)
+            else:
+                fields[key] = json.loads(bytes(buf[start:stop]))
+    except (ValueError, IndexError):
+        return None
+    if fields.get("type") != "result":
+        return None
+    return fields
@@ -0,0 +1,323 @@
+"""Deterministic agent outcome classification ahead of the haiku call.
+
+infer_result_from_stdout() used to send every finished agent's output to a
+``claude -p`` haiku call: 5-30 seconds and a model invocation per result,
+even when the agent had ended with an explicit ``**DECISION: APPROVED**``.
+Outcomes are now classified by the first tier that can decide:
+
+1. result_json: a ``result.json`` in the task dir, written by an agent
+   script ($RESULT_FILE in env.sh). prepare_task_directory() deletes it
+   before every run, so a stale file is never read.
+2. rules: explicit markers in the tail of the output (``outcome: done``,
+   ``DECISION: REJECTED``, ``SYSTEMIC_ESCALATION:``) and the subtype of
+   ``--output-format json`` results (error_max_turns, empty error results).
+   Conflicting markers are left to haiku.
+3. cache: haiku's earlier answer for the same role, prompt and tail.
+4. haiku_batch: an answer from one haiku call that classified every agent
+   finishing in the same tick (result_handler.prefetch_outcomes()).
+5. haiku: the model call for this agent alone. Recognised answers of both
+   haiku tiers are cached for tier 3.
+
+Every classification is counted per role and tier in
+.octopoid/runtime/outcome_stats.json; ``scripts/octopoid-status.py`` and the
+status API's ``outcomes`` query report the hit rate of each tier, i.e. how
+often the slow path still runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .lock_utils import locked
+
+logger = logging.getLogger("octopoid.result_handler")
+
+RESULT_FILENAME = "result.json"
+CACHE_FILENAME = "outcome_cache.json"
+STATS_FILENAME = "outcome_stats.json"
+
+RESULT_JSON = "result_json"
+RULES = "rules"
+CACHE = "cache"
+BATCH = "haiku_batch"
+HAIKU = "haiku"
+TIERS = (RESULT_JSON, RULES, CACHE, BATCH, HAIKU)
+
+# Cached haiku answers kept; the oldest are dropped first
+MAX_CACHE_ENTRIES = 1000
+
+_GATEKEEPER_ROLES = ("gatekeeper", "sanity-check-gatekeeper")
+
+# Leading markdown allowed before a marker: "**DECISION: APPROVED**", "- outcome: done"
+_MARKUP = r"^[ \t>#*_`-]*"
+_DECISION = re.compile(_MARKUP + r"DECISION\s*:\s*[*_`]*\s*(APPROVED|REJECTED)\b", re.IGNORECASE | re.MULTILINE)
+_OUTCOME = re.compile(
+    _MARKUP + r"outcome\s*:\s*[*_`]*\s*(done|failed|needs_continuation|fixed)\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_IMPLEMENTER_OUTCOMES = ("done", "failed", "needs_continuation")
+_FIXER_OUTCOMES = ("fixed", "failed", "systemic_escalation")
+
+
+def role_kind(agent_role: str) -> str:
+    """Map an agent role to the classifier it uses: implement, gatekeeper or fixer."""
+    if agent_role in _GATEKEEPER_ROLES:
+        return "gatekeeper"
+    if agent_role == "fixer":
+        return "fixer"
+    return "implement"
+
+
+# ---------------------------------------------------------------------------
+# Tier 1: result.json
+# ---------------------------------------------------------------------------
+
+def read_result_file(task_dir: Path, agent_role: str) -> dict | None:
+    """Read and validate the result.json an agent script wrote.
+
+    Accepted documents:
+    - implementer: {"outcome": "done" | "failed" | "needs_continuation", "reason": ...}
+    - gatekeeper: {"decision": "approve" | "reject", "comment": ...}
+    - fixer: {"outcome": "fixed" | "failed" | "systemic_escalation",
+      "diagnosis": ..., "fix_applied": ..., "reason": ...}
+
+    Returns:
+        The result in the shape infer_result_from_stdout() returns, or None
+        if there is no file or it is not valid for the role (a warning is
+        logged and classification falls through to the next tier).
+        A gatekeeper result without a comment has comment None; the caller
+        fills it in from stdout.
+    """
+    path = task_dir / RESULT_FILENAME
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {path}: {e}")
+        return None
+    if not isinstance(data, dict):
+        logger.warning(f"Ignoring {path}: not a JSON object")
+        return None
+
+    kind = role_kind(agent_role)
+    if kind == "gatekeeper":
+        decision = str(data.get("decision", "")).lower()
+        decision = {"approved": "approve", "rejected": "reject"}.get(decision, decision)
+        if decision not in ("approve", "reject"):
+            logger.warning(f"Ignoring {path}: decision {data.get('decision')!r} is not approve or reject")
+            return None
+        comment = data.get("comment")
+        return {"status": "success", "decision": decision, "comment": comment if isinstance(comment, str) else None}
+
+    outcome = data.get("outcome")
+    allowed = _FIXER_OUTCOMES if kind == "fixer" else _IMPLEMENTER_OUTCOMES
+    if outcome not in allowed:
+        logger.warning(f"Ignoring {path}: outcome {outcome!r} is not one of {', '.join(allowed)}")
+        return None
+    result: dict[str, Any] = {"outcome": outcome}
+    for field in ("reason", "diagnosis", "fix_applied"):
+        if isinstance(data.get(field), str):
+            result[field] = data[field]
+    if kind == "fixer" and outcome == "fixed":
+        result.setdefault("diagnosis", "Reported in result.json")
+        result.setdefault("fix_applied", "")
+    elif outcome in ("failed", "systemic_escalation"):
+        result.setdefault("reason", "Reported in result.json")
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Tier 2: rules over the tail
+# ---------------------------------------------------------------------------
+
+def _single_marker(pattern: re.Pattern, tail: str) -> str | None:
+    """The value of pattern's markers in tail, or None if absent or conflicting."""
+    values = {m.group(1).lower() for m in pattern.finditer(tail)}
+    return values.pop() if len(values) == 1 else None
+
+
+def classify_by_rules(tail: str, agent_role: str) -> dict | None:
+    """Classify from explicit markers in the tail of the agent's output.
+
+    Returns:
+        The result, or None when the tail has no marker for the role or its
+        markers disagree.
+    """
+    kind = role_kind(agent_role)
+    if kind == "gatekeeper":
+        decision = _single_marker(_DECISION, tail)
+        if decision is None:
+            return None
+        return {"status": "success", "decision": "approve" if decision == "approved" else "reject", "comment": tail}
+
+    if kind == "fixer":
+        if "SYSTEMIC_ESCALATION:" in tail:
+            # The reason is on the first SYSTEMIC_ESCALATION: line
+            for line in tail.splitlines():
+                if line.startswith("SYSTEMIC_ESCALATION:"):
+                    reason = line[len("SYSTEMIC_ESCALATION:"):].strip()
+                    return {"outcome": "systemic_escalation", "reason": reason, "diagnosis": tail[:1000]}
+            return {"outcome": "systemic_escalation", "reason": "Systemic issue detected", "diagnosis": tail[:1000]}
+        outcome = _single_marker(_OUTCOME, tail)
+        if outcome == "fixed":
+            return {"outcome": "fixed", "diagnosis": "Reported in stdout", "fix_applied": tail[:500]}
+        if outcome == "failed":
+            return {"outcome": "failed", "diagnosis": "Reported in stdout: could not fix"}
+        return None
+
+    outcome = _single_marker(_OUTCOME, tail)
+    if outcome == "done":
+        return {"outcome": "done"}
+    if outcome == "needs_continuation":
+        return {"outcome": "needs_continuation"}
+    if outcome == "failed":
+        return {"outcome": "failed", "reason": "Agent reported outcome: failed"}
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Tier 3: cached haiku answers
+# ---------------------------------------------------------------------------
+
+def get_cache_path() -> Path:
+    """Path of the haiku answer cache."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / CACHE_FILENAME
+
+
+def get_stats_path() -> Path:
+    """Path of the per-tier classification counts."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / STATS_FILENAME
+
+
+def cache_key(agent_role: str, prompt: str, tail: str) -> str:
+    """Cache key for haiku's answer: the role plus a hash of the prompt and tail.
+
+    The prompt template is part of the hash so that editing a prompt does
+    not serve answers given to the old one.
+    """
+    digest = hashlib.sha256(f"{prompt}\0{tail}".encode("utf-8", errors="replace")).hexdigest()
+    return f"{role_kind(agent_role)}:{digest}"
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}_", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.rename(temp_path, path)
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def cached_answer(key: str) -> str | None:
+    """Return haiku's cached answer for key, or None."""
+    answer = _read_json(get_cache_path()).get(key)
+    return answer if isinstance(answer, str) else None
+
+
+def store_answer(key: str, answer: str) -> None:
+    """Cache haiku's answer for key, dropping the oldest entries beyond MAX_CACHE_ENTRIES."""
+    path = get_cache_path()
+    try:
+        with locked(path.with_suffix(".lock"), blocking=True):
+            cache = _read_json(path)
+            cache.pop(key, None)
+            cache[key] = answer
+            for old in list(cache)[:max(0, len(cache) - MAX_CACHE_ENTRIES)]:
+                del cache[old]
+            _write_json(path, cache)
+    except OSError as e:
+        logger.debug(f"Could not cache haiku answer: {e}")
+
+
+# Answers from a batch call, waiting for their agent's result to be handled
+_batch_answers: dict[str, str] = {}
+_batch_lock = threading.Lock()
+
+
+def remember_batch_answer(key: str, answer: str) -> None:
+    """Hold a batch call's answer until take_batch_answer(key) collects it."""
+    with _batch_lock:
+        _batch_answers.pop(key, None)
+        _batch_answers[key] = answer
+        while len(_batch_answers) > MAX_CACHE_ENTRIES:
+            del _batch_answers[next(iter(_batch_answers))]
+
+
+def take_batch_answer(key: str) -> str | None:
+    """Return and forget the batch call's answer for key, or None."""
+    with _batch_lock:
+        return _batch_answers.pop(key, None)
+
+
+# ---------------------------------------------------------------------------
+# Hit rates
+# ---------------------------------------------------------------------------
+
+def record_tier(agent_role: str, tier: str) -> None:
+    """Count one classification decided by tier."""
+    path = get_stats_path()
+    try:
+        with locked(path.with_suffix(".lock"), blocking=True):
+            stats = _read_json(path)
+            stats.setdefault("since", datetime.now(tz=timezone.utc).isoformat())
+            roles = stats.setdefault("roles", {})
+            counts = roles.setdefault(role_kind(agent_role), {})
+            counts[tier] = counts.get(tier, 0) + 1
+            _write_json(path, stats)
+    except OSError as e:
+        logger.debug(f"Could not record outcome tier: {e}")
+
+
+def read_stats() -> dict[str, Any]:
+    """Return classification counts and each tier's hit rate.
+
+    Returns:
+        {"since": ISO timestamp or None, "total": n,
+         "tiers": {tier: {"count": n, "rate": fraction}},
+         "roles": {role: {tier: n}}}
+    """
+    stats = _read_json(get_stats_path())
+    roles = stats.get("roles") if isinstance(stats.get("roles"), dict) else {}
+    counts = {tier: sum(int(r.get(tier, 0)) for r in roles.values()) for tier in TIERS}
+    total = sum(counts.values())
+    return {
+        "since": stats.get("since"),
+        "total": total,
+        "tiers": {tier: {"count": n, "rate": n / total if total else 0.0} for tier, n in counts.items()},
+        "roles": roles,
+    }
+
+
+def format_hit_rates(stats: dict[str, Any]) -> str:
+    """One-line summary of read_stats(), e.g. ``result_json 10% | rules 70% | ... | haiku 5% (of 40)``."""
+    if not stats.get("total"):
+        return "no outcomes classified yet"
+    parts = [f"{tier} {stats['tiers'][tier]['rate']:.0%}" for tier in TIERS]
+    return " | ".join(parts) + f" (of {stats['total']})"
@@ -3,6 +3,11 @@
 Each blueprint (e.g. "implementer") can have multiple concurrent instances.
 This module tracks their PIDs in a per-blueprint running_pids.json file.
 
+Within a scheduler tick, a PidRegistry holds every blueprint's PIDs in memory
+with a task_id index and a single liveness snapshot (see tick_pid_registry()).
+While it is active the module-level helpers below read from it instead of
+re-reading the files and probing each PID, and writes go through it.
+
 Every mutation (add/remove) is logged to a JSONL audit trail at
 .octopoid/runtime/logs/pid_audit.jsonl for post-incident forensics.
 """
@@ -10,9 +15,12 @@ Every mutation (add/remove) is logged to a JSONL audit trail at
 import json
 import os
 import tempfile
+import threading
 import traceback
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 from .config import get_agents_runtime_dir
 
@@ -85,6 +93,13 @@ def load_blueprint_pids(blueprint_name: str) -> dict[int, dict]:
     Returns an empty dict if the file does not exist or cannot be parsed.
     Keys are integers (PIDs).
     """
+    if _active_registry is not None:
+        return _active_registry.pids(blueprint_name)
+    return _read_blueprint_pids(blueprint_name)
+
+
+def _read_blueprint_pids(blueprint_name: str) -> dict[int, dict]:
+    """Read running_pids.json for a blueprint from disk."""
     path = get_blueprint_pids_path(blueprint_name)
     if not path.exists():
         return {}
@@ -105,11 +120,19 @@ def save_blueprint_pids(blueprint_name: str, pids: dict[int, dict]) -> None:
         blueprint_name: Name of the blueprint (e.g. "implementer").
         pids: Mapping of PID (int) to info dict.
     """
+    if _active_registry is not None:
+        _active_registry.replace(blueprint_name, pids)
+        return
+    _write_blueprint_pids(blueprint_name, pids, _read_blueprint_pids(blueprint_name))
+
+
+def _write_blueprint_pids(
+    blueprint_name: str, pids: dict[int, dict], old_pids: dict[int, dict]
+) -> None:
+    """Atomically write running_pids.json and audit any added/removed PIDs."""
     path = get_blueprint_pids_path(blueprint_name)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Snapshot what was on disk before this write, for the audit trail
-    old_pids = load_blueprint_pids(blueprint_name) if path.exists() else {}
     removed = set(old_pids) - set(pids)
     added = set(pids) - set(old_pids)
 
@@ -146,6 +169,8 @@ def count_running_instances(blueprint_name: str) -> int:
 
     Dead PIDs are ignored (but not removed from the file here).
     """
+    if _active_registry is not None:
+        return _active_registry.count_running(blueprint_name)
     pids = load_blueprint_pids(blueprint_name)
     return sum(1 for pid in pids if _is_pid_alive(pid))
 
@@ -171,6 +196,8 @@ def register_instance_pid(
         "started_at": datetime.now(tz=timezone.utc).isoformat(),
         "instance_name": instance_name,
     }
+    if _active_registry is not None:
+        _active_registry.mark_alive(pid)
     save_blueprint_pids(blueprint_name, pids)
     _pid_audit(
         "register", blueprint_name, pid,
@@ -189,6 +216,9 @@ def find_pid_for_task(task_id: str) -> tuple[int, str] | None:
     Returns:
         (pid, blueprint_name) if found and the process is alive, else None.
     """
+    if _active_registry is not None:
+        return _active_registry.find_pid_for_task(task_id)
+
     agents_dir = get_agents_runtime_dir()
     if not agents_dir.exists():
         return None
@@ -239,6 +269,8 @@ def get_active_task_ids(blueprint_name: str) -> set[str]:
     Returns:
         Set of task_id strings for all running instances.
     """
+    if _active_registry is not None:
+        return _active_registry.active_task_ids(blueprint_name)
     pids = load_blueprint_pids(blueprint_name)
     return {
         info["task_id"]
@@ -285,11 +317,152 @@ def cleanup_dead_pids(blueprint_name: str) -> int:
     return len(dead)
 
 
+# ---------------------------------------------------------------------------
+# Tick-scoped registry
+# ---------------------------------------------------------------------------
+
+
+class PidRegistry:
+    """In-memory view of every blueprint's running_pids.json.
+
+    Loaded once (one directory scan, one file read per blueprint, one liveness
+    snapshot for all PIDs) and indexed so that count_running(),
+    active_task_ids() and find_pid_for_task() are dict lookups.
+
+    replace() updates the indexes and writes the affected blueprint's file
+    atomically straight away -- but only if its contents actually changed.
+    PIDs registered while the registry is active are treated as alive for
+    the rest of its lifetime; PIDs that die mid-tick are still seen as alive
+    until the next load, which errs on the side of spawning fewer agents.
+    """
+
+    def __init__(self, blueprints: dict[str, dict[int, dict]], alive: set[int]):
+        self._blueprints = blueprints
+        self._alive = alive
+        self._running: dict[str, int] = {}
+        self._active_tasks: dict[str, set[str]] = {}
+        self._by_task: dict[str, tuple[int, str]] = {}
+        self.writes = 0
+        self._lock = threading.RLock()  # parallel evaluation workers share the registry
+        self._reindex()
+
+    @classmethod
+    def load(cls) -> "PidRegistry":
+        """Read all blueprints' PID files and snapshot process liveness."""
+        blueprints: dict[str, dict[int, dict]] = {}
+        agents_dir = get_agents_runtime_dir()
+        if agents_dir.exists():
+            for blueprint_dir in sorted(agents_dir.iterdir()):
+                if blueprint_dir.is_dir():
+                    blueprints[blueprint_dir.name] = _read_blueprint_pids(blueprint_dir.name)
+        all_pids = {pid for pids in blueprints.values() for pid in pids}
+        return cls(blueprints, _snapshot_alive_pids(all_pids))
+
+    def _reindex(self) -> None:
+        self._running.clear()
+        self._active_tasks.clear()
+        self._by_task.clear()
+        for blueprint_name, pids in self._blueprints.items():
+            running = 0
+            tasks: set[str] = set()
+            for pid, info in pids.items():
+                if pid not in self._alive:
+                    continue
+                running += 1
+                task_id = info.get("task_id")
+                if task_id:
+                    tasks.add(task_id)
+                    self._by_task.setdefault(task_id, (pid, blueprint_name))
+            self._running[blueprint_name] = running
+            self._active_tasks[blueprint_name] = tasks
+
+    def pids(self, blueprint_name: str) -> dict[int, dict]:
+        """Return a copy of {pid: info} for a blueprint (safe to mutate)."""
+        with self._lock:
+            pids = self._blueprints.get(blueprint_name, {})
+            return {pid: dict(info) for pid, info in pids.items()}
+
+    def count_running(self, blueprint_name: str) -> int:
+        """Number of alive PIDs for a blueprint."""
+        with self._lock:
+            return self._running.get(blueprint_name, 0)
+
+    def active_task_ids(self, blueprint_name: str) -> set[str]:
+        """Task IDs held by alive PIDs of a blueprint."""
+        with self._lock:
+            return set(self._active_tasks.get(blueprint_name, ()))
+
+    def find_pid_for_task(self, task_id: str) -> tuple[int, str] | None:
+        """Return (pid, blueprint_name) of an alive instance working on task_id."""
+        with self._lock:
+            return self._by_task.get(task_id)
+
+    def replace(self, blueprint_name: str, pids: dict[int, dict]) -> None:
+        """Set a blueprint's PIDs, writing the file only if they changed."""
+        new_pids = {pid: dict(info) for pid, info in pids.items()}
+        with self._lock:
+            old_pids = self._blueprints.get(blueprint_name, {})
+            if new_pids == old_pids and get_blueprint_pids_path(blueprint_name).exists():
+                return
+            _write_blueprint_pids(blueprint_name, new_pids, old_pids)
+            self.writes += 1
+            self._blueprints[blueprint_name] = new_pids
+            self._reindex()
+
+    def mark_alive(self, pid: int) -> None:
+        """Record a freshly spawned PID as alive for the rest of the tick."""
+        with self._lock:
+            if pid not in self._alive:
+                self._alive.add(pid)
+                self._reindex()
+
+
+_active_registry: PidRegistry | None = None
+
+
+def get_active_registry() -> PidRegistry | None:
+    """Return the registry installed by tick_pid_registry(), if any."""
+    return _active_registry
+
+
+@contextmanager
+def tick_pid_registry() -> Iterator[PidRegistry]:
+    """Load a PidRegistry and route this module's helpers through it.
+
+    Nested uses share the outer registry. The registry is discarded on exit,
+    so the next tick re-reads the files and takes a fresh liveness snapshot.
+    """
+    global _active_registry
+    if _active_registry is not None:
+        yield _active_registry
+        return
+    _active_registry = PidRegistry.load()
+    try:
+        yield _active_registry
+    finally:
+        _active_registry = None
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
+def _snapshot_alive_pids(pids: set[int]) -> set[int]:
+    """Return the subset of pids that are running, using one /proc listing.
+
+    Falls back to probing each PID with _is_pid_alive() where /proc is not
+    available (e.g. macOS).
+    """
+    if not pids:
+        return set()
+    try:
+        running = {int(name) for name in os.listdir("/proc") if name.isdigit()}
+    except OSError:
+        return {pid for pid in pids if _is_pid_alive(pid)}
+    return pids & running
+
+
 def _is_pid_alive(pid: int) -> bool:
     """Return True if the process with the given PID is running."""
     try:
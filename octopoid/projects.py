@@ -135,7 +135,7 @@ def approve_project_via_flow(project_id: str) -> dict[str, Any]:
     """
     from .config import find_parent_project
     from .flow import load_flow
-    from .steps import execute_steps
+    from .steps import execute_steps, transition_step_options
 
     project = get_project(project_id)
     if not project:
@@ -165,7 +165,7 @@ def approve_project_via_flow(project_id: str) -> dict[str, Any]:
 
     try:
         if transition.runs:
-            execute_steps(transition.runs, project, {}, parent_project_dir)
+            execute_steps(transition.runs, project, {}, parent_project_dir, **transition_step_options(transition))
     except Exception as e:
         return {"success": False, "error": f"Step execution failed: {e}"}
 
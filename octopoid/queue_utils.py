@@ -11,7 +11,7 @@ Import from specific modules instead:
 
 from .sdk import get_orchestrator_id, get_sdk
 from .tasks import (
-    accept_completion, approve_and_merge, claim_task, complete_task, create_task,
+    accept_completion, approve_and_merge, claim_task, claim_tasks, complete_task, create_task,
     fail_task, find_task_by_id, get_continuation_tasks,
     get_review_feedback, get_task_by_id, hold_task, is_task_still_valid,
     list_tasks, mark_needs_continuation, reject_completion, reject_task,
@@ -10,6 +10,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .git_batch import current_branch, rev_parse
+from .git_fetch import fetch_origin
+
 
 class RebaseStatus(Enum):
     """Result of a rebase attempt."""
@@ -87,6 +90,16 @@ class RepoManager:
             timeout=timeout,
         )
 
+    def _count_commits(self, exclude: str, include: str) -> int | None:
+        """``git rev-list --count exclude..include``, or None if the range is invalid."""
+        result = self._run_git(["rev-list", "--count", f"{exclude}..{include}"], check=False)
+        if result.returncode != 0:
+            return None
+        try:
+            return int(result.stdout.strip())
+        except ValueError:
+            return None
+
     # --- Status ---
 
     def get_status(self) -> RepoStatus:
@@ -97,23 +110,19 @@ class RepoManager:
             whether there are uncommitted changes, and HEAD SHA.
         """
         # Branch name
-        result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False)
-        branch = result.stdout.strip() if result.returncode == 0 else ""
+        branch = current_branch(self.worktree)
+        if branch is None:
+            result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False)
+            branch = result.stdout.strip() if result.returncode == 0 else ""
 
         # HEAD ref
-        result = self._run_git(["rev-parse", "HEAD"], check=False)
-        head_ref = result.stdout.strip() if result.returncode == 0 else ""
+        head_ref = rev_parse(self.worktree, "HEAD")
+        if head_ref is None:
+            result = self._run_git(["rev-parse", "HEAD"], check=False)
+            head_ref = result.stdout.strip() if result.returncode == 0 else ""
 
         # Commits ahead of base
-        commits_ahead = 0
-        result = self._run_git(
-            ["rev-list", "--count", f"{self.base_branch}..HEAD"], check=False
-        )
-        if result.returncode == 0:
-            try:
-                commits_ahead = int(result.stdout.strip())
-            except ValueError:
-                pass
+        commits_ahead = self._count_commits(self.base_branch, "HEAD") or 0
 
         # Uncommitted changes
         result = self._run_git(["status", "--porcelain"], check=False)
@@ -185,18 +194,58 @@ class RepoManager:
         self._run_git(args)
         return status.branch
 
-    def rebase_on_base(self) -> RebaseResult:
+    def push_head(self, branch_name: str) -> str:
+        """Push HEAD to origin as branch_name without touching the worktree.
+
+        Unlike ensure_on_branch() followed by push_branch(), nothing is
+        checked out and the index is not read or written, so this is safe
+        while another step (e.g. the test suite) is using the worktree. The
+        local branch is created later, by create_pr().
+
+        Args:
+            branch_name: Remote branch to create or update.
+
+        Returns:
+            The branch name that was pushed.
+
+        Raises:
+            RuntimeError: If on a different named branch than branch_name.
+            subprocess.CalledProcessError: If push fails.
+        """
+        branch = current_branch(self.worktree)
+        if branch is None:
+            result = self._run_git(["rev-parse", "--abbrev-ref", "HEAD"], check=False)
+            branch = result.stdout.strip() if result.returncode == 0 else ""
+        if branch not in ("HEAD", branch_name):
+            raise RuntimeError(
+                f"On branch '{branch}', expected '{branch_name}' or detached HEAD"
+            )
+        self._run_git(["push", "origin", f"HEAD:refs/heads/{branch_name}"])
+        return branch_name
+
+    def _fetch_base(self, max_age: float | None = None, check: bool = True) -> None:
+        """Fetch origin/base_branch through the shared fetch coordinator."""
+        fetch_origin(
+            self.worktree, self.base_branch, max_age=max_age, check=check,
+            runner=lambda args: self._run_git(args, check=False, timeout=60),
+        )
+
+    def rebase_on_base(self, max_age: float | None = None) -> RebaseResult:
         """Fetch and rebase current branch onto the base branch.
 
         On conflict, aborts the rebase and returns CONFLICT status with
         the conflict output (so callers can decide how to handle it).
 
+        Args:
+            max_age: Reuse a fetch of the base branch younger than this many
+                seconds (defaults to ``repo.fetch_ttl``; 0 always fetches).
+
         Returns:
             RebaseResult with status, message, and conflict details.
         """
         # Fetch latest
         try:
-            self._run_git(["fetch", "origin", self.base_branch], timeout=60)
+            self._fetch_base(max_age)
         except subprocess.CalledProcessError as e:
             return RebaseResult(
                 status=RebaseStatus.ERROR,
@@ -209,19 +258,11 @@ class RepoManager:
             )
 
         # Check if rebase is needed
-        result = self._run_git(
-            ["rev-list", "--count", f"HEAD..origin/{self.base_branch}"], check=False
-        )
-        if result.returncode == 0:
-            try:
-                behind_count = int(result.stdout.strip())
-                if behind_count == 0:
-                    return RebaseResult(
-                        status=RebaseStatus.UP_TO_DATE,
-                        message="Already up to date with base branch",
-                    )
-            except ValueError:
-                pass
+        if self._count_commits("HEAD", f"origin/{self.base_branch}") == 0:
+            return RebaseResult(
+                status=RebaseStatus.UP_TO_DATE,
+                message="Already up to date with base branch",
+            )
 
         # Attempt rebase
         try:
@@ -250,7 +291,7 @@ class RepoManager:
 
         Fetches latest first, then resets. Use with care.
         """
-        self._run_git(["fetch", "origin", self.base_branch], check=False, timeout=60)
+        self._fetch_base(check=False)
         self._run_git(["reset", "--hard", f"origin/{self.base_branch}"])
 
     # --- PR lifecycle ---
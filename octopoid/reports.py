@@ -14,6 +14,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+from .tick_snapshot import TickSnapshot
+
 # Type hint for SDK
 try:
     from typing import TYPE_CHECKING
@@ -36,16 +38,20 @@ def get_project_report(sdk: "OctopoidSDK") -> dict[str, Any]:
         Structured dict with keys: work, flows, prs, proposals, messages,
         agents, health, drafts, jobs.
     """
+    # Work, done and health sections read overlapping queues (incoming,
+    # claimed, done) — share one listing per queue across the report. When
+    # the scheduler's task mirror is fresh, queues are read from it instead.
+    snapshot = TickSnapshot(sdk=sdk, mirror=_load_fresh_mirror())
     return {
-        "work": _gather_work(sdk),
+        "work": _gather_work(sdk, snapshot=snapshot),
         "flows": _gather_flows(sdk),
-        "done_tasks": _gather_done_tasks(sdk),
+        "done_tasks": _gather_done_tasks(sdk, snapshot=snapshot),
         "prs": [],  # Disabled — _gather_prs was burning 22k+ gh API calls/hour
         "proposals": _gather_proposals(),
         "messages": _gather_messages(sdk),
         "agents": _gather_agents(),
         "jobs": _gather_jobs(),
-        "health": _gather_health(sdk),
+        "health": _gather_health(sdk, snapshot=snapshot),
         "drafts": _gather_drafts(sdk),
         "generated_at": datetime.now().isoformat(),
     }
@@ -86,21 +92,67 @@ def _read_live_turns() -> dict[str, int]:
         return {}
 
 
-def _gather_work(sdk: "OctopoidSDK") -> dict[str, list[dict[str, Any]]]:
+def _load_fresh_mirror() -> Any:
+    """Return the scheduler's on-disk task mirror if recently synced, else None."""
+    try:
+        from .task_mirror import load_fresh_mirror
+        return load_fresh_mirror()
+    except Exception:
+        return None
+
+
+def _list_queue(sdk: "OctopoidSDK", queue: str, snapshot: TickSnapshot | None) -> list[dict[str, Any]]:
+    """List a queue through the shared snapshot when given, else directly."""
+    if snapshot is not None:
+        return snapshot.list_tasks(queue)
+    return sdk.tasks.list(queue=queue)
+
+
+# Task columns read by _format_task(), _is_recent() and _gather_done_tasks()
+_CARD_FIELDS = (
+    "id", "title", "role", "priority", "branch", "created", "claimed_by",
+    "turns_used", "commits_count", "pr_number", "blocked_by", "project_id",
+    "attempt_count", "rejection_count", "checks", "check_results", "staging_url",
+    "claimed_at", "queue", "flow", "completed_at", "updated_at", "created_at",
+)
+
+
+def _list_recent(
+    sdk: "OctopoidSDK",
+    queue: str,
+    cutoff: datetime,
+    snapshot: TickSnapshot | None,
+) -> list[dict[str, Any]]:
+    """List the tasks in a queue that finished at or after cutoff.
+
+    Reads the snapshot when it is backed by the task mirror or has already
+    listed the queue. Otherwise asks the server for only the card columns and
+    only tasks updated since cutoff, so terminal queues are not downloaded in
+    full. The _is_recent() filter still runs for servers that ignore those
+    parameters.
+    """
+    if snapshot is not None and (snapshot.mirror is not None or snapshot.is_cached(queue)):
+        tasks = snapshot.list_tasks(queue)
+    else:
+        tasks = sdk.tasks.iter_tasks(queue=queue, fields=_CARD_FIELDS, updated_since=cutoff)
+    return [t for t in tasks if _is_recent(t, cutoff)]
+
+
+def _gather_work(sdk: "OctopoidSDK", snapshot: TickSnapshot | None = None) -> dict[str, list[dict[str, Any]]]:
     """Gather task work items from all relevant queues via API."""
     # Fetch tasks from API server
-    incoming = [_format_task(t) for t in sdk.tasks.list(queue='incoming')]
+    incoming = [_format_task(t) for t in _list_queue(sdk, 'incoming', snapshot)]
 
     # For in-progress tasks, overlay live turn counts from tool_counter files
     live_turns = _read_live_turns()
     claimed = []
-    for t in sdk.tasks.list(queue='claimed'):
+    for t in _list_queue(sdk, 'claimed', snapshot):
         formatted = _format_task(t)
         task_id = formatted.get("id")
         if task_id and task_id in live_turns:
             formatted["turns"] = live_turns[task_id]
         claimed.append(formatted)
-    provisional = [_format_task(t) for t in sdk.tasks.list(queue='provisional')]
+    provisional = [_format_task(t) for t in _list_queue(sdk, 'provisional', snapshot)]
 
     # Split provisional into "checking" (has pending checks) and "in_review" (ready for human)
     checking = []
@@ -124,7 +176,7 @@ def _gather_work(sdk: "OctopoidSDK") -> dict[str, list[dict[str, Any]]]:
 
     # Tasks needing intervention — flag them but keep their actual queue
     intervention = []
-    for t in sdk.tasks.list(queue='requires-intervention'):
+    for t in _list_queue(sdk, 'requires-intervention', snapshot):
         formatted = _format_task(t)
         formatted["needs_intervention"] = True
         task_id = formatted.get("id")
@@ -133,9 +185,8 @@ def _gather_work(sdk: "OctopoidSDK") -> dict[str, list[dict[str, Any]]]:
         intervention.append(formatted)
 
     # "done_today" — tasks completed in the last 24 hours
-    done_all = sdk.tasks.list(queue='done')
     cutoff = datetime.now() - timedelta(hours=24)
-    done_today = [_format_task(t) for t in done_all if _is_recent(t, cutoff)]
+    done_today = [_format_task(t) for t in _list_recent(sdk, 'done', cutoff, snapshot)]
 
     return {
         "incoming": incoming,
@@ -147,7 +198,10 @@ def _gather_work(sdk: "OctopoidSDK") -> dict[str, list[dict[str, Any]]]:
     }
 
 
-def _gather_done_tasks(sdk: Optional["OctopoidSDK"] = None) -> list[dict[str, Any]]:
+def _gather_done_tasks(
+    sdk: Optional["OctopoidSDK"] = None,
+    snapshot: TickSnapshot | None = None,
+) -> list[dict[str, Any]]:
     """Gather completed tasks from the last 7 days for the Done tab.
 
     Includes merge method derived from task_history 'accepted' events.
@@ -159,20 +213,17 @@ def _gather_done_tasks(sdk: Optional["OctopoidSDK"] = None) -> list[dict[str, An
         return []
 
     # Done tasks
-    done_all = sdk.tasks.list(queue='done')
-    done_recent = [t for t in done_all if _is_recent(t, cutoff)]
+    done_recent = _list_recent(sdk, 'done', cutoff, snapshot)
 
     # Failed tasks
     try:
-        failed_all = sdk.tasks.list(queue='failed')
-        failed_recent = [t for t in failed_all if _is_recent(t, cutoff)]
+        failed_recent = _list_recent(sdk, 'failed', cutoff, snapshot)
     except Exception:
         failed_recent = []
 
     # Recycled tasks
     try:
-        recycled_all = sdk.tasks.list(queue='recycled')
-        recycled_recent = [t for t in recycled_all if _is_recent(t, cutoff)]
+        recycled_recent = _list_recent(sdk, 'recycled', cutoff, snapshot)
     except Exception:
         recycled_recent = []
 
@@ -671,7 +722,10 @@ def _get_agent_notes(notes_dir: Path, current_task: str | None) -> str | None:
 # ---------------------------------------------------------------------------
 
 
-def _gather_health(sdk: Optional["OctopoidSDK"] = None) -> dict[str, Any]:
+def _gather_health(
+    sdk: Optional["OctopoidSDK"] = None,
+    snapshot: TickSnapshot | None = None,
+) -> dict[str, Any]:
     """Gather system health information."""
     # Try to load agent config, but gracefully handle API-only mode
     try:
@@ -704,10 +758,10 @@ def _gather_health(sdk: Optional["OctopoidSDK"] = None) -> dict[str, Any]:
     # Queue depth = incoming + claimed + breakdown
     if sdk:
         # v2.0 API mode
-        incoming = len(sdk.tasks.list(queue='incoming'))
-        claimed = len(sdk.tasks.list(queue='claimed'))
+        incoming = len(_list_queue(sdk, 'incoming', snapshot))
+        claimed = len(_list_queue(sdk, 'claimed', snapshot))
         try:
-            breakdown = len(sdk.tasks.list(queue='breakdown'))
+            breakdown = len(_list_queue(sdk, 'breakdown', snapshot))
         except Exception:
             breakdown = 0
         queue_depth = incoming + claimed + breakdown
@@ -720,6 +774,10 @@ def _gather_health(sdk: Optional["OctopoidSDK"] = None) -> dict[str, Any]:
         except Exception:
             pass
 
+    # Slowest API endpoints over recent scheduler ticks; fall back to this
+    # process's own calls when the scheduler has not recorded any yet
+    api_endpoints = _top_api_endpoints(sdk)
+
     return {
         "scheduler": scheduler_status,
         "system_paused": system_paused,
@@ -728,9 +786,38 @@ def _gather_health(sdk: Optional["OctopoidSDK"] = None) -> dict[str, Any]:
         "paused_agents": paused_count,
         "total_agents": len(agents),
         "queue_depth": queue_depth,
+        "api_endpoints": api_endpoints,
     }
 
 
+def _top_api_endpoints(sdk: Optional["OctopoidSDK"], limit: int = 5) -> list[dict[str, Any]]:
+    """Return the API endpoints with the most total time, slowest first."""
+    from .api_metrics import top_endpoints
+    try:
+        endpoints = top_endpoints(limit=limit)
+    except Exception:
+        endpoints = []
+    if endpoints or sdk is None:
+        return endpoints
+    try:
+        stats = sdk.stats()
+    except Exception:
+        return []
+    if not isinstance(stats, dict):
+        return []
+    ranked = sorted(stats.items(), key=lambda item: item[1].get("total_ms", 0), reverse=True)[:limit]
+    return [
+        {
+            "endpoint": name,
+            "calls": e.get("calls", 0),
+            "errors": e.get("errors", 0),
+            "total_ms": round(e.get("total_ms", 0.0), 1),
+            "avg_ms": round(e.get("avg_ms", 0.0), 1),
+        }
+        for name, e in ranked
+    ]
+
+
 def _get_scheduler_status() -> str:
     """Determine if the scheduler is running via launchctl."""
     try:
@@ -0,0 +1,52 @@
+"""Per-resource concurrency caps for parallel agent evaluation.
+
+When the scheduler evaluates blueprints in a thread pool, each worker still
+funnels through a few shared resources: the git repository (fetch, worktree
+add) and the API server (claims). resource_slot() bounds how many workers may
+use a resource at once, independently of the pool size.
+
+Resources without a configured limit are unbounded, so in the default
+sequential mode resource_slot() costs a dict lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+_semaphores: dict[str, threading.BoundedSemaphore] = {}
+_lock = threading.Lock()
+
+
+def configure_resource_limits(limits: dict[str, int]) -> None:
+    """Set the concurrency cap for each named resource.
+
+    Replaces any previous configuration. Call before starting workers; a
+    resource whose limit is missing or not positive is left unbounded.
+
+    Args:
+        limits: Mapping of resource name (e.g. "git", "api") to max concurrency.
+    """
+    with _lock:
+        _semaphores.clear()
+        for name, limit in limits.items():
+            if limit and int(limit) > 0:
+                _semaphores[name] = threading.BoundedSemaphore(int(limit))
+
+
+def clear_resource_limits() -> None:
+    """Remove all caps (every resource becomes unbounded)."""
+    with _lock:
+        _semaphores.clear()
+
+
+@contextmanager
+def resource_slot(name: str) -> Iterator[None]:
+    """Hold one slot of a resource for the duration of the block.
+
+    Blocks until a slot is free. A no-op for unbounded resources.
+    """
+    semaphore = _semaphores.get(name)
+    with semaphore if semaphore is not None else nullcontext():
+        yield
@@ -0,0 +1,377 @@
+"""Background handling of finished agents' results.
+
+Handling a result can run a flow's steps: tests (up to five minutes), a
+rebase, a push, creating and merging a PR. Done inline in the tick, one slow
+test suite holds up lease renewal, spawning and every other job. In daemon
+mode the tick hands finished agents to a small pool of worker threads
+instead:
+
+- check_and_update_finished_agents() adds each dead PID to a persistent queue
+  (.octopoid/runtime/result_queue.json) and returns.
+- Entries submitted together are first handed, as a group, to an optional
+  prepare callable on a worker (the scheduler classifies their outcomes in
+  one batch inference call), then handled one by one.
+- A worker takes the task's lock (``.result.lock`` in the task dir, so a
+  one-shot scheduler run never handles the same task at the same time) and
+  runs the result handler. The entry records the attempt count, the last
+  error and the steps completed (from step_progress.json).
+- When the handler has moved the task on, the entry is marked done. The next
+  check_and_update_finished_agents() call removes the PID from
+  running_pids.json and drops the entry; PID files are never written from a
+  worker thread. A handler that returns False or raises leaves the entry
+  pending, and the next tick retries it, as before.
+
+The queue survives restarts: entries that were running when the daemon
+stopped become pending again and are retried, with their steps' pre_checks
+skipping work already done. Entries already done are reaped without running
+the handler a second time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .lock_utils import locked
+
+logger = logging.getLogger("octopoid.scheduler")
+
+QUEUE_FILENAME = "result_queue.json"
+TASK_LOCK_FILENAME = ".result.lock"
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+
+
+def get_queue_path() -> Path:
+    """Path of the persistent result queue."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / QUEUE_FILENAME
+
+
+def entry_key(blueprint_name: str, pid: int) -> str:
+    """Queue key of a tracked PID."""
+    return f"{blueprint_name}:{pid}"
+
+
+def task_lock_path(task_dir: Path) -> Path:
+    """Lock held while a task's result is being handled."""
+    return task_dir / TASK_LOCK_FILENAME
+
+
+def _now() -> str:
+    return datetime.now(tz=timezone.utc).isoformat()
+
+
+def read_step_progress(task_dir: Path, since: float = 0.0) -> dict[str, Any] | None:
+    """Return step_progress.json if execute_steps wrote it at or after since."""
+    path = task_dir / "step_progress.json"
+    try:
+        if path.stat().st_mtime < since:
+            return None
+        progress = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return progress if isinstance(progress, dict) else None
+
+
+class ResultQueue:
+    """The queue file. Every change is a read-modify-write under a flock."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @contextmanager
+    def _edit(self) -> Iterator[dict[str, dict]]:
+        with locked(self.path.with_suffix(".lock"), blocking=True):
+            entries = self._read()
+            before = json.dumps(entries, sort_keys=True)
+            yield entries
+            if json.dumps(entries, sort_keys=True) != before:
+                self._write(entries)
+
+    def _read(self) -> dict[str, dict]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        entries = data.get("entries") if isinstance(data, dict) else None
+        return entries if isinstance(entries, dict) else {}
+
+    def _write(self, entries: dict[str, dict]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".result_queue_", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"entries": entries}, f, indent=2)
+            os.rename(temp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def entries(self) -> dict[str, dict]:
+        """Return a snapshot of every entry, keyed by entry_key()."""
+        return self._read()
+
+    def add(self, blueprint_name: str, pid: int, info: dict, claim_from: str) -> bool:
+        """Queue a finished PID. Returns False if it is already queued."""
+        key = entry_key(blueprint_name, pid)
+        with self._edit() as entries:
+            if key in entries:
+                return False
+            entries[key] = {
+                "blueprint": blueprint_name,
+                "pid": pid,
+                "task_id": info.get("task_id", ""),
+                "instance_name": info.get("instance_name", blueprint_name),
+                "claim_from": claim_from,
+                "status": PENDING,
+                "attempts": 0,
+                "enqueued_at": _now(),
+                "updated_at": _now(),
+                "steps": None,
+                "error": "",
+            }
+        return True
+
+    def update(self, key: str, **fields: Any) -> dict | None:
+        """Update an entry's fields. Returns the new entry, or None if it is gone."""
+        with self._edit() as entries:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            entry.update(fields, updated_at=_now())
+            return dict(entry)
+
+    def claim(self, key: str) -> dict | None:
+        """Mark a pending entry running and count the attempt.
+
+        Returns the entry, or None if it is gone or not pending.
+        """
+        with self._edit() as entries:
+            entry = entries.get(key)
+            if entry is None or entry.get("status") != PENDING:
+                return None
+            entry.update(status=RUNNING, attempts=entry.get("attempts", 0) + 1, updated_at=_now())
+            return dict(entry)
+
+    def remove(self, key: str) -> None:
+        with self._edit() as entries:
+            entries.pop(key, None)
+
+    def retain(self, keys: set[str]) -> list[str]:
+        """Drop entries whose PID is no longer tracked. Returns the dropped keys."""
+        with self._edit() as entries:
+            dropped = [key for key in entries if key not in keys]
+            for key in dropped:
+                del entries[key]
+        return dropped
+
+    def recover(self) -> list[str]:
+        """Make entries left running by a stopped daemon pending again."""
+        recovered = []
+        with self._edit() as entries:
+            for key, entry in entries.items():
+                if entry.get("status") == RUNNING:
+                    entry.update(status=PENDING, updated_at=_now())
+                    recovered.append(key)
+        return recovered
+
+
+class ResultWorkers:
+    """A bounded thread pool draining the result queue.
+
+    Args:
+        size: Maximum results handled at once.
+        handler: Called as handler(blueprint_name, claim_from, task_id,
+            instance_name, task_dir) and returns True once the task has been
+            moved on (see housekeeping._dispatch_result).
+        queue: The queue to drain (default: get_queue_path()).
+        prepare: Called with the entries of each group of two or more
+            submitted together, on a worker, before their handlers run.
+            Errors are logged and the handlers run anyway.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        handler: Callable[[str, str, str, str, Path], bool],
+        queue: ResultQueue | None = None,
+        prepare: Callable[[list[dict]], Any] | None = None,
+    ):
+        self.size = max(1, size)
+        self.handler = handler
+        self.prepare = prepare
+        self.queue = queue or ResultQueue(get_queue_path())
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight: set[str] = set()
+        self._finished: list[int] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the threads and requeue entries a previous daemon left running."""
+        for key in self.queue.recover():
+            logger.info(f"Result queue: resuming {key} after restart")
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="octopoid-result")
+
+    def stop(self) -> None:
+        """Cancel queued work and wait for handlers already running."""
+        if self._executor is not None:
+            with self._lock:
+                running = len(self._in_flight)
+            if running:
+                logger.info(f"Result queue: waiting for {running} result handler(s) to finish")
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def in_flight(self) -> set[str]:
+        with self._lock:
+            return set(self._in_flight)
+
+    def take_finished(self) -> list[int]:
+        """Return PIDs whose entries became done since the last call."""
+        with self._lock:
+            finished, self._finished = self._finished, []
+        return finished
+
+    def submit_pending(self) -> int:
+        """Hand every pending entry not already being handled to a worker.
+
+        Returns the number of entries submitted.
+        """
+        if self._executor is None:
+            return 0
+        entries = []
+        for key, entry in self.queue.entries().items():
+            if entry.get("status") != PENDING:
+                continue
+            with self._lock:
+                if key in self._in_flight:
+                    continue
+                self._in_flight.add(key)
+            entries.append((key, entry))
+        if self.prepare is not None and len(entries) > 1:
+            return len(entries) if self._submit(self._prepare_and_run, entries, entries) else 0
+        return self._submit_each(entries)
+
+    def _submit(self, fn: Callable, arg: Any, entries: list[tuple[str, dict]]) -> bool:
+        """Submit fn(arg), releasing entries if the pool has shut down."""
+        executor = self._executor
+        try:
+            if executor is not None:
+                executor.submit(fn, arg)
+                return True
+        except RuntimeError:
+            pass
+        # Shut down since the check
+        with self._lock:
+            self._in_flight.difference_update(key for key, _ in entries)
+        return False
+
+    def _submit_each(self, entries: list[tuple[str, dict]]) -> int:
+        for index, (key, _) in enumerate(entries):
+            if not self._submit(self._run, key, entries[index:]):
+                return index
+        return len(entries)
+
+    def _prepare_and_run(self, entries: list[tuple[str, dict]]) -> None:
+        try:
+            self.prepare([entry for _, entry in entries])
+        except Exception as e:
+            logger.warning(f"Result queue: preparing {len(entries)} results failed: {e}")
+        self._submit_each(entries)
+
+    def _run(self, key: str) -> None:
+        try:
+            self._handle(key)
+        except Exception as e:
+            logger.error(f"Result queue: unexpected error handling {key}: {e}")
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def _handle(self, key: str) -> None:
+        from .config import get_tasks_dir
+
+        entry = self.queue.entries().get(key)
+        if entry is None or entry.get("status") != PENDING:
+            return
+        task_dir = get_tasks_dir() / entry["task_id"]
+        if not task_dir.exists():
+            # The tick drops the PID and the entry
+            return
+        with locked(task_lock_path(task_dir), blocking=False) as acquired:
+            if not acquired:
+                logger.debug(f"Result queue: task {entry['task_id']} is being handled elsewhere, retrying later")
+                return
+            entry = self.queue.claim(key)
+            if entry is None:
+                return
+            started = datetime.now().timestamp()
+            instance_name = entry["instance_name"]
+            error = ""
+            try:
+                transitioned = self.handler(
+                    entry["blueprint"], entry["claim_from"], entry["task_id"], instance_name, task_dir,
+                )
+            except Exception as e:
+                transitioned = False
+                error = str(e)[:500]
+                logger.error(
+                    f"Instance {instance_name} (PID {entry['pid']}) "
+                    f"result handling failed, will retry next tick: {e}"
+                )
+            # Allow for coarse file timestamps; an earlier flow's file is minutes old
+            steps = read_step_progress(task_dir, since=started - 1) or entry.get("steps")
+            self.queue.update(key, status=DONE if transitioned else PENDING, steps=steps, error=error)
+
+        if transitioned:
+            with self._lock:
+                self._finished.append(entry["pid"])
+        elif not error:
+            logger.debug(
+                f"Instance {instance_name} (PID {entry['pid']}): handler returned False "
+                f"(task not transitioned), keeping PID for retry"
+            )
+
+
+_workers: ResultWorkers | None = None
+
+
+def get_result_workers() -> ResultWorkers | None:
+    """Return the running worker pool, or None when results are handled inline."""
+    return _workers
+
+
+def start_result_workers(
+    size: int,
+    handler: Callable[[str, str, str, str, Path], bool],
+    prepare: Callable[[list[dict]], Any] | None = None,
+) -> ResultWorkers:
+    """Start the process-wide worker pool (see ResultWorkers)."""
+    global _workers
+    stop_result_workers()
+    workers = ResultWorkers(size, handler, prepare=prepare)
+    workers.start()
+    _workers = workers
+    return workers
+
+
+def stop_result_workers() -> None:
+    """Stop the worker pool; results are handled inline again afterwards."""
+    global _workers
+    workers, _workers = _workers, None
+    if workers is not None:
+        workers.stop()
@@ -9,8 +9,11 @@ import shutil
 import signal
 import subprocess
 import sys
+import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -24,14 +27,20 @@ from .config import (
     get_jobs_dir,
     get_base_branch,
     get_orchestrator_dir,
+    get_scheduler_config,
     get_scope,
     get_tasks_dir,
+    invalidate_config_cache,
     is_system_paused,
 )
 from .git_utils import get_task_branch, get_worktree_path
 from .lock_utils import locked_or_skip
+from .log_tail import read_result
 from .port_utils import get_port_env_vars
-from . import queue_utils
+from .resource_limits import clear_resource_limits, configure_resource_limits, resource_slot
+from . import api_metrics, queue_utils, result_queue, status_api
+from .exit_watcher import ExitWatcher, install_exit_watcher, uninstall_exit_watcher, watch_pid
+from .tick_snapshot import TickSnapshot
 from .state_utils import (
     AgentState,
     is_overdue,
@@ -47,7 +56,6 @@ from .pool import (
     register_instance_pid,
 )
 from .result_handler import (
-    extract_stdout_text,
     handle_agent_result,
     handle_agent_result_via_flow,
     handle_fixer_result,
@@ -77,9 +85,11 @@ from .housekeeping import (
     HOUSEKEEPING_JOBS,
     QUEUE_HEALTH_CHECK_INTERVAL_SECONDS,
     _check_queue_health_throttled,
+    _dispatch_result,
     _evaluate_project_script_condition,
     _execute_project_flow_transition,
     _log_pid_snapshot,
+    _prefetch_results,
     _register_orchestrator,
     _sweep_task_resources,
     _task_past_grace,
@@ -107,6 +117,9 @@ class AgentContext:
     state_path: Path
     claimed_task: dict | None = None
     queue_counts: dict | None = None  # Pre-fetched from poll endpoint; None → individual API calls
+    snapshot: TickSnapshot | None = None  # Tick-scoped task lists shared with other jobs
+    # Further tasks claimed in the same batch as claimed_task, spawned in this tick too
+    extra_claimed_tasks: list[dict] = field(default_factory=list)
 
 
 def guard_enabled(ctx: AgentContext) -> tuple[bool, str]:
@@ -188,10 +201,10 @@ def guard_backpressure(ctx: AgentContext) -> tuple[bool, str]:
         if ctx.queue_counts is not None:
             incoming = ctx.queue_counts.get("incoming", 0)
         else:
-            incoming = count_queue("incoming")
+            incoming = count_queue("incoming", snapshot=ctx.snapshot)
         if incoming == 0:
             return (False, "backpressure: no_tasks")
-        can_proceed, reason = can_claim_task(ctx.queue_counts)
+        can_proceed, reason = can_claim_task(ctx.queue_counts, snapshot=ctx.snapshot)
         if not can_proceed:
             return (False, f"backpressure: {reason}")
         return (True, "")
@@ -211,7 +224,7 @@ def guard_backpressure(ctx: AgentContext) -> tuple[bool, str]:
         if ctx.queue_counts is not None:
             count = ctx.queue_counts.get(claim_from, 0)
         else:
-            count = count_queue(claim_from)
+            count = count_queue(claim_from, snapshot=ctx.snapshot)
         if count == 0:
             return (False, f"backpressure: no_{claim_from}_tasks")
         return (True, "")
@@ -231,6 +244,10 @@ def guard_pre_check(ctx: AgentContext) -> tuple[bool, str]:
     return (True, "")
 
 
+# Serialises the backpressure re-check and the claim when agents are evaluated in parallel
+_claim_lock = threading.Lock()
+
+
 def guard_claim_task(ctx: AgentContext) -> tuple[bool, str]:
     """Claim a task for scripts-mode agents (sets ctx.claimed_task).
 
@@ -387,15 +404,50 @@ def guard_claim_task(ctx: AgentContext) -> tuple[bool, str]:
         ctx.claimed_task = task
         return (True, "")
 
-    task = claim_and_prepare_task(
-        agent_name=ctx.agent_name,
-        role=ctx.role,
-        role_filter=role_filter,
-        type_filter=type_filter,
-        claim_from=claim_from,
-    )
+    # Claim one task per idle pool slot in a single request, so a pool with
+    # several free slots fills up in one tick instead of one slot per tick.
+    blueprint_name = ctx.agent_config.get("blueprint_name", ctx.agent_name)
+    idle_capacity = max(1, ctx.agent_config.get("max_instances", 1) - count_running_instances(blueprint_name))
+
+    # guard_backpressure ran without the lock, so parallel evaluation workers
+    # may all have seen room for one more claim. Re-count the claimed queue
+    # and claim under _claim_lock; the snapshot is invalidated before it is
+    # released, so the next worker counts the claimed queue afresh.
+    with _claim_lock, resource_slot("api"):
+        if claim_from == "incoming":
+            from .backpressure import claim_headroom
+            headroom = claim_headroom(snapshot=ctx.snapshot)
+            if headroom == 0:
+                return (False, "backpressure: max_claimed reached by another claim this tick")
+            idle_capacity = min(idle_capacity, headroom)
+
+        if idle_capacity > 1:
+            tasks = claim_and_prepare_tasks(
+                agent_name=ctx.agent_name,
+                role=ctx.role,
+                limit=idle_capacity,
+                role_filter=role_filter,
+                type_filter=type_filter,
+                claim_from=claim_from,
+                snapshot=ctx.snapshot,
+            )
+        else:
+            task = claim_and_prepare_task(
+                agent_name=ctx.agent_name,
+                role=ctx.role,
+                role_filter=role_filter,
+                type_filter=type_filter,
+                claim_from=claim_from,
+                snapshot=ctx.snapshot,
+            )
+            tasks = [task] if task is not None else []
 
-    if task is None:
+        # The claim moved a task out of claim_from — drop both queues from the
+        # tick snapshot so later backpressure checks this tick see the new counts.
+        if tasks and ctx.snapshot is not None:
+            ctx.snapshot.invalidate(claim_from, "claimed")
+
+    if not tasks:
         return (False, "no_task_to_claim")
 
     # Dedup check: skip if another running instance of this blueprint is already
@@ -406,16 +458,19 @@ def guard_claim_task(ctx: AgentContext) -> tuple[bool, str]:
     # handled by a running instance. Requeuing would yank it out from under
     # the running agent, causing the result to be processed against the wrong
     # queue state (e.g. gatekeeper approves but task is now in 'claimed').
-    blueprint_name = ctx.agent_config.get("blueprint_name", ctx.agent_name)
     active_task_ids = get_active_task_ids(blueprint_name)
-    if task["id"] in active_task_ids:
-        logger.debug(
-            f"guard_claim_task: task {task['id']} already being processed by "
-            f"another {blueprint_name} instance, skipping (not requeuing)"
-        )
-        return (False, f"duplicate_task: {task['id']} already being processed")
+    fresh = [t for t in tasks if t["id"] not in active_task_ids]
+    for task in tasks:
+        if task["id"] in active_task_ids:
+            logger.debug(
+                f"guard_claim_task: task {task['id']} already being processed by "
+                f"another {blueprint_name} instance, skipping (not requeuing)"
+            )
+    if not fresh:
+        return (False, f"duplicate_task: {tasks[0]['id']} already being processed")
 
-    ctx.claimed_task = task
+    ctx.claimed_task = fresh[0]
+    ctx.extra_claimed_tasks = fresh[1:]
     return (True, "")
 
 
@@ -629,7 +684,7 @@ def peek_task_branch(role: str) -> str | None:
     return branch if branch and branch != "main" else None
 
 
-def check_continuation_for_agent(agent_name: str) -> dict | None:
+def check_continuation_for_agent(agent_name: str, snapshot: TickSnapshot | None = None) -> dict | None:
     """Check if an agent has continuation work to resume.
 
     Looks for:
@@ -638,6 +693,8 @@ def check_continuation_for_agent(agent_name: str) -> dict | None:
 
     Args:
         agent_name: Name of the agent to check
+        snapshot: Tick snapshot; when it is backed by the task mirror the
+            needs_continuation queue is read from there instead of the server
 
     Returns:
         Task dict with '_continuation' flag if work found, None otherwise
@@ -658,7 +715,10 @@ def check_continuation_for_agent(agent_name: str) -> dict | None:
             queue_utils.clear_task_marker_for(agent_name)
 
     # Check needs_continuation queue
-    continuation_tasks = queue_utils.get_continuation_tasks(agent_name=agent_name)
+    listed = None
+    if snapshot is not None and snapshot.mirror is not None:
+        listed = snapshot.list_tasks("needs_continuation")
+    continuation_tasks = queue_utils.get_continuation_tasks(agent_name=agent_name, tasks=listed)
     if continuation_tasks:
         task = continuation_tasks[0]
         task["_continuation"] = True
@@ -676,6 +736,7 @@ def claim_and_prepare_task(
     type_filter: str | None = None,
     claim_from: str = "incoming",
     role_filter: str | None = _UNSET,  # type: ignore[assignment]
+    snapshot: TickSnapshot | None = None,
 ) -> dict | None:
     """Claim a task and write it to the agent's runtime dir.
 
@@ -691,6 +752,7 @@ def claim_and_prepare_task(
         role_filter: Role to filter tasks by. Defaults to `role` when unset.
             Pass None explicitly to claim tasks regardless of their original
             role (e.g. gatekeeper reviewing provisional tasks with role='implement').
+        snapshot: Tick snapshot used for the continuation check.
 
     Returns:
         Task dict if work is available, None otherwise
@@ -698,7 +760,7 @@ def claim_and_prepare_task(
     # 1. Check for continuation work (only for incoming queue claims)
     task = None
     if claim_from == "incoming":
-        task = check_continuation_for_agent(agent_name)
+        task = check_continuation_for_agent(agent_name, snapshot=snapshot)
 
     # 2. If no continuation, claim a fresh task
     if task is None:
@@ -714,14 +776,64 @@ def claim_and_prepare_task(
         return None
 
     # 3. Write full task dict to agent runtime dir
+    _write_claimed_task(agent_name, task)
+    return task
+
+
+def claim_and_prepare_tasks(
+    agent_name: str,
+    role: str,
+    limit: int,
+    type_filter: str | None = None,
+    claim_from: str = "incoming",
+    role_filter: str | None = _UNSET,  # type: ignore[assignment]
+    snapshot: TickSnapshot | None = None,
+) -> list[dict]:
+    """Claim up to limit tasks in one request, for a pool with several idle slots.
+
+    Like claim_and_prepare_task(), but fresh tasks are claimed in one request
+    (queue_utils.claim_tasks). Continuation work is still returned on its own.
+    Only the first task is written to claimed_task.json; the caller spawns the
+    others with their task passed in the context. The other arguments are as
+    for claim_and_prepare_task().
+
+    Args:
+        limit: Maximum number of tasks to claim (the number of idle slots).
+
+    Returns:
+        The claimed tasks (possibly empty).
+    """
+    # 1. Check for continuation work (only for incoming queue claims)
+    tasks: list[dict] = []
+    if claim_from == "incoming":
+        task = check_continuation_for_agent(agent_name, snapshot=snapshot)
+        if task is not None:
+            tasks = [task]
+
+    # 2. If no continuation, claim fresh tasks
+    if not tasks:
+        tasks = queue_utils.claim_tasks(
+            limit,
+            role_filter=role if role_filter is _UNSET else role_filter,
+            agent_name=agent_name,
+            type_filter=type_filter,
+            from_queue=claim_from,
+        )
+        if not tasks:
+            return []
+
+    # 3. Write the first task to agent runtime dir
+    _write_claimed_task(agent_name, tasks[0])
+    return tasks
+
+
+def _write_claimed_task(agent_name: str, task: dict) -> None:
+    """Write the full task dict (including content) to the agent's claimed_task.json."""
     agent_dir = get_agents_runtime_dir() / agent_name
     agent_dir.mkdir(parents=True, exist_ok=True)
-    task_file = agent_dir / "claimed_task.json"
-    with open(task_file, "w") as f:
+    with open(agent_dir / "claimed_task.json", "w") as f:
         json.dump(task, f, indent=2)
 
-    return task
-
 
 # =============================================================================
 # Per-job interval management
@@ -789,6 +901,11 @@ def record_job_run(scheduler_state: dict, job_name: str) -> None:
     scheduler_state["jobs"][job_name] = datetime.now().isoformat()
 
 
+def mark_job_due(scheduler_state: dict, job_name: str) -> None:
+    """Make a job due on the next tick regardless of its interval."""
+    scheduler_state.get("jobs", {}).pop(job_name, None)
+
+
 def get_scheduler_lock_path() -> Path:
     """Get path to the global scheduler lock file."""
     from .config import get_runtime_dir
@@ -894,6 +1011,7 @@ def prepare_task_directory(
         {task_dir}/scripts/      - executable agent scripts
         {task_dir}/stdout.log    - agent stdout (read by scheduler for result inference)
         {task_dir}/notes.md      - progress notes
+        {task_dir}/result.json   - optional structured result, written by agent scripts
     """
     from .git_utils import create_task_worktree
 
@@ -908,9 +1026,7 @@ def prepare_task_directory(
     stdout_path = task_dir / "stdout.log"
     if stdout_path.exists():
         try:
-            prev_content = stdout_path.read_text(errors="replace")
-            prev_content = extract_stdout_text(prev_content)
-            tail = prev_content[-3000:]
+            _, tail = read_result(stdout_path, max_chars=3000)
             (task_dir / "prev_stdout.log").write_text(tail)
             # Archive as stdout-{blueprint}-{attempt}.log to preserve per-attempt output
             blueprint_name = agent_config.get("blueprint_name", agent_name)
@@ -921,7 +1037,7 @@ def prepare_task_directory(
             pass
 
     # Clean stale artifacts from previous runs
-    for stale_file in ['stdout.log', 'notes.md']:
+    for stale_file in ['stdout.log', 'notes.md', 'result.json']:
         stale_path = task_dir / stale_file
         if stale_path.exists():
             stale_path.unlink()
@@ -976,6 +1092,7 @@ def prepare_task_directory(
         f"export WORKTREE='{worktree_path}'",
         f"export ORCHESTRATOR_PYTHONPATH='{orchestrator_submodule}'",
         f"export NOTES_FILE='{task_dir / 'notes.md'}'",
+        f"export RESULT_FILE='{task_dir / 'result.json'}'",
     ]
     (task_dir / "env.sh").write_text("\n".join(env_lines) + "\n")
 
@@ -1077,17 +1194,19 @@ def invoke_claude(task_dir: Path, agent_config: dict) -> int:
     # Set up log files
     stdout_log = task_dir / "stdout.log"
     stderr_log = task_dir / "stderr.log"
-    stdout_file = open(stdout_log, "w")
-    stderr_file = open(stderr_log, "w")
-
-    process = subprocess.Popen(
-        cmd,
-        cwd=worktree_path,
-        env=env,
-        stdout=stdout_file,
-        stderr=stderr_file,
-        start_new_session=True,
-    )
+    # The child keeps its own copies of the log descriptors; close ours so a
+    # long-running daemon does not leak two per spawn
+    with open(stdout_log, "w") as stdout_file, open(stderr_log, "w") as stderr_file:
+        process = subprocess.Popen(
+            cmd,
+            cwd=worktree_path,
+            env=env,
+            stdout=stdout_file,
+            stderr=stderr_file,
+            start_new_session=True,
+        )
+
+    watch_pid(process.pid)
 
     logger.debug(f"Invoked claude for task dir {task_dir} with PID {process.pid}")
     return process.pid
@@ -1272,7 +1391,8 @@ def spawn_implementer(ctx: AgentContext) -> int:
     blueprint_name = ctx.agent_config.get("blueprint_name", ctx.agent_name)
     instance_name = _next_instance_name(blueprint_name)
 
-    task_dir = prepare_task_directory(ctx.claimed_task, instance_name, ctx.agent_config)
+    with resource_slot("git"):
+        task_dir = prepare_task_directory(ctx.claimed_task, instance_name, ctx.agent_config)
     pid = invoke_claude(task_dir, ctx.agent_config)
 
     register_instance_pid(blueprint_name, pid, ctx.claimed_task["id"], instance_name)
@@ -1300,27 +1420,65 @@ def get_spawn_strategy(ctx: AgentContext) -> Callable:
 def _fetch_poll_data() -> dict | None:
     """Fetch combined scheduler state from the poll endpoint.
 
+    The poll carries the task mirror's change cursor (``since``); servers that
+    support delta sync return the tasks changed since then, which are applied
+    to the mirror here. ``poll_data["mirror_synced"]`` is True when the mirror
+    is current and may be read instead of listing queues.
+
     Returns the poll response dict, or None if the call failed.
     Logs a debug warning on failure so callers can fall back gracefully.
     """
+    from .task_mirror import get_task_mirror
+
+    try:
+        mirror = get_task_mirror()
+    except Exception as e:
+        logger.debug(f"Task mirror unavailable: {e}")
+        mirror = None
+
     try:
         orch_id = queue_utils.get_orchestrator_id()
         sdk = queue_utils.get_sdk()
-        poll_data = sdk.poll(orch_id)
+        if mirror is not None:
+            poll_data = sdk.poll(orch_id, since=mirror.since)
+        else:
+            poll_data = sdk.poll(orch_id)
         logger.debug(f"Poll response: queue_counts={poll_data.get('queue_counts')}, "
                   f"provisional_tasks={len(poll_data.get('provisional_tasks') or [])}, "
                   f"orchestrator_registered={poll_data.get('orchestrator_registered')}")
-        return poll_data
     except Exception as e:
         logger.debug(f"Poll endpoint unavailable, falling back to individual API calls: {e}")
         return None
 
+    synced = False
+    if mirror is not None:
+        try:
+            synced = mirror.apply_poll(poll_data)
+        except Exception as e:
+            logger.debug(f"Could not apply poll delta to task mirror: {e}")
+    poll_data["mirror_synced"] = synced
+    # The delta has been applied; don't keep every changed task alive in
+    # poll_data for the rest of the tick
+    poll_data.pop("changed_tasks", None)
+    return poll_data
+
+
+# Serialises system_health.json read-modify-write when spawns run in parallel
+_systemic_failure_lock = threading.Lock()
 
-def _run_agent_evaluation_loop(queue_counts: dict | None) -> None:
+
+def _run_agent_evaluation_loop(queue_counts: dict | None, snapshot: TickSnapshot | None = None) -> None:
     """Evaluate and spawn agents for one tick.
 
+    By default blueprints are evaluated one after another. With
+    ``scheduler.parallel_evaluation: true`` in config.yaml, guard chains and
+    spawn preparation run in a bounded thread pool (``scheduler.max_workers``),
+    with git and API work capped separately by ``scheduler.resource_limits``.
+    Each agent is still evaluated under its own locked_or_skip lock.
+
     Args:
         queue_counts: Pre-fetched queue counts from poll (or None to use individual calls).
+        snapshot: Tick snapshot shared with the other jobs in this tick.
     """
     try:
         agents = get_agents()
@@ -1333,77 +1491,156 @@ def _run_agent_evaluation_loop(queue_counts: dict | None) -> None:
         logger.debug("No agents configured")
         return
 
-    for agent_config in agents:
-        agent_name = agent_config.get("name")
-        role = agent_config.get("role") or agent_config.get("type")
+    candidates = [a for a in agents if _is_pool_candidate(a)]
+    scheduler_config = get_scheduler_config()
+    workers = min(scheduler_config["max_workers"], len(candidates))
 
-        # Skip job-scheduled agents — they are invoked by jobs.yaml, not the pool loop.
-        if agent_config.get("job_agent"):
-            logger.debug(f"Skipping job agent {agent_name} (managed by jobs.yaml)")
-            continue
+    if not scheduler_config["parallel_evaluation"] or workers <= 1:
+        for agent_config in candidates:
+            _evaluate_and_spawn(agent_config, queue_counts, snapshot)
+        return
 
-        # Skip on-demand agents — spawned directly by the scheduler when needed
-        # (e.g. diagnostic agent on auto-pause), not by pool evaluation.
-        if agent_config.get("on_demand"):
-            logger.debug(f"Skipping on-demand agent {agent_name}")
-            continue
+    logger.debug(f"Evaluating {len(candidates)} agents with {workers} workers")
+    configure_resource_limits(scheduler_config["resource_limits"])
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="octopoid-eval") as pool:
+            futures = {
+                pool.submit(_evaluate_and_spawn, agent_config, queue_counts, snapshot): agent_config.get("name")
+                for agent_config in candidates
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Evaluation of agent {futures[future]} failed: {e}")
+    finally:
+        clear_resource_limits()
+
+
+def _is_pool_candidate(agent_config: dict) -> bool:
+    """Return True if the pool loop should evaluate this agent config."""
+    agent_name = agent_config.get("name")
+    role = agent_config.get("role") or agent_config.get("type")
+
+    # Skip job-scheduled agents — they are invoked by jobs.yaml, not the pool loop.
+    if agent_config.get("job_agent"):
+        logger.debug(f"Skipping job agent {agent_name} (managed by jobs.yaml)")
+        return False
+
+    # Skip on-demand agents — spawned directly by the scheduler when needed
+    # (e.g. diagnostic agent on auto-pause), not by pool evaluation.
+    if agent_config.get("on_demand"):
+        logger.debug(f"Skipping on-demand agent {agent_name}")
+        return False
+
+    if not agent_name or not role:
+        missing = []
+        if not agent_name:
+            missing.append("name")
+        if not role:
+            missing.append("role")
+        logger.warning(f"Skipping agent config (missing {', '.join(missing)}): {agent_config}")
+        return False
 
-        if not agent_name or not role:
-            missing = []
-            if not agent_name:
-                missing.append("name")
-            if not role:
-                missing.append("role")
-            logger.warning(f"Skipping agent config (missing {', '.join(missing)}): {agent_config}")
-            continue
+    return True
 
-        logger.debug(f"Evaluating agent {agent_name}: role={role}")
 
-        # Acquire agent lock
-        agent_lock_path = get_agent_lock_path(agent_name)
-        with locked_or_skip(agent_lock_path) as acquired:
-            if not acquired:
-                logger.warning(f"Agent {agent_name} is locked (another instance running?)")
-                continue
+def _evaluate_and_spawn(
+    agent_config: dict,
+    queue_counts: dict | None,
+    snapshot: TickSnapshot | None,
+) -> None:
+    """Run the guard chain for one agent and spawn it if every guard passes."""
+    agent_name = agent_config.get("name")
+    role = agent_config.get("role") or agent_config.get("type")
+    logger.debug(f"Evaluating agent {agent_name}: role={role}")
+
+    # Acquire agent lock
+    agent_lock_path = get_agent_lock_path(agent_name)
+    with locked_or_skip(agent_lock_path) as acquired:
+        if not acquired:
+            logger.warning(f"Agent {agent_name} is locked (another instance running?)")
+            return
 
-            # Build context — pass poll-fetched queue_counts so guards skip per-agent API calls
-            state_path = get_agent_state_path(agent_name)
-            ctx = AgentContext(
-                agent_config=agent_config,
-                agent_name=agent_name,
-                role=role,
-                interval=agent_config.get("interval_seconds", 300),
-                state=load_state(state_path),
-                state_path=state_path,
-                queue_counts=queue_counts,
-            )
+        # Build context — pass poll-fetched queue_counts so guards skip per-agent API calls
+        state_path = get_agent_state_path(agent_name)
+        ctx = AgentContext(
+            agent_config=agent_config,
+            agent_name=agent_name,
+            role=role,
+            interval=agent_config.get("interval_seconds", 300),
+            state=load_state(state_path),
+            state_path=state_path,
+            queue_counts=queue_counts,
+            snapshot=snapshot,
+        )
 
-            # Evaluate guards
-            if not evaluate_agent(ctx):
+        # Evaluate guards
+        passed = evaluate_agent(ctx)
+        extra_tasks, ctx.extra_claimed_tasks = ctx.extra_claimed_tasks, []
+        if not passed and not extra_tasks:
+            return
+
+        spawned = _spawn_agent(ctx) if passed else True
+
+        # The rest of a batch claim: spawn one instance per task. After a spawn
+        # failure the remaining tasks are returned to their queue untouched.
+        source_queue = agent_config.get("claim_from", "incoming")
+        for task in extra_tasks:
+            if not spawned:
+                _requeue_task_blameless(task["id"], source_queue=source_queue)
+                if snapshot is not None:
+                    snapshot.invalidate(source_queue, "claimed")
                 continue
+            extra_ctx = replace(ctx, claimed_task=task, state=load_state(state_path))
+            proceed, reason = guard_task_description_nonempty(extra_ctx)
+            if not proceed:
+                logger.debug(f"Agent {agent_name}: batch task {task['id']} BLOCKED: {reason}")
+                continue
+            spawned = _spawn_agent(extra_ctx)
 
-            # Spawn
-            logger.info(f"Starting agent {agent_name} (role: {role})")
 
-            strategy = get_spawn_strategy(ctx)
-            try:
-                pid = strategy(ctx)
-                logger.info(f"Agent {agent_name} started with PID {pid}")
-                _reset_systemic_failure_counter()
-            except Exception as e:
-                logger.error(f"Spawn failed for {agent_name}: {e}")
-                if ctx.claimed_task:
-                    source_queue = ctx.agent_config.get("claim_from", "incoming")
-                    _requeue_task_blameless(ctx.claimed_task["id"], source_queue=source_queue)
-                _handle_systemic_failure(f"Spawn failure for {agent_name}: {e}")
+def _spawn_agent(ctx: AgentContext) -> bool:
+    """Spawn an agent whose guards have passed.
+
+    On failure, a claimed task is requeued without penalty and the failure is
+    counted towards the systemic-failure auto-pause.
 
+    Returns:
+        True if the agent was spawned.
+    """
+    logger.info(f"Starting agent {ctx.agent_name} (role: {ctx.role})")
 
-def run_scheduler() -> None:
+    strategy = get_spawn_strategy(ctx)
+    try:
+        pid = strategy(ctx)
+        logger.info(f"Agent {ctx.agent_name} started with PID {pid}")
+        with _systemic_failure_lock:
+            _reset_systemic_failure_counter()
+        return True
+    except Exception as e:
+        logger.error(f"Spawn failed for {ctx.agent_name}: {e}")
+        if ctx.claimed_task:
+            source_queue = ctx.agent_config.get("claim_from", "incoming")
+            _requeue_task_blameless(ctx.claimed_task["id"], source_queue=source_queue)
+            if ctx.snapshot is not None:
+                ctx.snapshot.invalidate(source_queue, "claimed")
+        with _systemic_failure_lock:
+            _handle_systemic_failure(f"Spawn failure for {ctx.agent_name}: {e}")
+        return False
+
+
+def run_scheduler(scheduler_state: dict | None = None) -> None:
     """Main scheduler loop - evaluate and spawn agents.
 
     Job intervals and grouping are defined declaratively in .octopoid/jobs.yaml.
     run_due_jobs() handles the poll-batching optimisation: it fetches poll data
     once if any remote job is due, avoiding ~14 individual API calls per tick.
+
+    Args:
+        scheduler_state: In-memory scheduler state to reuse (daemon mode). When
+            None, the state is loaded from scheduler_state.json. Either way it
+            is saved back to disk at the end of the tick.
     """
     from .jobs import run_due_jobs
 
@@ -1441,7 +1678,8 @@ def run_scheduler() -> None:
         return
 
     # Load per-job scheduler state (persists last_run across launchd invocations)
-    scheduler_state = load_scheduler_state()
+    if scheduler_state is None:
+        scheduler_state = load_scheduler_state()
 
     # Sleep detection: if gap since last tick exceeds threshold, laptop likely slept.
     # renew_active_leases (which runs first in jobs.yaml) handles recovery automatically.
@@ -1462,7 +1700,10 @@ def run_scheduler() -> None:
     scheduler_state["last_tick"] = datetime.now().isoformat()
 
     # Dispatch all due jobs (declarative — intervals defined in .octopoid/jobs.yaml)
+    api_before = api_metrics.capture()
     poll_data = run_due_jobs(scheduler_state)
+    api_delta = api_metrics.record_tick(api_before)
+    status_api.publish_tick(scheduler_state, poll_data, api_delta)
 
     # Persist updated last_run timestamps (including last_tick set above)
     save_scheduler_state(scheduler_state)
@@ -1477,6 +1718,189 @@ def run_scheduler() -> None:
         logger.info("Scheduler tick complete")
 
 
+# =============================================================================
+# Daemon mode
+# =============================================================================
+
+DAEMON_DEFAULT_TICK_SECONDS = 10.0  # Matches the launchd StartInterval
+DAEMON_MIN_SLEEP_SECONDS = 0.05
+DAEMON_STOP_CHECK_SECONDS = 1.0  # Max time a stop request waits while the daemon sleeps
+
+
+class _FileWatcher:
+    """Detect changes to a set of files by comparing (mtime_ns, size) signatures."""
+
+    def __init__(self, paths: list[Path]):
+        self.paths = paths
+        self._signatures = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int] | None]:
+        signatures: dict[Path, tuple[int, int] | None] = {}
+        for path in self.paths:
+            try:
+                st = path.stat()
+                signatures[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                signatures[path] = None
+        return signatures
+
+    def changed(self) -> bool:
+        """Return True if any watched file changed since the last call."""
+        current = self._snapshot()
+        if current == self._signatures:
+            return False
+        self._signatures = current
+        return True
+
+
+def _watch_tracked_pids(watcher: ExitWatcher) -> None:
+    """Watch every PID already in running_pids.json (e.g. from a previous run)."""
+    agents_dir = get_agents_runtime_dir()
+    if not agents_dir.exists():
+        return
+    for blueprint_dir in agents_dir.iterdir():
+        if blueprint_dir.is_dir():
+            for pid in load_blueprint_pids(blueprint_dir.name):
+                watcher.watch(pid)
+
+
+def _handle_exited_agents(pids: list[int], scheduler_state: dict) -> None:
+    """Process results for agents the exit watcher reported, then free their slots.
+
+    The agent evaluation loop is made due so the freed slot is refilled on the
+    next tick rather than after its full interval.
+    """
+    logger.debug(f"Exit watcher: PIDs {sorted(pids)} exited, handling results")
+    try:
+        check_and_update_finished_agents(only_pids=set(pids))
+    except Exception as e:
+        logger.error(f"Result handling for exited PIDs {sorted(pids)} failed: {e}")
+    mark_job_due(scheduler_state, "agent_evaluation_loop")
+
+
+def _sleep_until_next_tick(
+    watcher: ExitWatcher,
+    stop: threading.Event,
+    timeout: float,
+    scheduler_state: dict,
+) -> None:
+    """Sleep up to timeout seconds, returning early on stop, agent exit or a handled result."""
+    deadline = time.monotonic() + timeout
+    while not stop.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        exited = watcher.wait(min(remaining, DAEMON_STOP_CHECK_SECONDS))
+        workers = result_queue.get_result_workers()
+        if workers is not None:
+            # PIDs whose results a worker finished; reaping them frees their slots
+            exited = exited + workers.take_finished()
+        if exited:
+            _handle_exited_agents(exited, scheduler_state)
+            return
+
+
+def run_scheduler_daemon(
+    tick_seconds: float = DAEMON_DEFAULT_TICK_SECONDS,
+    stop_event: threading.Event | None = None,
+) -> None:
+    """Run the scheduler as a long-lived process instead of one tick per launch.
+
+    The package import, SDK client (and its requests.Session) and the parsed
+    jobs.yaml stay warm between ticks. Scheduler state is kept in memory and
+    still saved after every tick so a restart resumes where it left off.
+
+    Between ticks the daemon sleeps until the next job in jobs.yaml is due,
+    capped at tick_seconds so pause flags and new agents are picked up
+    promptly. Changes to .octopoid/config.yaml or .octopoid/.api_key reset
+    the SDK so a new server URL or key takes effect on the next tick.
+
+    Agents are watched for exit (see exit_watcher.py): when one finishes, its
+    result is queued immediately and the next tick starts straight away.
+    Results are handled by scheduler.result_workers background threads (see
+    result_queue.py), so a long test run or merge never delays a tick.
+
+    While running, the daemon serves its task mirror, PID registry, job
+    schedule and tick metrics on a local Unix socket (see status_api.py) so
+    the dashboard and status scripts need not query the server.
+
+    Args:
+        tick_seconds: Maximum time between ticks. May be sub-second.
+        stop_event: Set to stop the loop (SIGTERM/SIGINT set it too).
+    """
+    from .jobs import seconds_until_next_job
+    from .sdk import reset_sdk
+    from .task_mirror import init_task_mirror
+
+    stop = stop_event or threading.Event()
+
+    def _request_stop(signum, _frame):
+        logger.info(f"Scheduler daemon received signal {signum}, stopping after current tick")
+        stop.set()
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, _request_stop)
+        signal.signal(signal.SIGINT, _request_stop)
+
+    orchestrator_dir = get_orchestrator_dir()
+    sdk_watcher = _FileWatcher([orchestrator_dir / "config.yaml", orchestrator_dir / ".api_key"])
+
+    scheduler_state = load_scheduler_state()
+    # The daemon keeps the task mirror in memory; one-shot runs use SQLite
+    try:
+        init_task_mirror(persistent=False)
+    except Exception as e:
+        logger.debug(f"Could not initialise task mirror: {e}")
+    watcher = install_exit_watcher()
+    try:
+        _watch_tracked_pids(watcher)
+    except Exception as e:
+        logger.debug(f"Could not watch already-tracked PIDs: {e}")
+    status_server = status_api.StatusServer()
+    try:
+        status_server.start()
+    except OSError as e:
+        logger.warning(f"Status API disabled, could not bind {status_server.path}: {e}")
+    result_workers = get_scheduler_config()["result_workers"]
+    if result_workers:
+        result_queue.start_result_workers(result_workers, _dispatch_result, prepare=_prefetch_results)
+    logger.info(f"Scheduler daemon started (tick interval {tick_seconds}s, {result_workers} result workers)")
+
+    try:
+        while not stop.is_set():
+            if sdk_watcher.changed():
+                logger.info("Server config changed on disk, resetting SDK client")
+                invalidate_config_cache()
+                reset_sdk()
+                # A new server or scope invalidates every mirrored task
+                try:
+                    init_task_mirror(persistent=False)
+                except Exception as e:
+                    logger.debug(f"Could not reset task mirror: {e}")
+
+            try:
+                run_scheduler(scheduler_state)
+            except SystemExit:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduler daemon tick failed: {e}")
+
+            try:
+                delay = seconds_until_next_job(scheduler_state)
+            except Exception as e:
+                logger.debug(f"Could not compute next job due time: {e}")
+                delay = tick_seconds
+            _sleep_until_next_tick(
+                watcher, stop, min(tick_seconds, max(delay, DAEMON_MIN_SLEEP_SECONDS)), scheduler_state,
+            )
+    finally:
+        result_queue.stop_result_workers()
+        status_server.stop()
+        uninstall_exit_watcher()
+
+    logger.info("Scheduler daemon stopped")
+
+
 def _check_venv_integrity() -> None:
     """Verify the orchestrator module is loaded from the correct location.
 
@@ -1523,6 +1947,17 @@ def main() -> None:
         action="store_true",
         help="Run once and exit (don't wait for lock)",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Stay resident and run ticks from an in-process timer",
+    )
+    parser.add_argument(
+        "--tick-interval",
+        type=float,
+        default=DAEMON_DEFAULT_TICK_SECONDS,
+        help=f"Maximum seconds between daemon ticks (default: {DAEMON_DEFAULT_TICK_SECONDS:g})",
+    )
     args = parser.parse_args()
 
     if args.debug:
@@ -1537,7 +1972,10 @@ def main() -> None:
             sys.exit(0)
 
         logger.debug("Scheduler lock acquired")
-        run_scheduler()
+        if args.daemon:
+            run_scheduler_daemon(tick_seconds=args.tick_interval)
+        else:
+            run_scheduler()
 
 
 # Default template if file doesn't exist
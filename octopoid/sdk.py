@@ -3,9 +3,10 @@
 This module provides the central SDK client and orchestrator ID management.
 """
 
+import asyncio
 import os
 import socket
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
 
 import yaml
 
@@ -45,7 +46,7 @@ def get_sdk():
     if env_url:
         api_key = os.getenv("OCTOPOID_API_KEY")
         scope = get_scope()
-        _sdk = OctopoidSDK(server_url=env_url, api_key=api_key, scope=scope)
+        _sdk = OctopoidSDK(server_url=env_url, api_key=api_key, scope=scope, **_cache_options({}))
         return _sdk
 
     # Load server configuration from config file
@@ -85,13 +86,36 @@ def get_sdk():
             api_key = os.getenv("OCTOPOID_API_KEY")
         scope = get_scope()
 
-        _sdk = OctopoidSDK(server_url=server_url, api_key=api_key, scope=scope)
+        _sdk = OctopoidSDK(
+            server_url=server_url, api_key=api_key, scope=scope, **_cache_options(server_config)
+        )
         return _sdk
 
     except Exception as e:
         raise RuntimeError(f"Failed to initialize SDK: {e}")
 
 
+def _cache_options(server_config: dict) -> dict:
+    """Resolve the SDK response cache settings.
+
+    Both are off unless configured. ``server.cache_ttl`` (seconds) and
+    ``server.coalesce`` in .octopoid/config.yaml enable them; the
+    OCTOPOID_SDK_CACHE_TTL env var overrides the TTL and also turns on
+    coalescing, for env-configured runs.
+    """
+    ttl = server_config.get("cache_ttl") or 0
+    coalesce = bool(server_config.get("coalesce", False))
+    env_ttl = os.environ.get("OCTOPOID_SDK_CACHE_TTL")
+    if env_ttl:
+        ttl = env_ttl
+        coalesce = True
+    try:
+        ttl = max(float(ttl), 0.0)
+    except (TypeError, ValueError):
+        ttl = 0.0
+    return {"cache_ttl": ttl, "coalesce": coalesce}
+
+
 def reset_sdk() -> None:
     """Clear the cached SDK instance so it is re-initialised on the next call.
 
@@ -102,6 +126,58 @@ def reset_sdk() -> None:
     _sdk = None
 
 
+# Maximum concurrent requests for fan_out(). Housekeeping batches are a few
+# dozen calls at most; this keeps them to a handful of round trips without
+# hammering the server.
+FAN_OUT_MAX_CONNECTIONS = 10
+
+
+def fan_out(
+    call: Callable[[Any, Any], Awaitable[Any]],
+    items: Iterable[Any],
+    sdk: Optional[Any] = None,
+    max_connections: int = FAN_OUT_MAX_CONNECTIONS,
+) -> list:
+    """Issue one SDK call per item concurrently and wait for all of them.
+
+    Wraps the sync SDK in an AsyncOctopoidSDK (sharing its session, credentials
+    and scope), so N independent per-task calls take roughly
+    N / max_connections round trips instead of N.
+
+    Args:
+        call: ``call(async_sdk, item)`` returning an awaitable, e.g.
+            ``lambda s, tid: s.tasks.update(tid, lease_expires_at=expiry)``.
+        items: Items to call for.
+        sdk: Sync SDK to wrap. Defaults to get_sdk().
+        max_connections: Maximum requests in flight at once.
+
+    Returns:
+        One entry per item, in order: the call's result, or the exception it
+        raised. A failing call never affects the others.
+
+    Raises:
+        RuntimeError: If the installed octopoid-sdk has no async client.
+    """
+    try:
+        from octopoid_sdk import AsyncOctopoidSDK
+    except ImportError:
+        raise RuntimeError(
+            "octopoid-sdk with AsyncOctopoidSDK required. Upgrade with: pip install -U octopoid-sdk"
+        )
+
+    items = list(items)
+    if not items:
+        return []
+    if sdk is None:
+        sdk = get_sdk()
+
+    async def _run() -> list:
+        async with AsyncOctopoidSDK.from_sdk(sdk, max_connections=max_connections) as async_sdk:
+            return await async_sdk.map(call, items)
+
+    return asyncio.run(_run())
+
+
 def get_orchestrator_id() -> str:
     """Get unique orchestrator instance ID.
 
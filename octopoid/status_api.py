@@ -0,0 +1,434 @@
+"""Local read-only status API served by the scheduler daemon.
+
+The daemon already holds everything the local status tools ask the server
+for: the task mirror, the last poll, the PID registry, the job schedule and
+the API metrics of the last tick. It serves them over a Unix socket at
+.octopoid/runtime/scheduler.sock. The dashboard, octopoid-status.py,
+``octopoid tasks`` and scripts/list-tasks query that socket first and only
+call the remote server when the daemon is not running or cannot answer.
+
+Protocol: one JSON request per connection, terminated by a newline::
+
+    {"method": "tasks", "params": {"queue": "incoming"}}
+
+answered by one JSON line, either ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": "..."}``. Methods:
+
+- status: daemon PID, start time, tick count, last tick and mirror state
+- poll: the last poll response (queue_counts, provisional_tasks, ...)
+- tasks: mirrored tasks, optionally for one queue or a comma-separated list
+- task: one mirrored task by ``id``
+- pids: running_pids.json contents per blueprint
+- jobs: each job's interval, last run and seconds until due
+- metrics: the last tick's per-endpoint API figures and the recent top endpoints
+- report: the last get_project_report() built by the daemon's report thread
+- outcomes: how many agent outcomes each classifier tier decided, and its hit rate
+
+Task methods only answer from a synced mirror. Otherwise they return an
+error and the caller falls back to the server. The mirror only syncs against
+servers whose poll returns a change cursor; with a server that does not,
+every task query falls back.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger("octopoid.scheduler")
+
+SOCKET_FILENAME = "scheduler.sock"
+CLIENT_TIMEOUT_SECONDS = 2.0
+REPORT_TTL_SECONDS = 5.0  # Dashboards refreshing together share one report
+REPORT_DEMAND_SECONDS = 120.0  # Keep building reports this long after the last "report" query
+REPORT_MAX_AGE_SECONDS = 60.0  # Older reports are not served; the caller builds its own
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+class StatusUnavailable(Exception):
+    """The status socket is missing, not answering, or could not serve a request."""
+
+
+def get_socket_path() -> Path:
+    """Return the path of the scheduler's status socket."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / SOCKET_FILENAME
+
+
+# =============================================================================
+# State published by the scheduler
+# =============================================================================
+
+_state_lock = threading.Lock()
+_state: dict[str, Any] = {
+    "started_at": None,
+    "ticks": 0,
+    "last_tick": None,
+    "poll": None,
+    "api_metrics": {},
+    "scheduler_state": {},
+}
+
+
+def publish_tick(
+    scheduler_state: dict,
+    poll_data: dict | None,
+    api_delta: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """Record the outcome of a scheduler tick for the status API.
+
+    Called at the end of every run_scheduler(). Cheap when no server is
+    running: it only keeps references to the latest values.
+    """
+    with _state_lock:
+        _state["ticks"] += 1
+        _state["last_tick"] = datetime.now().isoformat()
+        if poll_data is not None:
+            _state["poll"] = {k: v for k, v in poll_data.items() if k != "mirror_synced"}
+        _state["api_metrics"] = api_delta or {}
+        _state["scheduler_state"] = dict(scheduler_state.get("jobs", {}))
+
+
+def _published(key: str) -> Any:
+    with _state_lock:
+        return _state[key]
+
+
+# =============================================================================
+# Request handlers
+# =============================================================================
+
+
+def _synced_mirror() -> Any:
+    from .task_mirror import get_task_mirror
+
+    mirror = get_task_mirror()
+    if not mirror.is_synced:
+        raise StatusUnavailable("task mirror not synced")
+    return mirror
+
+
+def _handle_status(params: dict) -> dict:
+    from .task_mirror import get_task_mirror
+
+    mirror = get_task_mirror()
+    with _state_lock:
+        started_at, ticks, last_tick = _state["started_at"], _state["ticks"], _state["last_tick"]
+        poll = _state["poll"] or {}
+    return {
+        "pid": os.getpid(),
+        "started_at": started_at,
+        "ticks": ticks,
+        "last_tick": last_tick,
+        "queue_counts": poll.get("queue_counts"),
+        "mirror": {
+            "synced": mirror.is_synced,
+            "cursor": mirror.cursor,
+            "synced_at": mirror.synced_at.isoformat() if mirror.synced_at else None,
+            "tasks": len(mirror),
+        },
+    }
+
+
+def _handle_poll(params: dict) -> dict:
+    poll = _published("poll")
+    if poll is None:
+        raise StatusUnavailable("no poll yet")
+    return poll
+
+
+def _handle_tasks(params: dict) -> list[dict]:
+    mirror = _synced_mirror()
+    queue = params.get("queue")
+    if not queue:
+        return mirror.list_all()
+    tasks: list[dict] = []
+    for name in str(queue).split(","):
+        tasks.extend(mirror.list_tasks(name.strip()))
+    return tasks
+
+
+def _handle_task(params: dict) -> dict | None:
+    return _synced_mirror().get(str(params.get("id", "")))
+
+
+def _handle_pids(params: dict) -> dict[str, dict]:
+    from .config import get_agents_runtime_dir
+    from .pool import load_blueprint_pids
+
+    result = {}
+    for path in sorted(get_agents_runtime_dir().glob("*/running_pids.json")):
+        pids = load_blueprint_pids(path.parent.name)
+        result[path.parent.name] = {str(pid): info for pid, info in pids.items()}
+    return result
+
+
+def _handle_jobs(params: dict) -> list[dict]:
+    from .jobs import load_jobs_yaml
+
+    last_runs = _published("scheduler_state")
+    now = datetime.now()
+    jobs = []
+    for job_def in load_jobs_yaml():
+        name = job_def.get("name", "")
+        interval = job_def.get("interval", 60)
+        last_run = last_runs.get(name)
+        due_in = 0.0
+        if last_run:
+            try:
+                elapsed = (now - datetime.fromisoformat(last_run)).total_seconds()
+                due_in = max(0.0, interval - elapsed)
+            except (ValueError, TypeError):
+                pass
+        jobs.append({
+            "name": name,
+            "group": job_def.get("group"),
+            "interval": interval,
+            "last_run": last_run,
+            "due_in": round(due_in, 1),
+        })
+    return jobs
+
+
+def _handle_metrics(params: dict) -> dict:
+    from .api_metrics import top_endpoints
+
+    return {"last_tick": _published("api_metrics"), "top_endpoints": top_endpoints()}
+
+
+_report_lock = threading.Lock()
+_report_cache: tuple[float, dict] | None = None
+_report_requested_at: float | None = None
+_report_wanted = threading.Event()  # Wakes the report thread on a query
+
+
+def refresh_report() -> bool:
+    """Rebuild the cached project report if a client wants one.
+
+    Called from the status server's report thread, never from the scheduler
+    tick: a report makes many requests to the server. It also takes far
+    longer to build than a client waits on the socket, so the "report"
+    method never builds one itself: it only returns this copy. Nothing is
+    built unless a "report" query arrived in the last REPORT_DEMAND_SECONDS,
+    and at most once per REPORT_TTL_SECONDS.
+
+    Returns:
+        True if a new report was cached.
+    """
+    global _report_cache
+    from .reports import get_project_report
+    from .sdk import get_sdk
+
+    now = time.monotonic()
+    with _report_lock:
+        if _report_requested_at is None or now - _report_requested_at > REPORT_DEMAND_SECONDS:
+            return False
+        if _report_cache is not None and now - _report_cache[0] < REPORT_TTL_SECONDS:
+            return False
+    try:
+        report = get_project_report(get_sdk())
+    except Exception as e:
+        logger.debug(f"Status API report build failed: {e}")
+        return False
+    with _report_lock:
+        _report_cache = (time.monotonic(), report)
+    return True
+
+
+def _handle_report(params: dict) -> dict:
+    global _report_requested_at
+
+    with _report_lock:
+        _report_requested_at = time.monotonic()
+        cached = _report_cache
+    _report_wanted.set()
+    if cached is None or time.monotonic() - cached[0] > REPORT_MAX_AGE_SECONDS:
+        raise StatusUnavailable("no recent report; the daemon is building one")
+    return cached[1]
+
+
+def _report_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        refresh_report()
+        _report_wanted.wait(REPORT_TTL_SECONDS)
+        _report_wanted.clear()
+
+
+def _handle_outcomes(params: dict) -> dict:
+    from .outcome_classifier import read_stats
+
+    return read_stats()
+
+
+_HANDLERS: dict[str, Callable[[dict], Any]] = {
+    "status": _handle_status,
+    "poll": _handle_poll,
+    "tasks": _handle_tasks,
+    "task": _handle_task,
+    "pids": _handle_pids,
+    "jobs": _handle_jobs,
+    "metrics": _handle_metrics,
+    "report": _handle_report,
+    "outcomes": _handle_outcomes,
+}
+
+
+def handle_request(request: Any) -> dict:
+    """Dispatch one decoded request and return the response envelope."""
+    method = request.get("method") if isinstance(request, dict) else None
+    if method not in _HANDLERS:
+        return {"ok": False, "error": f"unknown method: {method}"}
+    params = request.get("params") or {}
+    try:
+        return {"ok": True, "result": _HANDLERS[method](params)}
+    except StatusUnavailable as e:
+        return {"ok": False, "error": str(e)}
+    except Exception as e:
+        logger.debug(f"Status API {method} failed: {e}")
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    timeout = CLIENT_TIMEOUT_SECONDS
+
+    def handle(self) -> None:
+        try:
+            line = self.rfile.readline(MAX_REQUEST_BYTES)
+            request = json.loads(line)
+        except (OSError, ValueError):
+            response = {"ok": False, "error": "malformed request"}
+        else:
+            response = handle_request(request)
+        try:
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+        except OSError:
+            pass
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class StatusServer:
+    """Serve the status API on a Unix socket from a background thread.
+
+    A second thread builds the project report while clients ask for it (see
+    refresh_report), so neither the handlers nor the scheduler tick wait on it.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or get_socket_path()
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+        self._report_thread: threading.Thread | None = None
+        self._stop_reports = threading.Event()
+
+    def start(self) -> None:
+        """Bind the socket (replacing a stale one) and start serving.
+
+        Raises:
+            OSError: If the socket cannot be bound, e.g. the path is too long.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.unlink(missing_ok=True)
+        self._server = _Server(str(self.path), _RequestHandler)
+        # Owner and group only: reports include task content
+        os.chmod(self.path, 0o660)
+        with _state_lock:
+            _state["started_at"] = datetime.now().isoformat()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="octopoid-status-api", daemon=True,
+        )
+        self._thread.start()
+        self._stop_reports.clear()
+        self._report_thread = threading.Thread(
+            target=_report_loop, args=(self._stop_reports,), name="octopoid-status-report", daemon=True,
+        )
+        self._report_thread.start()
+        logger.info(f"Status API listening on {self.path}")
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._stop_reports.set()
+        _report_wanted.set()
+        if self._report_thread is not None:
+            self._report_thread.join(timeout=5)
+        self._server = None
+        self._thread = None
+        self._report_thread = None
+        self.path.unlink(missing_ok=True)
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+def query(method: str, timeout: float = CLIENT_TIMEOUT_SECONDS, path: Path | None = None, **params: Any) -> Any:
+    """Ask the running scheduler daemon for status data.
+
+    Args:
+        method: One of the methods listed in the module docstring.
+        timeout: Seconds to wait for the connection and the response.
+        path: Socket path (defaults to get_socket_path()).
+        **params: Method parameters, e.g. queue="incoming".
+
+    Returns:
+        The method's result.
+
+    Raises:
+        StatusUnavailable: If no daemon is listening, it timed out, or it
+            could not answer the request.
+    """
+    path = path or get_socket_path()
+    if not path.exists():
+        raise StatusUnavailable(f"no status socket at {path}")
+    request = json.dumps({"method": method, "params": params}).encode() + b"\n"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(request)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError) as e:
+        raise StatusUnavailable(f"status socket did not answer: {e}") from e
+    if not isinstance(response, dict) or not response.get("ok"):
+        error = response.get("error") if isinstance(response, dict) else response
+        raise StatusUnavailable(str(error))
+    return response.get("result")
+
+
+def try_query(method: str, **params: Any) -> Any:
+    """Like query(), but return None instead of raising when unavailable."""
+    try:
+        return query(method, **params)
+    except StatusUnavailable as e:
+        logger.debug(f"Status API {method} unavailable: {e}")
+        return None
@@ -2,7 +2,9 @@
 
 Steps are either Step objects (with pre_check/execute/verify phases) or
 legacy functions: (task: dict, result: dict, task_dir: Path) -> None.
-Steps are referenced by name in flow YAML `runs:` lists.
+Steps are referenced by name in flow YAML `runs:` lists. A transition's
+optional `after:` mapping declares which steps a step waits for; steps whose
+dependencies are done then run concurrently (see execute_steps).
 
 The three-phase Step protocol prevents ghost completions and non-idempotent
 retries:
@@ -15,14 +17,23 @@ import json
 import logging
 import os
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
+from .git_fetch import fetch_origin
+
 logger = logging.getLogger("octopoid.steps")
 
 StepFn = Callable[[dict, dict, Path], None]
 
+# A rebase step's execute() reuses the fetch its pre_check() made this recently
+PRE_CHECK_FETCH_REUSE_SECONDS = 10
+
+# Steps run at once by a transition with `after:` dependencies
+MAX_PARALLEL_STEPS = 4
+
 
 # =============================================================================
 # Error types
@@ -156,8 +167,69 @@ def _write_step_progress(task_dir: Path, completed: list[str], failed: str | Non
         pass
 
 
-def execute_steps(step_names: list[str], task: dict, result: dict, task_dir: Path) -> None:
-    """Execute a list of named steps in order.
+def transition_step_options(transition: object) -> dict:
+    """Keyword arguments for execute_steps() from a flow transition.
+
+    Returns {"after": ...} only when the transition declares dependencies, so
+    transitions without them keep the plain sequential call.
+    """
+    after = getattr(transition, "after", None)
+    return {"after": after} if isinstance(after, dict) and after else {}
+
+
+def step_dependencies(step_names: list[str], after: dict[str, list[str]] | None) -> dict[str, list[str]]:
+    """Resolve the steps each step waits for.
+
+    A step listed in after waits for the steps given there; any other step
+    waits for the step before it in step_names, so without after the steps
+    form a chain. Dependencies on steps missing from step_names (e.g. steps
+    completed before a fixer resumed the flow) are dropped.
+
+    Returns:
+        {step: [steps it waits for]}, in step_names order.
+
+    Raises:
+        ValueError: If the dependencies form a cycle.
+    """
+    after = after or {}
+    present = set(step_names)
+    dependencies: dict[str, list[str]] = {}
+    for index, name in enumerate(step_names):
+        waits = after[name] if name in after else step_names[max(0, index - 1):index]
+        dependencies[name] = [step for step in waits if step in present]
+
+    # Repeatedly peel off steps whose dependencies are all peeled; what remains is a cycle
+    remaining = dict(dependencies)
+    while remaining:
+        ready = [name for name, waits in remaining.items() if not any(w in remaining for w in waits)]
+        if not ready:
+            raise ValueError(f"after: dependency cycle between steps {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+    return dependencies
+
+
+def _run_step(name: str, entry: Step | StepFn, ctx: StepContext) -> None:
+    """Run one step: pre_check, execute and verify for Step objects, else the legacy function."""
+    if isinstance(entry, Step):
+        if entry.pre_check(ctx):
+            logger.info(f"Step {name}: pre_check passed, skipping (already done)")
+            return
+        entry.execute(ctx)
+        entry.verify(ctx)
+    else:
+        # Old-style step function
+        entry(ctx.task, ctx.result, ctx.task_dir)
+
+
+def execute_steps(
+    step_names: list[str],
+    task: dict,
+    result: dict,
+    task_dir: Path,
+    after: dict[str, list[str]] | None = None,
+) -> None:
+    """Execute a list of named steps.
 
     Supports both new-style Step objects (with pre_check/execute/verify) and
     old-style step functions for backwards compatibility during migration.
@@ -168,43 +240,69 @@ def execute_steps(step_names: list[str], task: dict, result: dict, task_dir: Pat
     - Raises StepVerificationError if verify fails
     - Raises RetryableStepError for transient failures (caller keeps PID)
 
+    Without after, steps run one at a time in order. With after (a
+    transition's ``after:`` mapping, see step_dependencies), every step whose
+    dependencies have completed is started, up to MAX_PARALLEL_STEPS at
+    once. After a failure no further steps are started; steps already
+    running finish, and the first failure is raised.
+
     Writes step_progress.json to task_dir after each step so that
     intervention_context can record which steps completed before a failure.
     """
     ctx = StepContext(task=task, result=result, task_dir=task_dir)
+    if isinstance(after, dict) and after:
+        _execute_step_graph(step_names, after, ctx)
+        return
+
     completed: list[str] = []
     for name in step_names:
         entry = STEP_REGISTRY.get(name)
         if entry is None:
             _write_step_progress(task_dir, completed, failed=name)
             raise ValueError(f"Unknown step: {name}")
+        try:
+            _run_step(name, entry, ctx)
+        except Exception:
+            _write_step_progress(task_dir, completed, failed=name)
+            raise
+        completed.append(name)
+        _write_step_progress(task_dir, completed, failed=None)
 
-        if isinstance(entry, Step):
-            try:
-                if entry.pre_check(ctx):
-                    logger.info(f"Step {name}: pre_check passed, skipping (already done)")
+
+def _execute_step_graph(step_names: list[str], after: dict[str, list[str]], ctx: StepContext) -> None:
+    """Run steps as soon as the steps they wait for have completed (see execute_steps)."""
+    completed: list[str] = []
+    for name in step_names:
+        if name not in STEP_REGISTRY:
+            _write_step_progress(ctx.task_dir, completed, failed=name)
+            raise ValueError(f"Unknown step: {name}")
+    waiting = step_dependencies(step_names, after)
+
+    running: dict[Future, str] = {}
+    failure: tuple[str, BaseException] | None = None
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_STEPS, thread_name_prefix="octopoid-step") as pool:
+        while True:
+            if failure is None:
+                for name in [n for n, waits in waiting.items() if all(w in completed for w in waits)]:
+                    del waiting[name]
+                    running[pool.submit(_run_step, name, STEP_REGISTRY[name], ctx)] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                error = future.exception()
+                if error is None:
                     completed.append(name)
-                    _write_step_progress(task_dir, completed, failed=None)
-                    continue
-                entry.execute(ctx)
-                entry.verify(ctx)
-                completed.append(name)
-                _write_step_progress(task_dir, completed, failed=None)
-            except (RetryableStepError, StepVerificationError, PermanentStepError):
-                _write_step_progress(task_dir, completed, failed=name)
-                raise
-            except Exception:
-                _write_step_progress(task_dir, completed, failed=name)
-                raise
-        else:
-            # Old-style step function
-            try:
-                entry(task, result, task_dir)
-                completed.append(name)
-                _write_step_progress(task_dir, completed, failed=None)
-            except Exception:
-                _write_step_progress(task_dir, completed, failed=name)
-                raise
+                    _write_step_progress(ctx.task_dir, completed, failed=None)
+                elif failure is None:
+                    failure = (name, error)
+                else:
+                    logger.error(f"Step {name} also failed after {failure[0]}: {error}")
+
+    if failure is not None:
+        _write_step_progress(ctx.task_dir, completed, failed=failure[0])
+        raise failure[1]
 
 
 # =============================================================================
@@ -355,7 +453,10 @@ reject_with_feedback = STEP_REGISTRY["reject_with_feedback"]
 
 @register_step("push_branch")
 class _PushBranchStep(Step):
-    """Ensure worktree is on the task branch and push to remote.
+    """Push the worktree's HEAD to the task branch on the remote.
+
+    The worktree is left as it is (see RepoManager.push_head), so run_tests
+    can use it at the same time; create_pr checks out the branch afterwards.
 
     pre_check: Branch already exists on remote? Skip (prevents failures
                when a previous attempt partially pushed the branch).
@@ -378,9 +479,7 @@ class _PushBranchStep(Step):
         from .repo_manager import RepoManager
         worktree = ctx.task_dir / "worktree"
         branch = get_task_branch(ctx.task)
-        repo = RepoManager(worktree)
-        repo.ensure_on_branch(branch)
-        repo.push_branch()
+        RepoManager(worktree).push_head(branch)
 
     def verify(self, ctx: StepContext) -> None:
         if not self.check_done(ctx):
@@ -560,8 +659,9 @@ class _CreatePrStep(Step):
             f"## Changes\n\n```\n{commits_summary}\n```\n"
         )
 
+        from .git_utils import get_task_branch
         repo = RepoManager(worktree, base_branch=task.get("branch", "main"))
-        pr = repo.create_pr(title=f"[{task_id}] {task_title}", body=pr_body)
+        pr = repo.create_pr(title=f"[{task_id}] {task_title}", body=pr_body, task_branch=get_task_branch(task))
         logger.info(f"create_pr step: PR {pr.url} (new={pr.created})")
 
         # Store PR metadata on the task
@@ -621,11 +721,9 @@ class _RebaseOnBaseStep(Step):
         from .config import get_base_branch
         base_branch = get_base_branch()
         worktree = ctx.task_dir / "worktree"
-        # Fetch to get latest remote state before checking
-        subprocess.run(
-            ["git", "fetch", "origin", base_branch],
-            cwd=worktree, capture_output=True, text=True, timeout=60,
-        )
+        # Fetch to get latest remote state before checking. Deciding to skip
+        # the rebase right before merge needs a fetch started now.
+        fetch_origin(worktree, base_branch, max_age=0, timeout=60)
         return self.check_done(ctx)
 
     def execute(self, ctx: StepContext) -> None:
@@ -633,10 +731,8 @@ class _RebaseOnBaseStep(Step):
         base_branch = get_base_branch()
         worktree = ctx.task_dir / "worktree"
 
-        fetch = subprocess.run(
-            ["git", "fetch", "origin"],
-            cwd=worktree, capture_output=True, text=True,
-        )
+        # pre_check fetched the base branch strictly moments ago
+        fetch = fetch_origin(worktree, base_branch, max_age=PRE_CHECK_FETCH_REUSE_SECONDS)
         if fetch.returncode != 0:
             raise RuntimeError(f"rebase_on_base: git fetch failed:\n{fetch.stderr}")
 
@@ -712,10 +808,7 @@ class _RebaseOnProjectBranchStep(Step):
             logger.debug("rebase_on_project_branch: no project_id on task, skipping")
             return True  # Skip — nothing to do
         worktree = ctx.task_dir / "worktree"
-        subprocess.run(
-            ["git", "fetch", "origin", project_branch],
-            cwd=worktree, capture_output=True, text=True, timeout=60,
-        )
+        fetch_origin(worktree, project_branch, max_age=0, timeout=60)
         return self.check_done(ctx)
 
     def execute(self, ctx: StepContext) -> None:
@@ -727,10 +820,7 @@ class _RebaseOnProjectBranchStep(Step):
         project_branch = self._get_project_branch(ctx)
         worktree = ctx.task_dir / "worktree"
 
-        fetch = subprocess.run(
-            ["git", "fetch", "origin"],
-            cwd=worktree, capture_output=True, text=True,
-        )
+        fetch = fetch_origin(worktree, project_branch, max_age=PRE_CHECK_FETCH_REUSE_SECONDS)
         if fetch.returncode != 0:
             raise RuntimeError(f"rebase_on_project_branch: git fetch failed:\n{fetch.stderr}")
 
@@ -970,10 +1060,7 @@ class _UpdateChangelogStep(Step):
 
         try:
             # Pull latest before modifying so we don't clobber concurrent changes
-            fetch = subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=project_root, capture_output=True, text=True,
-            )
+            fetch = fetch_origin(project_root)
             if fetch.returncode != 0:
                 raise RuntimeError(f"update_changelog: git fetch failed:\n{fetch.stderr}")
 
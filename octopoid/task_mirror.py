@@ -0,0 +1,308 @@
+"""Local mirror of the server's tasks, kept current by delta-sync polls.
+
+The scheduler polls with ``since=<cursor>``; servers that support delta sync
+answer with only the tasks changed since that cursor (plus a new cursor). A
+TaskMirror applies those deltas so the tick can read whole queues locally
+instead of re-listing them from the server:
+
+- In daemon mode the mirror lives in memory (see init_task_mirror()).
+- Otherwise each scheduler run loads and updates a SQLite copy at
+  .octopoid/runtime/task_mirror.sqlite, so a launchd tick only downloads
+  what changed since the previous tick. Other processes (reports, the
+  dashboard) can read that file with load_fresh_mirror().
+
+A mirror is only trusted once a poll has returned a cursor. Servers without
+delta sync never return one, and everything keeps listing queues via the API.
+The TickSnapshot reads from the mirror once this tick's poll has been applied.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("octopoid.scheduler")
+
+MIRROR_FILENAME = "task_mirror.sqlite"
+# Cursor that asks the server for every task (a full sync)
+FULL_SYNC_CURSOR = "0"
+# How old a mirror load_fresh_mirror() will still hand out, in seconds
+DEFAULT_MAX_AGE_SECONDS = 120.0
+
+
+def _sort_key(task: dict) -> tuple:
+    return (task.get("created_at") or task.get("created") or "", task.get("id") or "")
+
+
+class TaskMirror:
+    """In-memory mirror of one scope's tasks.
+
+    Attributes:
+        scope: Scope the mirrored tasks belong to. A mirror for a different
+            scope is discarded rather than reused.
+        cursor: Change cursor of the last applied poll, or None if the mirror
+            has never synced (or the server stopped sending cursors).
+        synced_at: When the last delta was applied.
+    """
+
+    def __init__(self, scope: str | None = None):
+        self.scope = scope
+        self.cursor: str | None = None
+        self.synced_at: datetime | None = None
+        self._tasks: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def is_synced(self) -> bool:
+        """True once a poll has returned a cursor and its delta was applied."""
+        return self.cursor is not None
+
+    @property
+    def since(self) -> str:
+        """The cursor to send with the next poll."""
+        return self.cursor or FULL_SYNC_CURSOR
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def apply_poll(self, poll_data: dict | None) -> bool:
+        """Apply the task delta carried by a poll response.
+
+        Args:
+            poll_data: Response of sdk.poll(..., since=self.since).
+
+        Returns:
+            True if the response carried a delta and the mirror is now in
+            sync. False if the poll failed (the cursor is kept for the next
+            attempt) or the server does not do delta sync (the mirror is
+            marked unsynced so nothing reads stale data from it).
+        """
+        if not isinstance(poll_data, dict):
+            return False
+        cursor = poll_data.get("cursor")
+        if not isinstance(cursor, (str, int)) or cursor == "":
+            with self._lock:
+                self.cursor = None
+            return False
+
+        changed = poll_data.get("changed_tasks") or []
+        deleted = poll_data.get("deleted_task_ids") or []
+        full = bool(poll_data.get("full_sync"))
+        with self._lock:
+            if full:
+                self._tasks.clear()
+            for task in changed:
+                if task.get("id"):
+                    self._tasks[task["id"]] = dict(task)
+            for task_id in deleted:
+                self._tasks.pop(task_id, None)
+            self.cursor = str(cursor)
+            self.synced_at = datetime.now()
+            self._persist(changed, deleted, full)
+        logger.debug(
+            f"Task mirror {'full sync' if full else 'delta'}: {len(changed)} changed, "
+            f"{len(deleted)} deleted, {len(self._tasks)} mirrored (cursor {self.cursor})"
+        )
+        return True
+
+    def list_tasks(self, queue: str) -> list[dict]:
+        """Return copies of the mirrored tasks in a queue, oldest first."""
+        with self._lock:
+            tasks = [dict(t) for t in self._tasks.values() if t.get("queue") == queue]
+        tasks.sort(key=_sort_key)
+        return tasks
+
+    def list_all(self) -> list[dict]:
+        """Return copies of every mirrored task, oldest first."""
+        with self._lock:
+            tasks = [dict(t) for t in self._tasks.values()]
+        tasks.sort(key=_sort_key)
+        return tasks
+
+    def get(self, task_id: str) -> dict | None:
+        """Return a copy of one mirrored task, or None."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return dict(task) if task is not None else None
+
+    def record_update(self, task_id: str, **fields: Any) -> None:
+        """Apply a local update (as sent to sdk.tasks.update) ahead of the next poll."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            task.update(fields)
+            self._persist([task], [], False)
+
+    def reset(self) -> None:
+        """Forget everything; the next poll does a full sync."""
+        with self._lock:
+            self._tasks.clear()
+            self.cursor = None
+            self.synced_at = None
+            self._persist([], [], True)
+
+    def _persist(self, changed: list[dict], deleted: list[str], full: bool) -> None:
+        """Write a change through to storage. Called with the lock held."""
+
+
+class SqliteTaskMirror(TaskMirror):
+    """TaskMirror persisted to a SQLite file between scheduler runs."""
+
+    def __init__(self, path: Path, scope: str | None = None):
+        super().__init__(scope)
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS tasks (id TEXT PRIMARY KEY, queue TEXT, data TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+        self._load()
+
+    def _load(self) -> None:
+        meta = dict(self._db.execute("SELECT key, value FROM meta").fetchall())
+        if meta.get("scope") != (self.scope or ""):
+            # Mirror belongs to another scope (or is new): start over
+            self._persist([], [], True)
+            return
+        self.cursor = meta.get("cursor") or None
+        synced_at = meta.get("synced_at")
+        self.synced_at = datetime.fromisoformat(synced_at) if synced_at else None
+        for (data,) in self._db.execute("SELECT data FROM tasks"):
+            task = json.loads(data)
+            self._tasks[task["id"]] = task
+
+    def _persist(self, changed: list[dict], deleted: list[str], full: bool) -> None:
+        try:
+            with self._db:
+                if full:
+                    self._db.execute("DELETE FROM tasks")
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO tasks (id, queue, data) VALUES (?, ?, ?)",
+                    [(t["id"], t.get("queue"), json.dumps(t)) for t in changed if t.get("id")],
+                )
+                self._db.executemany("DELETE FROM tasks WHERE id = ?", [(i,) for i in deleted])
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("scope", self.scope or ""),
+                        ("cursor", self.cursor or ""),
+                        ("synced_at", self.synced_at.isoformat() if self.synced_at else ""),
+                    ],
+                )
+        except sqlite3.Error as e:
+            # The in-memory copy is still correct; force a full sync next run
+            logger.debug(f"Task mirror write failed, will resync: {e}")
+            self.cursor = None
+
+    def close(self) -> None:
+        self._db.close()
+
+
+# =============================================================================
+# Process-wide mirror
+# =============================================================================
+
+_mirror: TaskMirror | None = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror_path() -> Path:
+    """Return the path of the on-disk task mirror."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / MIRROR_FILENAME
+
+
+def init_task_mirror(persistent: bool = True) -> TaskMirror:
+    """Create the process-wide mirror, replacing any existing one.
+
+    Args:
+        persistent: Back the mirror with SQLite (one-shot scheduler runs) or
+            keep it in memory only (the long-lived daemon).
+    """
+    global _mirror
+    from .config import get_scope
+
+    scope = get_scope()
+    with _mirror_lock:
+        if isinstance(_mirror, SqliteTaskMirror):
+            _mirror.close()
+        _mirror = SqliteTaskMirror(get_mirror_path(), scope) if persistent else TaskMirror(scope)
+        return _mirror
+
+
+def get_task_mirror() -> TaskMirror:
+    """Return the process-wide mirror, creating a SQLite-backed one if needed."""
+    with _mirror_lock:
+        mirror = _mirror
+    return mirror if mirror is not None else init_task_mirror(persistent=True)
+
+
+def reset_task_mirror() -> None:
+    """Drop the mirrored tasks so the next poll does a full sync."""
+    with _mirror_lock:
+        mirror = _mirror
+    if mirror is not None:
+        mirror.reset()
+
+
+def close_task_mirror() -> None:
+    """Close and forget the process-wide mirror (e.g. when switching projects).
+
+    The on-disk copy is kept; the next get_task_mirror() reopens it.
+    """
+    global _mirror
+    with _mirror_lock:
+        if isinstance(_mirror, SqliteTaskMirror):
+            _mirror.close()
+        _mirror = None
+
+
+def load_fresh_mirror(max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS) -> TaskMirror | None:
+    """Return a task mirror the scheduler synced recently.
+
+    Prefers this process's own mirror (the daemon's in-memory one, e.g. when
+    a report is built for the status API). Otherwise reads the on-disk
+    mirror, for processes other than the scheduler. Returns None when there
+    is no mirror, it belongs to another scope, it has never synced, or its
+    last sync is older than max_age_seconds.
+    """
+    from .config import get_scope
+
+    with _mirror_lock:
+        own = _mirror
+    if own is not None and own.is_synced and own.synced_at is not None:
+        if (datetime.now() - own.synced_at).total_seconds() <= max_age_seconds:
+            return own
+
+    path = get_mirror_path()
+    if not path.exists():
+        return None
+    try:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=1)
+    except sqlite3.Error:
+        return None
+    try:
+        meta = dict(db.execute("SELECT key, value FROM meta").fetchall())
+        if meta.get("scope") != (get_scope() or "") or not meta.get("cursor") or not meta.get("synced_at"):
+            return None
+        synced_at = datetime.fromisoformat(meta["synced_at"])
+        if (datetime.now() - synced_at).total_seconds() > max_age_seconds:
+            return None
+        mirror = TaskMirror(meta["scope"] or None)
+        for (data,) in db.execute("SELECT data FROM tasks"):
+            task = json.loads(data)
+            mirror._tasks[task["id"]] = task
+        mirror.cursor = meta["cursor"]
+        mirror.synced_at = synced_at
+        return mirror
+    except (sqlite3.Error, ValueError, KeyError):
+        return None
+    finally:
+        db.close()
@@ -10,7 +10,7 @@ import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 from uuid import uuid4
 
 from .config import (
@@ -43,23 +43,21 @@ def _transition(
 
     return result
 
-def claim_task(
-    role_filter: str | None = None,
-    agent_name: str | None = None,
-    from_queue: str = "incoming",
-    type_filter: str | None = None,
-) -> dict[str, Any] | None:
-    """Atomically claim a task from the API server (with lease-based coordination)."""
+def _claim_kwargs(
+    role_filter: str | None,
+    agent_name: str | None,
+    from_queue: str,
+    type_filter: str | None,
+) -> dict[str, Any]:
+    """Build the sdk.tasks.claim()/claim_batch() arguments shared by claim_task and claim_tasks."""
     from .backpressure import get_queue_limits
 
-    sdk = get_sdk()
-    orchestrator_id = get_orchestrator_id()
     limits = get_queue_limits()
 
     # 4-hour lease. renew_active_leases() extends it when expiring so agents
     # that survive laptop sleep or run long never hit a stale lease.
     claim_kwargs: dict[str, Any] = dict(
-        orchestrator_id=orchestrator_id,
+        orchestrator_id=get_orchestrator_id(),
         agent_name=agent_name or "unknown",
         role_filter=role_filter,
         type_filter=type_filter,
@@ -68,23 +66,66 @@ def claim_task(
     )
     if from_queue != "incoming":
         claim_kwargs["queue"] = from_queue
-    task = sdk.tasks.claim(**claim_kwargs)
+    return claim_kwargs
 
-    if task is None:
-        return None
 
+def _log_claimed(task: dict[str, Any], agent_name: str | None) -> None:
     task_id = task.get("id")
     if task_id:
         logger = get_task_logger(task_id)
         attempt = task.get("attempt_count", 0)
         logger.log_claimed(
-            claimed_by=orchestrator_id,
+            claimed_by=get_orchestrator_id(),
             agent=agent_name or "unknown",
             attempt=attempt,
         )
 
+
+def claim_task(
+    role_filter: str | None = None,
+    agent_name: str | None = None,
+    from_queue: str = "incoming",
+    type_filter: str | None = None,
+) -> dict[str, Any] | None:
+    """Atomically claim a task from the API server (with lease-based coordination)."""
+    sdk = get_sdk()
+    task = sdk.tasks.claim(**_claim_kwargs(role_filter, agent_name, from_queue, type_filter))
+
+    if task is None:
+        return None
+
+    _log_claimed(task, agent_name)
     return task
 
+
+def claim_tasks(
+    limit: int,
+    role_filter: str | None = None,
+    agent_name: str | None = None,
+    from_queue: str = "incoming",
+    type_filter: str | None = None,
+) -> list[dict[str, Any]]:
+    """Claim up to ``limit`` tasks in one request (one lease for the batch).
+
+    Used to fill several idle pool slots in a single tick. With limit=1 this
+    is equivalent to claim_task().
+
+    Returns:
+        The claimed tasks (possibly fewer than limit, possibly empty).
+    """
+    if limit <= 1:
+        task = claim_task(role_filter, agent_name, from_queue, type_filter)
+        return [task] if task else []
+
+    sdk = get_sdk()
+    tasks = sdk.tasks.claim_batch(
+        limit=limit, **_claim_kwargs(role_filter, agent_name, from_queue, type_filter),
+    ) or []
+
+    for task in tasks:
+        _log_claimed(task, agent_name)
+    return tasks
+
 def unclaim_task(task_id: str) -> dict:
     """Return a claimed task to the incoming queue."""
     return _transition(task_id, "incoming", claimed_by=None)
@@ -610,9 +651,18 @@ def find_task_by_id(task_id: str, queues: list[str] | None = None) -> dict[str,
 
     return task
 
-def get_continuation_tasks(agent_name: str | None = None) -> list[dict[str, Any]]:
-    """Get tasks that need continuation, optionally filtered by agent."""
-    tasks = list_tasks("needs_continuation")
+def get_continuation_tasks(
+    agent_name: str | None = None,
+    tasks: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Get tasks that need continuation, optionally filtered by agent.
+
+    Args:
+        agent_name: Only return tasks last worked on or claimed by this agent.
+        tasks: Already-listed needs_continuation tasks (e.g. from the tick's
+            task mirror). Listed from the server when omitted.
+    """
+    tasks = list_tasks("needs_continuation") if tasks is None else _scope_and_sort(tasks)
 
     if agent_name:
         filtered = []
@@ -799,31 +849,47 @@ def get_task_by_id(task_id: str) -> dict[str, Any] | None:
         print(f"Warning: Failed to get task {task_id}: {e}")
         return None
 
-def list_tasks(subdir: str) -> list[dict[str, Any]]:
-    """List all tasks in a queue, filtered to the current scope."""
+# Columns list_tasks() itself reads: the scope filter and the sort key
+_LIST_TASKS_FIELDS = ("id", "scope", "expedite", "priority", "created_at", "created")
+
+def list_tasks(subdir: str, fields: Sequence[str] | None = None) -> list[dict[str, Any]]:
+    """List all tasks in a queue, filtered to the current scope.
+
+    Args:
+        subdir: Queue name.
+        fields: Optional task columns to request from the server. The columns
+            used for scope filtering and sorting are always included.
+    """
     try:
         sdk = get_sdk()
-        tasks = sdk.tasks.list(queue=subdir)
-
-        # Filter by scope as a client-side safety net.
-        # The SDK sends scope as a query param, but if the server does not filter
-        # by it (e.g. older server version), tasks from other scopes would leak
-        # into queue counts and status displays, blocking capacity checks.
-        scope = get_scope()
-        if scope:
-            tasks = [t for t in tasks if t.get("scope") == scope]
-
-        priority_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
-        tasks.sort(key=lambda t: (
-            0 if t.get("expedite") else 1,  # Expedited tasks first
-            priority_order.get(t.get("priority", "P2"), 2),
-            t.get("created_at") or t.get("created") or "",
-        ))
-        return tasks
+        if fields:
+            wanted = dict.fromkeys([*fields, *_LIST_TASKS_FIELDS])
+            tasks = sdk.tasks.list(queue=subdir, fields=list(wanted))
+        else:
+            tasks = sdk.tasks.list(queue=subdir)
+
+        return _scope_and_sort(tasks)
     except Exception as e:
         print(f"Warning: Failed to list tasks in queue {subdir}: {e}")
         return []
 
+def _scope_and_sort(tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Drop tasks from other scopes and sort expedited, then by priority and age."""
+    # Filter by scope as a client-side safety net.
+    # The SDK sends scope as a query param, but if the server does not filter
+    # by it (e.g. older server version), tasks from other scopes would leak
+    # into queue counts and status displays, blocking capacity checks.
+    scope = get_scope()
+    if scope:
+        tasks = [t for t in tasks if t.get("scope") == scope]
+
+    priority_order = {"P0": 0, "P1": 1, "P2": 2, "P3": 3}
+    return sorted(tasks, key=lambda t: (
+        0 if t.get("expedite") else 1,  # Expedited tasks first
+        priority_order.get(t.get("priority", "P2"), 2),
+        t.get("created_at") or t.get("created") or "",
+    ))
+
 def cancel_task(task_id: str) -> dict[str, Any]:
     """Cancel a task with full cleanup: kill agent, remove worktree and runtime, delete server record.
 
@@ -0,0 +1,149 @@
+"""Tick-scoped cache of task lists shared by the scheduler jobs.
+
+Several jobs in one tick read the same queues (renew_active_leases and
+check_and_requeue_expired_leases both list 'claimed', backpressure counts
+'claimed'). A TickSnapshot is built once per tick in run_due_jobs() and handed
+to every job via JobContext.snapshot, so each queue is listed at most once per
+tick.
+
+Jobs that mutate tasks report the change with record_update() (patches the
+cached entry, or drops it and invalidates the destination queue when the task
+moves) or invalidate() (forces a re-list on next access).
+
+When this tick's poll brought the task mirror up to date (see
+task_mirror.py), run_due_jobs() attaches the mirror and queues are read from
+it instead of the server. record_update() then patches the mirror too, so a
+task moved by one job shows up in its new queue for the next one. Queues
+passed to invalidate() were changed behind the mirror's back (e.g. by a
+claim), so they are re-listed from the server for the rest of the tick.
+
+A snapshot is safe to share between the parallel evaluation workers; a queue
+listed concurrently by two workers may be fetched twice.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger("octopoid.scheduler")
+
+
+class TickSnapshot:
+    """Lazily-populated per-tick view of task queues.
+
+    Attributes:
+        poll_data: The poll response for this tick, or None if the poll failed
+                   or no remote jobs were due.
+        mirror: Task mirror synced by this tick's poll, or None to list
+                queues from the server.
+        list_calls: Number of sdk.tasks.list() calls actually made.
+        cache_hits: Number of reads served from the snapshot.
+        mirror_reads: Number of queues read from the mirror.
+    """
+
+    def __init__(self, poll_data: dict | None = None, sdk: Any = None, mirror: Any = None):
+        self.poll_data = poll_data
+        self.mirror = mirror
+        self._sdk = sdk
+        self._queues: dict[str, list[dict]] = {}
+        self._stale: set[str] = set()  # Queues the mirror no longer reflects
+        self.list_calls = 0
+        self.cache_hits = 0
+        self.mirror_reads = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queue_counts(self) -> dict | None:
+        """Queue counts from the poll response, if available."""
+        return (self.poll_data or {}).get("queue_counts")
+
+    def _get_sdk(self) -> Any:
+        if self._sdk is None:
+            from . import queue_utils
+            self._sdk = queue_utils.get_sdk()
+        return self._sdk
+
+    def list_tasks(self, queue: str) -> list[dict]:
+        """Return the tasks in a queue, listing it at most once per tick.
+
+        Reads the task mirror when one is attached, otherwise the server.
+        Returns a shallow copy of the cached list; the task dicts themselves are
+        shared, so callers should report changes via record_update().
+
+        Raises:
+            Whatever sdk.tasks.list() raises. Failures are not cached.
+        """
+        with self._lock:
+            cached = self._queues.get(queue)
+            if cached is not None:
+                self.cache_hits += 1
+                return list(cached)
+
+        if self.mirror is not None and queue not in self._stale:
+            tasks = self.mirror.list_tasks(queue)
+            with self._lock:
+                self.mirror_reads += 1
+                self._queues[queue] = list(tasks)
+            return list(tasks)
+
+        tasks = self._get_sdk().tasks.list(queue=queue) or []
+        with self._lock:
+            self.list_calls += 1
+            self._queues[queue] = list(tasks)
+        return list(tasks)
+
+    def is_cached(self, queue: str) -> bool:
+        """Return True if the queue has been listed this tick and not invalidated."""
+        with self._lock:
+            return queue in self._queues
+
+    def invalidate(self, *queues: str) -> None:
+        """Drop cached queues so the next read re-lists them.
+
+        With no arguments, drops every cached queue. Invalidated queues are
+        no longer read from the mirror this tick.
+        """
+        with self._lock:
+            if not queues:
+                self._queues.clear()
+                self._stale.clear()
+                self.mirror = None
+                return
+            self._stale.update(queues)
+            for queue in queues:
+                self._queues.pop(queue, None)
+
+    def record_update(self, task_id: str, **fields: Any) -> None:
+        """Apply a task update (as sent to sdk.tasks.update) to the snapshot.
+
+        If the update moves the task to a different queue, the task is removed
+        from its cached source queue and the destination queue is invalidated
+        (its server-side ordering is unknown). Otherwise the cached task dict is
+        patched in place. The attached mirror, if any, is patched as well.
+        """
+        if self.mirror is not None:
+            self.mirror.record_update(task_id, **fields)
+        new_queue = fields.get("queue")
+        with self._lock:
+            for queue, tasks in self._queues.items():
+                match = next((i for i, t in enumerate(tasks) if t.get("id") == task_id), None)
+                if match is None:
+                    continue
+                if new_queue is None or new_queue == queue:
+                    tasks[match].update(fields)
+                    return
+                del tasks[match]
+                break
+        if new_queue is not None:
+            with self._lock:
+                self._queues.pop(new_queue, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return list-call, cache-hit and mirror-read counters for logging."""
+        return {
+            "list_calls": self.list_calls,
+            "cache_hits": self.cache_hits,
+            "mirror_reads": self.mirror_reads,
+        }
@@ -0,0 +1,232 @@
+"""Cheaper ways to create task worktrees in large repositories.
+
+By default a task worktree is a full ``git worktree add`` checkout. With
+dozens of worktrees kept around until the sweep removes them, that costs a
+full copy of the tree on disk per task, plus the I/O to write it. The
+``worktree_backend:`` key in config.yaml selects another backend:
+
+- ``reflink``: a pristine checkout of the start point is kept under
+  .octopoid/runtime/worktree-pristine/<ref>/. A task worktree is registered
+  with ``git worktree add --no-checkout``, and the pristine files and index
+  are copied in with ``cp --reflink=auto``. On filesystems that clone files
+  (btrfs, XFS) the copies share blocks until they are modified. If the
+  filesystem cannot clone, the ``sparse`` backend is used instead, because a
+  plain copy is no better than a checkout.
+- ``sparse``: a cone-mode sparse checkout of ``sparse_cone`` directories (plus
+  the top-level files). Without a cone this is a full checkout.
+
+Every backend leaves a clean, detached worktree at the start point, just like
+``git worktree add --detach``. Removal and sweeping work unchanged; the sweep
+also calls prune_pristine() to drop pristine checkouts that are no longer used.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+from .lock_utils import locked
+
+logger = logging.getLogger("octopoid.scheduler")
+
+PRISTINE_DIRNAME = "worktree-pristine"
+
+# Probed once per filesystem (st_dev): can cp clone files there?
+_reflink_support: dict[int, bool] = {}
+
+
+def get_pristine_dir() -> Path:
+    """Return the directory holding the pristine checkouts."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / PRISTINE_DIRNAME
+
+
+def _run_git(args: list[str], cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
+    from .git_utils import run_git
+    return run_git(args, cwd=cwd, check=check)
+
+
+def reflink_supported(directory: Path) -> bool:
+    """Whether ``cp --reflink=always`` can clone files inside directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    device = directory.stat().st_dev
+    if device not in _reflink_support:
+        with tempfile.TemporaryDirectory(dir=directory, prefix=".reflink-probe-") as tmp:
+            source = Path(tmp) / "source"
+            source.write_bytes(b"octopoid")
+            try:
+                result = subprocess.run(
+                    ["cp", "--reflink=always", str(source), str(Path(tmp) / "clone")],
+                    capture_output=True, timeout=10,
+                )
+                _reflink_support[device] = result.returncode == 0
+            except (OSError, subprocess.SubprocessError):
+                _reflink_support[device] = False
+        logger.debug(f"Reflink copies {'supported' if _reflink_support[device] else 'not supported'} under {directory}")
+    return _reflink_support[device]
+
+
+def _index_path(worktree: Path) -> Path:
+    """Path of a worktree's index file (it lives in the worktree's git dir)."""
+    path = Path(_run_git(["rev-parse", "--git-path", "index"], cwd=worktree).stdout.strip())
+    return path if path.is_absolute() else worktree / path
+
+
+def _update_pristine(parent_repo: Path, pristine: Path, start_point: str) -> None:
+    """Create the pristine checkout, or move it to start_point."""
+    if not (pristine / ".git").exists():
+        if pristine.exists():
+            shutil.rmtree(pristine, ignore_errors=True)
+        _run_git(["worktree", "prune"], cwd=parent_repo, check=False)
+        pristine.parent.mkdir(parents=True, exist_ok=True)
+        _run_git(["worktree", "add", "--detach", str(pristine), start_point], cwd=parent_repo)
+        return
+    _run_git(["checkout", "--force", "--detach", start_point], cwd=pristine)
+    _run_git(["clean", "-ffdx"], cwd=pristine)
+
+
+def create_reflink(parent_repo: Path, worktree_path: Path, start_point: str) -> None:
+    """Create worktree_path as a reflink copy of the pristine checkout.
+
+    Raises:
+        subprocess.CalledProcessError: If a git or cp command fails. The
+            half-made worktree is left for the caller to remove.
+    """
+    pristine = get_pristine_dir() / start_point.replace("/", "__")
+    _run_git(["worktree", "add", "--no-checkout", "--detach", str(worktree_path), start_point], cwd=parent_repo)
+    # Holding the lock keeps other claims from moving the pristine checkout mid-copy
+    with locked(pristine.with_name(pristine.name + ".lock"), blocking=True):
+        _update_pristine(parent_repo, pristine, start_point)
+        entries = [str(p) for p in pristine.iterdir() if p.name != ".git"]
+        if entries:
+            subprocess.run(
+                ["cp", "-a", "--reflink=auto", *entries, str(worktree_path)],
+                capture_output=True, text=True, check=True,
+            )
+        shutil.copy2(_index_path(pristine), _index_path(worktree_path))
+    # The copied index has the pristine files' inodes; refresh re-stats them
+    _run_git(["update-index", "-q", "--refresh"], cwd=worktree_path, check=False)
+
+
+def create_sparse(parent_repo: Path, worktree_path: Path, start_point: str, cone: list[str]) -> None:
+    """Create worktree_path as a cone-mode sparse checkout of start_point.
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails.
+    """
+    _run_git(["worktree", "add", "--no-checkout", "--detach", str(worktree_path), start_point], cwd=parent_repo)
+    _run_git(["sparse-checkout", "set", "--cone", *cone], cwd=worktree_path)
+    _run_git(["read-tree", "-mu", "HEAD"], cwd=worktree_path)
+
+
+def create_worktree(
+    parent_repo: Path,
+    worktree_path: Path,
+    start_point: str,
+    backend: str,
+    cone: list[str] | None = None,
+) -> str:
+    """Create a detached worktree at start_point with the given backend.
+
+    Args:
+        parent_repo: Repository the worktree belongs to.
+        worktree_path: Where to create it. Must not exist yet.
+        start_point: Ref to check out, e.g. "origin/main".
+        backend: "git", "reflink" or "sparse" (see the module docstring).
+        cone: Directories for sparse checkouts.
+
+    Returns:
+        The backend that was actually used.
+
+    Raises:
+        subprocess.CalledProcessError: If the fallback ``git worktree add``
+            fails too.
+    """
+    if backend == "reflink" and not reflink_supported(get_pristine_dir()):
+        backend = "sparse"
+    if backend == "sparse" and not cone:
+        backend = "git"
+
+    if backend != "git":
+        try:
+            if backend == "reflink":
+                create_reflink(parent_repo, worktree_path, start_point)
+            else:
+                create_sparse(parent_repo, worktree_path, start_point, cone or [])
+            return backend
+        except (subprocess.CalledProcessError, OSError) as e:
+            stderr = getattr(e, "stderr", "") or ""
+            logger.warning(f"{backend} worktree for {worktree_path} failed, using a full checkout: {e} {stderr.strip()}")
+            _run_git(["worktree", "remove", "--force", str(worktree_path)], cwd=parent_repo, check=False)
+            if worktree_path.exists():
+                shutil.rmtree(worktree_path, ignore_errors=True)
+            _run_git(["worktree", "prune"], cwd=parent_repo, check=False)
+
+    _run_git(["worktree", "add", "--detach", str(worktree_path), start_point], cwd=parent_repo)
+    return "git"
+
+
+def _ref_exists(parent_repo: Path, ref: str) -> bool:
+    result = _run_git(["rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"], cwd=parent_repo, check=False)
+    return result.returncode == 0
+
+
+def _remove_pristine(parent_repo: Path, path: Path) -> None:
+    with locked(path.with_name(path.name + ".lock"), blocking=True):
+        _run_git(["worktree", "remove", "--force", str(path)], cwd=parent_repo, check=False)
+        if path.exists():
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def drain_pristine(parent_repo: Path) -> int:
+    """Remove every pristine checkout. Returns the number removed."""
+    pristine_dir = get_pristine_dir()
+    if not pristine_dir.exists():
+        return 0
+    removed = 0
+    for path in pristine_dir.iterdir():
+        if not path.is_dir():
+            continue
+        _remove_pristine(parent_repo, path)
+        removed += 1
+    _run_git(["worktree", "prune"], cwd=parent_repo, check=False)
+    return removed
+
+
+def prune_pristine(parent_repo: Path, backend: str | None = None) -> int:
+    """Remove pristine checkouts that no task worktree will be copied from.
+
+    Called from the stale-resource sweep. When the configured backend is no
+    longer ``reflink`` every pristine checkout is drained. Otherwise only the
+    checkouts whose start point ref no longer exists (e.g. a deleted
+    ``origin/<branch>``) are removed.
+
+    Args:
+        parent_repo: Repository the pristine checkouts belong to.
+        backend: Configured backend (defaults to worktree_backend.type).
+
+    Returns:
+        Number of pristine checkouts removed.
+    """
+    if backend is None:
+        from .config import get_worktree_backend_config
+        backend = get_worktree_backend_config()["type"]
+    if backend != "reflink":
+        return drain_pristine(parent_repo)
+
+    pristine_dir = get_pristine_dir()
+    if not pristine_dir.exists():
+        return 0
+    removed = 0
+    for path in pristine_dir.iterdir():
+        if not path.is_dir() or _ref_exists(parent_repo, path.name.replace("__", "/")):
+            continue
+        logger.debug(f"Removing pristine checkout {path.name}: its ref no longer exists")
+        _remove_pristine(parent_repo, path)
+        removed += 1
+    if removed:
+        _run_git(["worktree", "prune"], cwd=parent_repo, check=False)
+    return removed
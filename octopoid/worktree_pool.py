@@ -0,0 +1,314 @@
+"""Pool of pre-created task worktrees, so a claim does not wait on a checkout.
+
+Creating a task worktree with ``git worktree add`` checks out the whole tree,
+which takes tens of seconds in a large repository and sits between the claim
+and the agent start. When ``worktree_pool.size`` is set in config.yaml, a
+few detached worktrees per base branch are created ahead of time under
+.octopoid/runtime/worktree-pool/<branch>/:
+
+- create_task_worktree() calls take(). It moves a ready worktree into
+  runtime/tasks/<id>/worktree (``git worktree move``), then resets it to the
+  freshly fetched start point with ``checkout --detach`` and ``clean``. Only
+  the files that changed since the slot was made are touched.
+- replenish_async() then refills the pool in a background thread. The same
+  thread re-checks-out slots older than REFRESH_SECONDS so they stay close to
+  origin.
+
+A slot is ready once its ``<slot>.ready`` marker exists. Taking a slot and
+removing a broken one happen under the pool's file lock. Only one process
+replenishes at a time. If anything goes wrong, take() returns False and the
+caller creates the worktree the normal way. The stale-resource sweep calls
+prune() to remove the pools of branches that are no longer configured.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import threading
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from .lock_utils import locked
+from .resource_limits import resource_slot
+
+logger = logging.getLogger("octopoid.scheduler")
+
+POOL_DIRNAME = "worktree-pool"
+READY_SUFFIX = ".ready"
+REFRESH_SECONDS = 3600  # Re-checkout ready slots older than this
+
+_replenisher: threading.Thread | None = None
+_replenisher_lock = threading.Lock()
+
+
+def get_pool_dir() -> Path:
+    """Return the root directory of the worktree pool."""
+    from .config import get_runtime_dir
+    return get_runtime_dir() / POOL_DIRNAME
+
+
+def _branch_dir(branch: str) -> Path:
+    return get_pool_dir() / branch.replace("/", "__")
+
+
+def _ready_marker(slot: Path) -> Path:
+    return slot.with_name(slot.name + READY_SUFFIX)
+
+
+def _ready_slots(branch: str) -> list[Path]:
+    """Ready slots for a branch, oldest first."""
+    branch_dir = _branch_dir(branch)
+    if not branch_dir.exists():
+        return []
+    markers = []
+    for marker in branch_dir.glob(f"*{READY_SUFFIX}"):
+        try:
+            markers.append((marker.stat().st_mtime, marker))
+        except FileNotFoundError:
+            continue  # Taken by another process meanwhile
+    slots = [m.with_name(m.name[: -len(READY_SUFFIX)]) for _, m in sorted(markers)]
+    return [s for s in slots if (s / ".git").exists()]
+
+
+def _run_git(args: list[str], cwd: Path, check: bool = False):
+    from .git_utils import run_git
+    return run_git(args, cwd=cwd, check=check)
+
+
+def _discard(parent_repo: Path, slot: Path) -> None:
+    """Remove a slot's worktree, directory and marker."""
+    _ready_marker(slot).unlink(missing_ok=True)
+    _run_git(["worktree", "remove", "--force", str(slot)], cwd=parent_repo)
+    if slot.exists():
+        shutil.rmtree(slot, ignore_errors=True)
+    _run_git(["worktree", "prune"], cwd=parent_repo)
+
+
+def pool_size(branch: str) -> int:
+    """Number of ready worktrees in a branch's pool."""
+    return len(_ready_slots(branch))
+
+
+def take(parent_repo: Path, branches: list[str], start_point: str, dest: Path) -> bool:
+    """Move a ready pooled worktree to dest and reset it to start_point.
+
+    Args:
+        parent_repo: Repository the worktrees belong to.
+        branches: Pools to try, in order (the task's base branch first).
+        start_point: Ref the worktree must end up on, e.g. "origin/main".
+        dest: Task worktree path. Must not exist yet.
+
+    Returns:
+        True if dest is now a clean detached worktree at start_point. False if
+        no slot was available or it could not be reused. The caller then
+        creates the worktree itself.
+    """
+    slot = None
+    with locked(get_pool_dir() / ".lock", blocking=True):
+        for branch in branches:
+            ready = _ready_slots(branch)
+            if ready:
+                slot = ready[0]
+                break
+        if slot is None:
+            return False
+        _ready_marker(slot).unlink(missing_ok=True)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        moved = _run_git(["worktree", "move", str(slot), str(dest)], cwd=parent_repo)
+        if moved.returncode != 0:
+            logger.debug(f"Could not move pooled worktree {slot.name}: {moved.stderr.strip()}")
+            _discard(parent_repo, slot)
+            return False
+
+    for args in (["checkout", "--force", "--detach", start_point], ["clean", "-ffd"]):
+        result = _run_git(args, cwd=dest)
+        if result.returncode != 0:
+            logger.debug(f"Could not reset pooled worktree to {start_point}: {result.stderr.strip()}")
+            _discard(parent_repo, dest)
+            return False
+    logger.debug(f"Took pooled worktree {slot.name} for {dest.parent.name} at {start_point}")
+    return True
+
+
+def _add_slot(parent_repo: Path, branch: str) -> bool:
+    branch_dir = _branch_dir(branch)
+    branch_dir.mkdir(parents=True, exist_ok=True)
+    slot = branch_dir / f"slot-{uuid4().hex[:8]}"
+    start_point = f"origin/{branch}"
+    with resource_slot("git"):
+        result = _run_git(["worktree", "add", "--detach", str(slot), start_point], cwd=parent_repo)
+    if result.returncode != 0:
+        logger.debug(f"Could not add pooled worktree for {branch}: {result.stderr.strip()}")
+        with locked(get_pool_dir() / ".lock", blocking=True):
+            _discard(parent_repo, slot)
+        return False
+    _ready_marker(slot).write_text(start_point)
+    return True
+
+
+def _refresh_slot(parent_repo: Path, slot: Path, branch: str) -> None:
+    """Bring an old ready slot up to origin/<branch>, unless it is taken meanwhile."""
+    marker = _ready_marker(slot)
+    with locked(get_pool_dir() / ".lock", blocking=True):
+        if not marker.exists():
+            return
+        # Hide the slot from take() while it is being updated
+        marker.unlink()
+    with resource_slot("git"):
+        result = _run_git(["checkout", "--force", "--detach", f"origin/{branch}"], cwd=slot)
+    if result.returncode != 0:
+        with locked(get_pool_dir() / ".lock", blocking=True):
+            _discard(parent_repo, slot)
+        return
+    marker.write_text(f"origin/{branch}")
+
+
+def replenish(parent_repo: Path, size: int | None = None, branches: list[str] | None = None) -> int:
+    """Fill each branch's pool up to size and refresh stale slots.
+
+    Skips the run if another process is already replenishing.
+
+    Args:
+        parent_repo: Repository to create worktrees in.
+        size: Target ready slots per branch (defaults to worktree_pool.size).
+        branches: Branches to pool (defaults to worktree_pool.branches).
+
+    Returns:
+        Number of worktrees created.
+    """
+    if size is None or branches is None:
+        from .config import get_worktree_pool_config
+        config = get_worktree_pool_config()
+        size = config["size"] if size is None else size
+        branches = config["branches"] if branches is None else branches
+
+    created = 0
+    with locked(get_pool_dir() / "replenish.lock") as acquired:
+        if not acquired:
+            return 0
+        for branch in branches:
+            branch_dir = _branch_dir(branch)
+            # Slots without a marker are leftovers of an interrupted add/refresh
+            if branch_dir.exists():
+                with locked(get_pool_dir() / ".lock", blocking=True):
+                    for path in branch_dir.iterdir():
+                        if path.is_dir() and not _ready_marker(path).exists():
+                            _discard(parent_repo, path)
+
+            ready = _ready_slots(branch)
+            for slot in ready[size:]:
+                with locked(get_pool_dir() / ".lock", blocking=True):
+                    if _ready_marker(slot).exists():
+                        _discard(parent_repo, slot)
+            now = time.time()
+            for slot in ready[:size]:
+                try:
+                    age = now - _ready_marker(slot).stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if age > REFRESH_SECONDS:
+                    _refresh_slot(parent_repo, slot, branch)
+
+            while pool_size(branch) < size:
+                if not _add_slot(parent_repo, branch):
+                    break
+                created += 1
+    if created:
+        logger.info(f"Worktree pool: created {created} worktree(s)")
+    return created
+
+
+def replenish_async(parent_repo: Path) -> threading.Thread | None:
+    """Start replenish() in a background thread unless one is already running.
+
+    The thread is not a daemon thread: a one-shot scheduler run finishes
+    filling the pool before the process exits rather than leaving a
+    half-created worktree behind.
+
+    Returns:
+        The started thread, or None if the pool is disabled or a replenish
+        is already in progress.
+    """
+    global _replenisher
+    from .config import get_worktree_pool_config
+
+    config = get_worktree_pool_config()
+    if config["size"] <= 0:
+        return None
+    with _replenisher_lock:
+        if _replenisher is not None and _replenisher.is_alive():
+            return None
+
+        def _run() -> None:
+            try:
+                replenish(parent_repo, config["size"], config["branches"])
+            except Exception as e:
+                logger.warning(f"Worktree pool replenish failed: {e}")
+
+        _replenisher = threading.Thread(target=_run, name="octopoid-worktree-pool")
+        _replenisher.start()
+        return _replenisher
+
+
+def _drain_branches(parent_repo: Path, branch_dirs: list[Path]) -> int:
+    removed = 0
+    with locked(get_pool_dir() / ".lock", blocking=True):
+        for branch_dir in branch_dirs:
+            for path in list(branch_dir.iterdir()):
+                if path.is_dir():
+                    _discard(parent_repo, path)
+                    removed += 1
+            shutil.rmtree(branch_dir, ignore_errors=True)
+    return removed
+
+
+def drain(parent_repo: Path) -> int:
+    """Remove every pooled worktree. Returns the number removed."""
+    pool_dir = get_pool_dir()
+    if not pool_dir.exists():
+        return 0
+    return _drain_branches(parent_repo, [d for d in pool_dir.iterdir() if d.is_dir()])
+
+
+def prune(parent_repo: Path, size: int | None = None, branches: list[str] | None = None) -> int:
+    """Remove pooled worktrees that no claim will take.
+
+    Called from the stale-resource sweep. With the pool disabled (size 0)
+    every slot is drained. Otherwise the pools of branches that are no longer
+    configured, or whose ``origin/<branch>`` no longer exists, are removed.
+    Skipped while a replenish is in progress.
+
+    Args:
+        parent_repo: Repository the worktrees belong to.
+        size: Configured slots per branch (defaults to worktree_pool.size).
+        branches: Configured branches (defaults to worktree_pool.branches).
+
+    Returns:
+        Number of worktrees removed.
+    """
+    pool_dir = get_pool_dir()
+    if not pool_dir.exists():
+        return 0
+    if size is None or branches is None:
+        from .config import get_worktree_pool_config
+        config = get_worktree_pool_config()
+        size = config["size"] if size is None else size
+        branches = config["branches"] if branches is None else branches
+
+    # The replenish lock keeps half-added slots (no ready marker yet) safe
+    with locked(pool_dir / "replenish.lock") as acquired:
+        if not acquired:
+            return 0
+        if size <= 0:
+            return drain(parent_repo)
+        wanted = {
+            _branch_dir(b).name for b in branches
+            if _run_git(["rev-parse", "--verify", "--quiet", f"origin/{b}^{{commit}}"], cwd=parent_repo).returncode == 0
+        }
+        stale = [d for d in pool_dir.iterdir() if d.is_dir() and d.name not in wanted]
+        removed = _drain_branches(parent_repo, stale) if stale else 0
+    if removed:
+        logger.info(f"Worktree pool: removed {removed} worktree(s) no longer in use")
+    return removed
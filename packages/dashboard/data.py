@@ -2,6 +2,10 @@
 
 Wraps orchestrator.reports.get_project_report() for use by Textual widgets.
 Data is fetched synchronously in a background thread (via Textual's @work).
+
+When the scheduler daemon is running, both calls are answered by its local
+status API (octopoid/status_api.py) instead of the remote server, so several
+dashboards on one machine add no server load.
 """
 
 from typing import Any
@@ -24,6 +28,11 @@ class DataManager:
             RuntimeError: If the SDK is not installed or not configured.
         """
         from octopoid.sdk import get_sdk, get_orchestrator_id
+        from octopoid.status_api import try_query
+
+        local = try_query("poll")
+        if local is not None:
+            return local
 
         sdk = get_sdk()
         orch_id = get_orchestrator_id()
@@ -43,6 +52,11 @@ class DataManager:
         """
         from octopoid.sdk import get_sdk
         from octopoid.reports import get_project_report
+        from octopoid.status_api import try_query
+
+        local = try_query("report")
+        if local is not None:
+            return local
 
         sdk = get_sdk()
         return get_project_report(sdk)
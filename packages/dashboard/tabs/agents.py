@@ -8,7 +8,7 @@ from textual.widget import Widget
 from textual.widgets import Label, ListItem, ListView, TabbedContent, TabPane
 from textual.containers import Horizontal, Vertical, VerticalScroll
 
-from ..utils import format_age
+from ..utils import format_age, format_endpoint
 from ..widgets.status_badge import StatusBadge
 from .base import TabBase
 
@@ -353,6 +353,17 @@ class AgentDetail(Widget):
                 yield Label("LAST RUN OUTPUT", classes="detail-section-header")
                 yield Label("(no runs recorded yet)", classes="agent-detail-row dim-text")
 
+            # API endpoints the scheduler's jobs spent the most time on
+            yield Label("")  # spacer
+            yield Label("SCHEDULER API (recent ticks)", classes="detail-section-header")
+            endpoints = self._report.get("health", {}).get("api_endpoints", [])
+            if endpoints:
+                for entry in endpoints:
+                    css = "status--blocked" if entry.get("errors") else "dim-text"
+                    yield Label(format_endpoint(entry), classes=f"agent-detail-row {css}")
+            else:
+                yield Label("(no API calls recorded yet)", classes="agent-detail-row dim-text")
+
     def update_agent(self, agent: dict | None, report: dict) -> None:
         """Switch to a new agent and recompose the detail pane."""
         self._agent = agent
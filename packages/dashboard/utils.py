@@ -50,3 +50,13 @@ def time_ago(iso_str: str | None) -> str | None:
         return f"{days}d {hours % 24}h ago"
     except (ValueError, TypeError):
         return None
+
+
+def format_endpoint(entry: dict) -> str:
+    """Format a health report ``api_endpoints`` entry as a one-line latency/volume summary."""
+    errors = entry.get("errors", 0)
+    error_text = f" · {errors} err" if errors else ""
+    return (
+        f"{entry.get('endpoint', '?')}  {entry.get('calls', 0)}x"
+        f" · avg {entry.get('avg_ms', 0):.0f}ms · total {entry.get('total_ms', 0):.0f}ms{error_text}"
+    )
@@ -36,6 +36,21 @@ def _get_base_branch() -> str:
         return "feature/client-server-architecture"
 
 
+# Logs can run to megabytes; the tabs only show their end
+_RESULT_TAIL_CHARS = 2000
+_LOG_TAIL_CHARS = 20000
+
+
+def _read_log_tail(path: Path, max_chars: int) -> tuple[str, bool]:
+    """Return (last max_chars characters of path, whether it was cut)."""
+    import sys
+    repo_str = str(_get_repo_root())
+    if repo_str not in sys.path:
+        sys.path.insert(0, repo_str)
+    from octopoid.log_tail import read_tail
+    return read_tail(path, max_chars)
+
+
 def _fetch_tab_content(task_id: str, tab_index: int) -> str:
     """Fetch content for the given tab index.
 
@@ -107,12 +122,11 @@ def _fetch_tab_content(task_id: str, tab_index: int) -> str:
         if not stdout_file.exists():
             return "(no stdout.log yet)"
         try:
-            content = stdout_file.read_text()
-            if not content.strip():
-                return "(stdout.log is empty)"
             # Show the last 2000 chars (same tail the scheduler uses for inference)
-            tail = content[-2000:]
-            prefix = f"[last {len(tail)} chars of stdout.log]\n\n" if len(content) > 2000 else ""
+            tail, truncated = _read_log_tail(stdout_file, _RESULT_TAIL_CHARS)
+            if not tail.strip() and not truncated:
+                return "(stdout.log is empty)"
+            prefix = f"[last {len(tail)} chars of stdout.log]\n\n" if truncated else ""
             return prefix + tail
         except Exception as e:
             return f"(error reading stdout.log: {e})"
@@ -122,9 +136,10 @@ def _fetch_tab_content(task_id: str, tab_index: int) -> str:
             log_file = runtime_dir / log_name
             if log_file.exists():
                 try:
-                    content = log_file.read_text()
-                    if content.strip():
-                        return content
+                    tail, truncated = _read_log_tail(log_file, _LOG_TAIL_CHARS)
+                    if tail.strip():
+                        prefix = f"[last {len(tail)} chars of {log_name}]\n\n" if truncated else ""
+                        return prefix + tail
                 except OSError:
                     pass
         return "(no logs available)"
@@ -3,6 +3,7 @@ Octopoid Python SDK
 """
 
 from .client import OctopoidSDK
+from .async_client import AsyncOctopoidSDK
 
 __version__ = '2.0.0'
-__all__ = ['OctopoidSDK']
+__all__ = ['OctopoidSDK', 'AsyncOctopoidSDK']
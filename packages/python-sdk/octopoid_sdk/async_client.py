@@ -0,0 +1,177 @@
+"""
+Octopoid SDK Async Client
+asyncio interface to the Octopoid v2.0 API for fanning out many requests
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from requests.adapters import HTTPAdapter
+
+from .client import OctopoidSDK
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+_API_GROUPS = ('tasks', 'drafts', 'projects', 'flows', 'messages', 'actions', 'status')
+
+
+class AsyncAPI:
+    """Awaitable mirror of one sync API group (TasksAPI, ProjectsAPI, ...)
+
+    Every public method of the wrapped group is exposed as a coroutine
+    function with the same signature, so ``await sdk.tasks.update(...)``
+    behaves exactly like ``OctopoidSDK().tasks.update(...)``.
+    """
+
+    def __init__(self, client: 'AsyncOctopoidSDK', api: Any):
+        self._client = client
+        self._api = api
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        method = getattr(self._api, name)
+        if not callable(method):
+            return method
+
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self._client._run(method, *args, **kwargs)
+
+        return call
+
+
+class AsyncOctopoidSDK:
+    """
+    asyncio Octopoid SDK client
+
+    Requests are issued from a small thread pool over a shared keep-alive
+    connection pool, so the SDK keeps its single dependency on ``requests``.
+    At most ``max_connections`` requests are in flight at once (the client
+    only ever talks to one host), and every request uses the same timeout.
+
+    Usage:
+        async with AsyncOctopoidSDK(server_url='https://...', api_key='...') as sdk:
+            results = await sdk.gather(
+                *(sdk.tasks.update(task_id, lease_expires_at=expiry) for task_id in ids)
+            )
+
+    An existing sync client can be wrapped with ``AsyncOctopoidSDK.from_sdk``
+    to share its session, credentials and scope.
+    """
+
+    def __init__(
+        self,
+        server_url: str,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        scope: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ):
+        sync = OctopoidSDK(server_url=server_url, api_key=api_key, timeout=timeout, scope=scope)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        sync.session.mount('http://', adapter)
+        sync.session.mount('https://', adapter)
+        self._init(sync, max_connections, owns_sync=True)
+
+    @classmethod
+    def from_sdk(
+        cls,
+        sdk: OctopoidSDK,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> 'AsyncOctopoidSDK':
+        """Wrap an existing sync client
+
+        The sync client is shared, not copied: closing the async wrapper
+        leaves it open.
+
+        Args:
+            sdk: Sync client to issue requests through
+            max_connections: Maximum number of requests in flight at once
+        """
+        instance = cls.__new__(cls)
+        instance._init(sdk, max_connections, owns_sync=False)
+        return instance
+
+    def _init(self, sync: OctopoidSDK, max_connections: int, owns_sync: bool) -> None:
+        if max_connections < 1:
+            raise ValueError('max_connections must be at least 1')
+        self.sync = sync
+        self.max_connections = max_connections
+        self._owns_sync = owns_sync
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections, thread_name_prefix='octopoid-sdk'
+        )
+        # Created on first use so it binds to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        for name in _API_GROUPS:
+            setattr(self, name, AsyncAPI(self, getattr(sync, name)))
+
+    @property
+    def timeout(self) -> int:
+        return self.sync.timeout
+
+    @property
+    def scope(self) -> Optional[str]:
+        return self.sync.scope
+
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking SDK call in the pool, bounded by max_connections"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._executor, functools.partial(fn, *args, **kwargs)
+            )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None
+    ) -> Any:
+        """Make HTTP request to API (see OctopoidSDK._request)"""
+        return await self._run(self.sync._request, method, path, params=params, json=json)
+
+    async def poll(self, orchestrator_id: str, since: Optional[str] = None) -> Dict[str, Any]:
+        """Get all scheduler state in a single call (see OctopoidSDK.poll)"""
+        return await self._run(self.sync.poll, orchestrator_id, since=since)
+
+    async def gather(self, *aws: Awaitable[Any]) -> List[Any]:
+        """Await many SDK calls concurrently
+
+        Failures do not cancel the other calls: each failed call's exception
+        is returned in its slot of the result list instead of being raised.
+
+        Returns:
+            Results (or exceptions) in the order the awaitables were given
+        """
+        return list(await asyncio.gather(*aws, return_exceptions=True))
+
+    async def map(
+        self,
+        fn: Callable[['AsyncOctopoidSDK', Any], Awaitable[Any]],
+        items: Iterable[Any],
+    ) -> List[Any]:
+        """Call ``fn(self, item)`` for every item concurrently (see gather)"""
+        return await self.gather(*(fn(self, item) for item in items))
+
+    async def aclose(self) -> None:
+        """Shut down the worker pool, and the session if this client owns it"""
+        self._executor.shutdown(wait=True)
+        if self._owns_sync:
+            self.sync.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -0,0 +1,188 @@
+"""
+Response cache and request coalescing for OctopoidSDK
+Opt-in layer used by OctopoidSDK._request for GET requests
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+# Resources whose responses aggregate every other resource (e.g. the
+# scheduler poll's queue counts); any mutation invalidates them.
+AGGREGATE_RESOURCES = frozenset({'scheduler'})
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _segments(path: str) -> List[str]:
+    parts = [p for p in path.split('/') if p]
+    if parts[:2] == ['api', 'v1']:
+        return parts[2:]
+    if parts[:1] == ['api']:
+        return parts[1:]
+    return parts
+
+
+def resource_of(path: str) -> str:
+    """Return the resource a request path belongs to
+
+    '/api/v1/tasks/abc/claim' -> 'tasks', '/api/health' -> 'health'
+    """
+    parts = _segments(path)
+    return parts[0] if parts else ''
+
+
+def resources_of(path: str) -> FrozenSet[str]:
+    """Return every collection a request path reads or writes
+
+    Collections are the segments between ids, so nested paths belong to each
+    collection they name:
+    '/api/v1/projects/P1/tasks' -> {'projects', 'tasks'},
+    '/api/v1/tasks/abc/claim' -> {'tasks', 'claim'}
+    """
+    parts = _segments(path)
+    return frozenset(parts[::2]) if parts else frozenset({''})
+
+
+def make_key(path: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+    """Build a hashable cache key from a path and its query params"""
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (path, items)
+
+
+class _Flight:
+    """One in-progress GET that concurrent identical callers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """Per-key TTL cache with single-flight coalescing for GET responses
+
+    Concurrent identical GETs share one request (coalescing), and repeated
+    GETs within `ttl` seconds are answered from memory. Mutations invalidate
+    every entry whose path names a collection they touch (so updating
+    /tasks/abc also drops /projects/P1/tasks) plus the aggregate resources.
+    A GET that was already in flight when its resource was invalidated is
+    returned to its callers but not stored.
+
+    Cached values are deep-copied on the way out, so callers may modify
+    the dicts they get back.
+
+    Args:
+        ttl: Seconds a response stays fresh; 0 disables caching
+        coalesce: Merge concurrent identical GETs into one request
+    """
+
+    def __init__(self, ttl: float = 0, coalesce: bool = False):
+        if ttl < 0:
+            raise ValueError(f'ttl must be >= 0, got {ttl}')
+        self.ttl = ttl
+        self.coalesce = coalesce
+        self._lock = threading.Lock()
+        self._entries: Dict[CacheKey, Tuple[float, FrozenSet[str], Any]] = {}
+        self._flights: Dict[CacheKey, _Flight] = {}
+        # Bumped on invalidation; a GET only stores its response if neither
+        # changed while it was in flight
+        self._epoch = 0
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 or self.coalesce
+
+    def get(self, path: str, params: Optional[Dict[str, Any]], fetch: Callable[[], Any]) -> Any:
+        """Return the response for a GET, calling fetch() only when needed
+
+        Exceptions raised by fetch() propagate to every coalesced caller and
+        are never cached.
+        """
+        key = make_key(path, params)
+        resources = resources_of(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, _, value = entry
+                if time.monotonic() < expires:
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+
+            flight = self._flights.get(key) if self.coalesce else None
+            if flight is not None:
+                self.coalesced += 1
+            else:
+                self.misses += 1
+                leader = _Flight()
+                if self.coalesce:
+                    self._flights[key] = leader
+                generation = self._generation(resources)
+
+        if flight is not None:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            leader.result = fetch()
+        except BaseException as e:
+            leader.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is leader:
+                    del self._flights[key]
+                if (
+                    leader.error is None
+                    and self.ttl > 0
+                    and self._generation(resources) == generation
+                ):
+                    self._entries[key] = (
+                        time.monotonic() + self.ttl, resources, copy.deepcopy(leader.result)
+                    )
+            leader.done.set()
+        return leader.result
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop cached responses affected by a mutation of `path`
+
+        With no path, drops everything.
+        """
+        with self._lock:
+            self.invalidations += 1
+            if path is None:
+                self._epoch += 1
+                self._entries.clear()
+                return
+            stale = resources_of(path) | AGGREGATE_RESOURCES
+            self._entries = {
+                k: v for k, v in self._entries.items() if not (v[1] & stale)
+            }
+            for resource in stale:
+                self._generations[resource] = self._generations.get(resource, 0) + 1
+
+    def _generation(self, resources: FrozenSet[str]) -> Tuple[int, ...]:
+        return (self._epoch,) + tuple(self._generations.get(r, 0) for r in sorted(resources))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current entry count"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+                'hit_rate': round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+            }
@@ -4,29 +4,178 @@ Main API client for interacting with Octopoid v2.0 server
 """
 
 import logging
+import time
 import requests
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Iterable, Iterator, List, Any, Union
+
+from .cache import ResponseCache
+from .metrics import RequestMetrics
 
 logger = logging.getLogger(__name__)
 
+# Concurrent PATCHes used by bulk_update() when the server has no bulk endpoint
+BULK_FALLBACK_CONCURRENCY = 10
+
+# Tasks requested per page by TasksAPI.iter_tasks()
+DEFAULT_PAGE_SIZE = 200
+
 
 class TasksAPI:
     """Tasks API endpoints"""
 
     def __init__(self, client: 'OctopoidSDK'):
         self.client = client
+        # Cleared the first time the server rejects PATCH /api/v1/tasks
+        self._bulk_supported = True
 
-    def list(self, queue: Optional[str] = None, **filters) -> List[Dict[str, Any]]:
-        """List tasks with optional filters"""
-        params = {}
+    def list(
+        self,
+        queue: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        updated_since: Optional[Union[str, datetime]] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """List tasks with optional filters
+
+        Pages through the results (offset/limit, or next_cursor where the
+        server offers one) until every matching task has been fetched. Use
+        iter_tasks() to process large queues page by page.
+
+        Args:
+            queue: Only list tasks in this queue
+            fields: Only return these task columns (e.g. ['id', 'queue'])
+            updated_since: Only return tasks updated at or after this time
+                (ISO string or datetime)
+            **filters: Additional server-side filters (priority, role, limit...)
+
+        Returns:
+            List of task dictionaries
+        """
+        return list(self.iter_tasks(queue, fields=fields, updated_since=updated_since, **filters))
+
+    def list_page(
+        self,
+        queue: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        updated_since: Optional[Union[str, datetime]] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        offset: Optional[int] = None,
+        **filters
+    ) -> Dict[str, Any]:
+        """Fetch one page of tasks
+
+        The server pages with offset/limit and reports the number of matching
+        tasks as 'total'. A server may also return a next_cursor, which is
+        then preferred. Servers that do not support fields/updated_since
+        ignore them.
+
+        Args:
+            queue: Only list tasks in this queue
+            fields: Only return these task columns
+            updated_since: Only return tasks updated at or after this time
+            cursor: Cursor from a previous page's next_cursor
+            page_size: Maximum tasks on this page (sent as 'limit')
+            offset: Number of matching tasks to skip
+            **filters: Additional server-side filters
+
+        Returns:
+            Dict with keys:
+              - tasks: list of task dicts
+              - next_cursor: cursor for the next page, or None
+              - total: number of matching tasks, or None if not reported
+              - offset: offset of this page's first task
+        """
+        params: Dict[str, Any] = {}
         if queue:
             params['queue'] = queue
+        if fields:
+            params['fields'] = ','.join(fields)
+        if updated_since:
+            if isinstance(updated_since, datetime):
+                if updated_since.tzinfo is None:
+                    updated_since = updated_since.astimezone()
+                updated_since = updated_since.astimezone(timezone.utc).isoformat()
+            params['updated_since'] = updated_since
+        if cursor:
+            params['cursor'] = cursor
+        if offset:
+            params['offset'] = offset
+        if page_size:
+            params['limit'] = page_size
         params.update(filters)
 
         response = self.client._request('GET', '/api/v1/tasks', params=params)
         if isinstance(response, dict) and 'tasks' in response:
-            return response['tasks']
-        return response if isinstance(response, list) else []
+            return {
+                'tasks': response['tasks'],
+                'next_cursor': response.get('next_cursor'),
+                'total': response.get('total'),
+                'offset': response.get('offset', offset or 0),
+            }
+        tasks = response if isinstance(response, list) else []
+        return {'tasks': tasks, 'next_cursor': None, 'total': None, 'offset': offset or 0}
+
+    def iter_tasks(
+        self,
+        queue: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        updated_since: Optional[Union[str, datetime]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield tasks one at a time, fetching pages lazily
+
+        Pages are requested with offset/limit until offset + page length
+        reaches the server's 'total'. A next_cursor in the response is
+        followed instead. The next page is only requested once the current
+        one has been consumed, so callers that stop early never fetch the rest.
+
+        Args:
+            queue: Only list tasks in this queue
+            fields: Only return these task columns
+            updated_since: Only return tasks updated at or after this time
+            page_size: Tasks requested per page; the server may return fewer
+            **filters: Additional server-side filters; 'limit' caps the total
+
+        Yields:
+            Task dictionaries
+        """
+        fields = list(fields) if fields else None
+        limit = filters.pop('limit', None)
+        limit = int(limit) if limit is not None else None
+        yielded = 0
+        cursor = None
+        offset = 0
+        while limit is None or yielded < limit:
+            wanted = page_size if limit is None else min(page_size, limit - yielded)
+            page = self.list_page(
+                queue, fields=fields, updated_since=updated_since,
+                cursor=cursor, page_size=wanted, offset=None if cursor else offset, **filters
+            )
+            tasks = page['tasks']
+            for task in tasks:
+                if limit is not None and yielded >= limit:
+                    return
+                yield task
+                yielded += 1
+
+            next_cursor = page['next_cursor']
+            if next_cursor:
+                # A repeated cursor would loop forever; treat it as the last page
+                if next_cursor == cursor:
+                    return
+                cursor = next_cursor
+                continue
+            if cursor or not tasks:
+                return
+            total = page['total']
+            offset = int(page['offset'] or 0) + len(tasks)
+            # Without a total the server did not page: this was everything
+            if total is None or offset >= int(total):
+                return
 
     def get(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get a single task by ID"""
@@ -116,6 +265,72 @@ class TasksAPI:
         Returns:
             Claimed task dictionary, or None if no tasks available
         """
+        return self._claim_one(self._claim_data(
+            orchestrator_id, agent_name, role_filter, type_filter,
+            lease_duration_seconds, max_claimed, queue,
+        ))
+
+    def claim_batch(
+        self,
+        orchestrator_id: str,
+        agent_name: str,
+        limit: int,
+        role_filter: Optional[str] = None,
+        type_filter: Optional[str] = None,
+        lease_duration_seconds: Optional[int] = None,
+        max_claimed: Optional[int] = None,
+        queue: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Claim up to ``limit`` available tasks in one request
+
+        The server claims them under a single lease and returns
+        ``{"tasks": [...]}``. Servers that ignore ``limit`` return a single
+        task; the remainder is then claimed one request at a time until the
+        queue is empty or a claim fails. The other arguments are as for
+        claim().
+
+        Args:
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            List of claimed task dictionaries (possibly empty)
+        """
+        data = self._claim_data(
+            orchestrator_id, agent_name, role_filter, type_filter,
+            lease_duration_seconds, max_claimed, queue,
+        )
+        limit = max(int(limit), 1)
+        result = self._claim_one({**data, 'limit': limit})
+        if not result:
+            return []
+        if 'tasks' in result:
+            return list(result['tasks'] or [])[:limit]
+
+        # Server ignored limit and claimed a single task: claim the rest one by one.
+        # Keep what was already claimed if a later claim fails, so the caller can
+        # spawn (or requeue) those tasks rather than leaking their leases.
+        claimed = [result]
+        while len(claimed) < limit:
+            try:
+                task = self._claim_one(data)
+            except Exception as e:
+                logger.debug('claim_batch() fallback stopped after %d tasks: %s', len(claimed), e)
+                break
+            if not task:
+                break
+            claimed.append(task)
+        return claimed
+
+    @staticmethod
+    def _claim_data(
+        orchestrator_id: str,
+        agent_name: str,
+        role_filter: Optional[str],
+        type_filter: Optional[str],
+        lease_duration_seconds: Optional[int],
+        max_claimed: Optional[int],
+        queue: Optional[str],
+    ) -> Dict[str, Any]:
         data = {
             'orchestrator_id': orchestrator_id,
             'agent_name': agent_name,
@@ -131,10 +346,12 @@ class TasksAPI:
             data['max_claimed'] = max_claimed
         if queue is not None:
             data['queue'] = queue
+        return data
 
+    def _claim_one(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         logger.debug(
             'claim() request: orchestrator_id=%r agent_name=%r role_filter=%r queue=%r',
-            orchestrator_id, agent_name, role_filter, queue,
+            data['orchestrator_id'], data['agent_name'], data.get('role_filter'), data.get('queue'),
         )
 
         try:
@@ -262,6 +479,89 @@ class TasksAPI:
         """
         return self.update(task_id, queue='failed', execution_notes=reason)
 
+    def bulk_update(self, patches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Update many tasks in one request
+
+        Each patch is applied independently: one task failing (not found,
+        rejected by the server) does not affect the others. Servers without
+        the bulk endpoint get one PATCH per task instead, issued concurrently.
+        A batch the server rejects outright (any other 4xx) is retried the
+        same way, so the failure is reported against the offending task.
+
+        Args:
+            patches: List of dicts, each with the task 'id' plus the fields to
+                update, e.g. [{'id': 'abc', 'lease_expires_at': '...'}]
+
+        Returns:
+            Dict with keys:
+              - updated: list of updated task dicts
+              - failed: list of {'id': task_id, 'error': message} dicts
+        """
+        if not patches:
+            return {'updated': [], 'failed': []}
+        for patch in patches:
+            if not patch.get('id'):
+                raise ValueError(f'bulk_update patch is missing an id: {patch!r}')
+
+        if self._bulk_supported:
+            try:
+                result = self.client._request('PATCH', '/api/v1/tasks', json={'tasks': patches})
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status in (404, 405):
+                    logger.debug('bulk_update: server has no bulk endpoint (%d), patching per task', status)
+                    self._bulk_supported = False
+                elif status is not None and 400 <= status < 500:
+                    # The server rejected the batch as a whole, most likely over
+                    # one bad patch. Apply them one by one so only that task fails.
+                    logger.debug('bulk_update: batch rejected (%d), patching per task', status)
+                    return self._update_each(patches)
+                else:
+                    raise
+            else:
+                result = result or {}
+                return {
+                    'updated': list(result.get('updated') or []),
+                    'failed': list(result.get('failed') or []),
+                }
+
+        return self._update_each(patches)
+
+    def _update_each(self, patches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        def apply(patch: Dict[str, Any]) -> Dict[str, Any]:
+            fields = {k: v for k, v in patch.items() if k != 'id'}
+            try:
+                return {'task': self.update(patch['id'], **fields)}
+            except Exception as e:
+                return {'error': str(e)}
+
+        workers = min(len(patches), BULK_FALLBACK_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='octopoid-bulk') as pool:
+            outcomes = list(pool.map(apply, patches))
+
+        result: Dict[str, Any] = {'updated': [], 'failed': []}
+        for patch, outcome in zip(patches, outcomes):
+            if 'error' in outcome:
+                result['failed'].append({'id': patch['id'], 'error': outcome['error']})
+            else:
+                result['updated'].append(outcome['task'])
+        return result
+
+    def bulk_renew_leases(self, task_ids: List[str], duration_seconds: int) -> Dict[str, Any]:
+        """Extend the leases of many tasks in one request
+
+        Args:
+            task_ids: Tasks whose lease to extend
+            duration_seconds: New lease length, measured from now
+
+        Returns:
+            Same shape as bulk_update(): {'updated': [...], 'failed': [...]}
+        """
+        expires_at = (datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)).isoformat()
+        return self.bulk_update([
+            {'id': task_id, 'lease_expires_at': expires_at} for task_id in task_ids
+        ])
+
 
 class DraftsAPI:
     """Drafts API endpoints"""
@@ -631,6 +931,15 @@ class OctopoidSDK:
 
         # List tasks
         tasks = sdk.tasks.list(queue='incoming')
+
+    Args:
+        server_url: Base URL of the Octopoid server
+        api_key: API key (sent as a Bearer token)
+        timeout: Request timeout in seconds
+        scope: Scope injected into every request
+        cache_ttl: Seconds to serve repeated identical GETs from memory;
+            0 (the default) disables the cache
+        coalesce: Merge concurrent identical GETs into one request
     """
 
     def __init__(
@@ -638,13 +947,17 @@ class OctopoidSDK:
         server_url: str,
         api_key: Optional[str] = None,
         timeout: int = 30,
-        scope: Optional[str] = None
+        scope: Optional[str] = None,
+        cache_ttl: float = 0,
+        coalesce: bool = False
     ):
         self.server_url = server_url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
         self.scope = scope
         self.session = requests.Session()
+        self.cache = ResponseCache(ttl=cache_ttl, coalesce=coalesce)
+        self.metrics = RequestMetrics()
 
         if api_key:
             self.session.headers['Authorization'] = f'Bearer {api_key}'
@@ -665,7 +978,11 @@ class OctopoidSDK:
         params: Optional[Dict] = None,
         json: Optional[Dict] = None
     ) -> Any:
-        """Make HTTP request to API"""
+        """Make HTTP request to API
+
+        When the response cache is enabled, GETs go through it and every
+        other method invalidates the cached responses for its resource.
+        """
         # Auto-inject scope into requests when set
         if self.scope:
             if method == 'GET':
@@ -675,7 +992,27 @@ class OctopoidSDK:
             elif json is not None:
                 json.setdefault('scope', self.scope)
 
+        if not self.cache.enabled:
+            return self._send(method, path, params, json)
+        if method == 'GET':
+            return self.cache.get(path, params, lambda: self._send(method, path, params, json))
+        try:
+            return self._send(method, path, params, json)
+        finally:
+            self.cache.invalidate(path)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict],
+        json: Optional[Dict]
+    ) -> Any:
+        """Send one HTTP request, decode the response and record its metrics"""
         url = f'{self.server_url}{path}'
+        started = time.perf_counter()
+        response = None
+        failed = timed_out = False
 
         try:
             response = self.session.request(
@@ -696,9 +1033,25 @@ class OctopoidSDK:
                 return response.text
 
         except requests.Timeout:
+            failed = timed_out = True
             raise TimeoutError(f'Request to {url} timed out after {self.timeout}s')
+        except Exception:
+            failed = True
+            raise
+        finally:
+            try:
+                size = len(response.content) if response is not None else 0
+            except (TypeError, AttributeError):
+                size = 0
+            self.metrics.record(
+                method, path,
+                (time.perf_counter() - started) * 1000,
+                response_bytes=size,
+                error=failed,
+                timeout=timed_out,
+            )
 
-    def poll(self, orchestrator_id: str) -> Dict[str, Any]:
+    def poll(self, orchestrator_id: str, since: Optional[str] = None) -> Dict[str, Any]:
         """Get all scheduler state in a single call.
 
         Returns queue counts, provisional tasks, and orchestrator registration status.
@@ -706,18 +1059,58 @@ class OctopoidSDK:
 
         Args:
             orchestrator_id: Orchestrator identifier (passed as ?orchestrator_id=<id>)
+            since: Change cursor from a previous poll's 'cursor', or '0' to
+                request every task. When given, servers that support delta
+                sync also return the tasks changed after that cursor.
 
         Returns:
             Dict with keys:
               - queue_counts: {incoming: int, claimed: int, provisional: int}
               - provisional_tasks: list of task dicts with id, hooks, pr_number
               - orchestrator_registered: bool
+            With `since`, on servers that support it, also:
+              - cursor: cursor to pass as `since` next time
+              - full_sync: True if changed_tasks holds every task (the
+                cursor was '0' or too old) rather than a delta
+              - changed_tasks: full task dicts created or updated since the cursor
+              - deleted_task_ids: IDs of tasks deleted since the cursor
         """
-        return self._request(
-            'GET',
-            '/api/v1/scheduler/poll',
-            params={'orchestrator_id': orchestrator_id},
-        )
+        params = {'orchestrator_id': orchestrator_id}
+        if since is not None:
+            params['since'] = since
+        return self._request('GET', '/api/v1/scheduler/poll', params=params)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return response cache counters
+
+        Returns:
+            Dict with keys:
+              - hits: GETs answered from the cache
+              - misses: GETs sent to the server
+              - coalesced: GETs that waited on an identical in-flight request
+              - invalidations: mutations that dropped cached responses
+              - entries: responses currently cached
+              - hit_rate: (hits + coalesced) / all cached lookups
+        """
+        return self.cache.stats()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-endpoint request metrics for this client
+
+        Endpoints are labelled by method and path template, e.g.
+        'PATCH /api/v1/tasks/{id}'. Only requests sent to the server are
+        counted; responses served from the cache are not.
+
+        Returns:
+            Dict of endpoint -> {calls, errors, timeouts, total_ms, avg_ms,
+            max_ms, p50_ms, p95_ms, bytes, buckets}. The percentiles are
+            upper bounds of metrics.LATENCY_BUCKETS_MS buckets.
+        """
+        return self.metrics.snapshot()
+
+    def clear_cache(self) -> None:
+        """Drop every cached response"""
+        self.cache.invalidate()
 
     def close(self):
         """Close the session"""
@@ -0,0 +1,150 @@
+"""
+Per-endpoint request metrics for OctopoidSDK
+Call counts, latency histograms, response sizes and error counts
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Second path segments that are fixed endpoint names rather than IDs
+_STATIC_SEGMENTS = frozenset({'claim', 'poll', 'register'})
+
+
+def endpoint_of(method: str, path: str) -> str:
+    """Return the endpoint label for a request, with IDs replaced by {id}
+
+    'PATCH', '/api/v1/tasks/abc123/submit' -> 'PATCH /api/v1/tasks/{id}/submit'
+    'POST', '/api/v1/tasks/claim' -> 'POST /api/v1/tasks/claim'
+    """
+    parts = path.split('?', 1)[0].strip('/').split('/')
+    start = 3 if parts[:2] == ['api', 'v1'] else 2
+    if len(parts) > start and parts[start] not in _STATIC_SEGMENTS:
+        parts[start] = '{id}'
+    return f"{method.upper()} /{'/'.join(parts)}"
+
+
+def _percentile(buckets: List[int], count: int, fraction: float) -> Optional[float]:
+    """Estimate a percentile as the upper bound of the bucket it falls in"""
+    if not count:
+        return None
+    rank = fraction * count
+    seen = 0
+    for bound, n in zip(LATENCY_BUCKETS_MS, buckets):
+        seen += n
+        if seen >= rank:
+            return float(bound)
+    return float('inf')
+
+
+class _EndpointStats:
+    __slots__ = ('calls', 'errors', 'timeouts', 'total_ms', 'max_ms', 'bytes', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bytes = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+class RequestMetrics:
+    """Thread-safe per-endpoint counters fed by OctopoidSDK._request"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+
+    def record(
+        self,
+        method: str,
+        path: str,
+        elapsed_ms: float,
+        response_bytes: int = 0,
+        error: bool = False,
+        timeout: bool = False,
+    ) -> None:
+        """Record one completed (or failed) request"""
+        endpoint = endpoint_of(method, path)
+        index = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = _EndpointStats()
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.timeouts += int(timeout)
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.bytes += response_bytes
+            stats.buckets[index] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-endpoint metrics, keyed by endpoint label
+
+        Each value has calls, errors, timeouts, total_ms, avg_ms, max_ms,
+        p50_ms, p95_ms (bucket upper bounds), bytes and buckets (counts per
+        LATENCY_BUCKETS_MS bound, plus one overflow bucket).
+        """
+        with self._lock:
+            items = [(name, s, list(s.buckets)) for name, s in self._endpoints.items()]
+            result = {}
+            for name, s, buckets in items:
+                result[name] = {
+                    'calls': s.calls,
+                    'errors': s.errors,
+                    'timeouts': s.timeouts,
+                    'total_ms': round(s.total_ms, 2),
+                    'avg_ms': round(s.total_ms / s.calls, 2) if s.calls else 0.0,
+                    'max_ms': round(s.max_ms, 2),
+                    'p50_ms': _percentile(buckets, s.calls, 0.5),
+                    'p95_ms': _percentile(buckets, s.calls, 0.95),
+                    'bytes': s.bytes,
+                    'buckets': buckets,
+                }
+            return result
+
+    def reset(self) -> None:
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def diff_stats(
+    before: Dict[str, Dict[str, Any]],
+    after: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Return the metrics recorded between two snapshot() results
+
+    Only endpoints with new calls are included. max_ms is not recoverable
+    from two cumulative snapshots and is left out.
+    """
+    delta = {}
+    for endpoint, now in after.items():
+        prev = before.get(endpoint, {})
+        calls = now['calls'] - prev.get('calls', 0)
+        if calls <= 0:
+            continue
+        total_ms = now['total_ms'] - prev.get('total_ms', 0.0)
+        prev_buckets = prev.get('buckets') or [0] * len(now['buckets'])
+        buckets = [a - b for a, b in zip(now['buckets'], prev_buckets)]
+        delta[endpoint] = {
+            'calls': calls,
+            'errors': now['errors'] - prev.get('errors', 0),
+            'timeouts': now['timeouts'] - prev.get('timeouts', 0),
+            'total_ms': round(total_ms, 2),
+            'avg_ms': round(total_ms / calls, 2),
+            'p50_ms': _percentile(buckets, calls, 0.5),
+            'p95_ms': _percentile(buckets, calls, 0.95),
+            'bytes': now['bytes'] - prev.get('bytes', 0),
+            'buckets': buckets,
+        }
+    return delta
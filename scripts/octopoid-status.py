@@ -19,6 +19,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from octopoid.api_metrics import format_endpoint, top_endpoints
 from octopoid.config import (
     get_agents,
     get_agents_runtime_dir,
@@ -28,8 +29,11 @@ from octopoid.config import (
     get_tasks_dir,
     is_system_paused,
 )
+from octopoid.git_batch import current_branch
+from octopoid.git_utils import get_commit_count, get_head_ref
+from octopoid.outcome_classifier import format_hit_rates, read_stats
 from octopoid.queue_utils import get_sdk
-from octopoid.backpressure import count_queue
+from octopoid.status_api import try_query
 from octopoid.task_logger import get_task_logger
 
 VERBOSE = "--verbose" in sys.argv or "-v" in sys.argv
@@ -139,6 +143,24 @@ def print_scheduler_health() -> None:
     else:
         print("  launchd:        NOT LOADED")
 
+    daemon = try_query("status")
+    if daemon:
+        mirror = daemon.get("mirror") or {}
+        print(
+            f"  daemon:         running (pid {daemon.get('pid')}, {daemon.get('ticks')} ticks, "
+            f"last tick {ago(daemon.get('last_tick'))}, mirror {'synced' if mirror.get('synced') else 'not synced'})"
+        )
+
+    print(f"  outcome tiers:  {format_hit_rates(read_stats())}")
+
+    endpoints = top_endpoints()
+    if endpoints:
+        print("  api endpoints:  slowest over recent ticks")
+        for entry in endpoints:
+            print(f"    {format_endpoint(entry)}")
+    else:
+        print("  api endpoints:  no calls recorded yet")
+
     if is_system_paused():
         print("  system pause:   PAUSED (all agents stopped)")
     else:
@@ -171,12 +193,15 @@ def print_queue_status() -> None:
     sdk = get_sdk()
     limits = get_queue_limits()
 
-    # Fetch all tasks in one call (no queue filter)
-    try:
-        all_tasks = sdk.tasks.list()
-    except Exception as e:
-        print(f"  API error: {e}")
-        return
+    # Fetch all tasks in one call (no queue filter), from the scheduler
+    # daemon's task mirror when it is running
+    all_tasks = try_query("tasks")
+    if all_tasks is None:
+        try:
+            all_tasks = sdk.tasks.list()
+        except Exception as e:
+            print(f"  API error: {e}")
+            return
 
     # Group by queue
     by_queue: dict[str, list] = {}
@@ -201,7 +226,7 @@ def print_queue_status() -> None:
 
     print(f"  {' | '.join(parts) if parts else 'all queues empty'}")
 
-    provisional = count_queue("provisional")
+    provisional = len(by_queue.get("provisional", []))
     print(f"  provisional: {provisional} (limit: {limits.get('max_provisional', '?')})")
     print(f"  max claimed: {limits.get('max_claimed', '?')}")
 
@@ -393,25 +418,24 @@ def print_worktree_status() -> None:
             name = agent_dir.name
             wt = str(worktree)
 
-            branch = run(["git", "branch", "--show-current"], cwd=wt) or run(
-                ["git", "rev-parse", "--short", "HEAD"], cwd=wt
-            )
-            commits_ahead = run(
-                ["git", "rev-list", "--count", "main..HEAD"], cwd=wt
-            )
+            # Branch, HEAD and ahead count come from the long-lived git
+            # helper (git_batch) rather than a fork per query
+            branch = current_branch(worktree)
+            if branch is None:
+                branch = run(["git", "branch", "--show-current"], cwd=wt)
+            if not branch or branch == "HEAD":
+                branch = get_head_ref(worktree)[:7]
+            commits_ahead = get_commit_count(worktree, since_ref="main")
             diff_shortstat = run(["git", "diff", "--shortstat"], cwd=wt)
 
             subheader(f"{name} [{agent_roles.get(name, '?')}]")
             print(f"    branch:   {branch}")
-            print(f"    ahead:    {commits_ahead or '0'} commit(s)")
+            print(f"    ahead:    {commits_ahead} commit(s)")
             if diff_shortstat:
                 print(f"    unstaged: {diff_shortstat}")
 
             if VERBOSE:
-                try:
-                    n = min(int(commits_ahead or "0"), 5)
-                except ValueError:
-                    n = 0
+                n = min(commits_ahead, 5)
                 if n > 0:
                     log = run(["git", "log", "--oneline", f"-{n}"], cwd=wt)
                     if log:
@@ -430,9 +454,11 @@ def print_worktree_status() -> None:
             subheader(f"task worktrees ({len(task_wts)})")
             for d in task_wts:
                 wt = str(d / "worktree")
-                branch = run(
-                    ["git", "branch", "--show-current"], cwd=wt
-                ) or "detached"
+                branch = current_branch(d / "worktree")
+                if branch is None:
+                    branch = run(["git", "branch", "--show-current"], cwd=wt)
+                if not branch or branch == "HEAD":
+                    branch = "detached"
                 print(f"    {d.name}  ({branch})")
 
     if not found and not (tasks_dir.exists() and any(tasks_dir.iterdir())):
@@ -535,7 +561,7 @@ def print_task_detail(task_id: str) -> None:
     header(f"TASK: {task_id}")
 
     sdk = get_sdk()
-    task = sdk.tasks.get(task_id)
+    task = try_query("task", id=task_id) or sdk.tasks.get(task_id)
     if not task:
         print(f"  Task {task_id} not found")
         return
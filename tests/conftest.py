@@ -173,3 +173,18 @@ def mock_sdk_for_unit_tests(request):
 
     # Reset the SDK cache after the test as well
     octopoid.sdk._sdk = None
+
+
+@pytest.fixture(autouse=True)
+def isolate_task_mirror():
+    """Give each test an empty in-memory task mirror.
+
+    Without this, the first poll in a test would create (and later tests
+    would read) .octopoid/runtime/task_mirror.sqlite in the working tree.
+    """
+    import octopoid.task_mirror
+    from octopoid.task_mirror import TaskMirror
+
+    octopoid.task_mirror._mirror = TaskMirror()
+    yield
+    octopoid.task_mirror._mirror = None
@@ -17,10 +17,38 @@ def _git(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     )
 
 
+def git(args: list[str], cwd: Path) -> str:
+    """Run a git command in a directory and return its stripped stdout."""
+    return _git(args, cwd).stdout.strip()
+
+
+def advance_origin(work: Path, files: dict[str, str]) -> str:
+    """Commit files in a test_repo clone, push them to main and fetch.
+
+    Args:
+        work: The working clone (test_repo["work"]).
+        files: Relative path -> new content.
+
+    Returns:
+        The new origin/main SHA.
+    """
+    for name, content in files.items():
+        path = work / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(["add", "."], work)
+    _git(["commit", "-m", "advance"], work)
+    _git(["push", "origin", "main"], work)
+    _git(["fetch", "origin"], work)
+    return git(["rev-parse", "origin/main"], work)
+
+
 @pytest.fixture
 def test_repo(tmp_path: Path) -> dict:
     """Create a local git repo with a bare remote (no GitHub needed).
 
+    The base branch is main, whatever the local init.defaultBranch.
+
     Returns:
         dict with keys:
             "bare": Path to the bare remote repo
@@ -31,7 +59,7 @@ def test_repo(tmp_path: Path) -> dict:
 
     # Init bare repo
     subprocess.run(
-        ["git", "init", "--bare", str(bare)],
+        ["git", "init", "--bare", "--initial-branch=main", str(bare)],
         check=True,
         capture_output=True,
     )
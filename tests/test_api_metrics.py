@@ -0,0 +1,181 @@
+"""Tests for per-endpoint SDK request metrics and the scheduler's API metrics file."""
+
+import json
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from octopoid_sdk import OctopoidSDK
+from octopoid_sdk.metrics import RequestMetrics, diff_stats, endpoint_of
+
+from octopoid import api_metrics
+
+
+def _response(status=200, body=b'{"ok": true}'):
+    response = MagicMock()
+    response.status_code = status
+    response.content = body
+    response.json.return_value = json.loads(body) if body else None
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+class TestEndpointOf:
+    @pytest.mark.parametrize("method,path,expected", [
+        ("get", "/api/v1/tasks", "GET /api/v1/tasks"),
+        ("PATCH", "/api/v1/tasks/abc123", "PATCH /api/v1/tasks/{id}"),
+        ("POST", "/api/v1/tasks/abc123/submit", "POST /api/v1/tasks/{id}/submit"),
+        ("POST", "/api/v1/tasks/claim", "POST /api/v1/tasks/claim"),
+        ("GET", "/api/v1/scheduler/poll", "GET /api/v1/scheduler/poll"),
+        ("POST", "/api/v1/orchestrators/o-1/heartbeat", "POST /api/v1/orchestrators/{id}/heartbeat"),
+        ("GET", "/api/health", "GET /api/health"),
+    ])
+    def test_templates(self, method, path, expected):
+        assert endpoint_of(method, path) == expected
+
+
+class TestRequestMetrics:
+    def test_counts_latency_bytes_and_errors(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "/api/v1/tasks/a", 3.0, response_bytes=100)
+        metrics.record("GET", "/api/v1/tasks/b", 40.0, response_bytes=50)
+        metrics.record("GET", "/api/v1/tasks/c", 20000.0, error=True, timeout=True)
+
+        stats = metrics.snapshot()["GET /api/v1/tasks/{id}"]
+        assert stats["calls"] == 3
+        assert stats["errors"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["bytes"] == 150
+        assert stats["max_ms"] == 20000.0
+        assert stats["buckets"][0] == 1 and stats["buckets"][3] == 1 and stats["buckets"][-1] == 1
+        assert stats["p50_ms"] == 50.0
+
+    def test_diff_stats_only_includes_new_calls(self):
+        metrics = RequestMetrics()
+        metrics.record("GET", "/api/v1/flows", 10.0)
+        before = metrics.snapshot()
+        metrics.record("GET", "/api/v1/tasks", 30.0, response_bytes=10)
+        metrics.record("GET", "/api/v1/tasks", 50.0, response_bytes=10)
+
+        delta = diff_stats(before, metrics.snapshot())
+        assert list(delta) == ["GET /api/v1/tasks"]
+        assert delta["GET /api/v1/tasks"]["calls"] == 2
+        assert delta["GET /api/v1/tasks"]["avg_ms"] == 40.0
+        assert delta["GET /api/v1/tasks"]["bytes"] == 20
+
+
+class TestSdkStats:
+    def test_requests_are_recorded_per_endpoint(self):
+        sdk = OctopoidSDK(server_url="http://example.com")
+        sdk.session.request = MagicMock(return_value=_response())
+
+        sdk.tasks.update("abc", priority="P0")
+        sdk.tasks.update("def", priority="P1")
+
+        stats = sdk.stats()
+        assert stats["PATCH /api/v1/tasks/{id}"]["calls"] == 2
+        assert stats["PATCH /api/v1/tasks/{id}"]["bytes"] == 2 * len(b'{"ok": true}')
+
+    def test_http_errors_and_timeouts_are_counted(self):
+        sdk = OctopoidSDK(server_url="http://example.com")
+        sdk.session.request = MagicMock(return_value=_response(status=404, body=b""))
+        assert sdk.tasks.get("missing") is None
+
+        sdk.session.request = MagicMock(side_effect=requests.Timeout())
+        with pytest.raises(TimeoutError):
+            sdk.tasks.get("slow")
+
+        stats = sdk.stats()["GET /api/v1/tasks/{id}"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 2
+        assert stats["timeouts"] == 1
+
+    def test_cache_hits_are_not_counted(self):
+        sdk = OctopoidSDK(server_url="http://example.com", cache_ttl=60)
+        sdk.session.request = MagicMock(return_value=_response(body=b'{"tasks": []}'))
+
+        sdk.tasks.list(queue="done")
+        sdk.tasks.list(queue="done")
+
+        assert sdk.stats()["GET /api/v1/tasks"]["calls"] == 1
+
+
+class TestRecordTick:
+    def _sdk(self):
+        sdk = MagicMock()
+        sdk.metrics = RequestMetrics()
+        sdk.stats.side_effect = sdk.metrics.snapshot
+        return sdk
+
+    def test_logs_summary_and_appends_to_file(self, tmp_path, caplog):
+        sdk = self._sdk()
+        path = tmp_path / "api_metrics.jsonl"
+        with patch("octopoid.sdk.get_sdk", return_value=sdk):
+            before = api_metrics.capture()
+            sdk.metrics.record("GET", "/api/v1/tasks", 120.0)
+            sdk.metrics.record("PATCH", "/api/v1/tasks/abc", 30.0)
+            with caplog.at_level(logging.INFO, logger="octopoid.scheduler"):
+                delta = api_metrics.record_tick(before, path=path)
+
+        assert set(delta) == {"GET /api/v1/tasks", "PATCH /api/v1/tasks/{id}"}
+        assert "API: 2 calls, 150ms; slowest: GET /api/v1/tasks 1x 120ms" in caplog.text
+        record = json.loads(path.read_text())
+        assert record["endpoints"]["GET /api/v1/tasks"]["calls"] == 1
+
+    def test_idle_tick_writes_nothing(self, tmp_path):
+        sdk = self._sdk()
+        path = tmp_path / "api_metrics.jsonl"
+        with patch("octopoid.sdk.get_sdk", return_value=sdk):
+            assert api_metrics.record_tick(api_metrics.capture(), path=path) == {}
+        assert not path.exists()
+
+    def test_file_rotates_past_max_size(self, tmp_path):
+        path = tmp_path / "api_metrics.jsonl"
+        path.write_text("x" * 100)
+        with patch.object(api_metrics, "MAX_METRICS_BYTES", 50):
+            api_metrics._append(path, {"endpoints": {}})
+
+        assert (tmp_path / "api_metrics.jsonl.1").read_text() == "x" * 100
+        assert json.loads(path.read_text()) == {"endpoints": {}}
+
+
+class TestTopEndpoints:
+    def test_aggregates_recent_ticks_by_total_time(self, tmp_path):
+        path = tmp_path / "api_metrics.jsonl"
+        ticks = [
+            {"GET /api/v1/tasks": {"calls": 4, "errors": 0, "total_ms": 200.0},
+             "GET /api/v1/flows": {"calls": 1, "errors": 0, "total_ms": 10.0}},
+            {"GET /api/v1/tasks": {"calls": 2, "errors": 1, "total_ms": 100.0},
+             "POST /api/v1/tasks/claim": {"calls": 1, "errors": 0, "total_ms": 250.0}},
+        ]
+        path.write_text("".join(json.dumps({"endpoints": t}) + "\n" for t in ticks))
+
+        top = api_metrics.top_endpoints(limit=2, path=path)
+
+        assert top == [
+            {"endpoint": "GET /api/v1/tasks", "calls": 6, "errors": 1, "total_ms": 300.0, "avg_ms": 50.0},
+            {"endpoint": "POST /api/v1/tasks/claim", "calls": 1, "errors": 0, "total_ms": 250.0, "avg_ms": 250.0},
+        ]
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert api_metrics.top_endpoints(path=tmp_path / "nope.jsonl") == []
+
+    def test_format_endpoint_shows_volume_and_latency(self):
+        entry = {"endpoint": "GET /api/v1/tasks", "calls": 6, "errors": 1, "total_ms": 300.0, "avg_ms": 50.0}
+        assert api_metrics.format_endpoint(entry) == "GET /api/v1/tasks  6 calls, avg 50ms, total 300ms, 1 error"
+        assert api_metrics.format_endpoint({**entry, "errors": 0}) == "GET /api/v1/tasks  6 calls, avg 50ms, total 300ms"
+
+    def test_health_report_falls_back_to_sdk_stats(self):
+        from octopoid.reports import _top_api_endpoints
+
+        sdk = MagicMock()
+        sdk.stats.return_value = {
+            "GET /api/v1/tasks": {"calls": 3, "errors": 0, "total_ms": 90.0, "avg_ms": 30.0},
+            "GET /api/v1/flows": {"calls": 1, "errors": 0, "total_ms": 5.0, "avg_ms": 5.0},
+        }
+        with patch("octopoid.api_metrics.top_endpoints", return_value=[]):
+            top = _top_api_endpoints(sdk, limit=1)
+
+        assert top == [{"endpoint": "GET /api/v1/tasks", "calls": 3, "errors": 0, "total_ms": 90.0, "avg_ms": 30.0}]
@@ -0,0 +1,121 @@
+"""Tests for AsyncOctopoidSDK and octopoid.sdk.fan_out."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from octopoid_sdk import AsyncOctopoidSDK, OctopoidSDK
+from octopoid.sdk import fan_out
+
+
+class _SlowTasks:
+    """Sync TasksAPI stand-in whose update takes `delay` seconds."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.updated: list[str] = []
+        self._lock = threading.Lock()
+
+    def update(self, task_id, **updates):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            self.updated.append(task_id)
+        if task_id == "boom":
+            raise RuntimeError("server error")
+        return {"id": task_id, **updates}
+
+
+def _sync_sdk(tasks=None) -> MagicMock:
+    sdk = MagicMock()
+    sdk.tasks = tasks or _SlowTasks()
+    return sdk
+
+
+class TestAsyncOctopoidSDK:
+    def test_mirrors_sync_api_groups(self):
+        sync = OctopoidSDK(server_url="http://example.com", scope="s1")
+        sdk = AsyncOctopoidSDK.from_sdk(sync)
+
+        for name in ("tasks", "drafts", "projects", "flows", "messages", "actions", "status"):
+            assert hasattr(sdk, name)
+        assert asyncio.iscoroutinefunction(sdk.tasks.update)
+        assert sdk.scope == "s1"
+        assert sdk.timeout == sync.timeout
+
+    def test_calls_go_through_sync_request_with_scope(self):
+        sync = OctopoidSDK(server_url="http://example.com", scope="s1")
+        sync.session.request = MagicMock()
+        sync.session.request.return_value.status_code = 200
+        sync.session.request.return_value.json.return_value = {"id": "T1"}
+
+        async def run():
+            async with AsyncOctopoidSDK.from_sdk(sync) as sdk:
+                return await sdk.tasks.update("T1", priority="P1")
+
+        assert asyncio.run(run()) == {"id": "T1"}
+        call = sync.session.request.call_args
+        assert call.args == ("PATCH", "http://example.com/api/v1/tasks/T1")
+        assert call.kwargs["json"] == {"priority": "P1", "scope": "s1"}
+        assert call.kwargs["timeout"] == sync.timeout
+
+    def test_concurrency_is_bounded(self):
+        tasks = _SlowTasks(delay=0.02)
+
+        async def run():
+            async with AsyncOctopoidSDK.from_sdk(_sync_sdk(tasks), max_connections=3) as sdk:
+                await sdk.gather(*(sdk.tasks.update(f"T{i}") for i in range(12)))
+
+        asyncio.run(run())
+        assert len(tasks.updated) == 12
+        assert 1 < tasks.max_in_flight <= 3
+
+    def test_gather_returns_exceptions_in_place(self):
+        async def run():
+            async with AsyncOctopoidSDK.from_sdk(_sync_sdk(_SlowTasks(0))) as sdk:
+                return await sdk.gather(sdk.tasks.update("ok"), sdk.tasks.update("boom"))
+
+        ok, failed = asyncio.run(run())
+        assert ok == {"id": "ok"}
+        assert isinstance(failed, RuntimeError)
+
+    def test_wrapped_client_is_not_closed(self):
+        sync = MagicMock()
+
+        async def run():
+            async with AsyncOctopoidSDK.from_sdk(sync):
+                pass
+
+        asyncio.run(run())
+        sync.close.assert_not_called()
+
+    def test_rejects_zero_connections(self):
+        with pytest.raises(ValueError):
+            AsyncOctopoidSDK.from_sdk(MagicMock(), max_connections=0)
+
+
+class TestFanOut:
+    def test_overlaps_calls(self):
+        tasks = _SlowTasks(delay=0.05)
+        ids = [f"T{i}" for i in range(50)]
+
+        start = time.monotonic()
+        results = fan_out(lambda s, tid: s.tasks.update(tid), ids, sdk=_sync_sdk(tasks), max_connections=50)
+        elapsed = time.monotonic() - start
+
+        assert [r["id"] for r in results] == ids
+        assert elapsed < 50 * 0.05 / 4
+
+    def test_empty_items_makes_no_calls(self):
+        sdk = MagicMock()
+        assert fan_out(lambda s, tid: s.tasks.update(tid), [], sdk=sdk) == []
+        sdk.tasks.update.assert_not_called()
+
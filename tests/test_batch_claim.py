@@ -0,0 +1,149 @@
+"""Tests for batch claiming: one claim request fills several idle pool slots."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from octopoid.scheduler import AgentContext, _evaluate_and_spawn, guard_claim_task
+from octopoid.state_utils import AgentState
+
+
+def _sdk_with_responses(*responses):
+    from octopoid_sdk import OctopoidSDK
+
+    sdk = OctopoidSDK(server_url="http://example.com")
+    sdk._request = MagicMock(side_effect=list(responses))  # type: ignore[method-assign]
+    return sdk
+
+
+class TestSdkClaimBatch:
+    def test_claim_returns_single_task(self):
+        sdk = _sdk_with_responses({"id": "a"})
+        assert sdk.tasks.claim(orchestrator_id="o", agent_name="x") == {"id": "a"}
+        assert "limit" not in sdk._request.call_args.kwargs["json"]
+
+    def test_batch_response_is_returned_as_list(self):
+        sdk = _sdk_with_responses({"tasks": [{"id": "a"}, {"id": "b"}]})
+        tasks = sdk.tasks.claim_batch(orchestrator_id="o", agent_name="x", limit=3)
+
+        assert [t["id"] for t in tasks] == ["a", "b"]
+        sdk._request.assert_called_once()
+        assert sdk._request.call_args.kwargs["json"]["limit"] == 3
+
+    def test_falls_back_to_single_claims_when_limit_ignored(self):
+        sdk = _sdk_with_responses({"id": "a"}, {"id": "b"}, None)
+        tasks = sdk.tasks.claim_batch(orchestrator_id="o", agent_name="x", limit=4)
+
+        assert [t["id"] for t in tasks] == ["a", "b"]
+        assert sdk._request.call_count == 3
+        assert "limit" not in sdk._request.call_args.kwargs["json"]
+
+    def test_fallback_keeps_claimed_tasks_when_later_claim_fails(self):
+        sdk = _sdk_with_responses({"id": "a"}, RuntimeError("server down"))
+        tasks = sdk.tasks.claim_batch(orchestrator_id="o", agent_name="x", limit=3)
+        assert [t["id"] for t in tasks] == ["a"]
+
+    def test_empty_queue_returns_empty_list(self):
+        sdk = _sdk_with_responses(None)
+        assert sdk.tasks.claim_batch(orchestrator_id="o", agent_name="x", limit=2) == []
+
+
+def _ctx(max_instances: int = 3) -> AgentContext:
+    return AgentContext(
+        agent_config={
+            "name": "implementer",
+            "spawn_mode": "scripts",
+            "claim_from": "incoming",
+            "blueprint_name": "implementer",
+            "max_instances": max_instances,
+        },
+        agent_name="implementer",
+        role="implement",
+        interval=60,
+        state=AgentState(),
+        state_path=Path("/tmp/fake_state.json"),
+    )
+
+
+class TestGuardClaimTaskBatch:
+    def test_claims_one_task_per_idle_slot(self):
+        ctx = _ctx(max_instances=3)
+        tasks = [{"id": "a"}, {"id": "b"}]
+
+        with (
+            patch("octopoid.scheduler.count_running_instances", return_value=1),
+            patch("octopoid.scheduler.claim_and_prepare_tasks", return_value=tasks) as mock_claim,
+            patch("octopoid.scheduler.get_active_task_ids", return_value=set()),
+        ):
+            proceed, _ = guard_claim_task(ctx)
+
+        assert proceed is True
+        assert mock_claim.call_args.kwargs["limit"] == 2
+        assert ctx.claimed_task == {"id": "a"}
+        assert ctx.extra_claimed_tasks == [{"id": "b"}]
+
+    def test_single_idle_slot_uses_single_claim(self):
+        ctx = _ctx(max_instances=1)
+
+        with (
+            patch("octopoid.scheduler.count_running_instances", return_value=0),
+            patch("octopoid.scheduler.claim_and_prepare_tasks") as mock_batch,
+            patch("octopoid.scheduler.claim_and_prepare_task", return_value={"id": "a"}),
+            patch("octopoid.scheduler.get_active_task_ids", return_value=set()),
+        ):
+            proceed, _ = guard_claim_task(ctx)
+
+        assert proceed is True
+        mock_batch.assert_not_called()
+        assert ctx.extra_claimed_tasks == []
+
+    def test_duplicates_are_dropped_from_batch(self):
+        ctx = _ctx()
+
+        with (
+            patch("octopoid.scheduler.count_running_instances", return_value=0),
+            patch("octopoid.scheduler.claim_and_prepare_tasks", return_value=[{"id": "a"}, {"id": "b"}]),
+            patch("octopoid.scheduler.get_active_task_ids", return_value={"a"}),
+        ):
+            proceed, _ = guard_claim_task(ctx)
+
+        assert proceed is True
+        assert ctx.claimed_task == {"id": "b"}
+        assert ctx.extra_claimed_tasks == []
+
+
+class TestBatchSpawn:
+    def _run(self, strategy):
+        config = _ctx().agent_config
+
+        def fake_evaluate(ctx):
+            ctx.claimed_task = {"id": "a", "content": "x"}
+            ctx.extra_claimed_tasks = [{"id": "b", "content": "x"}, {"id": "c", "content": "x"}]
+            return True
+
+        with (
+            patch("octopoid.scheduler.locked_or_skip") as mock_lock,
+            patch("octopoid.scheduler.load_state", return_value=AgentState()),
+            patch("octopoid.scheduler.evaluate_agent", side_effect=fake_evaluate),
+            patch("octopoid.scheduler.get_spawn_strategy", return_value=strategy),
+            patch("octopoid.scheduler._reset_systemic_failure_counter"),
+            patch("octopoid.scheduler._handle_systemic_failure"),
+            patch("octopoid.scheduler._requeue_task_blameless") as mock_requeue,
+        ):
+            mock_lock.return_value.__enter__.return_value = True
+            _evaluate_and_spawn(config, None, None)
+        return mock_requeue
+
+    def test_spawns_every_claimed_task(self):
+        spawned = []
+        self._run(lambda ctx: spawned.append(ctx.claimed_task["id"]) or 100)
+        assert spawned == ["a", "b", "c"]
+
+    def test_failure_requeues_failed_and_remaining_tasks(self):
+        def strategy(ctx):
+            if ctx.claimed_task["id"] == "b":
+                raise RuntimeError("worktree add failed")
+            return 100
+
+        mock_requeue = self._run(strategy)
+        requeued = [c.args[0] for c in mock_requeue.call_args_list]
+        assert requeued == ["b", "c"]
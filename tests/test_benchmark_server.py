@@ -0,0 +1,95 @@
+"""Tests for the benchmark suite's fake server and regression check."""
+
+import pytest
+from octopoid_sdk import OctopoidSDK
+
+from benchmarks.fake_server import FakeServer
+from benchmarks.harness import ScenarioResult
+from benchmarks.run import compare_to_baseline
+
+
+@pytest.fixture
+def server():
+    with FakeServer(scope="bench") as srv:
+        srv.state.seed(tasks=20, projects=2, roles=["implement"])
+        yield srv
+
+
+@pytest.fixture
+def sdk(server):
+    client = OctopoidSDK(server_url=server.url, scope="bench")
+    yield client
+    client.close()
+
+
+class TestFakeServer:
+    def test_seed_spreads_tasks_across_queues_and_projects(self, server):
+        tasks = server.state.tasks.values()
+        assert len(tasks) == 20
+        assert {t["queue"] for t in tasks} >= {"incoming", "claimed", "done"}
+        assert {t["project_id"] for t in tasks} == {"PROJ-bench0000", "PROJ-bench0001"}
+        assert {"default", "project"} <= set(server.state.flows)
+
+    def test_list_filters_by_queue_and_scope(self, server, sdk):
+        incoming = sdk.tasks.list(queue="incoming")
+        assert incoming and all(t["queue"] == "incoming" for t in incoming)
+
+        other_scope = OctopoidSDK(server_url=server.url, scope="elsewhere")
+        assert other_scope.tasks.list(queue="incoming") == []
+
+    def test_batch_claim_returns_task_list(self, sdk):
+        claimed = sdk.tasks.claim_batch("orch", "agent", 3, role_filter="implement")
+        assert len(claimed) == 3
+        assert all(t["queue"] == "claimed" and t["claimed_by"] == "agent" for t in claimed)
+
+    def test_claim_on_empty_queue_returns_none(self, sdk):
+        assert sdk.tasks.claim("orch", "agent", role_filter="no-such-role") is None
+
+    def test_poll_counts_queues(self, server, sdk):
+        poll = sdk.poll("bench-local")
+        incoming = sum(1 for t in server.state.tasks.values() if t["queue"] == "incoming")
+        assert poll["queue_counts"]["incoming"] == incoming
+        assert poll["orchestrator_registered"] is False
+
+    def test_counts_calls_per_endpoint(self, server, sdk):
+        server.state.reset_calls()
+        sdk.tasks.list(queue="done")
+        sdk.tasks.get("bench000000")
+        sdk.tasks.update("bench000000", priority="P0")
+
+        assert server.state.call_counts() == {
+            "GET /api/v1/tasks": 1,
+            "GET /api/v1/tasks/{id}": 1,
+            "PATCH /api/v1/tasks/{id}": 1,
+        }
+        assert server.state.tasks["bench000000"]["priority"] == "P0"
+
+
+class TestCompareToBaseline:
+    def _summary(self, calls=10.0, latency=100.0, memory=500.0):
+        return {"name": "run_due_jobs", "api_calls_mean": calls,
+                "latency_ms_p50": latency, "peak_memory_kib": memory}
+
+    def test_any_extra_api_call_is_a_regression(self):
+        regressions = compare_to_baseline([self._summary(calls=11)], [self._summary()], tolerance=0.5)
+        assert regressions == ["run_due_jobs: API calls 10.0 -> 11"]
+
+    def test_latency_within_tolerance_passes(self):
+        assert compare_to_baseline([self._summary(latency=140)], [self._summary()], tolerance=0.5) == []
+
+    def test_latency_beyond_tolerance_fails(self):
+        regressions = compare_to_baseline([self._summary(latency=160)], [self._summary()], tolerance=0.5)
+        assert len(regressions) == 1 and "latency_ms_p50" in regressions[0]
+
+
+class TestScenarioSummary:
+    @pytest.mark.parametrize("latencies, p95", [
+        ([2232.0, 1557.5], 2232.0),
+        ([5.0], 5.0),
+        ([float(n) for n in range(1, 21)], 19.0),
+        ([float(n) for n in range(1, 101)], 95.0),
+    ])
+    def test_p95_is_nearest_rank(self, latencies, p95):
+        summary = ScenarioResult(name="s", latencies_ms=latencies).summary()
+        assert summary["latency_ms_p95"] == p95
+        assert summary["latency_ms_p95"] >= summary["latency_ms_p50"]
@@ -0,0 +1,178 @@
+"""Tests for TasksAPI.bulk_update / bulk_renew_leases and the lease jobs using them."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from octopoid_sdk import OctopoidSDK
+
+from octopoid.housekeeping import check_and_requeue_expired_leases, renew_active_leases
+
+
+def _response(status: int, body=None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status
+    response.json.return_value = body
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+def _sdk(*responses) -> OctopoidSDK:
+    sdk = OctopoidSDK(server_url="http://example.com", scope="s1")
+    sdk.session.request = MagicMock(side_effect=list(responses))
+    return sdk
+
+
+def _iso(delta: timedelta) -> str:
+    return (datetime.now(timezone.utc) + delta).isoformat()
+
+
+class TestBulkUpdate:
+    def test_sends_one_request(self):
+        sdk = _sdk(_response(200, {"updated": [{"id": "a"}, {"id": "b"}], "failed": []}))
+
+        result = sdk.tasks.bulk_update([{"id": "a", "priority": "P0"}, {"id": "b", "priority": "P1"}])
+
+        assert result == {"updated": [{"id": "a"}, {"id": "b"}], "failed": []}
+        call = sdk.session.request.call_args
+        assert call.args == ("PATCH", "http://example.com/api/v1/tasks")
+        assert call.kwargs["json"]["tasks"] == [{"id": "a", "priority": "P0"}, {"id": "b", "priority": "P1"}]
+        assert call.kwargs["json"]["scope"] == "s1"
+
+    def test_reports_partial_failures(self):
+        sdk = _sdk(_response(200, {"updated": [{"id": "a"}], "failed": [{"id": "b", "error": "not found"}]}))
+
+        result = sdk.tasks.bulk_update([{"id": "a"}, {"id": "b"}])
+
+        assert result["failed"] == [{"id": "b", "error": "not found"}]
+
+    def test_falls_back_to_per_task_patches(self):
+        sdk = _sdk(
+            _response(404, {"error": "no route"}),
+            _response(200, {"id": "a", "priority": "P0"}),
+        )
+
+        result = sdk.tasks.bulk_update([{"id": "a", "priority": "P0"}])
+
+        assert result == {"updated": [{"id": "a", "priority": "P0"}], "failed": []}
+        assert sdk.session.request.call_args.args == ("PATCH", "http://example.com/api/v1/tasks/a")
+
+    def test_fallback_reports_each_failure_and_is_remembered(self):
+        sdk = OctopoidSDK(server_url="http://example.com")
+        sdk.session.request = MagicMock(return_value=_response(405))
+
+        def update(task_id, **fields):
+            if task_id == "bad":
+                raise RuntimeError("boom")
+            return {"id": task_id}
+
+        sdk.tasks.update = MagicMock(side_effect=update)
+
+        first = sdk.tasks.bulk_update([{"id": "ok"}, {"id": "bad"}])
+        sdk.tasks.bulk_update([{"id": "ok"}])
+
+        assert first == {"updated": [{"id": "ok"}], "failed": [{"id": "bad", "error": "boom"}]}
+        # The bulk endpoint was only tried once
+        assert sdk.session.request.call_count == 1
+
+    @pytest.mark.parametrize("status", [400, 409, 422])
+    def test_rejected_batch_is_retried_per_task(self, status):
+        sdk = _sdk(_response(status, {"error": "task gone"}))
+
+        def update(task_id, **fields):
+            if task_id == "gone":
+                raise RuntimeError("gone")
+            return {"id": task_id}
+
+        sdk.tasks.update = MagicMock(side_effect=update)
+
+        result = sdk.tasks.bulk_update([{"id": "ok"}, {"id": "gone"}])
+
+        assert result == {"updated": [{"id": "ok"}], "failed": [{"id": "gone", "error": "gone"}]}
+        # The bulk endpoint stays in use for later ticks
+        assert sdk.tasks._bulk_supported is True
+
+    def test_other_http_errors_propagate(self):
+        sdk = _sdk(_response(500))
+        with pytest.raises(requests.HTTPError):
+            sdk.tasks.bulk_update([{"id": "a"}])
+
+    def test_empty_and_invalid_patches(self):
+        sdk = _sdk()
+        assert sdk.tasks.bulk_update([]) == {"updated": [], "failed": []}
+        with pytest.raises(ValueError):
+            sdk.tasks.bulk_update([{"priority": "P0"}])
+        sdk.session.request.assert_not_called()
+
+    def test_bulk_renew_leases_sets_expiry_from_now(self):
+        sdk = _sdk(_response(200, {"updated": [], "failed": []}))
+
+        sdk.tasks.bulk_renew_leases(["a", "b"], duration_seconds=3600)
+
+        patches = sdk.session.request.call_args.kwargs["json"]["tasks"]
+        assert [p["id"] for p in patches] == ["a", "b"]
+        expiry = datetime.fromisoformat(patches[0]["lease_expires_at"])
+        assert abs((expiry - datetime.now(timezone.utc)) - timedelta(hours=1)) < timedelta(minutes=1)
+
+
+class TestLeaseJobsUseBulkUpdates:
+    def _sdk(self, claimed: list[dict]) -> MagicMock:
+        sdk = MagicMock()
+        sdk.tasks.list.side_effect = lambda queue=None: claimed if queue == "claimed" else []
+        return sdk
+
+    def test_renewals_go_in_one_request(self):
+        claimed = [{"id": t, "lease_expires_at": _iso(timedelta(minutes=5))} for t in ("a", "b", "c")]
+        sdk = self._sdk(claimed)
+        sdk.tasks.bulk_renew_leases.return_value = {
+            "updated": [{"id": "a", "lease_expires_at": "new"}, {"id": "c", "lease_expires_at": "new"}],
+            "failed": [{"id": "b", "error": "boom"}],
+        }
+        snapshot = MagicMock()
+        snapshot.list_tasks.return_value = claimed
+
+        with (
+            patch("octopoid.housekeeping.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping.find_pid_for_task", return_value=(1, "implementer")),
+        ):
+            renew_active_leases(snapshot=snapshot)
+
+        sdk.tasks.bulk_renew_leases.assert_called_once_with(["a", "b", "c"], duration_seconds=3600)
+        sdk.tasks.update.assert_not_called()
+        recorded = [c.args[0] for c in snapshot.record_update.call_args_list]
+        assert recorded == ["a", "c"]
+
+    def test_expired_leases_requeued_in_one_request(self):
+        claimed = [
+            {"id": t, "lease_expires_at": _iso(timedelta(minutes=-5)), "attempt_count": 0}
+            for t in ("x", "y")
+        ]
+        sdk = self._sdk(claimed)
+        sdk.tasks.bulk_update.return_value = {"updated": [{"id": "x"}, {"id": "y"}], "failed": []}
+
+        with (
+            patch("octopoid.housekeeping.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping.find_pid_for_task", return_value=None),
+            patch("octopoid.housekeeping._get_circuit_breaker_threshold", return_value=3),
+        ):
+            check_and_requeue_expired_leases()
+
+        sdk.tasks.bulk_update.assert_called_once()
+        patches = sdk.tasks.bulk_update.call_args.args[0]
+        assert [p["id"] for p in patches] == ["x", "y"]
+        assert all(p["queue"] == "incoming" and p["attempt_count"] == 1 for p in patches)
+        sdk.tasks.update.assert_not_called()
+
+    def test_nothing_expired_sends_nothing(self):
+        claimed = [{"id": "z", "lease_expires_at": _iso(timedelta(hours=1))}]
+        sdk = self._sdk(claimed)
+
+        with (
+            patch("octopoid.housekeeping.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping._get_circuit_breaker_threshold", return_value=3),
+        ):
+            check_and_requeue_expired_leases()
+
+        sdk.tasks.bulk_update.assert_not_called()
@@ -91,6 +91,34 @@ class TestCheckProjectCompletion:
 
         sdk.projects.update.assert_not_called()
 
+    def test_children_are_fetched_concurrently_and_failures_isolated(self):
+        """Each active project's children are fetched in one fan-out; one failure skips only that project."""
+        import threading
+
+        projects = [
+            {"id": "PROJ-a", "status": "active", "branch": "feature/a"},
+            {"id": "PROJ-b", "status": "active", "branch": "feature/b"},
+        ]
+        both_fetching = threading.Barrier(2, timeout=5)
+
+        def get_tasks(pid):
+            both_fetching.wait()  # only passes if both fetches are in flight at once
+            if pid == "PROJ-a":
+                raise RuntimeError("server error")
+            return [{"id": "TASK-1", "queue": "done"}]
+
+        sdk = _make_sdk(projects=projects)
+        sdk.projects.get_tasks.side_effect = get_tasks
+
+        with (
+            patch("octopoid.scheduler.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping._execute_project_flow_transition") as mock_transition,
+        ):
+            from octopoid.scheduler import check_project_completion
+            check_project_completion()
+
+        mock_transition.assert_called_once_with(sdk, projects[1], "children_complete")
+
     def test_all_done_tasks_triggers_flow_transition(self):
         """When all tasks are done, the flow's children_complete -> provisional transition runs."""
         project_id = "PROJ-abc"
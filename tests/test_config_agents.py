@@ -381,3 +381,54 @@ class TestGetAgentsFormatPriority:
         blueprint_names = [a["blueprint_name"] for a in agents]
         assert "my-blueprint" in blueprint_names
         assert "fleet-agent" not in blueprint_names
+
+
+class TestConfigCache:
+    """Parsed YAML is reused until the file's mtime or size changes."""
+
+    def test_agents_yaml_parsed_once_until_changed(self, tmp_project):
+        from octopoid.config import is_system_paused, get_queue_limits, load_agents_config
+
+        _write_agents_yaml(tmp_project, {"paused": False, "queue_limits": {"max_claimed": 3}})
+        with _patch_project(tmp_project):
+            with patch("octopoid.config.yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+                load_agents_config()
+                assert get_queue_limits()["max_claimed"] == 3
+                assert is_system_paused() is False
+                assert mock_load.call_count == 1
+
+                _write_agents_yaml(tmp_project, {"paused": True})
+                assert is_system_paused() is True
+                assert mock_load.call_count == 2
+
+    def test_callers_cannot_mutate_cached_config(self, tmp_project):
+        from octopoid.config import load_agents_config
+
+        _write_agents_yaml(tmp_project, {"queue_limits": {"max_claimed": 3}})
+        with _patch_project(tmp_project):
+            load_agents_config()["queue_limits"]["max_claimed"] = 99
+            assert load_agents_config()["queue_limits"]["max_claimed"] == 3
+
+    def test_agent_yaml_cached_across_get_agents_calls(self, tmp_project):
+        from octopoid.config import get_agents
+
+        agent_dir = tmp_project / ".octopoid" / "agents" / "implementer"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "agent.yaml").write_text("role: implement\n")
+        with _patch_project(tmp_project):
+            with patch("octopoid.config.yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+                get_agents()
+                agents = get_agents()
+                assert mock_load.call_count == 1
+        assert agents[0]["name"] == "implementer"
+
+    def test_invalidate_config_cache_forces_reparse(self, tmp_project):
+        from octopoid.config import invalidate_config_cache, load_agents_config
+
+        _write_agents_yaml(tmp_project, {"paused": False})
+        with _patch_project(tmp_project):
+            with patch("octopoid.config.yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+                load_agents_config()
+                invalidate_config_cache()
+                load_agents_config()
+                assert mock_load.call_count == 2
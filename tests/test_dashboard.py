@@ -174,6 +174,20 @@ class TestFormatAge:
         assert self._fmt(ts) == "1h"
 
 
+class TestFormatEndpoint:
+    """Tests for format_endpoint() in packages/dashboard/utils.py."""
+
+    def test_shows_volume_latency_and_errors(self):
+        from packages.dashboard.utils import format_endpoint
+        entry = {"endpoint": "GET /api/v1/tasks", "calls": 6, "errors": 1, "total_ms": 300.0, "avg_ms": 50.0}
+        assert format_endpoint(entry) == "GET /api/v1/tasks  6x · avg 50ms · total 300ms · 1 err"
+
+    def test_omits_errors_when_none(self):
+        from packages.dashboard.utils import format_endpoint
+        entry = {"endpoint": "POST /api/v1/tasks/claim", "calls": 1, "errors": 0, "total_ms": 250.0, "avg_ms": 250.0}
+        assert format_endpoint(entry) == "POST /api/v1/tasks/claim  1x · avg 250ms · total 250ms"
+
+
 # ---------------------------------------------------------------------------
 # Tab widget update_data interface tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,124 @@
+"""Tests for octopoid.exit_watcher and the daemon's exit-driven result handling."""
+
+import os
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from octopoid.exit_watcher import ExitWatcher, watch_pid
+from octopoid.housekeeping import check_and_update_finished_agents
+from octopoid.scheduler import _handle_exited_agents, _sleep_until_next_tick
+
+
+def _spawn(seconds: float) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", f"import time; time.sleep({seconds})"])
+
+
+class TestExitWatcher:
+    def test_reports_exit_and_reaps_child(self):
+        proc = _spawn(0.1)
+        watcher = ExitWatcher()
+        try:
+            watcher.watch(proc.pid)
+            assert watcher.wait(10) == [proc.pid]
+        finally:
+            watcher.close()
+
+        with pytest.raises(ChildProcessError):
+            os.waitpid(proc.pid, os.WNOHANG)
+        assert watcher.watched() == set()
+
+    def test_times_out_while_process_runs(self):
+        proc = _spawn(5)
+        watcher = ExitWatcher()
+        try:
+            watcher.watch(proc.pid)
+            assert watcher.wait(0.05) == []
+            assert watcher.watched() == {proc.pid}
+        finally:
+            watcher.close()
+            proc.kill()
+            proc.wait()
+
+    def test_polling_fallback_without_pidfd(self, monkeypatch):
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+        proc = _spawn(0.1)
+        watcher = ExitWatcher(poll_interval=0.02)
+        try:
+            watcher.watch(proc.pid)
+            assert watcher.wait(10) == [proc.pid]
+        finally:
+            watcher.close()
+
+    def test_already_gone_pid_is_reported(self):
+        proc = _spawn(0)
+        proc.wait()
+        watcher = ExitWatcher()
+        try:
+            watcher.watch(proc.pid)
+            assert watcher.wait(1) == [proc.pid]
+        finally:
+            watcher.close()
+
+    def test_watch_pid_is_noop_without_installed_watcher(self):
+        with patch("octopoid.exit_watcher._watcher", None):
+            watch_pid(12345)  # must not raise
+
+
+class TestTargetedResultHandling:
+    def test_only_listed_pids_are_handled(self, tmp_path):
+        agents_dir = tmp_path / "agents"
+        (agents_dir / "implementer").mkdir(parents=True)
+        (agents_dir / "implementer" / "running_pids.json").write_text("{}")
+        pids = {
+            101: {"task_id": "", "instance_name": "implementer-1"},
+            202: {"task_id": "", "instance_name": "implementer-2"},
+        }
+
+        with (
+            patch("octopoid.housekeeping.get_agents_runtime_dir", return_value=agents_dir),
+            patch("octopoid.housekeeping.get_agents", return_value=[]),
+            patch("octopoid.housekeeping.load_blueprint_pids", return_value=dict(pids)),
+            patch("octopoid.housekeeping.is_process_running", return_value=False),
+            patch("octopoid.housekeeping.save_blueprint_pids") as mock_save,
+            patch("octopoid.housekeeping._log_pid_snapshot") as mock_snapshot,
+        ):
+            check_and_update_finished_agents(only_pids={101})
+
+        mock_save.assert_called_once_with("implementer", {202: pids[202]})
+        mock_snapshot.assert_not_called()
+
+    def test_empty_pid_set_is_a_noop(self):
+        with patch("octopoid.housekeeping.get_agents_runtime_dir") as mock_dir:
+            check_and_update_finished_agents(only_pids=set())
+        mock_dir.assert_not_called()
+
+
+class TestDaemonExitHandling:
+    def test_exit_handles_results_and_makes_evaluation_due(self):
+        state = {"jobs": {"agent_evaluation_loop": "2026-01-01T00:00:00", "send_heartbeat": "x"}}
+        with patch("octopoid.scheduler.check_and_update_finished_agents") as mock_check:
+            _handle_exited_agents([42], state)
+
+        mock_check.assert_called_once_with(only_pids={42})
+        assert "agent_evaluation_loop" not in state["jobs"]
+        assert "send_heartbeat" in state["jobs"]
+
+    def test_sleep_returns_early_on_exit(self):
+        watcher = MagicMock()
+        watcher.wait.return_value = [7]
+        with patch("octopoid.scheduler._handle_exited_agents") as mock_handle:
+            _sleep_until_next_tick(watcher, threading.Event(), 30, {})
+
+        watcher.wait.assert_called_once()
+        mock_handle.assert_called_once_with([7], {})
+
+    def test_sleep_stops_when_stop_is_set(self):
+        stop = threading.Event()
+        stop.set()
+        watcher = MagicMock()
+        _sleep_until_next_tick(watcher, stop, 30, {})
+        watcher.wait.assert_not_called()
@@ -136,6 +136,71 @@ class TestTransition:
         assert "on_fail state 'nonexistent_state' is not a valid state" in errors[0]
 
 
+class TestTransitionAfter:
+    """Tests for after: step dependencies on transitions."""
+
+    def test_from_dict_parses_after(self):
+        trans = Transition.from_dict("claimed -> provisional", {
+            "runs": ["rebase_on_base", "push_branch", "run_tests"],
+            "after": {"run_tests": "rebase_on_base", "push_branch": None},
+        })
+        assert trans.after == {"run_tests": ["rebase_on_base"], "push_branch": []}
+        assert Transition.from_dict("incoming -> claimed", {}).after == {}
+
+    def test_after_round_trips_through_server_registration(self):
+        from octopoid.flow import flow_to_server_registration
+
+        flow = Flow.from_dict({
+            "name": "test",
+            "transitions": {
+                "incoming -> claimed": {"agent": "implementer"},
+                "claimed -> done": {
+                    "runs": ["post_review_comment", "rebase_on_base", "merge_pr"],
+                    "after": {"rebase_on_base": []},
+                },
+            },
+        })
+        registration = flow_to_server_registration(flow)
+        serialized = {(t["from"], t["to"]): t for t in registration["transitions"]}
+        assert serialized[("claimed", "done")]["after"] == {"rebase_on_base": []}
+        assert "after" not in serialized[("incoming", "claimed")]
+
+        restored = Flow.from_server_dict({"name": "test", **registration})
+        assert restored.get_transitions_from("claimed")[0].after == {"rebase_on_base": []}
+
+    def test_validate_after_unknown_steps(self):
+        trans = Transition(
+            from_state="incoming", to_state="claimed",
+            runs=["push_branch", "create_pr"],
+            after={"create_pr": ["run_tests"], "merge_pr": []},
+        )
+        errors = trans.validate("test-flow", {"incoming", "claimed"})
+        assert any("'create_pr' waits for 'run_tests', which is not in runs" in e for e in errors)
+        assert any("step 'merge_pr' is not in runs" in e for e in errors)
+
+    def test_validate_after_cycle(self):
+        trans = Transition(
+            from_state="incoming", to_state="claimed",
+            runs=["push_branch", "create_pr"],
+            after={"push_branch": ["create_pr"]},
+        )
+        errors = trans.validate("test-flow", {"incoming", "claimed"})
+        assert errors == [
+            "Flow 'test-flow' transition 'incoming -> claimed': "
+            "after: dependency cycle between steps create_pr, push_branch"
+        ]
+
+    def test_default_yaml_runs_tests_beside_push(self):
+        from octopoid.flow import generate_default_flow
+        from octopoid.steps import step_dependencies
+
+        flow = Flow.from_dict(yaml.safe_load(generate_default_flow()))
+        trans = flow.get_transitions_from("claimed")[0]
+        dependencies = step_dependencies(trans.runs, trans.after)
+        assert dependencies["push_branch"] == dependencies["run_tests"] == []
+        assert sorted(dependencies["create_pr"]) == ["push_branch", "run_tests"]
+
+
 class TestFlow:
     """Tests for Flow class."""
 
@@ -775,3 +840,91 @@ class TestTransitionChecks:
         prov_to_done = data["transitions"]["provisional -> done"]
         runs = prov_to_done.get("runs", [])
         assert "check_ci" not in runs
+
+
+class TestFlowCache:
+    """load_flow()/list_flows() share one fetched flow list per TTL window."""
+
+    def setup_method(self):
+        from octopoid.flow import invalidate_flow_cache
+        invalidate_flow_cache()
+
+    def _sdk(self, flows: list) -> MagicMock:
+        sdk = MagicMock()
+        sdk.flows.list.return_value = flows
+        return sdk
+
+    def test_repeated_loads_fetch_once(self):
+        sdk = self._sdk([
+            {"name": "default", "transitions": [{"from_state": "incoming", "to_state": "claimed"}]},
+            {"name": "project", "transitions": []},
+        ])
+        with patch("octopoid.sdk.get_sdk", return_value=sdk):
+            first = load_flow("default")
+            assert load_flow("default") is first
+            load_flow("project")
+            assert list_flows() == ["default", "project"]
+        sdk.flows.list.assert_called_once()
+
+    def test_ttl_expiry_refetches_and_reuses_unchanged_flows(self):
+        from octopoid import flow as flow_module
+
+        flows = [
+            {"name": "default", "transitions": [{"from_state": "incoming", "to_state": "claimed"}]},
+            {"name": "project", "transitions": []},
+        ]
+        sdk = self._sdk(flows)
+        with patch("octopoid.sdk.get_sdk", return_value=sdk):
+            default = load_flow("default")
+            project = load_flow("project")
+
+            flows[1] = {"name": "project", "transitions": [{"from_state": "incoming", "to_state": "done"}]}
+            with patch.object(flow_module._flow_registry, "ttl", 0):
+                assert load_flow("default") is default  # same content hash, same object
+                new_project = load_flow("project")
+        assert new_project is not project
+        assert len(new_project.transitions) == 1
+        assert sdk.flows.list.call_count == 3
+
+    def test_new_sdk_instance_bypasses_cache(self):
+        old = self._sdk([{"name": "default", "transitions": []}])
+        new = self._sdk([{"name": "default", "transitions": []}])
+        with patch("octopoid.sdk.get_sdk", return_value=old):
+            load_flow("default")
+        with patch("octopoid.sdk.get_sdk", return_value=new):
+            load_flow("default")
+        new.flows.list.assert_called_once()
+
+    def test_invalidate_forces_refetch(self):
+        from octopoid.flow import invalidate_flow_cache
+
+        sdk = self._sdk([{"name": "default", "transitions": []}])
+        with patch("octopoid.sdk.get_sdk", return_value=sdk):
+            load_flow("default")
+            invalidate_flow_cache()
+            load_flow("default")
+        assert sdk.flows.list.call_count == 2
+
+
+class TestTransitionIndex:
+    def test_get_transitions_from_uses_compiled_index(self):
+        a = Transition(from_state="incoming", to_state="claimed")
+        b = Transition(from_state="claimed", to_state="provisional")
+        c = Transition(from_state="claimed", to_state="failed")
+        flow = Flow(name="f", description="", transitions=[a, b, c])
+
+        assert flow.get_transitions_from("claimed") == [b, c]
+        assert flow.get_transitions_from("done") == []
+
+    def test_index_rebuilt_when_transitions_appended(self):
+        flow = Flow(name="f", description="", transitions=[Transition(from_state="incoming", to_state="claimed")])
+        flow.get_transitions_from("incoming")
+
+        extra = Transition(from_state="incoming", to_state="failed")
+        flow.transitions.append(extra)
+        assert flow.get_transitions_from("incoming")[-1] is extra
+
+    def test_returned_list_does_not_alias_index(self):
+        flow = Flow(name="f", description="", transitions=[Transition(from_state="incoming", to_state="claimed")])
+        flow.get_transitions_from("incoming").clear()
+        assert len(flow.get_transitions_from("incoming")) == 1
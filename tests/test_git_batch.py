@@ -0,0 +1,192 @@
+"""Tests for the persistent git cat-file helpers (octopoid/git_batch.py).
+
+Answers are compared against real ``git rev-parse`` / ``git rev-list`` output.
+Commit counts are left to ``git rev-list``; TestCommitCounts checks the
+callers against it, including histories with skewed committer dates.
+"""
+
+import os
+import random
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from octopoid import git_batch
+from octopoid.git_batch import current_branch, get_batch, rev_parse
+from tests.fixtures.conftest_mock import git
+
+
+def _commit(repo: Path, name: str) -> None:
+    (repo / name).write_text(name)
+    git(["add", name], cwd=repo)
+    git(["commit", "-m", name], cwd=repo)
+
+
+@pytest.fixture(autouse=True)
+def fresh_helpers():
+    git_batch.close_all()
+    yield
+    git_batch.close_all()
+
+
+@pytest.fixture
+def repo(test_repo):
+    """main: init-b-c. feature: from b, d-e, then merges main (c) and adds f."""
+    repo = test_repo["work"]
+    _commit(repo, "b")
+    git(["push", "-u", "origin", "main"], cwd=repo)
+    git(["checkout", "-b", "feature"], cwd=repo)
+    _commit(repo, "d")
+    _commit(repo, "e")
+    git(["checkout", "main"], cwd=repo)
+    _commit(repo, "c")
+    git(["checkout", "feature"], cwd=repo)
+    git(["merge", "--no-edit", "main"], cwd=repo)
+    _commit(repo, "f")
+    return repo
+
+
+class TestCurrentBranch:
+    def test_named_and_detached(self, repo):
+        assert current_branch(repo) == "feature"
+        git(["checkout", "--detach"], cwd=repo)
+        assert current_branch(repo) == "HEAD"
+
+    def test_linked_worktree(self, repo, tmp_path):
+        worktree = tmp_path / "wt"
+        git(["worktree", "add", "-b", "other", str(worktree), "main"], cwd=repo)
+        assert current_branch(worktree) == "other"
+
+    def test_not_a_checkout(self, tmp_path):
+        assert current_branch(tmp_path) is None
+        assert rev_parse(tmp_path, "HEAD") is None
+
+
+class TestRevParse:
+    def test_matchesgit(self, repo):
+        for rev in ("HEAD", "main", "HEAD~2", "origin/main"):
+            assert rev_parse(repo, rev) == git(["rev-parse", rev], cwd=repo)
+        assert rev_parse(repo, "no-such-branch") is None
+
+    def test_sees_new_commits(self, repo):
+        rev_parse(repo, "HEAD")
+        _commit(repo, "g")
+        assert rev_parse(repo, "HEAD") == git(["rev-parse", "HEAD"], cwd=repo)
+
+
+def _skewed_dag(repo: Path, seed: int, size: int = 40) -> list[str]:
+    """Commit a random DAG with merges whose committer dates are skewed by hours.
+
+    Returns the commit names, oldest first.
+    """
+    rng = random.Random(seed)
+    tree = git(["mktree"], cwd=repo)
+    commits: list[str] = []
+    for i in range(size):
+        parents = rng.sample(commits, min(len(commits), rng.choice([1, 1, 2])))
+        date = 1_700_000_000 + i * 600 + rng.randint(-4 * 3600, 4 * 3600)
+        env = {**os.environ, "GIT_COMMITTER_DATE": f"{date} +0000", "GIT_AUTHOR_DATE": f"{date} +0000"}
+        args = ["git", "commit-tree", tree, "-m", f"c{i}"]
+        for parent in parents:
+            args += ["-p", parent]
+        commits.append(subprocess.run(args, cwd=repo, env=env, capture_output=True, text=True, check=True).stdout.strip())
+    return commits
+
+
+class TestCommitCounts:
+    @pytest.mark.parametrize("exclude, include", [
+        ("main", "HEAD"),
+        ("HEAD", "main"),
+        ("origin/main", "HEAD"),
+        ("HEAD~1", "HEAD"),
+        ("HEAD", "HEAD"),
+    ])
+    def test_matches_rev_list(self, repo, exclude, include):
+        from octopoid.git_utils import _count_commits
+        from octopoid.repo_manager import RepoManager
+
+        expected = int(git(["rev-list", "--count", f"{exclude}..{include}"], cwd=repo))
+        assert _count_commits(repo, f"{exclude}..{include}") == expected
+        assert RepoManager(worktree=repo)._count_commits(exclude, include) == expected
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_skewed_committer_dates(self, repo, seed):
+        from octopoid.git_utils import _count_commits
+        from octopoid.repo_manager import RepoManager
+
+        commits = _skewed_dag(repo, seed)
+        manager = RepoManager(worktree=repo)
+        rng = random.Random(seed)
+        for _ in range(50):
+            exclude, include = rng.choice(commits), rng.choice(commits)
+            expected = int(git(["rev-list", "--count", f"{exclude}..{include}"], cwd=repo))
+            assert _count_commits(repo, f"{exclude}..{include}") == expected
+            assert manager._count_commits(exclude, include) == expected
+
+    def test_invalid_range(self, repo):
+        from octopoid.git_utils import _count_commits
+        assert _count_commits(repo, "no-such-branch..HEAD") is None
+
+
+class TestRestart:
+    def test_dead_process_is_restarted(self, repo):
+        helper = get_batch(repo)
+        assert rev_parse(repo, "HEAD")
+        proc = helper._procs["batch-check"].proc
+        proc.kill()
+        proc.wait()
+
+        assert rev_parse(repo, "HEAD") == git(["rev-parse", "HEAD"], cwd=repo)
+        assert helper.restarts == 1
+
+    def test_recreated_worktree_gets_a_new_helper(self, repo, tmp_path):
+        worktree = tmp_path / "wt"
+        git(["worktree", "add", "--detach", str(worktree), "main"], cwd=repo)
+        first = get_batch(worktree)
+        git(["worktree", "remove", str(worktree)], cwd=repo)
+        git(["worktree", "add", "--detach", str(worktree), "HEAD"], cwd=repo)
+
+        assert get_batch(worktree) is not first
+        assert rev_parse(worktree, "HEAD") == git(["rev-parse", "HEAD"], cwd=repo)
+
+    def test_least_recently_used_helpers_are_closed(self, repo, tmp_path):
+        worktree = tmp_path / "wt"
+        git(["worktree", "add", "--detach", str(worktree), "main"], cwd=repo)
+        with patch.object(git_batch, "MAX_HELPERS", 1):
+            first = get_batch(repo)
+            rev_parse(repo, "HEAD")
+            get_batch(worktree)
+
+        assert first._procs == {}
+
+
+class TestCallersUseHelper:
+    def test_git_utils_queries_fork_only_for_counts(self, repo):
+        from octopoid.git_utils import (
+            get_commit_count,
+            get_current_branch,
+            get_head_ref,
+            has_commits_ahead_of_base,
+            run_git,
+        )
+
+        with patch("octopoid.git_utils.run_git", wraps=run_git) as mock_run:
+            assert get_current_branch(repo) == "feature"
+            assert get_head_ref(repo) == git(["rev-parse", "HEAD"], cwd=repo)
+            assert has_commits_ahead_of_base(repo, "main") is True
+            assert get_commit_count(repo) == int(git(["rev-list", "--count", "main..HEAD"], cwd=repo))
+        assert {c[0][0][0] for c in mock_run.call_args_list} <= {"rev-list", "merge-base"}
+
+    def test_repo_manager_status(self, repo):
+        from octopoid.repo_manager import RepoManager
+
+        manager = RepoManager(worktree=repo, base_branch="main")
+        with patch.object(manager, "_run_git", wraps=manager._run_git) as mock_run:
+            status = manager.get_status()
+
+        assert status.branch == "feature"
+        assert status.commits_ahead == int(git(["rev-list", "--count", "main..HEAD"], cwd=repo))
+        # The branch and HEAD come from the helper; only the count and status fork
+        assert [c[0][0][0] for c in mock_run.call_args_list] == ["rev-list", "status"]
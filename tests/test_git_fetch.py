@@ -0,0 +1,200 @@
+"""Tests for the coalesced git fetch coordinator (octopoid/git_fetch.py).
+
+Uses the test_repo fixture's bare "origin" and real fetches.
+"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from octopoid import git_fetch
+from octopoid.git_fetch import fetch_origin
+from tests.fixtures.conftest_mock import git
+
+
+@pytest.fixture
+def repo(test_repo):
+    return test_repo["work"]
+
+
+class CountingRunner:
+    """Runs git for real and records each fetch."""
+
+    def __init__(self, cwd: Path, gate: threading.Event | None = None, returncode: int | None = None):
+        self.cwd = cwd
+        self.gate = gate
+        self.returncode = returncode
+        self.calls: list[list[str]] = []
+        self.started = threading.Event()
+
+    def __call__(self, args):
+        self.calls.append(args)
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait(10)
+        if self.returncode is not None:
+            return subprocess.CompletedProcess(["git"] + args, self.returncode, "", "fatal: unreachable")
+        return subprocess.run(["git"] + args, cwd=self.cwd, capture_output=True, text=True)
+
+
+class TestFreshness:
+    def test_recent_fetch_is_reused(self, repo):
+        runner = CountingRunner(repo)
+
+        assert fetch_origin(repo, max_age=60, runner=runner).returncode == 0
+        assert fetch_origin(repo, max_age=60, runner=runner).returncode == 0
+
+        assert runner.calls == [["fetch", "origin"]]
+
+    def test_max_age_zero_always_fetches(self, repo):
+        runner = CountingRunner(repo)
+
+        fetch_origin(repo, max_age=60, runner=runner)
+        fetch_origin(repo, max_age=0, runner=runner)
+
+        assert len(runner.calls) == 2
+
+    def test_expired_fetch_runs_again(self, repo):
+        runner = CountingRunner(repo)
+        fetch_origin(repo, max_age=60, runner=runner)
+
+        later = time.time() + 120
+        with patch("octopoid.git_fetch.time.time", return_value=later):
+            fetch_origin(repo, max_age=60, runner=runner)
+
+        assert len(runner.calls) == 2
+
+    def test_full_fetch_serves_branch_requests_but_not_the_reverse(self, repo):
+        runner = CountingRunner(repo)
+
+        fetch_origin(repo, "main", max_age=60, runner=runner)
+        fetch_origin(repo, max_age=60, runner=runner)
+        fetch_origin(repo, "main", max_age=60, runner=runner)
+
+        assert runner.calls == [["fetch", "origin", "main"], ["fetch", "origin"]]
+
+    def test_worktrees_share_the_record(self, repo, tmp_path):
+        worktree = tmp_path / "wt"
+        git(["worktree", "add", "--detach", str(worktree), "origin/main"], cwd=repo)
+        runner = CountingRunner(repo)
+
+        fetch_origin(repo, max_age=60, runner=runner)
+        fetch_origin(worktree, max_age=60, runner=runner)
+
+        assert len(runner.calls) == 1
+        assert (repo / ".git" / git_fetch.STATE_FILENAME).exists()
+
+    def test_new_commits_are_visible_after_fetch(self, repo, test_repo, tmp_path):
+        other = tmp_path / "other"
+        git(["clone", str(test_repo["bare"]), str(other)], cwd=tmp_path)
+        git(["config", "user.email", "test@example.com"], cwd=other)
+        git(["config", "user.name", "Test User"], cwd=other)
+        (other / "README.md").write_text("v2\n")
+        git(["commit", "-am", "advance"], cwd=other)
+        git(["push", "origin", "main"], cwd=other)
+
+        fetch_origin(repo, "main", max_age=0)
+
+        assert git(["rev-parse", "origin/main"], cwd=repo) == git(["rev-parse", "HEAD"], cwd=other)
+
+
+class TestSharing:
+    def _in_flight(self, repo, runner):
+        thread = threading.Thread(target=fetch_origin, args=(repo,), kwargs={"max_age": 60, "runner": runner})
+        thread.start()
+        assert runner.started.wait(10)
+        return thread
+
+    def test_waiter_shares_in_flight_fetch(self, repo):
+        gate = threading.Event()
+        runner = CountingRunner(repo, gate=gate)
+        first = self._in_flight(repo, runner)
+
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(fetch_origin(repo, max_age=60, runner=runner)))
+        waiter.start()
+        time.sleep(0.2)
+        gate.set()
+        first.join(10)
+        waiter.join(10)
+
+        assert len(runner.calls) == 1
+        assert results[0].returncode == 0
+
+    def test_waiter_shares_failure_but_later_callers_retry(self, repo):
+        gate = threading.Event()
+        runner = CountingRunner(repo, gate=gate, returncode=128)
+        first = self._in_flight(repo, runner)
+
+        errors = []
+
+        def wait_strictly_checked():
+            try:
+                fetch_origin(repo, max_age=60, check=True, runner=runner)
+            except subprocess.CalledProcessError as e:
+                errors.append(e)
+
+        waiter = threading.Thread(target=wait_strictly_checked)
+        waiter.start()
+        time.sleep(0.2)
+        gate.set()
+        first.join(10)
+        waiter.join(10)
+
+        assert len(runner.calls) == 1
+        assert errors and "unreachable" in errors[0].stderr
+
+        fetch_origin(repo, max_age=60, runner=runner)
+        assert len(runner.calls) == 2
+
+    def test_strict_waiter_does_not_share_earlier_fetch(self, repo):
+        gate = threading.Event()
+        runner = CountingRunner(repo, gate=gate)
+        first = self._in_flight(repo, runner)
+
+        waiter = threading.Thread(target=fetch_origin, args=(repo,), kwargs={"max_age": 0, "runner": runner})
+        waiter.start()
+        time.sleep(0.2)
+        gate.set()
+        first.join(10)
+        waiter.join(10)
+
+        assert len(runner.calls) == 2
+
+
+class TestErrors:
+    def test_timeout_is_raised(self, repo):
+        def runner(args):
+            raise subprocess.TimeoutExpired(["git"] + args, 5)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            fetch_origin(repo, max_age=0, runner=runner, timeout=5)
+
+    def test_outside_a_checkout_fetch_just_runs(self, tmp_path):
+        runner = CountingRunner(tmp_path, returncode=0)
+
+        fetch_origin(tmp_path, max_age=60, runner=runner)
+        fetch_origin(tmp_path, max_age=60, runner=runner)
+
+        assert len(runner.calls) == 2
+        assert not list(tmp_path.glob("*fetch*"))
+
+
+class TestFetchTtlConfig:
+    def test_default(self, tmp_path):
+        from octopoid.config import DEFAULT_FETCH_TTL_SECONDS, get_fetch_ttl
+
+        with patch("octopoid.config.find_parent_project", return_value=tmp_path):
+            assert get_fetch_ttl() == DEFAULT_FETCH_TTL_SECONDS
+
+    def test_configured(self, tmp_path):
+        from octopoid.config import get_fetch_ttl
+
+        (tmp_path / ".octopoid").mkdir()
+        (tmp_path / ".octopoid" / "config.yaml").write_text("repo:\n  fetch_ttl: 5\n")
+        with patch("octopoid.config.find_parent_project", return_value=tmp_path):
+            assert get_fetch_ttl() == 5.0
@@ -35,6 +35,7 @@ from octopoid.jobs import (
     load_jobs_yaml,
     register_job,
     run_due_jobs,
+    seconds_until_next_job,
 )
 
 
@@ -89,6 +90,51 @@ class TestLoadJobsYaml:
         assert "job_b" in names
 
 
+    def test_reuses_parsed_jobs_until_file_changes(self, tmp_path):
+        jobs_yaml = tmp_path / "jobs.yaml"
+        jobs_yaml.write_text("jobs:\n  - name: job_a\n    interval: 30\n")
+        with patch("octopoid.jobs.get_orchestrator_dir", return_value=tmp_path):
+            with patch("octopoid.config.yaml.safe_load", wraps=__import__("yaml").safe_load) as mock_load:
+                load_jobs_yaml()
+                load_jobs_yaml()
+                assert mock_load.call_count == 1
+
+                jobs_yaml.write_text("jobs:\n  - name: job_bb\n    interval: 30\n")
+                result = load_jobs_yaml()
+                assert mock_load.call_count == 2
+        assert result[0]["name"] == "job_bb"
+
+
+# =============================================================================
+# seconds_until_next_job
+# =============================================================================
+
+
+class TestSecondsUntilNextJob:
+    def _ago(self, seconds):
+        from datetime import datetime, timedelta
+        return (datetime.now() - timedelta(seconds=seconds)).isoformat()
+
+    def test_never_run_job_is_due_now(self):
+        jobs = [{"name": "a", "interval": 60}]
+        assert seconds_until_next_job({"jobs": {}}, jobs) == 0.0
+
+    def test_returns_time_to_soonest_job(self):
+        jobs = [{"name": "a", "interval": 60}, {"name": "b", "interval": 10}]
+        state = {"jobs": {"a": self._ago(0), "b": self._ago(4)}}
+        remaining = seconds_until_next_job(state, jobs)
+        assert 5.0 < remaining <= 6.0
+
+    def test_overdue_job_returns_zero(self):
+        jobs = [{"name": "a", "interval": 10}]
+        state = {"jobs": {"a": self._ago(30)}}
+        assert seconds_until_next_job(state, jobs) == 0.0
+
+    def test_no_jobs_defined_returns_default(self):
+        with patch("octopoid.jobs.load_jobs_yaml", return_value=[]):
+            assert seconds_until_next_job({"jobs": {}}) == 60.0
+
+
 # =============================================================================
 # register_job
 # =============================================================================
@@ -517,7 +563,7 @@ class TestJobHandlerDelegates:
         with patch("octopoid.scheduler.check_and_requeue_expired_leases") as mock_impl:
             from octopoid.jobs import check_and_requeue_expired_leases
             check_and_requeue_expired_leases(ctx)
-        mock_impl.assert_called_once_with()
+        mock_impl.assert_called_once_with(snapshot=None)
 
     def test_check_project_completion_delegates(self):
         ctx = JobContext(scheduler_state={})
@@ -539,21 +585,21 @@ class TestJobHandlerDelegates:
         with patch("octopoid.scheduler._run_agent_evaluation_loop") as mock_impl:
             from octopoid.jobs import agent_evaluation_loop
             agent_evaluation_loop(ctx)
-        mock_impl.assert_called_once_with(queue_counts=queue_counts)
+        mock_impl.assert_called_once_with(queue_counts=queue_counts, snapshot=None)
 
     def test_agent_evaluation_loop_passes_none_when_no_poll_data(self):
         ctx = JobContext(scheduler_state={}, poll_data=None)
         with patch("octopoid.scheduler._run_agent_evaluation_loop") as mock_impl:
             from octopoid.jobs import agent_evaluation_loop
             agent_evaluation_loop(ctx)
-        mock_impl.assert_called_once_with(queue_counts=None)
+        mock_impl.assert_called_once_with(queue_counts=None, snapshot=None)
 
     def test_sweep_stale_resources_delegates(self):
         ctx = JobContext(scheduler_state={})
         with patch("octopoid.scheduler.sweep_stale_resources") as mock_impl:
             from octopoid.jobs import sweep_stale_resources
             sweep_stale_resources(ctx)
-        mock_impl.assert_called_once_with()
+        mock_impl.assert_called_once_with(snapshot=None)
 
     def test_send_heartbeat_delegates(self):
         ctx = JobContext(scheduler_state={})
@@ -0,0 +1,121 @@
+"""Tests for the tail-only log reader (octopoid/log_tail.py)."""
+
+import json
+import random
+from unittest.mock import patch
+
+import pytest
+
+from octopoid.log_tail import is_blank, read_result, read_tail
+
+
+def _result_doc(text: str, **extra) -> dict:
+    doc = {
+        "type": "result",
+        "subtype": "success",
+        "is_error": False,
+        "usage": {"input_tokens": 10, "cache": [{"note": "a } and a \" inside"}]},
+        "result": text,
+    }
+    doc.update(extra)
+    return doc
+
+
+class TestReadTail:
+    def test_short_file_is_returned_whole(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_bytes(b"line one\r\nline two\n")
+        assert read_tail(path, 100) == ("line one\nline two\n", False)
+
+    def test_long_file_keeps_the_end(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_text("x" * 50_000 + "THE END")
+        tail, truncated = read_tail(path, 10)
+        assert (tail, truncated) == ("xxxTHE END", True)
+
+    def test_multibyte_characters_at_the_cut(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        content = "é" * 5000 + "😀" * 3
+        path.write_text(content)
+        assert read_tail(path, 7)[0] == content[-7:]
+
+    def test_is_blank(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_text("")
+        assert is_blank(path)
+        path.write_text(" \n\t\n")
+        assert is_blank(path)
+        path.write_text("\n" * 10_000 + "x")
+        assert not is_blank(path)
+
+
+class TestReadResult:
+    def test_matches_full_parse(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        rng = random.Random(7)
+        alphabet = ["a", "\\", '"', "\n", "é", "😀", " ", "\x01", "u", "{"]
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+            path.write_text(json.dumps(_result_doc(text), ensure_ascii=rng.random() < 0.5))
+            for max_chars in (None, 1, 9, 50):
+                fields, tail = read_result(path, max_chars)
+                expected = text if max_chars is None else text[-max_chars:]
+                assert tail == expected
+                assert fields["result"] == expected
+
+    def test_scalar_fields_only(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps(_result_doc("done", subtype="error_max_turns", num_turns=3), indent=2))
+        fields, text = read_result(path, 100)
+        assert fields == {"type": "result", "subtype": "error_max_turns", "is_error": False, "result": "done", "num_turns": 3}
+        assert text == "done"
+
+    def test_large_result_decodes_only_the_tail(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps(_result_doc("\\n" * 1_000_000 + "DONE")))
+        with pytest.MonkeyPatch.context() as mp:
+            # The full string must never be decoded
+            original = json.loads
+            mp.setattr(json, "loads", lambda s, *a, **k: original(s, *a, **k) if len(s) < 100_000 else pytest.fail("full decode"))
+            _, text = read_result(path, 2000)
+        assert text.endswith("DONE") and len(text) == 2000
+
+    @pytest.mark.parametrize("content", [
+        "plain text output\nDONE\n",
+        '{"type": "assistant", "result": "x"}',
+        '{"type": "result", "result": "x"} trailing',
+        '{"type": "result", "result": "unterminated',
+        '{"type": "result"}\n{"type": "result"}',
+    ])
+    def test_other_content_falls_back_to_the_tail(self, tmp_path, content):
+        path = tmp_path / "stdout.log"
+        path.write_text(content)
+        assert read_result(path, 8) == (None, content[-8:])
+
+    def test_null_result(self, tmp_path):
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps(_result_doc(None, is_error=True)))
+        fields, text = read_result(path, 100)
+        assert fields["result"] is None and fields["is_error"] is True
+        assert text == ""
+
+
+class TestCallers:
+    def test_inference_sees_the_end_of_a_large_result(self, tmp_path):
+        from octopoid.result_handler import infer_result_from_stdout
+
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps(_result_doc("working...\n" * 200_000 + "All tests pass. DONE")))
+        with patch("octopoid.result_handler._call_haiku", return_value="done") as mock_haiku:
+            result = infer_result_from_stdout(path, "implement")
+
+        assert result["outcome"] == "done"
+        prompt = mock_haiku.call_args[0][0]
+        assert "All tests pass. DONE" in prompt
+        assert prompt.count("working...") <= 200
+
+    def test_run_log_summary(self, tmp_path):
+        from octopoid.agent_run_log import _extract_summary
+
+        (tmp_path / "stdout.log").write_text(json.dumps(_result_doc("noise\n" * 100_000 + "a\nb\nProcessed 2 drafts")))
+        assert _extract_summary(tmp_path) == "a | b | Processed 2 drafts"
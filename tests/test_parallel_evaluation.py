@@ -0,0 +1,179 @@
+"""Tests for parallel agent evaluation (scheduler.parallel_evaluation)."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from octopoid.config import DEFAULT_SCHEDULER_CONFIG, get_scheduler_config
+from octopoid.resource_limits import clear_resource_limits, configure_resource_limits, resource_slot
+from octopoid.scheduler import _run_agent_evaluation_loop
+
+
+def _agents(n: int) -> list[dict]:
+    return [{"name": f"agent-{i}", "role": "implement"} for i in range(n)]
+
+
+def _config(parallel: bool, workers: int = 4) -> dict:
+    return {"parallel_evaluation": parallel, "max_workers": workers, "resource_limits": {"git": 1, "api": 4}}
+
+
+class TestGetSchedulerConfig:
+    def test_defaults_when_unset(self):
+        with patch("octopoid.config._load_project_config", return_value={}):
+            config = get_scheduler_config()
+        assert config == DEFAULT_SCHEDULER_CONFIG
+
+    def test_overrides_merge_with_defaults(self):
+        raw = {"scheduler": {"parallel_evaluation": True, "max_workers": 8, "resource_limits": {"git": 3}}}
+        with patch("octopoid.config._load_project_config", return_value=raw):
+            config = get_scheduler_config()
+        assert config["parallel_evaluation"] is True
+        assert config["max_workers"] == 8
+        assert config["resource_limits"] == {"git": 3, "api": 4}
+
+
+class TestResourceSlot:
+    def teardown_method(self):
+        clear_resource_limits()
+
+    def test_caps_concurrent_holders(self):
+        configure_resource_limits({"git": 2})
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with resource_slot("git"):
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak == 2
+
+    def test_unconfigured_resource_is_unbounded(self):
+        with resource_slot("api"):
+            with resource_slot("api"):
+                pass
+
+
+class TestParallelEvaluationLoop:
+    def test_sequential_by_default(self):
+        seen = []
+        with (
+            patch("octopoid.scheduler.get_agents", return_value=_agents(3)),
+            patch("octopoid.scheduler.get_scheduler_config", return_value=_config(False)),
+            patch("octopoid.scheduler._evaluate_and_spawn", side_effect=lambda a, q, s: seen.append(a["name"])),
+        ):
+            _run_agent_evaluation_loop(queue_counts=None)
+        assert seen == ["agent-0", "agent-1", "agent-2"]
+
+    def test_parallel_runs_agents_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        threads = set()
+
+        def evaluate(agent_config, queue_counts, snapshot):
+            barrier.wait()  # only passes if all three run at once
+            threads.add(threading.current_thread().name)
+
+        with (
+            patch("octopoid.scheduler.get_agents", return_value=_agents(3)),
+            patch("octopoid.scheduler.get_scheduler_config", return_value=_config(True)),
+            patch("octopoid.scheduler._evaluate_and_spawn", side_effect=evaluate),
+        ):
+            _run_agent_evaluation_loop(queue_counts={"incoming": 1})
+        assert len(threads) == 3
+
+    def test_worker_failure_does_not_stop_others(self):
+        seen = []
+
+        def evaluate(agent_config, queue_counts, snapshot):
+            if agent_config["name"] == "agent-0":
+                raise RuntimeError("boom")
+            seen.append(agent_config["name"])
+
+        with (
+            patch("octopoid.scheduler.get_agents", return_value=_agents(3)),
+            patch("octopoid.scheduler.get_scheduler_config", return_value=_config(True, workers=2)),
+            patch("octopoid.scheduler._evaluate_and_spawn", side_effect=evaluate),
+        ):
+            _run_agent_evaluation_loop(queue_counts=None)
+        assert sorted(seen) == ["agent-1", "agent-2"]
+
+    def test_skips_job_and_on_demand_agents(self):
+        agents = _agents(1) + [
+            {"name": "job", "role": "analyse", "job_agent": True},
+            {"name": "diag", "role": "diagnose", "on_demand": True},
+        ]
+        seen = []
+        with (
+            patch("octopoid.scheduler.get_agents", return_value=agents),
+            patch("octopoid.scheduler.get_scheduler_config", return_value=_config(True)),
+            patch("octopoid.scheduler._evaluate_and_spawn", side_effect=lambda a, q, s: seen.append(a["name"])),
+        ):
+            _run_agent_evaluation_loop(queue_counts=None)
+        assert seen == ["agent-0"]
+
+
+class TestParallelClaimBackpressure:
+    def test_two_workers_respect_max_claimed(self, tmp_path):
+        """Both workers pass backpressure before either claims; only one may claim."""
+        from octopoid import scheduler
+        from octopoid.tick_snapshot import TickSnapshot
+
+        queues = {"incoming": [{"id": "t1"}, {"id": "t2"}], "claimed": []}
+        queue_lock = threading.Lock()
+
+        class FakeTasks:
+            def list(self, queue=None, **kwargs):
+                with queue_lock:
+                    return [dict(t) for t in queues.get(queue, [])]
+
+        class FakeSdk:
+            tasks = FakeTasks()
+
+        def claim(agent_name, **kwargs):
+            with queue_lock:
+                task = queues["incoming"].pop(0)
+                queues["claimed"].append(task)
+            return dict(task, content="Do the thing")
+
+        both_past_backpressure = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_worker(ctx):
+            both_past_backpressure.wait()
+            return (True, "")
+
+        spawned = []
+        with (
+            patch("octopoid.scheduler.get_agents", return_value=_agents(2)),
+            patch("octopoid.scheduler.get_scheduler_config", return_value=_config(True, workers=2)),
+            patch("octopoid.scheduler.AGENT_GUARDS", [
+                scheduler.guard_backpressure, wait_for_other_worker, scheduler.guard_claim_task,
+            ]),
+            patch("octopoid.scheduler.get_agent_lock_path", side_effect=lambda name: tmp_path / f"{name}.lock"),
+            patch("octopoid.scheduler.get_agent_state_path", side_effect=lambda name: tmp_path / f"{name}.json"),
+            patch("octopoid.scheduler.count_running_instances", return_value=0),
+            patch("octopoid.scheduler.get_active_task_ids", return_value=set()),
+            patch("octopoid.scheduler.claim_and_prepare_task", side_effect=claim),
+            patch("octopoid.scheduler._spawn_agent", side_effect=lambda ctx: spawned.append(ctx.claimed_task["id"])),
+            patch("octopoid.backpressure.get_scope", return_value=None),
+            patch("octopoid.backpressure.get_queue_limits", return_value={
+                "max_incoming": 20, "max_claimed": 1, "max_provisional": 10,
+            }),
+        ):
+            _run_agent_evaluation_loop(
+                queue_counts={"incoming": 2, "provisional": 0},
+                snapshot=TickSnapshot(sdk=FakeSdk()),
+            )
+
+        assert len(queues["claimed"]) == 1
+        assert len(spawned) == 1
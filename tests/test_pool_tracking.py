@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from octopoid.pool import (
+    PidRegistry,
     cleanup_dead_pids,
     count_running_instances,
     find_pid_for_task,
@@ -16,6 +17,7 @@ from octopoid.pool import (
     register_instance_pid,
     remove_pid_from_blueprint,
     save_blueprint_pids,
+    tick_pid_registry,
 )
 
 
@@ -377,3 +379,92 @@ class TestRemovePidFromBlueprint:
         remove_pid_from_blueprint("implementer", 9999, reason="test")
         remaining = load_blueprint_pids("implementer")
         assert 5678 in remaining
+
+
+# ---------------------------------------------------------------------------
+# PidRegistry / tick_pid_registry
+# ---------------------------------------------------------------------------
+
+
+def _info(task_id: str, instance: str = "i-1") -> dict:
+    return {"task_id": task_id, "started_at": "t", "instance_name": instance}
+
+
+class TestPidRegistry:
+    def test_load_indexes_alive_pids_only(self, agents_runtime_dir):
+        save_blueprint_pids("implementer", {111: _info("TASK-a"), 222: _info("TASK-b", "i-2")})
+        save_blueprint_pids("gatekeeper", {333: _info("TASK-c")})
+
+        with patch("octopoid.pool._snapshot_alive_pids", return_value={111, 333}):
+            registry = PidRegistry.load()
+
+        assert registry.count_running("implementer") == 1
+        assert registry.active_task_ids("implementer") == {"TASK-a"}
+        assert registry.find_pid_for_task("TASK-c") == (333, "gatekeeper")
+        assert registry.find_pid_for_task("TASK-b") is None
+        assert registry.count_running("missing") == 0
+
+    def test_snapshot_uses_single_proc_listing(self):
+        with (
+            patch("octopoid.pool.os.listdir", return_value=["1", "42", "self"]) as listdir,
+            patch("octopoid.pool.os.kill") as kill,
+        ):
+            from octopoid.pool import _snapshot_alive_pids
+            assert _snapshot_alive_pids({42, 99}) == {42}
+        listdir.assert_called_once_with("/proc")
+        kill.assert_not_called()
+
+    def test_snapshot_falls_back_to_kill_without_proc(self):
+        with (
+            patch("octopoid.pool.os.listdir", side_effect=FileNotFoundError),
+            patch("octopoid.pool.os.kill", return_value=None),
+        ):
+            from octopoid.pool import _snapshot_alive_pids
+            assert _snapshot_alive_pids({42}) == {42}
+
+    def test_unchanged_save_does_not_write(self, agents_runtime_dir):
+        save_blueprint_pids("implementer", {111: _info("TASK-a")})
+
+        with patch("octopoid.pool._snapshot_alive_pids", return_value={111}):
+            with tick_pid_registry() as registry:
+                pids = load_blueprint_pids("implementer")
+                save_blueprint_pids("implementer", pids)
+                remove_pid_from_blueprint("implementer", 999)
+
+        assert registry.writes == 0
+
+    def test_writes_go_to_disk_and_update_index(self, agents_runtime_dir):
+        save_blueprint_pids("implementer", {111: _info("TASK-a")})
+
+        with patch("octopoid.pool._snapshot_alive_pids", return_value={111}):
+            with tick_pid_registry() as registry:
+                register_instance_pid("implementer", 222, "TASK-b", "i-2")
+                assert count_running_instances("implementer") == 2
+                assert find_pid_for_task("TASK-b") == (222, "implementer")
+
+                remove_pid_from_blueprint("implementer", 111, reason="test")
+                assert find_pid_for_task("TASK-a") is None
+
+        assert registry.writes == 2
+        assert set(load_blueprint_pids("implementer")) == {222}
+
+    def test_in_place_info_mutation_is_detected(self, agents_runtime_dir):
+        save_blueprint_pids("implementer", {111: _info("TASK-a")})
+
+        with patch("octopoid.pool._snapshot_alive_pids", return_value={111}):
+            with tick_pid_registry() as registry:
+                pids = load_blueprint_pids("implementer")
+                pids[111]["task_id"] = "TASK-z"
+                save_blueprint_pids("implementer", pids)
+
+        assert registry.writes == 1
+        assert load_blueprint_pids("implementer")[111]["task_id"] == "TASK-z"
+
+    def test_nested_scopes_share_registry_and_exit_clears_it(self, agents_runtime_dir):
+        from octopoid.pool import get_active_registry
+
+        with tick_pid_registry() as outer:
+            with tick_pid_registry() as inner:
+                assert inner is outer
+            assert get_active_registry() is outer
+        assert get_active_registry() is None
@@ -491,7 +491,7 @@ class TestGetQueueStatus:
 
     def test_get_queue_status(self, mock_config, sample_task_file, mock_sdk_for_unit_tests):
         """Test getting queue status via SDK."""
-        def mock_list_tasks(queue=None):
+        def mock_list_tasks(queue=None, fields=None):
             if queue == "incoming":
                 return [{"id": "abc12345", "title": "Task 1", "priority": "P1"}]
             return []
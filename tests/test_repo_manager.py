@@ -112,6 +112,28 @@ class TestPushBranch:
         )
 
 
+class TestPushHead:
+    def test_pushes_head_without_checkout(self, repo):
+        """push_head pushes HEAD to the branch ref and runs no other git command."""
+        with patch("octopoid.repo_manager.current_branch", return_value="HEAD"), \
+             patch.object(repo, "_run_git") as mock_git:
+            mock_git.return_value = make_completed()
+
+            branch = repo.push_head("agent/task-1")
+
+        assert branch == "agent/task-1"
+        mock_git.assert_called_once_with(["push", "origin", "HEAD:refs/heads/agent/task-1"])
+
+    def test_other_named_branch_raises(self, repo):
+        """push_head refuses to push a different named branch."""
+        with patch("octopoid.repo_manager.current_branch", return_value="feature/other"), \
+             patch.object(repo, "_run_git") as mock_git:
+            with pytest.raises(RuntimeError, match="expected 'agent/task-1'"):
+                repo.push_head("agent/task-1")
+
+        mock_git.assert_not_called()
+
+
 class TestRebaseOnBase:
     def test_success(self, repo):
         """Successful rebase returns SUCCESS."""
@@ -7,6 +7,7 @@ Tests cover:
 - _infer_fixer routes correctly based on haiku response
 - infer_result_from_stdout dispatches by agent_role
 - infer_result_from_stdout reads only the last 2000 chars (tail)
+- log_tail.read_result parses Claude JSON output (--output-format json)
 - Haiku exceptions are caught and return unknown/failure dicts
 """
 
@@ -508,69 +509,80 @@ class TestJsonStdoutParsing:
 
 
 # =============================================================================
-# _parse_json_stdout — unit tests
+# log_tail.read_result — parsing of Claude JSON output for inference
 # =============================================================================
 
 
-class TestParseJsonStdout:
-    """_parse_json_stdout correctly identifies and parses Claude JSON output."""
+class TestReadResult:
+    """read_result correctly identifies and parses Claude JSON output."""
 
-    def test_valid_json_result_object_parsed(self):
-        """Valid Claude JSON result object returns (parsed, result_text)."""
+    def test_valid_json_result_object_parsed(self, tmp_path):
+        """Valid Claude JSON result object returns (fields, result_text)."""
         import json
-        from octopoid.result_handler import _parse_json_stdout
+        from octopoid.log_tail import read_result
 
-        payload = json.dumps({
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps({
             "type": "result",
             "subtype": "success",
             "is_error": False,
             "result": "All done!",
-        })
+        }))
 
-        parsed, text = _parse_json_stdout(payload)
+        parsed, text = read_result(path)
 
         assert parsed is not None
         assert parsed["subtype"] == "success"
         assert text == "All done!"
 
-    def test_plain_text_returns_none(self):
+    def test_plain_text_returns_none(self, tmp_path):
         """Plain-text stdout returns (None, original_text)."""
-        from octopoid.result_handler import _parse_json_stdout
+        from octopoid.log_tail import read_result
+
+        path = tmp_path / "stdout.log"
+        path.write_text("Finished the task.")
 
-        plain = "Finished the task."
-        parsed, text = _parse_json_stdout(plain)
+        parsed, text = read_result(path)
 
         assert parsed is None
-        assert text == plain
+        assert text == "Finished the task."
 
-    def test_invalid_json_returns_none(self):
+    def test_invalid_json_returns_none(self, tmp_path):
         """Malformed JSON returns (None, original_text)."""
-        from octopoid.result_handler import _parse_json_stdout
+        from octopoid.log_tail import read_result
 
         bad = '{"type": "result", broken'
-        parsed, text = _parse_json_stdout(bad)
+        path = tmp_path / "stdout.log"
+        path.write_text(bad)
+
+        parsed, text = read_result(path)
 
         assert parsed is None
         assert text == bad
 
-    def test_json_without_type_result_returns_none(self):
+    def test_json_without_type_result_returns_none(self, tmp_path):
         """JSON that is not a Claude result object returns (None, original_text)."""
         import json
-        from octopoid.result_handler import _parse_json_stdout
+        from octopoid.log_tail import read_result
 
         other_json = json.dumps({"foo": "bar"})
-        parsed, text = _parse_json_stdout(other_json)
+        path = tmp_path / "stdout.log"
+        path.write_text(other_json)
+
+        parsed, text = read_result(path)
 
         assert parsed is None
         assert text == other_json
 
-    def test_empty_result_field_returns_empty_string(self):
+    def test_empty_result_field_returns_empty_string(self, tmp_path):
         """JSON with missing result field yields empty string for text."""
         import json
-        from octopoid.result_handler import _parse_json_stdout
+        from octopoid.log_tail import read_result
+
+        path = tmp_path / "stdout.log"
+        path.write_text(json.dumps({"type": "result", "subtype": "error_max_turns_exceeded"}))
 
-        payload = json.dumps({"type": "result", "subtype": "error_max_turns_exceeded"})
-        parsed, text = _parse_json_stdout(payload)
+        parsed, text = read_result(path)
 
         assert parsed is not None
         assert text == ""
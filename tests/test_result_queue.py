@@ -0,0 +1,270 @@
+"""Tests for background result handling (octopoid/result_queue.py).
+
+Uses real running_pids.json files and a real queue file under tmp_path; the
+result handler is a stub that records its calls.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from octopoid import result_queue
+from octopoid.housekeeping import check_and_update_finished_agents
+from octopoid.lock_utils import locked
+from octopoid.result_queue import DONE, PENDING, RUNNING, ResultQueue, ResultWorkers, entry_key
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def env(tmp_path):
+    """An implementer with one dead PID working on TASK-1."""
+    agents_dir = tmp_path / "agents"
+    (agents_dir / "implementer").mkdir(parents=True)
+    (agents_dir / "implementer" / "running_pids.json").write_text(json.dumps({
+        "101": {"task_id": "TASK-1", "instance_name": "implementer-1"},
+    }))
+    tasks_dir = tmp_path / "tasks"
+    (tasks_dir / "TASK-1").mkdir(parents=True)
+
+    with (
+        patch("octopoid.housekeeping.get_agents_runtime_dir", return_value=agents_dir),
+        patch("octopoid.pool.get_agents_runtime_dir", return_value=agents_dir),
+        patch("octopoid.housekeeping.get_tasks_dir", return_value=tasks_dir),
+        patch("octopoid.config.get_tasks_dir", return_value=tasks_dir),
+        patch("octopoid.config.get_logs_dir", return_value=tmp_path / "logs"),
+        patch("octopoid.housekeeping.get_agents", return_value=[]),
+        patch("octopoid.housekeeping.is_process_running", return_value=False),
+    ):
+        yield {"agents_dir": agents_dir, "tasks_dir": tasks_dir, "queue": ResultQueue(tmp_path / "result_queue.json")}
+
+
+def _tracked(env) -> dict:
+    return json.loads((env["agents_dir"] / "implementer" / "running_pids.json").read_text())
+
+
+@pytest.fixture
+def start_workers(env):
+    """Install a worker pool over env's queue with the given handler."""
+    pools = []
+
+    def start(handler, size=2):
+        workers = ResultWorkers(size, handler, queue=env["queue"])
+        workers.start()
+        result_queue._workers = workers
+        pools.append(workers)
+        return workers
+
+    yield start
+    result_queue._workers = None
+    for workers in pools:
+        workers.stop()
+
+
+class TestResultQueue:
+    def test_add_claim_and_update(self, tmp_path):
+        queue = ResultQueue(tmp_path / "q.json")
+        assert queue.add("implementer", 7, {"task_id": "T", "instance_name": "implementer-1"}, "incoming")
+        assert not queue.add("implementer", 7, {"task_id": "T"}, "incoming")
+
+        entry = queue.claim(entry_key("implementer", 7))
+        assert entry["status"] == RUNNING and entry["attempts"] == 1
+        assert queue.claim(entry_key("implementer", 7)) is None
+
+        queue.update(entry_key("implementer", 7), status=DONE)
+        assert ResultQueue(tmp_path / "q.json").entries()["implementer:7"]["status"] == DONE
+
+    def test_recover_and_retain(self, tmp_path):
+        queue = ResultQueue(tmp_path / "q.json")
+        queue.add("implementer", 1, {"task_id": "A"}, "incoming")
+        queue.add("implementer", 2, {"task_id": "B"}, "incoming")
+        queue.claim("implementer:1")
+
+        assert queue.recover() == ["implementer:1"]
+        assert queue.entries()["implementer:1"]["status"] == PENDING
+        assert queue.retain({"implementer:2"}) == ["implementer:1"]
+        assert list(queue.entries()) == ["implementer:2"]
+
+
+class TestBackgroundHandling:
+    def test_tick_queues_without_waiting_for_the_handler(self, env, start_workers):
+        release = threading.Event()
+        handler = MagicMock(side_effect=lambda *args: release.wait(5))
+        workers = start_workers(handler)
+
+        started = time.monotonic()
+        check_and_update_finished_agents()
+        assert time.monotonic() - started < 1
+
+        _wait_for(lambda: handler.called)
+        handler.assert_called_once_with("implementer", "incoming", "TASK-1", "implementer-1", env["tasks_dir"] / "TASK-1")
+        # A second tick while the handler runs neither re-runs nor reaps it
+        check_and_update_finished_agents()
+        assert "101" in _tracked(env)
+        assert handler.call_count == 1
+
+        release.set()
+        _wait_for(lambda: env["queue"].entries()["implementer:101"]["status"] == DONE)
+        assert workers.take_finished() == [101]
+
+        check_and_update_finished_agents(only_pids={101})
+        assert _tracked(env) == {}
+        assert env["queue"].entries() == {}
+
+    def test_untransitioned_result_is_retried(self, env, start_workers):
+        handler = MagicMock(side_effect=[False, RuntimeError("push failed"), True])
+        start_workers(handler)
+        key = "implementer:101"
+
+        for attempts in (1, 2):
+            check_and_update_finished_agents()
+            _wait_for(lambda: env["queue"].entries()[key]["attempts"] == attempts
+                      and env["queue"].entries()[key]["status"] == PENDING)
+        assert env["queue"].entries()[key]["error"] == "push failed"
+        assert "101" in _tracked(env)
+
+        check_and_update_finished_agents()
+        _wait_for(lambda: env["queue"].entries()[key]["status"] == DONE)
+        check_and_update_finished_agents()
+        assert _tracked(env) == {}
+
+    def test_step_progress_is_recorded(self, env, start_workers):
+        task_dir = env["tasks_dir"] / "TASK-1"
+
+        def handler(*args):
+            (task_dir / "step_progress.json").write_text(json.dumps({"completed": ["push_branch"], "failed": "create_pr"}))
+            return False
+
+        start_workers(handler)
+        check_and_update_finished_agents()
+        _wait_for(lambda: env["queue"].entries()["implementer:101"]["steps"] is not None)
+
+        assert env["queue"].entries()["implementer:101"]["steps"] == {"completed": ["push_branch"], "failed": "create_pr"}
+
+    def test_locked_task_is_left_for_later(self, env, start_workers):
+        handler = MagicMock(return_value=True)
+        workers = start_workers(handler)
+        lock_path = result_queue.task_lock_path(env["tasks_dir"] / "TASK-1")
+
+        with locked(lock_path) as acquired:
+            assert acquired
+            check_and_update_finished_agents()
+            _wait_for(lambda: not workers.in_flight())
+            handler.assert_not_called()
+            assert env["queue"].entries()["implementer:101"]["status"] == PENDING
+
+        check_and_update_finished_agents()
+        _wait_for(lambda: handler.called)
+
+
+class TestBatchedInference:
+    @pytest.fixture
+    def two_finished(self, env):
+        (env["agents_dir"] / "implementer" / "running_pids.json").write_text(json.dumps({
+            "101": {"task_id": "TASK-1", "instance_name": "implementer-1"},
+            "102": {"task_id": "TASK-2", "instance_name": "implementer-2"},
+        }))
+        (env["tasks_dir"] / "TASK-2").mkdir()
+        return env
+
+    def test_workers_prepare_the_group_before_handling_it(self, two_finished, start_workers):
+        calls = []
+        handler = MagicMock(side_effect=lambda *args: calls.append(args[2]) or True)
+        workers = start_workers(handler)
+        workers.prepare = lambda entries: calls.append(sorted(e["task_id"] for e in entries))
+
+        check_and_update_finished_agents()
+        _wait_for(lambda: len(calls) == 3)
+
+        assert calls[0] == ["TASK-1", "TASK-2"]
+        assert sorted(calls[1:]) == ["TASK-1", "TASK-2"]
+
+    def test_inline_sweep_classifies_all_finishers_first(self, two_finished):
+        with (
+            patch("octopoid.housekeeping.prefetch_outcomes") as mock_prefetch,
+            patch("octopoid.housekeeping.handle_agent_result", return_value=True) as mock_handle,
+        ):
+            check_and_update_finished_agents()
+
+        tasks_dir = two_finished["tasks_dir"]
+        mock_prefetch.assert_called_once_with([
+            ("TASK-1", tasks_dir / "TASK-1", "implement"),
+            ("TASK-2", tasks_dir / "TASK-2", "implement"),
+        ])
+        assert mock_handle.call_count == 2
+
+
+class TestRestart:
+    def test_running_entry_is_resumed(self, env, start_workers):
+        queue = env["queue"]
+        queue.add("implementer", 101, {"task_id": "TASK-1", "instance_name": "implementer-1"}, "incoming")
+        queue.claim("implementer:101")
+        handler = MagicMock(return_value=True)
+
+        start_workers(handler)
+        assert queue.entries()["implementer:101"]["status"] == PENDING
+        check_and_update_finished_agents()
+
+        _wait_for(lambda: queue.entries()["implementer:101"]["status"] == DONE)
+        assert queue.entries()["implementer:101"]["attempts"] == 2
+        handler.assert_called_once()
+
+    def test_done_entry_is_reaped_without_handling_again(self, env, start_workers):
+        queue = env["queue"]
+        queue.add("implementer", 101, {"task_id": "TASK-1"}, "incoming")
+        queue.update("implementer:101", status=DONE)
+        handler = MagicMock(return_value=True)
+
+        start_workers(handler)
+        check_and_update_finished_agents()
+
+        handler.assert_not_called()
+        assert _tracked(env) == {}
+        assert queue.entries() == {}
+
+
+class TestInline:
+    def test_without_workers_the_tick_handles_results(self, env):
+        with patch("octopoid.housekeeping.handle_agent_result", return_value=True) as mock_handle:
+            check_and_update_finished_agents()
+
+        mock_handle.assert_called_once()
+        assert _tracked(env) == {}
+        assert not env["queue"].path.exists()
+
+    def test_inline_skips_a_task_being_handled_elsewhere(self, env):
+        lock_path = result_queue.task_lock_path(env["tasks_dir"] / "TASK-1")
+        with (
+            locked(lock_path),
+            patch("octopoid.housekeeping.handle_agent_result", return_value=True) as mock_handle,
+        ):
+            check_and_update_finished_agents()
+
+        mock_handle.assert_not_called()
+        assert "101" in _tracked(env)
+
+
+class TestDaemonWakeup:
+    def test_finished_results_wake_the_daemon(self):
+        from octopoid.scheduler import _sleep_until_next_tick
+
+        workers = MagicMock()
+        workers.take_finished.return_value = [101]
+        watcher = MagicMock()
+        watcher.wait.return_value = []
+        with (
+            patch("octopoid.result_queue._workers", workers),
+            patch("octopoid.scheduler._handle_exited_agents") as mock_handle,
+        ):
+            _sleep_until_next_tick(watcher, threading.Event(), 30, {})
+
+        mock_handle.assert_called_once_with([101], {})
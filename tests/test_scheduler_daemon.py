@@ -0,0 +1,123 @@
+"""Tests for the long-lived scheduler daemon mode (run_scheduler_daemon)."""
+
+import threading
+from unittest.mock import patch
+
+from octopoid.scheduler import _FileWatcher, run_scheduler_daemon
+
+
+class TestFileWatcher:
+    def test_unchanged_files_report_no_change(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("scope: a\n")
+        watcher = _FileWatcher([path])
+        assert watcher.changed() is False
+
+    def test_detects_modification_and_creation(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        missing = tmp_path / ".api_key"
+        path.write_text("scope: a\n")
+        watcher = _FileWatcher([path, missing])
+
+        path.write_text("scope: abc\n")
+        assert watcher.changed() is True
+        assert watcher.changed() is False
+
+        missing.write_text("oct_key\n")
+        assert watcher.changed() is True
+
+
+class TestRunSchedulerDaemon:
+    def _run(self, tmp_path, ticks, on_tick=None, next_due=0.0):
+        stop = threading.Event()
+        states = []
+
+        def fake_tick(state):
+            states.append(state)
+            if on_tick:
+                on_tick(len(states))
+            if len(states) >= ticks:
+                stop.set()
+
+        with (
+            patch("octopoid.scheduler.get_orchestrator_dir", return_value=tmp_path),
+            patch("octopoid.scheduler.load_scheduler_state", return_value={"jobs": {}}) as mock_load,
+            patch("octopoid.scheduler.run_scheduler", side_effect=fake_tick),
+            patch("octopoid.jobs.seconds_until_next_job", return_value=next_due),
+            patch("octopoid.sdk.reset_sdk") as mock_reset,
+            patch("octopoid.scheduler._watch_tracked_pids"),
+            patch("octopoid.status_api.get_socket_path", return_value=tmp_path / "scheduler.sock"),
+            patch("octopoid.result_queue.get_queue_path", return_value=tmp_path / "result_queue.json"),
+        ):
+            run_scheduler_daemon(tick_seconds=0.01, stop_event=stop)
+        return states, mock_load, mock_reset
+
+    def test_reuses_in_memory_state_across_ticks(self, tmp_path):
+        states, mock_load, _ = self._run(tmp_path, ticks=3)
+        assert len(states) == 3
+        assert all(s is states[0] for s in states)
+        mock_load.assert_called_once()
+
+    def test_tick_exception_does_not_stop_daemon(self, tmp_path):
+        def explode(n):
+            if n == 1:
+                raise RuntimeError("boom")
+
+        states, _, _ = self._run(tmp_path, ticks=2, on_tick=explode)
+        assert len(states) == 2
+
+    def test_config_change_resets_sdk(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        config.write_text("scope: a\n")
+
+        def edit_config(n):
+            if n == 1:
+                config.write_text("scope: changed\n")
+
+        _, _, mock_reset = self._run(tmp_path, ticks=2, on_tick=edit_config)
+        mock_reset.assert_called_once()
+
+    def test_serves_status_api_while_running(self, tmp_path):
+        from octopoid import status_api
+
+        socket_path = tmp_path / "scheduler.sock"
+        answers = []
+
+        def ask(n):
+            answers.append(status_api.query("status", path=socket_path))
+
+        self._run(tmp_path, ticks=1, on_tick=ask)
+
+        assert answers and answers[0]["pid"] > 0
+        assert not socket_path.exists()
+
+    def test_runs_result_workers_while_running(self, tmp_path):
+        from octopoid import result_queue
+
+        seen = []
+        self._run(tmp_path, ticks=1, on_tick=lambda n: seen.append(result_queue.get_result_workers()))
+
+        assert seen[0] is not None and seen[0].size == 2
+        assert result_queue.get_result_workers() is None
+
+
+class TestInvokeClaude:
+    def test_log_files_are_closed_after_spawn(self, tmp_path):
+        from octopoid.scheduler import invoke_claude
+
+        (tmp_path / "worktree").mkdir()
+        (tmp_path / "prompt.md").write_text("do the task")
+        handed_to_child = []
+
+        def fake_popen(cmd, stdout, stderr, **kwargs):
+            handed_to_child.extend([stdout, stderr])
+            return type("Proc", (), {"pid": 4321})()
+
+        with (
+            patch("octopoid.scheduler.subprocess.Popen", side_effect=fake_popen),
+            patch("octopoid.scheduler.watch_pid"),
+        ):
+            assert invoke_claude(tmp_path, {}) == 4321
+
+        assert len(handed_to_child) == 2
+        assert all(f.closed for f in handed_to_child)
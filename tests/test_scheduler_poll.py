@@ -48,7 +48,7 @@ class TestCanClaimTaskWithQueueCounts:
         with patch("octopoid.backpressure.count_queue", return_value=0) as mock_count:
             result, reason = can_claim_task(queue_counts=queue_counts)
         # claimed is always re-fetched via count_queue for scope filtering (GH-227)
-        mock_count.assert_called_once_with("claimed")
+        mock_count.assert_called_once_with("claimed", snapshot=None)
         assert result is True
 
     def test_queue_counts_empty_incoming_blocked(self):
@@ -126,7 +126,7 @@ class TestGuardBackpressureWithQueueCounts:
         with patch("octopoid.backpressure.count_queue", return_value=0) as mock_count:
             proceed, reason = guard_backpressure(ctx)
         # claimed is always re-fetched for scope filtering (GH-227); incoming uses poll data
-        mock_count.assert_called_once_with("claimed")
+        mock_count.assert_called_once_with("claimed", snapshot=None)
         assert proceed is True
 
     def test_incoming_queue_counts_empty_returns_false(self, tmp_path):
@@ -201,7 +201,7 @@ class TestCanClaimTaskScopeIsolation:
 
         assert can_proceed is True
         # count_queue should have been called for "claimed" (and never uses poll's claimed=5)
-        mock_count.assert_called_once_with("claimed")
+        mock_count.assert_called_once_with("claimed", snapshot=None)
 
     def test_can_claim_blocked_when_scoped_claimed_at_limit(self) -> None:
         """can_claim_task() is blocked when scope-filtered claimed tasks hit the limit."""
@@ -0,0 +1,217 @@
+"""Tests for the opt-in response cache and request coalescing in OctopoidSDK."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from octopoid_sdk import OctopoidSDK
+from octopoid_sdk.cache import ResponseCache, resource_of, resources_of
+
+
+def _sdk(**kwargs) -> OctopoidSDK:
+    sdk = OctopoidSDK(server_url="http://example.com", **kwargs)
+    sdk._send = MagicMock(side_effect=lambda method, path, params, json: {"path": path, "n": sdk._send.call_count})
+    return sdk
+
+
+class TestResourceOf:
+    @pytest.mark.parametrize("path,resource", [
+        ("/api/v1/tasks", "tasks"),
+        ("/api/v1/tasks/abc/claim", "tasks"),
+        ("/api/v1/scheduler/poll", "scheduler"),
+        ("/api/health", "health"),
+    ])
+    def test_resource(self, path, resource):
+        assert resource_of(path) == resource
+
+    @pytest.mark.parametrize("path,resources", [
+        ("/api/v1/tasks", {"tasks"}),
+        ("/api/v1/tasks/abc", {"tasks"}),
+        ("/api/v1/projects/P1/tasks", {"projects", "tasks"}),
+        ("/api/health", {"health"}),
+    ])
+    def test_resources(self, path, resources):
+        assert resources_of(path) == resources
+
+
+class TestResponseCache:
+    def test_disabled_by_default(self):
+        sdk = _sdk()
+        sdk.tasks.list(queue="done")
+        sdk.tasks.list(queue="done")
+        assert sdk._send.call_count == 2
+        assert sdk.cache_stats()["misses"] == 0
+
+    def test_repeated_get_served_from_cache(self):
+        sdk = _sdk(cache_ttl=60)
+        first = sdk._request("GET", "/api/v1/tasks", params={"queue": "done"})
+        second = sdk._request("GET", "/api/v1/tasks", params={"queue": "done"})
+
+        assert first == second
+        assert sdk._send.call_count == 1
+        assert sdk.cache_stats()["hits"] == 1
+        assert sdk.cache_stats()["misses"] == 1
+
+    def test_params_are_part_of_the_key(self):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/tasks", params={"queue": "done"})
+        sdk._request("GET", "/api/v1/tasks", params={"queue": "failed"})
+        assert sdk._send.call_count == 2
+
+    def test_entries_expire(self):
+        sdk = _sdk(cache_ttl=60)
+        with patch("octopoid_sdk.cache.time.monotonic", return_value=1000.0):
+            sdk._request("GET", "/api/v1/flows")
+        with patch("octopoid_sdk.cache.time.monotonic", return_value=1061.0):
+            sdk._request("GET", "/api/v1/flows")
+        assert sdk._send.call_count == 2
+
+    def test_callers_get_independent_copies(self):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/flows")["path"] = "mutated"
+        assert sdk._request("GET", "/api/v1/flows")["path"] == "/api/v1/flows"
+
+    def test_mutation_invalidates_resource_and_poll(self):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/tasks", params={"queue": "done"})
+        sdk._request("GET", "/api/v1/scheduler/poll")
+        sdk._request("GET", "/api/v1/flows")
+
+        sdk._request("PATCH", "/api/v1/tasks/abc", json={"priority": "P0"})
+        sdk._send.reset_mock()
+        sdk._request("GET", "/api/v1/tasks", params={"queue": "done"})
+        sdk._request("GET", "/api/v1/scheduler/poll")
+        sdk._request("GET", "/api/v1/flows")
+
+        called = [c.args[1] for c in sdk._send.call_args_list]
+        assert called == ["/api/v1/tasks", "/api/v1/scheduler/poll"]
+        assert sdk.cache_stats()["invalidations"] == 1
+
+    @pytest.mark.parametrize("method,path", [
+        ("PATCH", "/api/v1/tasks/abc"),
+        ("POST", "/api/v1/tasks/claim"),
+        ("POST", "/api/v1/tasks/abc/submit"),
+    ])
+    def test_task_mutation_invalidates_nested_project_tasks(self, method, path):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/projects/P1/tasks")
+        sdk._request("GET", "/api/v1/projects/P1")
+
+        sdk._request(method, path, json={})
+        sdk._send.reset_mock()
+        sdk._request("GET", "/api/v1/projects/P1/tasks")
+        sdk._request("GET", "/api/v1/projects/P1")
+
+        # Only the listing that names the tasks collection is refetched
+        assert [c.args[1] for c in sdk._send.call_args_list] == ["/api/v1/projects/P1/tasks"]
+
+    def test_failed_mutation_still_invalidates(self):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/tasks")
+        sdk._send.side_effect = RuntimeError("500")
+        with pytest.raises(RuntimeError):
+            sdk._request("POST", "/api/v1/tasks/abc/submit", json={})
+        assert sdk.cache_stats()["entries"] == 0
+
+    def test_errors_are_not_cached(self):
+        cache = ResponseCache(ttl=60)
+        with pytest.raises(RuntimeError):
+            cache.get("/api/v1/tasks", None, MagicMock(side_effect=RuntimeError("boom")))
+        assert cache.get("/api/v1/tasks", None, lambda: [1]) == [1]
+
+    def test_get_in_flight_during_invalidation_is_not_stored(self):
+        cache = ResponseCache(ttl=60)
+
+        def fetch():
+            cache.invalidate("/api/v1/tasks/abc")
+            return ["stale"]
+
+        assert cache.get("/api/v1/tasks", None, fetch) == ["stale"]
+        assert cache.stats()["entries"] == 0
+
+    def test_clear_cache(self):
+        sdk = _sdk(cache_ttl=60)
+        sdk._request("GET", "/api/v1/flows")
+        sdk.clear_cache()
+        sdk._request("GET", "/api/v1/flows")
+        assert sdk._send.call_count == 2
+
+    def test_negative_ttl_rejected(self):
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=-1)
+
+
+class TestCoalescing:
+    def test_concurrent_identical_gets_share_one_request(self):
+        cache = ResponseCache(coalesce=True)
+        release = threading.Event()
+        fetch = MagicMock(side_effect=lambda: release.wait(5) and {"ok": True})
+        results = []
+
+        def call():
+            results.append(cache.get("/api/v1/scheduler/poll", {"orchestrator_id": "o"}, fetch))
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for t in threads:
+            t.start()
+        deadline = time.monotonic() + 5
+        while cache.stats()["coalesced"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert fetch.call_count == 1
+        assert results == [{"ok": True}] * 5
+        assert cache.stats()["coalesced"] == 4
+        # Coalescing alone does not keep the response around
+        assert cache.stats()["entries"] == 0
+
+    def test_leader_error_reaches_waiters(self):
+        cache = ResponseCache(coalesce=True)
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("down")
+
+        def call(fn):
+            try:
+                cache.get("/api/v1/tasks", None, fn)
+            except RuntimeError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call, args=(fetch,))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call, args=(MagicMock(),))
+        follower.start()
+        deadline = time.monotonic() + 5
+        while cache.stats()["coalesced"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert len(errors) == 2
+
+
+class TestGetSdkCacheOptions:
+    def test_off_by_default(self, monkeypatch):
+        from octopoid.sdk import _cache_options
+        monkeypatch.delenv("OCTOPOID_SDK_CACHE_TTL", raising=False)
+        assert _cache_options({}) == {"cache_ttl": 0.0, "coalesce": False}
+
+    def test_config_values(self, monkeypatch):
+        from octopoid.sdk import _cache_options
+        monkeypatch.delenv("OCTOPOID_SDK_CACHE_TTL", raising=False)
+        assert _cache_options({"cache_ttl": 2, "coalesce": True}) == {"cache_ttl": 2.0, "coalesce": True}
+
+    def test_env_overrides_config(self, monkeypatch):
+        from octopoid.sdk import _cache_options
+        monkeypatch.setenv("OCTOPOID_SDK_CACHE_TTL", "1.5")
+        assert _cache_options({"cache_ttl": 10}) == {"cache_ttl": 1.5, "coalesce": True}
@@ -0,0 +1,201 @@
+"""Tests for the scheduler daemon's local status API (octopoid/status_api.py)."""
+
+import json
+import time
+from argparse import Namespace
+from unittest.mock import patch
+
+import pytest
+
+from octopoid import status_api, task_mirror
+from octopoid.status_api import StatusServer, StatusUnavailable, handle_request, query, try_query
+
+
+def _sync_mirror(*tasks):
+    task_mirror._mirror.apply_poll({"cursor": "1", "full_sync": True, "changed_tasks": list(tasks)})
+
+
+@pytest.fixture(autouse=True)
+def reset_status_state(monkeypatch):
+    monkeypatch.setattr(status_api, "_state", {
+        "started_at": None, "ticks": 0, "last_tick": None,
+        "poll": None, "api_metrics": {}, "scheduler_state": {},
+    })
+    monkeypatch.setattr(status_api, "_report_cache", None)
+    monkeypatch.setattr(status_api, "_report_requested_at", None)
+
+
+@pytest.fixture
+def server(tmp_path):
+    srv = StatusServer(tmp_path / "s.sock")
+    srv.start()
+    yield srv
+    srv.stop()
+
+
+class TestHandleRequest:
+    def test_unknown_method(self):
+        assert handle_request({"method": "delete"}) == {"ok": False, "error": "unknown method: delete"}
+        assert handle_request(["tasks"])["ok"] is False
+
+    def test_tasks_need_a_synced_mirror(self):
+        assert handle_request({"method": "tasks"}) == {"ok": False, "error": "task mirror not synced"}
+
+    def test_tasks_by_queue(self):
+        _sync_mirror(
+            {"id": "a", "queue": "incoming", "created_at": "1"},
+            {"id": "b", "queue": "claimed", "created_at": "2"},
+            {"id": "c", "queue": "done", "created_at": "3"},
+        )
+        response = handle_request({"method": "tasks", "params": {"queue": "incoming,claimed"}})
+        assert [t["id"] for t in response["result"]] == ["a", "b"]
+        assert len(handle_request({"method": "tasks"})["result"]) == 3
+
+    def test_poll_is_published_by_tick(self):
+        assert handle_request({"method": "poll"})["ok"] is False
+
+        status_api.publish_tick({"jobs": {}}, {"queue_counts": {"incoming": 2}, "mirror_synced": True})
+
+        assert handle_request({"method": "poll"})["result"] == {"queue_counts": {"incoming": 2}}
+        assert handle_request({"method": "status"})["result"]["ticks"] == 1
+
+    def test_jobs_schedule(self):
+        status_api.publish_tick({"jobs": {"heartbeat": "2000-01-01T00:00:00"}}, None)
+        jobs = [{"name": "heartbeat", "interval": 30, "group": "remote"}, {"name": "sweep", "interval": 600}]
+        with patch("octopoid.jobs.load_jobs_yaml", return_value=jobs):
+            result = handle_request({"method": "jobs"})["result"]
+
+        assert result[0]["last_run"] == "2000-01-01T00:00:00" and result[0]["due_in"] == 0.0
+        assert result[1]["last_run"] is None
+
+    def test_pids_per_blueprint(self, tmp_path):
+        (tmp_path / "implementer").mkdir()
+        (tmp_path / "implementer" / "running_pids.json").write_text(json.dumps({"123": {"task_id": "t1"}}))
+        with (
+            patch("octopoid.config.get_agents_runtime_dir", return_value=tmp_path),
+            patch("octopoid.pool.get_agents_runtime_dir", return_value=tmp_path),
+        ):
+            result = handle_request({"method": "pids"})["result"]
+
+        assert result == {"implementer": {"123": {"task_id": "t1"}}}
+
+    def test_handler_errors_are_reported(self):
+        with patch("octopoid.api_metrics.top_endpoints", side_effect=RuntimeError("disk")):
+            response = handle_request({"method": "metrics"})
+        assert response == {"ok": False, "error": "RuntimeError: disk"}
+
+
+class TestServerAndClient:
+    def test_round_trip(self, server):
+        _sync_mirror({"id": "a", "queue": "incoming", "created_at": "1"})
+        assert [t["id"] for t in query("tasks", path=server.path, queue="incoming")] == ["a"]
+        assert query("task", path=server.path, id="a")["queue"] == "incoming"
+
+    def test_error_raises_unavailable(self, server):
+        with pytest.raises(StatusUnavailable, match="not synced"):
+            query("tasks", path=server.path)
+
+    def test_malformed_request(self, server):
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(server.path))
+            sock.sendall(b"not json\n")
+            assert json.loads(sock.recv(1024)) == {"ok": False, "error": "malformed request"}
+
+    def test_report_is_built_in_the_background_not_by_the_query(self, server):
+        with (
+            patch("octopoid.sdk.get_sdk"),
+            patch("octopoid.reports.get_project_report", return_value={"work": {}}) as mock_report,
+        ):
+            # The first query finds no report and wakes the report thread
+            with pytest.raises(StatusUnavailable, match="no recent report"):
+                query("report", path=server.path)
+
+            deadline = time.monotonic() + 5
+            while status_api._report_cache is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert query("report", path=server.path) == {"work": {}}
+            assert query("report", path=server.path) == {"work": {}}
+        mock_report.assert_called_once()
+
+    def test_no_report_without_demand(self):
+        with patch("octopoid.reports.get_project_report") as mock_report:
+            assert status_api.refresh_report() is False
+        mock_report.assert_not_called()
+
+    def test_report_is_rebuilt_at_most_once_per_ttl(self, monkeypatch):
+        monkeypatch.setattr(status_api, "_report_requested_at", time.monotonic())
+        with (
+            patch("octopoid.sdk.get_sdk"),
+            patch("octopoid.reports.get_project_report", return_value={"work": {}}) as mock_report,
+        ):
+            assert status_api.refresh_report() is True
+            assert status_api.refresh_report() is False
+        mock_report.assert_called_once()
+
+    def test_stale_report_is_not_served(self, monkeypatch):
+        monkeypatch.setattr(status_api, "_report_cache", (0.0, {"work": {}}))
+        assert handle_request({"method": "report"})["ok"] is False
+
+    def test_demand_expires(self, monkeypatch):
+        monkeypatch.setattr(status_api, "_report_requested_at", -status_api.REPORT_DEMAND_SECONDS - 1.0)
+        with patch("octopoid.reports.get_project_report") as mock_report:
+            assert status_api.refresh_report() is False
+        mock_report.assert_not_called()
+
+    def test_stop_removes_socket(self, tmp_path):
+        srv = StatusServer(tmp_path / "s.sock")
+        srv.start()
+        srv.stop()
+        assert not srv.path.exists()
+
+    def test_stale_socket_is_replaced(self, tmp_path):
+        (tmp_path / "s.sock").write_text("")
+        srv = StatusServer(tmp_path / "s.sock")
+        srv.start()
+        try:
+            assert query("status", path=srv.path)["pid"] > 0
+        finally:
+            srv.stop()
+
+    def test_try_query_without_daemon(self, tmp_path):
+        with patch("octopoid.status_api.get_socket_path", return_value=tmp_path / "missing.sock"):
+            assert try_query("tasks") is None
+
+
+class TestLocalClients:
+    def test_dashboard_poll_prefers_daemon(self):
+        from packages.dashboard.data import DataManager
+
+        with (
+            patch("octopoid.status_api.try_query", return_value={"queue_counts": {"incoming": 1}}),
+            patch("octopoid.sdk.get_sdk") as mock_get_sdk,
+        ):
+            assert DataManager().poll_sync() == {"queue_counts": {"incoming": 1}}
+        mock_get_sdk.assert_not_called()
+
+    def test_dashboard_report_falls_back_to_server(self):
+        from packages.dashboard.data import DataManager
+
+        with (
+            patch("octopoid.status_api.try_query", return_value=None),
+            patch("octopoid.sdk.get_sdk"),
+            patch("octopoid.reports.get_project_report", return_value={"work": {}}) as mock_report,
+        ):
+            assert DataManager().fetch_sync() == {"work": {}}
+        mock_report.assert_called_once()
+
+    def test_cli_tasks_prefers_daemon(self, capsys):
+        from octopoid.cli import cmd_tasks
+
+        tasks = [{"id": "a", "queue": "incoming", "priority": "P1", "title": "Local"}]
+        with (
+            patch("octopoid.cli.try_query", return_value=tasks) as mock_query,
+            patch("octopoid.cli.get_sdk") as mock_get_sdk,
+        ):
+            cmd_tasks(Namespace(queue="incoming"))
+
+        mock_query.assert_called_once_with("tasks", queue="incoming")
+        mock_get_sdk.assert_not_called()
+        assert "Local" in capsys.readouterr().out
@@ -900,7 +900,7 @@ class TestPushBranchExecute:
         return StepContext(task=task or {"id": "abc123"}, result={}, task_dir=tmp_path)
 
     def test_execute_calls_repo_manager(self, tmp_path, mock_sdk_for_unit_tests):
-        """execute() calls RepoManager.ensure_on_branch and push_branch."""
+        """execute() pushes HEAD to the task branch without checking it out."""
         from octopoid.steps import STEP_REGISTRY
         step = STEP_REGISTRY["push_branch"]
         ctx = self._make_ctx(tmp_path)
@@ -912,5 +912,5 @@ class TestPushBranchExecute:
              patch("octopoid.git_utils.get_task_branch", return_value="agent/abc123"):
             step.execute(ctx)
 
-        mock_repo.ensure_on_branch.assert_called_once_with("agent/abc123")
-        mock_repo.push_branch.assert_called_once()
+        mock_repo.push_head.assert_called_once_with("agent/abc123")
+        mock_repo.ensure_on_branch.assert_not_called()
@@ -69,6 +69,102 @@ class TestStepRegistry:
                 STEP_REGISTRY["run_tests"] = original_run
 
 
+class TestExecuteStepsGraph:
+    """Tests for execute_steps with after: dependencies."""
+
+    @pytest.fixture
+    def registry(self):
+        from octopoid.steps import STEP_REGISTRY
+
+        with patch.dict(STEP_REGISTRY):
+            yield STEP_REGISTRY
+
+    def test_dependencies_default_to_a_chain(self):
+        from octopoid.steps import step_dependencies
+
+        assert step_dependencies(["a", "b", "c"], None) == {"a": [], "b": ["a"], "c": ["b"]}
+        assert step_dependencies(["a", "b", "c"], {"c": ["a"]}) == {"a": [], "b": ["a"], "c": ["a"]}
+        # Dependencies on steps not being run (already completed) are dropped
+        assert step_dependencies(["b", "c"], {"c": ["a", "b"]}) == {"b": [], "c": ["b"]}
+
+    def test_transition_options_only_pass_declared_dependencies(self):
+        from octopoid.steps import transition_step_options
+
+        declared = MagicMock(after={"c": ["a"]})
+        assert transition_step_options(declared) == {"after": {"c": ["a"]}}
+        # An empty or non-dict `after` (e.g. an unset MagicMock attribute) keeps the sequential call
+        assert transition_step_options(MagicMock(after={})) == {}
+        assert transition_step_options(MagicMock()) == {}
+
+    def test_cycle_raises(self):
+        from octopoid.steps import step_dependencies
+
+        with pytest.raises(ValueError, match="dependency cycle between steps a, b"):
+            step_dependencies(["a", "b"], {"a": ["b"]})
+
+    def test_independent_steps_run_concurrently(self, registry, tmp_path):
+        """Steps waiting on the same step overlap; the joining step waits for both."""
+        import json
+        import threading
+
+        from octopoid.steps import execute_steps
+
+        both_started = threading.Barrier(2, timeout=5)
+        calls = []
+        registry["first"] = lambda t, r, d: calls.append("first")
+        registry["left"] = lambda t, r, d: (both_started.wait(), calls.append("left"))
+        registry["right"] = lambda t, r, d: (both_started.wait(), calls.append("right"))
+        registry["join"] = lambda t, r, d: calls.append("join")
+
+        execute_steps(
+            ["first", "left", "right", "join"], {}, {}, tmp_path,
+            after={"right": ["first"], "join": ["left", "right"]},
+        )
+
+        assert calls[0] == "first" and calls[-1] == "join"
+        progress = json.loads((tmp_path / "step_progress.json").read_text())
+        assert sorted(progress["completed"]) == ["first", "join", "left", "right"]
+        assert progress["failed"] is None
+
+    def test_failure_stops_new_steps_and_records_progress(self, registry, tmp_path):
+        """After a failure, running steps finish, nothing new starts, the first error is raised."""
+        import json
+        import threading
+
+        from octopoid.steps import execute_steps
+
+        failed = threading.Event()
+        calls = []
+
+        def slow(t, r, d):
+            failed.wait(timeout=5)
+            calls.append("slow")
+
+        def broken(t, r, d):
+            failed.set()
+            raise RuntimeError("tests failed")
+
+        registry["slow"] = slow
+        registry["broken"] = broken
+        registry["after_slow"] = lambda t, r, d: calls.append("after_slow")
+
+        with pytest.raises(RuntimeError, match="tests failed"):
+            execute_steps(["slow", "broken", "after_slow"], {}, {}, tmp_path, after={"broken": []})
+
+        assert calls == ["slow"]
+        progress = json.loads((tmp_path / "step_progress.json").read_text())
+        assert progress["completed"] == ["slow"]
+        assert progress["failed"] == "broken"
+
+    def test_unknown_step_raises_before_running_anything(self, registry, tmp_path):
+        from octopoid.steps import execute_steps
+
+        registry["first"] = MagicMock()
+        with pytest.raises(ValueError, match="Unknown step: nonexistent"):
+            execute_steps(["first", "nonexistent"], {}, {}, tmp_path, after={"nonexistent": []})
+        registry["first"].assert_not_called()
+
+
 class TestBuildNodePath:
     """Tests for _build_node_path."""
 
@@ -309,6 +405,21 @@ class TestCreatePrStep:
             pr_number=42,
         )
 
+    def test_create_pr_creates_the_task_branch(self, tmp_path, mock_sdk_for_unit_tests):
+        """create_pr passes the task branch so a detached worktree gets its branch (push_branch leaves it detached)."""
+        from octopoid.repo_manager import PrInfo
+        from octopoid.steps import create_pr
+
+        (tmp_path / "worktree").mkdir()
+        mock_repo = MagicMock()
+        mock_repo.create_pr.return_value = PrInfo(url="https://github.com/test/repo/pull/42", number=42, created=True)
+
+        with patch("octopoid.repo_manager.RepoManager", MagicMock(return_value=mock_repo)), \
+             patch("octopoid.git_utils.get_task_branch", return_value="agent/TASK-test456"):
+            create_pr({"id": "TASK-test456", "title": "Test PR creation"}, {}, tmp_path)
+
+        assert mock_repo.create_pr.call_args.kwargs["task_branch"] == "agent/TASK-test456"
+
     def test_create_pr_passes_task_branch_to_repo_manager(self, tmp_path, mock_sdk_for_unit_tests):
         """create_pr passes task branch to RepoManager as base_branch."""
         from octopoid.repo_manager import PrInfo
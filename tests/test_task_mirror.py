@@ -0,0 +1,281 @@
+"""Tests for delta-sync polling and the local task mirror."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from octopoid_sdk import OctopoidSDK
+
+from benchmarks.fake_server import FakeServer
+from octopoid import task_mirror
+from octopoid.task_mirror import SqliteTaskMirror, TaskMirror, load_fresh_mirror
+from octopoid.tick_snapshot import TickSnapshot
+
+
+def _task(task_id, queue="incoming", created_at="2026-01-01T00:00:00", **fields):
+    return {"id": task_id, "queue": queue, "created_at": created_at, **fields}
+
+
+class TestApplyPoll:
+    def test_full_sync_replaces_contents(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "3", "full_sync": True, "changed_tasks": [_task("a")]})
+        mirror.apply_poll({"cursor": "5", "full_sync": True, "changed_tasks": [_task("b")]})
+
+        assert [t["id"] for t in mirror.list_tasks("incoming")] == ["b"]
+        assert mirror.since == "5"
+
+    def test_delta_updates_and_deletes(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "3", "full_sync": True, "changed_tasks": [_task("a"), _task("b")]})
+        mirror.apply_poll({
+            "cursor": "4",
+            "full_sync": False,
+            "changed_tasks": [_task("a", queue="claimed")],
+            "deleted_task_ids": ["b"],
+        })
+
+        assert mirror.list_tasks("incoming") == []
+        assert [t["id"] for t in mirror.list_tasks("claimed")] == ["a"]
+        assert len(mirror) == 1
+
+    def test_server_without_cursor_leaves_mirror_unsynced(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "3", "full_sync": True, "changed_tasks": []})
+
+        assert mirror.apply_poll({"queue_counts": {"incoming": 1}}) is False
+        assert not mirror.is_synced
+        assert mirror.since == task_mirror.FULL_SYNC_CURSOR
+
+    def test_failed_poll_keeps_cursor(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "3", "full_sync": True, "changed_tasks": []})
+
+        assert mirror.apply_poll(None) is False
+        assert mirror.since == "3"
+
+    def test_lists_oldest_first_and_returns_copies(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "1", "full_sync": True, "changed_tasks": [
+            _task("new", created_at="2026-01-02T00:00:00"),
+            _task("old", created_at="2026-01-01T00:00:00"),
+        ]})
+
+        tasks = mirror.list_tasks("incoming")
+        tasks[0]["queue"] = "done"
+        assert [t["id"] for t in tasks] == ["old", "new"]
+        assert mirror.get("old")["queue"] == "incoming"
+
+
+class TestSqliteTaskMirror:
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "mirror.sqlite"
+        first = SqliteTaskMirror(path, scope="proj")
+        first.apply_poll({"cursor": "7", "full_sync": True, "changed_tasks": [_task("a"), _task("b")]})
+        first.apply_poll({"cursor": "8", "changed_tasks": [], "deleted_task_ids": ["b"]})
+        first.record_update("a", queue="claimed")
+        first.close()
+
+        second = SqliteTaskMirror(path, scope="proj")
+        assert second.since == "8"
+        assert [t["id"] for t in second.list_tasks("claimed")] == ["a"]
+        assert len(second) == 1
+        second.close()
+
+    def test_other_scope_starts_over(self, tmp_path):
+        path = tmp_path / "mirror.sqlite"
+        first = SqliteTaskMirror(path, scope="proj")
+        first.apply_poll({"cursor": "7", "full_sync": True, "changed_tasks": [_task("a")]})
+        first.close()
+
+        other = SqliteTaskMirror(path, scope="other")
+        assert not other.is_synced
+        assert len(other) == 0
+        other.close()
+
+
+class TestLoadFreshMirror:
+    def _write(self, tmp_path, scope="proj"):
+        mirror = SqliteTaskMirror(tmp_path / task_mirror.MIRROR_FILENAME, scope=scope)
+        mirror.apply_poll({"cursor": "2", "full_sync": True, "changed_tasks": [_task("a", queue="done")]})
+        mirror.close()
+
+    def test_returns_recent_mirror(self, tmp_path):
+        self._write(tmp_path)
+        with (
+            patch("octopoid.config.get_runtime_dir", return_value=tmp_path),
+            patch("octopoid.config.get_scope", return_value="proj"),
+        ):
+            mirror = load_fresh_mirror()
+
+        assert mirror is not None
+        assert [t["id"] for t in mirror.list_tasks("done")] == ["a"]
+
+    def test_stale_or_foreign_mirror_is_ignored(self, tmp_path):
+        self._write(tmp_path)
+        later = datetime.now() + timedelta(minutes=10)
+        with (
+            patch("octopoid.config.get_runtime_dir", return_value=tmp_path),
+            patch("octopoid.config.get_scope", return_value="proj"),
+            patch("octopoid.task_mirror.datetime") as mock_dt,
+        ):
+            mock_dt.now.return_value = later
+            mock_dt.fromisoformat = datetime.fromisoformat
+            assert load_fresh_mirror(max_age_seconds=60) is None
+
+        with (
+            patch("octopoid.config.get_runtime_dir", return_value=tmp_path),
+            patch("octopoid.config.get_scope", return_value="other"),
+        ):
+            assert load_fresh_mirror() is None
+
+    def test_missing_file(self, tmp_path):
+        with patch("octopoid.config.get_runtime_dir", return_value=tmp_path):
+            assert load_fresh_mirror() is None
+
+
+class TestSnapshotWithMirror:
+    def _mirror(self):
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "1", "full_sync": True, "changed_tasks": [
+            _task("a", queue="incoming"), _task("b", queue="claimed"),
+        ]})
+        return mirror
+
+    def test_reads_queues_from_mirror(self):
+        sdk = MagicMock()
+        snapshot = TickSnapshot(sdk=sdk, mirror=self._mirror())
+
+        assert [t["id"] for t in snapshot.list_tasks("incoming")] == ["a"]
+        sdk.tasks.list.assert_not_called()
+        assert snapshot.stats()["mirror_reads"] == 1
+
+    def test_record_update_moves_task_in_mirror(self):
+        mirror = self._mirror()
+        snapshot = TickSnapshot(sdk=MagicMock(), mirror=mirror)
+        snapshot.list_tasks("incoming")
+
+        snapshot.record_update("a", queue="claimed")
+
+        assert snapshot.list_tasks("incoming") == []
+        assert {t["id"] for t in snapshot.list_tasks("claimed")} == {"a", "b"}
+        assert mirror.get("a")["queue"] == "claimed"
+
+    def test_invalidated_queue_is_listed_from_server(self):
+        sdk = MagicMock()
+        sdk.tasks.list.return_value = [_task("a", queue="claimed")]
+        snapshot = TickSnapshot(sdk=sdk, mirror=self._mirror())
+
+        snapshot.invalidate("incoming", "claimed")
+
+        assert [t["id"] for t in snapshot.list_tasks("claimed")] == ["a"]
+        sdk.tasks.list.assert_called_once_with(queue="claimed")
+        assert snapshot.stats()["mirror_reads"] == 0
+
+
+class TestFetchPollData:
+    def test_sends_cursor_and_applies_delta(self):
+        from octopoid.scheduler import _fetch_poll_data
+
+        mirror = TaskMirror()
+        task_mirror._mirror = mirror
+        sdk = MagicMock()
+        sdk.poll.return_value = {
+            "queue_counts": {"incoming": 1},
+            "cursor": "9",
+            "full_sync": True,
+            "changed_tasks": [_task("a")],
+        }
+        with (
+            patch("octopoid.scheduler.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.scheduler.queue_utils.get_orchestrator_id", return_value="orch"),
+        ):
+            poll_data = _fetch_poll_data()
+            sdk.poll.assert_called_once_with("orch", since="0")
+            assert poll_data["mirror_synced"] is True
+            assert "changed_tasks" not in poll_data
+
+            sdk.poll.return_value = {"queue_counts": {}, "cursor": "10", "changed_tasks": []}
+            _fetch_poll_data()
+            sdk.poll.assert_called_with("orch", since="9")
+
+        assert [t["id"] for t in mirror.list_tasks("incoming")] == ["a"]
+
+    def test_server_without_delta_sync_is_not_synced(self):
+        from octopoid.scheduler import _fetch_poll_data
+
+        sdk = MagicMock()
+        sdk.poll.return_value = {"queue_counts": {}}
+        with (
+            patch("octopoid.scheduler.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.scheduler.queue_utils.get_orchestrator_id", return_value="orch"),
+        ):
+            assert _fetch_poll_data()["mirror_synced"] is False
+
+
+class TestContinuationFromMirror:
+    def test_reads_needs_continuation_from_snapshot(self):
+        from octopoid.scheduler import check_continuation_for_agent
+
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "1", "full_sync": True, "changed_tasks": [
+            _task("c", queue="needs_continuation", content="LAST_AGENT: impl-1"),
+        ]})
+        sdk = MagicMock()
+        snapshot = TickSnapshot(sdk=sdk, mirror=mirror)
+        with (
+            patch("octopoid.scheduler.queue_utils.read_task_marker_for", return_value=None),
+            patch("octopoid.tasks.get_scope", return_value=None),
+        ):
+            task = check_continuation_for_agent("impl-1", snapshot=snapshot)
+
+        assert task["id"] == "c" and task["_continuation"] is True
+        sdk.tasks.list.assert_not_called()
+
+
+class TestSweepUsesMirror:
+    def test_candidates_come_from_snapshot(self):
+        from octopoid.housekeeping import _list_sweep_candidates
+
+        old = (datetime.now() - timedelta(days=3)).isoformat()
+        mirror = TaskMirror()
+        mirror.apply_poll({"cursor": "1", "full_sync": True, "changed_tasks": [
+            _task("d", queue="done", updated_at=old),
+        ]})
+        sdk = MagicMock()
+        snapshot = TickSnapshot(sdk=sdk, mirror=mirror)
+
+        candidates = _list_sweep_candidates(sdk, "done", 86400, snapshot=snapshot)
+
+        assert [t["id"] for t in candidates] == ["d"]
+        sdk.tasks.iter_tasks.assert_not_called()
+        sdk.tasks.list.assert_not_called()
+
+
+class TestFakeServerDelta:
+    @pytest.fixture
+    def server(self):
+        with FakeServer(scope="bench") as srv:
+            srv.state.seed(tasks=10, projects=1, roles=["implement"])
+            yield srv
+
+    def test_mirror_tracks_server_changes(self, server):
+        sdk = OctopoidSDK(server_url=server.url, scope="bench")
+        mirror = TaskMirror(scope="bench")
+        try:
+            assert mirror.apply_poll(sdk.poll("orch", since=mirror.since))
+            assert len(mirror) == 10
+
+            task_id = next(iter(server.state.tasks))
+            sdk.tasks.update(task_id, queue="failed")
+            delta = sdk.poll("orch", since=mirror.since)
+            assert [t["id"] for t in delta["changed_tasks"]] == [task_id]
+            mirror.apply_poll(delta)
+            assert mirror.get(task_id)["queue"] == "failed"
+
+            sdk.tasks.delete(task_id)
+            mirror.apply_poll(sdk.poll("orch", since=mirror.since))
+            assert mirror.get(task_id) is None
+            assert len(mirror) == 9
+        finally:
+            sdk.close()
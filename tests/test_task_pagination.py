@@ -0,0 +1,197 @@
+"""Tests for field projection, updated_since and cursor pagination on task listing."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from octopoid_sdk import OctopoidSDK
+
+from benchmarks.fake_server import FakeServer
+
+
+@pytest.fixture
+def server():
+    with FakeServer(scope="bench") as srv:
+        srv.state.seed(tasks=30, projects=1, roles=["implement"])
+        yield srv
+
+
+@pytest.fixture
+def sdk(server):
+    client = OctopoidSDK(server_url=server.url, scope="bench")
+    yield client
+    client.close()
+
+
+class TestIterTasks:
+    def test_pages_by_offset_until_total(self, server, sdk):
+        server.state.reset_calls()
+        tasks = list(sdk.tasks.iter_tasks(page_size=7))
+
+        assert sorted(t["id"] for t in tasks) == sorted(server.state.tasks)
+        assert server.state.call_counts()["GET /api/v1/tasks"] == 5  # ceil(30 / 7)
+
+    def test_list_reads_past_the_server_page_limit(self):
+        all_tasks = [{"id": f"t{i}"} for i in range(5)]
+
+        def request(method, path, params):
+            # Server caps every page at 2 tasks, whatever limit is asked for
+            offset = params.get("offset", 0)
+            return {"tasks": all_tasks[offset:offset + 2], "total": 5, "offset": offset, "limit": 2}
+
+        client = OctopoidSDK(server_url="http://example.com")
+        client._request = MagicMock(side_effect=request)
+
+        assert client.tasks.list(queue="done") == all_tasks
+        assert [c.kwargs["params"].get("offset") for c in client._request.call_args_list] == [None, 2, 4]
+
+    def test_follows_next_cursor_when_offered(self):
+        pages = {
+            None: {"tasks": [{"id": "a"}], "next_cursor": "c1", "total": 3, "offset": 0},
+            "c1": {"tasks": [{"id": "b"}, {"id": "c"}], "next_cursor": None, "total": 3, "offset": 0},
+        }
+        client = OctopoidSDK(server_url="http://example.com")
+        client._request = MagicMock(side_effect=lambda method, path, params: pages[params.get("cursor")])
+
+        assert [t["id"] for t in client.tasks.list()] == ["a", "b", "c"]
+        assert "offset" not in client._request.call_args.kwargs["params"]
+
+    def test_pages_are_fetched_lazily(self, server, sdk):
+        server.state.reset_calls()
+        it = sdk.tasks.iter_tasks(page_size=5)
+        first = [next(it) for _ in range(5)]
+
+        assert len(first) == 5
+        assert server.state.call_counts()["GET /api/v1/tasks"] == 1
+
+    def test_limit_caps_total(self, sdk):
+        assert len(list(sdk.tasks.iter_tasks(page_size=4, limit=6))) == 6
+
+    def test_fields_projects_columns(self, sdk):
+        tasks = sdk.tasks.list(fields=["id", "queue"])
+        assert tasks and all(set(t) == {"id", "queue"} for t in tasks)
+
+    def test_updated_since_filters_old_tasks(self, server, sdk):
+        since = datetime.now(timezone.utc) - timedelta(hours=6)
+        recent = sdk.tasks.list(updated_since=since, fields=["id"])
+
+        expected = {
+            t["id"] for t in server.state.tasks.values()
+            if datetime.fromisoformat(t["updated_at"]) >= since
+        }
+        assert {t["id"] for t in recent} == expected
+        assert 0 < len(expected) < 30
+
+    def test_server_without_pagination_returns_single_page(self):
+        client = OctopoidSDK(server_url="http://example.com")
+        client._request = MagicMock(return_value={"tasks": [{"id": "a"}, {"id": "b"}]})
+
+        assert client.tasks.list(queue="done", fields=["id"]) == [{"id": "a"}, {"id": "b"}]
+        params = client._request.call_args.kwargs["params"]
+        assert params["queue"] == "done"
+        assert params["fields"] == "id"
+        assert "cursor" not in params
+
+    def test_repeated_cursor_stops(self):
+        client = OctopoidSDK(server_url="http://example.com")
+        client._request = MagicMock(return_value={"tasks": [{"id": "a"}], "next_cursor": "same"})
+
+        assert len(list(client.tasks.iter_tasks())) == 2
+        assert client._request.call_count == 2
+
+
+class TestReportsRequestOnlyWhatTheyUse:
+    def test_done_tasks_use_window_and_card_fields(self):
+        from octopoid.reports import _CARD_FIELDS, _gather_done_tasks
+
+        sdk = MagicMock()
+        now = datetime.now()
+        sdk.tasks.iter_tasks.side_effect = lambda queue, **kw: iter([
+            {"id": f"{queue}-new", "updated_at": now.isoformat()},
+            {"id": f"{queue}-old", "updated_at": (now - timedelta(days=30)).isoformat()},
+        ])
+
+        done = _gather_done_tasks(sdk)
+
+        assert sorted(t["id"] for t in done) == ["done-new", "failed-new", "recycled-new"]
+        for call in sdk.tasks.iter_tasks.call_args_list:
+            assert call.kwargs["fields"] == _CARD_FIELDS
+            assert now - call.kwargs["updated_since"] == pytest.approx(timedelta(days=7), abs=timedelta(seconds=5))
+        sdk.tasks.list.assert_not_called()
+
+    def test_cached_snapshot_queue_is_reused(self):
+        from octopoid.reports import _list_recent
+        from octopoid.tick_snapshot import TickSnapshot
+
+        sdk = MagicMock()
+        sdk.tasks.list.return_value = [{"id": "t1", "updated_at": datetime.now().isoformat()}]
+        snapshot = TickSnapshot(sdk=sdk)
+        snapshot.list_tasks("done")
+
+        recent = _list_recent(sdk, "done", datetime.now() - timedelta(days=1), snapshot)
+
+        assert [t["id"] for t in recent] == ["t1"]
+        sdk.tasks.iter_tasks.assert_not_called()
+
+
+class TestSweepWindow:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        import octopoid.housekeeping as hk
+        hk._last_sweep_at = None
+        yield
+        hk._last_sweep_at = None
+
+    def _sweep(self, sdk, tmp_path):
+        from octopoid import housekeeping as hk
+        with patch.object(hk.queue_utils, "get_sdk", return_value=sdk), \
+             patch.object(hk, "find_parent_project", return_value=tmp_path), \
+             patch.object(hk, "get_tasks_dir", return_value=tmp_path / "tasks"), \
+             patch.object(hk, "get_logs_dir", return_value=tmp_path / "logs"):
+            hk.sweep_stale_resources()
+
+    def test_first_sweep_is_full_then_incremental(self, tmp_path):
+        from octopoid import housekeeping as hk
+
+        sdk = MagicMock()
+        sdk.tasks.iter_tasks.return_value = iter([])
+        self._sweep(sdk, tmp_path)
+
+        first = sdk.tasks.iter_tasks.call_args_list
+        assert [c.kwargs["queue"] for c in first] == ["done", "failed"]
+        assert all(c.kwargs["updated_since"] is None for c in first)
+        assert all(c.kwargs["fields"] == hk._SWEEP_FIELDS for c in first)
+        last_sweep = hk._last_sweep_at
+        assert last_sweep is not None
+
+        sdk.tasks.iter_tasks.reset_mock()
+        sdk.tasks.iter_tasks.return_value = iter([])
+        self._sweep(sdk, tmp_path)
+
+        done_call, failed_call = sdk.tasks.iter_tasks.call_args_list
+        overlap = hk._SWEEP_OVERLAP_SECONDS
+        assert done_call.kwargs["updated_since"] == last_sweep - timedelta(seconds=hk._DONE_GRACE_SECONDS + overlap)
+        assert failed_call.kwargs["updated_since"] == last_sweep - timedelta(seconds=hk._FAILED_GRACE_SECONDS + overlap)
+
+    def test_failed_fetch_keeps_full_scan(self, tmp_path):
+        from octopoid import housekeeping as hk
+
+        sdk = MagicMock()
+        sdk.tasks.iter_tasks.side_effect = RuntimeError("down")
+        self._sweep(sdk, tmp_path)
+
+        assert hk._last_sweep_at is None
+
+    def test_every_candidate_is_swept(self, tmp_path):
+        from octopoid import housekeeping as hk
+
+        old = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
+        sdk = MagicMock()
+        sdk.tasks.iter_tasks.side_effect = lambda queue, **kw: iter(
+            [{"id": f"{queue}-{i}", "queue": queue, "updated_at": old} for i in range(2)]
+        )
+        with patch.object(hk, "_sweep_task_resources", return_value=True) as sweep_one, \
+             patch.object(hk, "run_git"):
+            self._sweep(sdk, tmp_path)
+
+        assert sweep_one.call_count == 4
@@ -0,0 +1,142 @@
+"""Tests for octopoid.tick_snapshot — per-tick shared task lists."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from octopoid.housekeeping import check_and_requeue_expired_leases, renew_active_leases
+from octopoid.jobs import JobContext, run_due_jobs
+from octopoid.tick_snapshot import TickSnapshot
+
+
+def _sdk_with_queues(queues: dict[str, list[dict]]) -> MagicMock:
+    sdk = MagicMock()
+    sdk.tasks.list.side_effect = lambda queue=None, **kw: [dict(t) for t in queues.get(queue, [])]
+    sdk.tasks.bulk_update.side_effect = lambda patches: {"updated": [dict(p) for p in patches], "failed": []}
+    sdk.tasks.bulk_renew_leases.side_effect = lambda task_ids, duration_seconds: {
+        "updated": [{"id": t, "lease_expires_at": _iso(timedelta(seconds=duration_seconds))} for t in task_ids],
+        "failed": [],
+    }
+    return sdk
+
+
+def _iso(delta: timedelta) -> str:
+    return (datetime.now(timezone.utc) + delta).isoformat()
+
+
+class TestTickSnapshot:
+    def test_lists_each_queue_once(self):
+        sdk = _sdk_with_queues({"claimed": [{"id": "a"}]})
+        snapshot = TickSnapshot(sdk=sdk)
+
+        assert snapshot.list_tasks("claimed") == [{"id": "a"}]
+        assert snapshot.list_tasks("claimed") == [{"id": "a"}]
+
+        sdk.tasks.list.assert_called_once_with(queue="claimed")
+        assert snapshot.stats() == {"list_calls": 1, "cache_hits": 1, "mirror_reads": 0}
+
+    def test_invalidate_forces_relist(self):
+        sdk = _sdk_with_queues({"claimed": [{"id": "a"}]})
+        snapshot = TickSnapshot(sdk=sdk)
+        snapshot.list_tasks("claimed")
+
+        snapshot.invalidate("claimed")
+        snapshot.list_tasks("claimed")
+
+        assert sdk.tasks.list.call_count == 2
+
+    def test_record_update_patches_task_in_place(self):
+        sdk = _sdk_with_queues({"claimed": [{"id": "a", "lease_expires_at": "old"}]})
+        snapshot = TickSnapshot(sdk=sdk)
+        snapshot.list_tasks("claimed")
+
+        snapshot.record_update("a", lease_expires_at="new")
+
+        assert snapshot.list_tasks("claimed") == [{"id": "a", "lease_expires_at": "new"}]
+        assert sdk.tasks.list.call_count == 1
+
+    def test_record_update_queue_move_removes_task_and_invalidates_target(self):
+        sdk = _sdk_with_queues({"claimed": [{"id": "a"}, {"id": "b"}], "incoming": []})
+        snapshot = TickSnapshot(sdk=sdk)
+        snapshot.list_tasks("claimed")
+        snapshot.list_tasks("incoming")
+
+        snapshot.record_update("a", queue="incoming")
+
+        assert [t["id"] for t in snapshot.list_tasks("claimed")] == ["b"]
+        assert snapshot.is_cached("incoming") is False
+
+    def test_failed_list_is_not_cached(self):
+        sdk = MagicMock()
+        sdk.tasks.list.side_effect = [RuntimeError("down"), [{"id": "a"}]]
+        snapshot = TickSnapshot(sdk=sdk)
+
+        try:
+            snapshot.list_tasks("claimed")
+        except RuntimeError:
+            pass
+
+        assert snapshot.list_tasks("claimed") == [{"id": "a"}]
+
+    def test_queue_counts_from_poll_data(self):
+        snapshot = TickSnapshot(poll_data={"queue_counts": {"incoming": 2}})
+        assert snapshot.queue_counts == {"incoming": 2}
+        assert TickSnapshot().queue_counts is None
+
+
+class TestLeaseJobsShareSnapshot:
+    def test_renew_and_expiry_list_claimed_once(self):
+        expiring = {"id": "live", "lease_expires_at": _iso(timedelta(minutes=5)), "attempt_count": 0}
+        sdk = _sdk_with_queues({"claimed": [expiring], "provisional": []})
+        snapshot = TickSnapshot(sdk=sdk)
+
+        with (
+            patch("octopoid.housekeeping.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping.find_pid_for_task", return_value=(123, "implementer")),
+            patch("octopoid.housekeeping._get_circuit_breaker_threshold", return_value=3),
+        ):
+            renew_active_leases(snapshot=snapshot)
+            check_and_requeue_expired_leases(snapshot=snapshot)
+
+        queues_listed = [c.kwargs["queue"] for c in sdk.tasks.list.call_args_list]
+        assert queues_listed.count("claimed") == 1
+        # Renewed lease was recorded, so the expiry check did not requeue it
+        sdk.tasks.bulk_renew_leases.assert_called_once()
+        assert sdk.tasks.bulk_renew_leases.call_args.args[0] == ["live"]
+        sdk.tasks.bulk_update.assert_not_called()
+
+    def test_expiry_requeue_is_recorded(self):
+        expired = {"id": "stale", "lease_expires_at": _iso(timedelta(minutes=-5)), "attempt_count": 0}
+        sdk = _sdk_with_queues({"claimed": [expired], "provisional": []})
+        snapshot = TickSnapshot(sdk=sdk)
+
+        with (
+            patch("octopoid.housekeeping.queue_utils.get_sdk", return_value=sdk),
+            patch("octopoid.housekeeping.find_pid_for_task", return_value=None),
+            patch("octopoid.housekeeping._get_circuit_breaker_threshold", return_value=3),
+        ):
+            check_and_requeue_expired_leases(snapshot=snapshot)
+
+        assert snapshot.list_tasks("claimed") == []
+
+
+class TestRunDueJobsSnapshot:
+    def test_remote_jobs_share_one_snapshot(self):
+        seen: list[JobContext] = []
+        jobs = [
+            {"name": "job_a", "interval": 60, "group": "remote"},
+            {"name": "job_b", "interval": 60, "group": "remote"},
+        ]
+        poll = {"queue_counts": {"incoming": 1}}
+
+        with (
+            patch("octopoid.jobs.load_jobs_yaml", return_value=jobs),
+            patch("octopoid.scheduler.is_job_due", return_value=True),
+            patch("octopoid.scheduler.record_job_run"),
+            patch("octopoid.scheduler._fetch_poll_data", return_value=poll),
+            patch("octopoid.jobs._run_job", side_effect=lambda job_def, ctx: seen.append(ctx)),
+        ):
+            run_due_jobs({"jobs": {}})
+
+        assert len(seen) == 2
+        assert seen[0].snapshot is seen[1].snapshot
+        assert seen[0].snapshot.poll_data is poll
@@ -0,0 +1,183 @@
+"""Tests for the reflink and sparse task worktree backends (octopoid/worktree_backend.py).
+
+Uses the test_repo fixture's bare "origin" and real git worktrees. The
+reflink path is exercised with ``cp --reflink=auto``, which copies normally
+on filesystems that cannot clone.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from octopoid import worktree_backend
+from octopoid.worktree_backend import create_worktree, prune_pristine
+from tests.fixtures.conftest_mock import advance_origin, git
+
+
+@pytest.fixture
+def repo_env(test_repo, tmp_path):
+    """test_repo's clone with src/, docs/ and a top-level file, plus a pristine dir."""
+    repo = test_repo["work"]
+    advance_origin(repo, {
+        "src/app.py": "print('v1')\n",
+        "docs/guide.md": "guide\n",
+        "README.md": "v1\n",
+    })
+
+    pristine_dir = tmp_path / "pristine"
+    with patch("octopoid.worktree_backend.get_pristine_dir", return_value=pristine_dir):
+        yield {"repo": repo, "pristine_dir": pristine_dir, "tmp": tmp_path}
+
+
+def _advance_origin(repo: Path) -> str:
+    return advance_origin(repo, {"src/app.py": "print('v2')\n", "src/new.py": "new\n"})
+
+
+def _assert_clean_detached(worktree: Path, sha: str) -> None:
+    assert git(["rev-parse", "HEAD"], cwd=worktree) == sha
+    assert git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=worktree) == "HEAD"
+    assert git(["status", "--porcelain"], cwd=worktree) == ""
+
+
+class TestReflink:
+    @pytest.fixture(autouse=True)
+    def clone_capable(self):
+        with patch("octopoid.worktree_backend.reflink_supported", return_value=True):
+            yield
+
+    def test_copies_pristine_checkout(self, repo_env):
+        repo = repo_env["repo"]
+        dest = repo_env["tmp"] / "tasks" / "t1" / "worktree"
+
+        assert create_worktree(repo, dest, "origin/main", "reflink") == "reflink"
+
+        _assert_clean_detached(dest, git(["rev-parse", "origin/main"], cwd=repo))
+        assert (dest / "src" / "app.py").read_text() == "print('v1')\n"
+        assert (repo_env["pristine_dir"] / "origin__main" / "README.md").exists()
+        assert str(dest) in git(["worktree", "list"], cwd=repo)
+
+    def test_pristine_follows_start_point(self, repo_env):
+        repo = repo_env["repo"]
+        create_worktree(repo, repo_env["tmp"] / "t1", "origin/main", "reflink")
+        head = _advance_origin(repo)
+
+        dest = repo_env["tmp"] / "t2"
+        create_worktree(repo, dest, "origin/main", "reflink")
+
+        _assert_clean_detached(dest, head)
+        assert (dest / "src" / "new.py").exists()
+
+    def test_worktrees_are_independent(self, repo_env):
+        repo = repo_env["repo"]
+        first, second = repo_env["tmp"] / "t1", repo_env["tmp"] / "t2"
+        create_worktree(repo, first, "origin/main", "reflink")
+        create_worktree(repo, second, "origin/main", "reflink")
+
+        (first / "README.md").write_text("changed\n")
+
+        assert (second / "README.md").read_text() == "v1\n"
+        assert (repo_env["pristine_dir"] / "origin__main" / "README.md").read_text() == "v1\n"
+
+    def test_failure_falls_back_to_full_checkout(self, repo_env):
+        repo = repo_env["repo"]
+        dest = repo_env["tmp"] / "t1"
+        error = subprocess.CalledProcessError(1, ["cp"], stderr="cp: boom")
+        with patch("octopoid.worktree_backend.create_reflink", side_effect=error):
+            assert create_worktree(repo, dest, "origin/main", "reflink") == "git"
+
+        _assert_clean_detached(dest, git(["rev-parse", "origin/main"], cwd=repo))
+
+
+class TestPrunePristine:
+    @pytest.fixture(autouse=True)
+    def clone_capable(self):
+        with patch("octopoid.worktree_backend.reflink_supported", return_value=True):
+            yield
+
+    def test_removes_checkouts_whose_ref_is_gone(self, repo_env):
+        repo = repo_env["repo"]
+        git(["push", "origin", "main:old"], cwd=repo)
+        git(["fetch", "origin"], cwd=repo)
+        create_worktree(repo, repo_env["tmp"] / "t1", "origin/main", "reflink")
+        create_worktree(repo, repo_env["tmp"] / "t2", "origin/old", "reflink")
+        git(["push", "origin", "--delete", "old"], cwd=repo)
+        git(["fetch", "--prune", "origin"], cwd=repo)
+
+        assert prune_pristine(repo, "reflink") == 1
+        assert (repo_env["pristine_dir"] / "origin__main" / "README.md").exists()
+        assert not (repo_env["pristine_dir"] / "origin__old").exists()
+
+    def test_other_backends_drain_every_checkout(self, repo_env):
+        repo = repo_env["repo"]
+        create_worktree(repo, repo_env["tmp"] / "t1", "origin/main", "reflink")
+
+        assert prune_pristine(repo, "git") == 1
+        assert str(repo_env["pristine_dir"]) not in git(["worktree", "list"], cwd=repo)
+
+
+class TestSparse:
+    def test_checks_out_cone_only(self, repo_env):
+        repo = repo_env["repo"]
+        dest = repo_env["tmp"] / "t1"
+
+        assert create_worktree(repo, dest, "origin/main", "sparse", ["src"]) == "sparse"
+
+        _assert_clean_detached(dest, git(["rev-parse", "origin/main"], cwd=repo))
+        assert (dest / "src" / "app.py").exists()
+        assert (dest / "README.md").exists()
+        assert not (dest / "docs").exists()
+        # The parent checkout is not made sparse
+        assert (repo / "docs" / "guide.md").exists()
+
+    def test_reflink_without_clone_support_uses_sparse(self, repo_env):
+        with patch("octopoid.worktree_backend.reflink_supported", return_value=False):
+            used = create_worktree(repo_env["repo"], repo_env["tmp"] / "t1", "origin/main", "reflink", ["src"])
+        assert used == "sparse"
+
+    def test_without_cone_is_a_full_checkout(self, repo_env):
+        dest = repo_env["tmp"] / "t1"
+        assert create_worktree(repo_env["repo"], dest, "origin/main", "sparse") == "git"
+        assert (dest / "docs" / "guide.md").exists()
+
+
+class TestSelection:
+    def test_config_defaults_togit(self):
+        from octopoid.config import get_worktree_backend_config
+
+        with patch("octopoid.config._load_project_config", return_value={}):
+            assert get_worktree_backend_config() == {"type": "git", "sparse_cone": []}
+        with patch("octopoid.config._load_project_config", return_value={"worktree_backend": {"type": "zfs"}}):
+            assert get_worktree_backend_config()["type"] == "git"
+        with patch("octopoid.config._load_project_config",
+                   return_value={"worktree_backend": {"type": "sparse", "sparse_cone": "src/"}}):
+            assert get_worktree_backend_config() == {"type": "sparse", "sparse_cone": ["src"]}
+
+    def test_create_task_worktree_uses_configured_backend(self, repo_env):
+        from octopoid.git_utils import create_task_worktree
+
+        repo = repo_env["repo"]
+        tasks_dir = repo_env["tmp"] / "tasks"
+        with patch.multiple(
+            "octopoid.git_utils",
+            find_parent_project=lambda: repo,
+            get_base_branch=lambda: "main",
+            get_tasks_dir=lambda: tasks_dir,
+            get_worktree_pool_config=lambda: {"size": 0, "branches": ["main"]},
+            get_worktree_backend_config=lambda: {"type": "sparse", "sparse_cone": ["src"]},
+        ):
+            worktree = create_task_worktree({"id": "t1", "branch": "main"})
+
+        assert (worktree / "src" / "app.py").exists()
+        assert not (worktree / "docs").exists()
+
+    def test_reflink_probe(self, tmp_path):
+        worktree_backend._reflink_support.clear()
+        try:
+            supported = worktree_backend.reflink_supported(tmp_path)
+            assert isinstance(supported, bool)
+            assert list(worktree_backend._reflink_support.values()) == [supported]
+            assert list(tmp_path.iterdir()) == []
+        finally:
+            worktree_backend._reflink_support.clear()
@@ -0,0 +1,171 @@
+"""Tests for the pre-created task worktree pool (octopoid/worktree_pool.py).
+
+Uses the test_repo fixture's bare "origin" and real git worktrees.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from octopoid import worktree_pool
+from tests.fixtures.conftest_mock import advance_origin, git
+
+
+@pytest.fixture
+def repo_env(test_repo, tmp_path):
+    """test_repo's clone, plus a pool dir outside the clone."""
+    pool_dir = tmp_path / "pool"
+    with patch("octopoid.worktree_pool.get_pool_dir", return_value=pool_dir):
+        yield {"repo": test_repo["work"], "pool_dir": pool_dir, "tmp": tmp_path}
+
+
+def _advance_origin(repo: Path) -> str:
+    return advance_origin(repo, {"README.md": "v2\n"})
+
+
+class TestReplenish:
+    def test_fills_pool_to_size(self, repo_env):
+        created = worktree_pool.replenish(repo_env["repo"], size=2, branches=["main"])
+
+        assert created == 2
+        assert worktree_pool.pool_size("main") == 2
+        assert worktree_pool.replenish(repo_env["repo"], size=2, branches=["main"]) == 0
+
+    def test_removes_leftovers_and_extra_slots(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=3, branches=["main"])
+        leftover = repo_env["pool_dir"] / "main" / "slot-broken"
+        leftover.mkdir()
+
+        worktree_pool.replenish(repo, size=1, branches=["main"])
+
+        assert not leftover.exists()
+        assert worktree_pool.pool_size("main") == 1
+        assert len(git(["worktree", "list"], cwd=repo).splitlines()) == 2
+
+    def test_skips_when_another_process_is_replenishing(self, repo_env):
+        from octopoid.lock_utils import locked
+
+        with locked(repo_env["pool_dir"] / "replenish.lock") as acquired:
+            assert acquired
+            assert worktree_pool.replenish(repo_env["repo"], size=1, branches=["main"]) == 0
+
+
+class TestTake:
+    def test_moves_slot_and_resets_to_start_point(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=1, branches=["main"])
+        head = _advance_origin(repo)
+        dest = repo_env["tmp"] / "tasks" / "t1" / "worktree"
+
+        assert worktree_pool.take(repo, ["main"], "origin/main", dest) is True
+
+        assert git(["rev-parse", "HEAD"], cwd=dest) == head
+        assert git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=dest) == "HEAD"
+        assert (dest / "README.md").read_text() == "v2\n"
+        assert str(dest) in git(["worktree", "list"], cwd=repo)
+        assert worktree_pool.pool_size("main") == 0
+
+    def test_empty_pool(self, repo_env):
+        dest = repo_env["tmp"] / "tasks" / "t1" / "worktree"
+        assert worktree_pool.take(repo_env["repo"], ["main"], "origin/main", dest) is False
+        assert not dest.exists()
+
+    def test_falls_back_to_other_branch_pool(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=1, branches=["main"])
+        dest = repo_env["tmp"] / "tasks" / "t1" / "worktree"
+
+        assert worktree_pool.take(repo, ["feature/x", "main"], "origin/main", dest) is True
+
+    def test_unusable_slot_is_discarded(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=1, branches=["main"])
+        dest = repo_env["tmp"] / "tasks" / "t1" / "worktree"
+
+        assert worktree_pool.take(repo, ["main"], "origin/no-such-branch", dest) is False
+
+        assert not dest.exists()
+        assert len(git(["worktree", "list"], cwd=repo).splitlines()) == 1
+
+
+class TestCreateTaskWorktreeUsesPool:
+    def test_claim_takes_pooled_worktree_and_replenishes(self, repo_env):
+        from octopoid.git_utils import create_task_worktree
+
+        repo = repo_env["repo"]
+        tasks_dir = repo_env["tmp"] / "tasks"
+        worktree_pool.replenish(repo, size=1, branches=["main"])
+        pool_config = {"size": 1, "branches": ["main"]}
+
+        with (
+            patch.multiple(
+                "octopoid.git_utils",
+                find_parent_project=lambda: repo,
+                get_base_branch=lambda: "main",
+                get_tasks_dir=lambda: tasks_dir,
+                get_worktree_pool_config=lambda: pool_config,
+            ),
+            patch("octopoid.config.get_worktree_pool_config", return_value=pool_config),
+            patch("octopoid.git_utils._add_detached_worktree") as mock_add,
+        ):
+            worktree = create_task_worktree({"id": "t1", "branch": "main"})
+            thread = worktree_pool._replenisher
+            thread.join(30)
+
+        mock_add.assert_not_called()
+        assert worktree == tasks_dir / "t1" / "worktree"
+        assert (worktree / "README.md").exists()
+        assert (tasks_dir / "t1" / "base_branch").read_text() == "main"
+        assert worktree_pool.pool_size("main") == 1
+
+    def test_pool_disabled_by_default(self):
+        from octopoid.config import get_worktree_pool_config
+
+        with patch("octopoid.config._load_project_config", return_value={}), \
+             patch("octopoid.config.get_base_branch", return_value="main"):
+            assert get_worktree_pool_config() == {"size": 0, "branches": ["main"]}
+
+
+class TestDrain:
+    def test_removes_all_slots(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=2, branches=["main"])
+
+        assert worktree_pool.drain(repo) == 2
+        assert worktree_pool.pool_size("main") == 0
+        assert len(git(["worktree", "list"], cwd=repo).splitlines()) == 1
+
+
+class TestPrune:
+    def _add_branch(self, repo: Path, branch: str) -> None:
+        git(["push", "origin", f"main:{branch}"], cwd=repo)
+        git(["fetch", "origin"], cwd=repo)
+
+    def test_removes_pools_of_unconfigured_branches(self, repo_env):
+        repo = repo_env["repo"]
+        self._add_branch(repo, "feature/x")
+        worktree_pool.replenish(repo, size=1, branches=["main", "feature/x"])
+
+        assert worktree_pool.prune(repo, size=1, branches=["main"]) == 1
+        assert worktree_pool.pool_size("main") == 1
+        assert not (repo_env["pool_dir"] / "feature__x").exists()
+
+    def test_removes_pools_whose_origin_branch_is_gone(self, repo_env):
+        repo = repo_env["repo"]
+        self._add_branch(repo, "old")
+        worktree_pool.replenish(repo, size=1, branches=["main", "old"])
+        git(["push", "origin", "--delete", "old"], cwd=repo)
+        git(["fetch", "--prune", "origin"], cwd=repo)
+
+        assert worktree_pool.prune(repo, size=1, branches=["main", "old"]) == 1
+        assert worktree_pool.pool_size("main") == 1
+        assert worktree_pool.pool_size("old") == 0
+
+    def test_disabled_pool_is_drained(self, repo_env):
+        repo = repo_env["repo"]
+        worktree_pool.replenish(repo, size=2, branches=["main"])
+
+        assert worktree_pool.prune(repo, size=0, branches=["main"]) == 2
+        assert len(git(["worktree", "list"], cwd=repo).splitlines()) == 1